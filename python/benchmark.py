@@ -0,0 +1,462 @@
+"""
+Benchmark pentru pachetul `calculations` și endpoint-urile HTTP
+Rulează offline, în proces (fără server și fără client HTTP extern).
+
+Utilizare (din directorul python/):
+
+    python benchmark.py                          # rulare, tabel cu rezultate
+    python benchmark.py --salveaza               # rulare + actualizarea bazei de referință
+    python benchmark.py --compara                # rulare + comparare cu baza; cod 1 la regresie
+    python benchmark.py --filtru performante --prag 0.15
+    python benchmark.py --pornire 10 --filtru pornire  # doar pornirea serverului
+
+Pentru fiecare caz se măsoară latența (p50/p90/p99, medie), debitul
+secvențial și memoria maximă alocată (tracemalloc, o rulare separată).
+Cu --pornire N se măsoară și pornirea la rece a serverului (`python main.py`
+într-un proces nou, de N ori): timpul până la primul /health reușit și până
+la primul răspuns /calculate/all.
+"""
+
+import argparse
+import asyncio
+import copy
+import http.client
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from calculations import __version__ as VERSIUNE_CALCUL
+from serviciu import VEHICUL_REFERINTA
+
+BAZA_IMPLICITA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+
+def vehicul(trepte: int = 5, indice: int = 0) -> Dict[str, Any]:
+    """Vehiculul de referință cu `trepte` rapoarte în progresie geometrică (3.727 … 0.820)."""
+    v = copy.deepcopy(VEHICUL_REFERINTA)
+    if trepte != 5:
+        v["transmisie"]["numarTrepte"] = trepte
+        v["transmisie"]["raporturiCV"] = np.round(np.geomspace(3.727, 0.820, trepte), 3).tolist()
+    if indice:
+        # Variante distincte (amprente diferite în cache)
+        v["masa"]["masaTotala"] += indice
+    return v
+
+# ============== Cazuri ==============
+
+class Caz:
+    """Un caz de benchmark: `fn` este măsurată, `pregatire` rulează înainte, nemăsurată."""
+
+    def __init__(self, nume: str, fn: Callable[[], Any], pregatire: Optional[Callable[[], Any]] = None):
+        self.nume = nume
+        self.fn = fn
+        self.pregatire = pregatire
+
+def cazuri_calcul() -> List[Caz]:
+    from modele import VehicleParams
+    from calculations.vehicule import ContextVehicul
+    from calculations.resistance import calculate_resistances_ctx
+    from calculations.traction import calculate_traction_ctx
+    from calculations.performance import calculate_performance_ctx
+    from calculations.braking import calculate_braking_ctx
+
+    def lot(n: int, trepte: int = 5) -> List[Any]:
+        return [VehicleParams(**vehicul(trepte, i)) for i in range(n)]
+
+    cazuri = []
+    for n in (1, 100):
+        v = lot(n)
+        cazuri.append(Caz(f"calcul/rezistente/lot={n}",
+                          lambda v=v: calculate_resistances_ctx(ContextVehicul(v))))
+        cazuri.append(Caz(f"calcul/franare/lot={n}",
+                          lambda v=v: calculate_braking_ctx(ContextVehicul(v))))
+
+    for trepte in (4, 5, 6):
+        for puncte in (100, 1000):
+            v = lot(1, trepte)
+            cazuri.append(Caz(f"calcul/tractiune/trepte={trepte}/puncte={puncte}",
+                              lambda v=v, p=puncte: calculate_traction_ctx(ContextVehicul(v, p))))
+
+    for trepte, puncte, pas in [(4, 100, 1.0), (5, 100, 1.0), (6, 100, 1.0),
+                                (5, 1000, 1.0), (5, 100, 0.1), (5, 100, 0.01)]:
+        v = lot(1, trepte)
+        cazuri.append(Caz(
+            f"calcul/performante/trepte={trepte}/puncte={puncte}/pas={pas}",
+            lambda v=v, p=puncte, pas=pas: calculate_performance_ctx(ContextVehicul(v, p), pas, 100.0)
+        ))
+
+    v = lot(1)
+    cazuri.append(Caz("calcul/performante/puncte=1000/pas=0.01/max_puncte=200",
+                      lambda v=v: calculate_performance_ctx(ContextVehicul(v, 1000), 0.01, 100.0, 200)))
+
+    # Curbă de cuplu măsurată (tabelul este memorat după primul apel)
+    date = vehicul()
+    n = np.linspace(800, 6500, 5000)
+    date["motor"]["curbaCuplu"] = {"turatii": n.tolist(),
+                                   "cupluri": (160 - 40 * ((n - 4000) / 3000) ** 2).tolist()}
+    v = [VehicleParams(**date)]
+    cazuri.append(Caz("calcul/performante/curba_masurata=5000",
+                      lambda v=v: calculate_performance_ctx(ContextVehicul(v))))
+
+    v = lot(100)
+    cazuri.append(Caz("calcul/performante/lot=100",
+                      lambda: calculate_performance_ctx(ContextVehicul(v))))
+
+    # Un bloc Monte Carlo (pilot): eșantionare, evaluare și histograme per punct
+    from calculations.incertitudine import bloc_montecarlo
+    baza = lot(1)[0]
+    distributii = [{"camp": "masaTotala", "tip": "normala", "abatere_relativa": 0.05},
+                   {"camp": "coefAerodinamic", "tip": "uniforma", "minim": 0.27, "maxim": 0.33},
+                   {"camp": "putereMaxima", "tip": "triunghiulara", "minim": 85, "maxim": 95}]
+    cazuri.append(Caz("calcul/montecarlo/bloc=1024",
+                      lambda: bloc_montecarlo(baza, distributii, 0, 0, 1024)))
+
+    # Cicluri de conducere: NEDC + ECE-15 + EUDC (1775 s la 1 Hz) pentru un lot
+    from calculations.ciclu import ciclu_standard, simuleaza_cicluri_batch
+    cicluri = [ciclu_standard(n) for n in ("nedc", "ece15", "eudc")]
+    vehicule_cicluri = lot(100)
+    cazuri.append(Caz("calcul/cicluri/nedc+ece15+eudc/lot=100",
+                      lambda: simuleaza_cicluri_batch(vehicule_cicluri, cicluri)))
+
+    # Tabelul de demarare (0 → v_max, pas 0.1 km/h) și o interogare în el
+    from calculations.intervale import interogheaza, tabel_demarare
+    cazuri.append(Caz("calcul/intervale/tabel", lambda: tabel_demarare(baza)))
+    tabel = tabel_demarare(baza)
+    cazuri.append(Caz("calcul/intervale/interogare",
+                      lambda: interogheaza(tabel, viteze_kmh=list(range(0, 200, 10)))))
+    return cazuri
+
+def cazuri_http() -> List[Caz]:
+    import main
+
+    bucla = asyncio.new_event_loop()
+    corp = json.dumps(VEHICUL_REFERINTA).encode("utf-8")
+    corp_lot = json.dumps([vehicul(5, i) for i in range(10)]).encode("utf-8")
+
+    def cerere(metoda: str, cale: str, date: bytes = b"", antete: Optional[Dict[str, str]] = None):
+        def fn():
+            status, _ = bucla.run_until_complete(cerere_asgi(main.app, metoda, cale, date, antete))
+            if status >= 400:
+                raise RuntimeError(f"{metoda} {cale} → {status}")
+        return fn
+
+    cazuri = [Caz("http/health", cerere("GET", "/health"))]
+    for capitol in ("rezistente", "tractiune", "performante", "franare", "all"):
+        fn = cerere("POST", f"/calculate/{capitol}", corp)
+        cazuri.append(Caz(f"http/{capitol}/rece", fn, main.cache.goleste))
+        cazuri.append(Caz(f"http/{capitol}/cald", fn))
+    cazuri.append(Caz("http/all/coloane/rece",
+                      cerere("POST", "/calculate/all", corp, {"accept": "application/vnd.usv.coloane"}),
+                      main.cache.goleste))
+    cazuri.append(Caz("http/batch/lot=10/rece", cerere("POST", "/calculate/batch", corp_lot),
+                      main.cache.goleste))
+
+    # Redeschiderea unui proiect cu 50 de variante salvate, cu cache-ul gol:
+    # rezultatele vin din depozit (o bază temporară, nu cea a utilizatorului)
+    proiect: Dict[str, Any] = {}
+
+    def proiect_salvat():
+        if not proiect:
+            from proiecte import DepozitProiecte
+            main._depozit["proiecte"] = DepozitProiecte(os.path.join(tempfile.mkdtemp(), "proiecte.sqlite3"))
+            proiect.update(main.depozit().creeaza_proiect("benchmark"))
+            for i in range(50):
+                cerere("POST", f"/proiecte/{proiect['id']}/variante",
+                       json.dumps({"vehicul": vehicul(5, i)}).encode("utf-8"))()
+        main.cache.goleste()
+
+    cazuri.append(Caz("http/proiecte/deschidere/variante=50/rece",
+                      lambda: cerere("GET", f"/proiecte/{proiect['id']}/rezultate")(), proiect_salvat))
+    return cazuri
+
+async def cerere_asgi(app: Any, metoda: str, cale: str, corp: bytes = b"",
+                      antete: Optional[Dict[str, str]] = None) -> Tuple[int, bytes]:
+    """O cerere HTTP direct prin interfața ASGI a aplicației (fără rețea)."""
+    cale, _, interogare = cale.partition("?")
+    lista_antete = [(b"content-type", b"application/json"), (b"content-length", str(len(corp)).encode())]
+    lista_antete += [(k.lower().encode(), v.encode()) for k, v in (antete or {}).items()]
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": metoda, "scheme": "http", "path": cale, "raw_path": cale.encode(),
+        "query_string": interogare.encode(), "root_path": "", "headers": lista_antete,
+        "client": ("127.0.0.1", 0), "server": ("127.0.0.1", 8000)
+    }
+    terminat = asyncio.Event()
+    trimis = False
+    raspuns: Dict[str, Any] = {"status": 0, "corp": []}
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal trimis
+        if not trimis:
+            trimis = True
+            return {"type": "http.request", "body": corp, "more_body": False}
+        await terminat.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(mesaj: Dict[str, Any]) -> None:
+        if mesaj["type"] == "http.response.start":
+            raspuns["status"] = mesaj["status"]
+        elif mesaj["type"] == "http.response.body":
+            raspuns["corp"].append(mesaj.get("body", b""))
+            if not mesaj.get("more_body", False):
+                terminat.set()
+
+    await app(scope, receive, send)
+    return raspuns["status"], b"".join(raspuns["corp"])
+
+# ============== Măsurare ==============
+
+def masoara(caz: Caz, timp_min_s: float = 0.5, iteratii_min: int = 5, incalzire: int = 2) -> Dict[str, Any]:
+    """Latențe pe iterații până la timp_min_s (cel puțin iteratii_min), apoi memoria maximă."""
+    for _ in range(incalzire):
+        if caz.pregatire:
+            caz.pregatire()
+        caz.fn()
+
+    latente: List[float] = []
+    inceput = time.perf_counter()
+    while len(latente) < iteratii_min or time.perf_counter() - inceput < timp_min_s:
+        if caz.pregatire:
+            caz.pregatire()
+        t0 = time.perf_counter()
+        caz.fn()
+        latente.append(time.perf_counter() - t0)
+
+    if caz.pregatire:
+        caz.pregatire()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    caz.fn()
+    _, varf = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return statistici(latente, varf / 1024)
+
+def statistici(latente: List[float], memorie_kb: float) -> Dict[str, Any]:
+    ms = np.array(latente) * 1000
+    return {
+        "iteratii": len(latente),
+        "p50_ms": round(float(np.percentile(ms, 50)), 4),
+        "p90_ms": round(float(np.percentile(ms, 90)), 4),
+        "p99_ms": round(float(np.percentile(ms, 99)), 4),
+        "medie_ms": round(float(ms.mean()), 4),
+        "debit_ops_s": round(len(ms) / (ms.sum() / 1000), 2),
+        "memorie_maxima_kb": round(memorie_kb, 1)
+    }
+
+# ============== Pornire la rece ==============
+
+def _port_liber() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _cerere_http(port: int, metoda: str, cale: str, corp: Optional[bytes] = None) -> int:
+    conexiune = http.client.HTTPConnection("127.0.0.1", port, timeout=30)
+    try:
+        antete = {"Content-Type": "application/json"} if corp is not None else {}
+        conexiune.request(metoda, cale, body=corp, headers=antete)
+        raspuns = conexiune.getresponse()
+        raspuns.read()
+        return raspuns.status
+    finally:
+        conexiune.close()
+
+def _memorie_proces_kb(pid: int) -> float:
+    """Memoria rezidentă a procesului [KiB] (Linux, /proc); 0 dacă nu este disponibilă."""
+    try:
+        with open(f"/proc/{pid}/status", encoding="ascii") as f:
+            for linie in f:
+                if linie.startswith("VmRSS:"):
+                    return float(linie.split()[1])
+    except OSError:
+        pass
+    return 0.0
+
+def porneste_o_data(timeout_s: float = 60.0) -> Tuple[float, float, float]:
+    """
+    Pornește `python main.py` pe un port liber și măsoară, de la lansarea
+    procesului, timpul până la primul /health reușit și până la primul
+    răspuns /calculate/all (cerut imediat după /health). Returnează și
+    memoria rezidentă a serverului la momentul /health [KiB].
+    """
+    port = _port_liber()
+    director = os.path.dirname(os.path.abspath(__file__))
+    corp = json.dumps(VEHICUL_REFERINTA).encode("utf-8")
+    t0 = time.perf_counter()
+    proces = subprocess.Popen([sys.executable, "main.py"], cwd=director,
+                              env=dict(os.environ, USV_PORT=str(port)),
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while True:
+            if proces.poll() is not None:
+                raise RuntimeError(f"Serverul s-a oprit la pornire (cod {proces.returncode})")
+            if time.perf_counter() - t0 > timeout_s:
+                raise RuntimeError("Serverul nu a pornit în timpul alocat")
+            try:
+                if _cerere_http(port, "GET", "/health") == 200:
+                    break
+            except OSError:
+                time.sleep(0.005)
+        sanatos = time.perf_counter() - t0
+        memorie = _memorie_proces_kb(proces.pid)
+        status = _cerere_http(port, "POST", "/calculate/all", corp)
+        if status != 200:
+            raise RuntimeError(f"POST /calculate/all → {status}")
+        primul_calcul = time.perf_counter() - t0
+    finally:
+        proces.terminate()
+        proces.wait(10)
+    return sanatos, primul_calcul, memorie
+
+def masoara_pornirea(repetari: int) -> Dict[str, Dict[str, Any]]:
+    sanatos, primul_calcul, memorie = [], [], []
+    for _ in range(repetari):
+        s, c, m = porneste_o_data()
+        sanatos.append(s)
+        primul_calcul.append(c)
+        memorie.append(m)
+    return {
+        "pornire/sanatos": statistici(sanatos, max(memorie)),
+        "pornire/primul_calcul": statistici(primul_calcul, max(memorie))
+    }
+
+def _afiseaza_rezultat(nume: str, r: Dict[str, Any], afiseaza: Callable[[str], None]) -> None:
+    afiseaza(f"{nume:<50} p50 {r['p50_ms']:>10.3f} ms  p99 {r['p99_ms']:>10.3f} ms  "
+             f"{r['debit_ops_s']:>10.1f} op/s  {r['memorie_maxima_kb']:>10.1f} KiB")
+
+def ruleaza(filtru: Optional[str] = None, timp_min_s: float = 0.5, iteratii_min: int = 5,
+            http: bool = True, pornire: int = 0,
+            afiseaza: Callable[[str], None] = print) -> Dict[str, Any]:
+    cazuri = cazuri_calcul() + (cazuri_http() if http else [])
+    if filtru:
+        cazuri = [c for c in cazuri if filtru in c.nume]
+
+    rezultate: Dict[str, Any] = {}
+    if pornire:
+        # Înaintea cazurilor în proces, pe o mașină încă nesolicitată
+        for nume, r in masoara_pornirea(pornire).items():
+            if not filtru or filtru in nume:
+                rezultate[nume] = r
+                _afiseaza_rezultat(nume, r, afiseaza)
+    for caz in cazuri:
+        rezultate[caz.nume] = masoara(caz, timp_min_s, iteratii_min)
+        _afiseaza_rezultat(caz.nume, rezultate[caz.nume], afiseaza)
+
+    return {
+        "meta": {
+            "data": datetime.now().isoformat(timespec="seconds"),
+            "versiune_calcul": VERSIUNE_CALCUL,
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platforma": platform.platform(),
+            "procesor": platform.processor() or platform.machine(),
+            "executie": os.environ.get("USV_EXECUTIE", "thread")
+        },
+        "cazuri": rezultate
+    }
+
+def compara(baza: Dict[str, Any], curent: Dict[str, Any], prag: float = 0.25,
+            prag_memorie: float = 0.5, metrica: str = "p50_ms") -> List[Dict[str, Any]]:
+    """
+    Compară rezultatele cu baza de referință, caz cu caz.
+
+    Un caz regresează dacă metrica de timp crește cu mai mult de `prag`
+    (fracție, 0.25 = +25%) sau memoria maximă cu mai mult de `prag_memorie`.
+    """
+    comparatii = []
+    for nume, nou in curent["cazuri"].items():
+        vechi = baza.get("cazuri", {}).get(nume)
+        if vechi is None:
+            continue
+        raport_timp = nou[metrica] / vechi[metrica] if vechi[metrica] > 0 else 1.0
+        raport_memorie = (nou["memorie_maxima_kb"] / vechi["memorie_maxima_kb"]
+                          if vechi["memorie_maxima_kb"] > 0 else 1.0)
+        comparatii.append({
+            "caz": nume,
+            "baza": vechi[metrica],
+            "curent": nou[metrica],
+            "raport_timp": round(raport_timp, 3),
+            "raport_memorie": round(raport_memorie, 3),
+            "regresie": raport_timp > 1 + prag or raport_memorie > 1 + prag_memorie
+        })
+    return comparatii
+
+def scrie_json(cale: str, date: Dict[str, Any]) -> None:
+    with open(cale, "w", encoding="utf-8") as f:
+        json.dump(date, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+
+def actualizeaza_baza(cale: str, curent: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Scrie rezultatele rulării în baza de referință, peste cea existentă: o
+    rulare parțială (--filtru, --fara-http) înlocuiește doar cazurile rulate,
+    restul își păstrează valorile. `meta` este cel al ultimei rulări.
+    """
+    cazuri: Dict[str, Any] = {}
+    if os.path.exists(cale):
+        with open(cale, encoding="utf-8") as f:
+            cazuri = json.load(f).get("cazuri", {})
+    cazuri.update(curent["cazuri"])
+    baza = {"meta": curent["meta"], "cazuri": dict(sorted(cazuri.items()))}
+    scrie_json(cale, baza)
+    return baza
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark calcule și endpoint-uri")
+    parser.add_argument("--filtru", help="Rulează doar cazurile care conțin textul dat")
+    parser.add_argument("--timp-min", type=float, default=0.5, help="Durata minimă per caz [s]")
+    parser.add_argument("--iteratii-min", type=int, default=5, help="Numărul minim de iterații per caz")
+    parser.add_argument("--fara-http", action="store_true", help="Doar pachetul calculations")
+    parser.add_argument("--salveaza", nargs="?", const=BAZA_IMPLICITA, help="Salvează rezultatele ca bază")
+    parser.add_argument("--compara", nargs="?", const=BAZA_IMPLICITA, help="Compară cu baza dată")
+    parser.add_argument("--prag", type=float, default=0.25, help="Regresie de timp admisă (0.25 = +25%%)")
+    parser.add_argument("--prag-memorie", type=float, default=0.5, help="Regresie de memorie admisă")
+    parser.add_argument("--metrica", default="p50_ms", choices=["p50_ms", "p90_ms", "p99_ms", "medie_ms"])
+    parser.add_argument("--pornire", type=int, default=0, metavar="N",
+                        help="Măsoară și pornirea la rece a serverului, de N ori")
+    parser.add_argument("--iesire", help="Scrie rezultatele JSON în fișierul dat")
+    args = parser.parse_args(argv)
+    if args.salveaza and args.compara and os.path.abspath(args.salveaza) == os.path.abspath(args.compara):
+        parser.error(f"--salveaza și --compara folosesc același fișier ({args.compara}); "
+                     "rularea ar fi comparată cu ea însăși")
+
+    curent = ruleaza(args.filtru, args.timp_min, args.iteratii_min, http=not args.fara_http,
+                     pornire=args.pornire)
+
+    if args.iesire:
+        scrie_json(args.iesire, curent)
+        print(f"Rezultate salvate în {args.iesire}")
+    if args.salveaza:
+        baza = actualizeaza_baza(args.salveaza, curent)
+        print(f"Baza {args.salveaza}: {len(curent['cazuri'])} cazuri actualizate, "
+              f"{len(baza['cazuri'])} în total")
+
+    if args.compara:
+        with open(args.compara, encoding="utf-8") as f:
+            baza = json.load(f)
+        comparatii = compara(baza, curent, args.prag, args.prag_memorie, args.metrica)
+        print(f"\nComparare cu {args.compara} ({args.metrica}, prag +{args.prag:.0%}, "
+              f"memorie +{args.prag_memorie:.0%}):")
+        for c in comparatii:
+            marcaj = "REGRESIE" if c["regresie"] else "ok"
+            print(f"{c['caz']:<50} {c['baza']:>10.3f} → {c['curent']:>10.3f} ms  "
+                  f"×{c['raport_timp']:<6} mem ×{c['raport_memorie']:<6} {marcaj}")
+        regresii = [c for c in comparatii if c["regresie"]]
+        if regresii:
+            print(f"\n{len(regresii)} regresii peste prag")
+            return 1
+        print("\nFără regresii")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
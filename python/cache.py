@@ -0,0 +1,437 @@
+"""
+Cache de rezultate adresat prin conținut
+Rezultatele serializate (JSON) sunt păstrate per capitol, cu evacuare LRU
+în limita unui buget de memorie.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: fără cache partajat (mod cu un singur proces server)
+    fcntl = None
+
+from calculations import __version__ as VERSIUNE_CALCUL
+
+# Costul aproximativ al unei intrări în afara conținutului (cheie, noduri) [bytes]
+COST_INTRARE = 200
+
+class CacheRezultate:
+    """
+    Cache LRU cu buget de memorie pentru rezultate deja serializate.
+
+    Valorile sunt bytes (corpul JSON), astfel încât un hit nu mai necesită
+    nici calcul, nici serializare. Accesul este protejat de un lock.
+    """
+
+    def __init__(self, capacitate_bytes: int):
+        self.capacitate_bytes = capacitate_bytes
+        self._intrari: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.ocupat_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evacuari = 0
+        self.raspunsuri_304 = 0
+
+    def get(self, cheie: str) -> Optional[bytes]:
+        with self._lock:
+            valoare = self._intrari.get(cheie)
+            if valoare is None:
+                self.misses += 1
+                return None
+            self._intrari.move_to_end(cheie)
+            self.hits += 1
+            return valoare
+
+    def put(self, cheie: str, valoare: bytes) -> None:
+        cost = len(valoare) + COST_INTRARE
+        if cost > self.capacitate_bytes:
+            return  # Nu încape niciodată; nu evacuăm tot cache-ul pentru ea
+        with self._lock:
+            vechi = self._intrari.pop(cheie, None)
+            if vechi is not None:
+                self.ocupat_bytes -= len(vechi) + COST_INTRARE
+            self._intrari[cheie] = valoare
+            self.ocupat_bytes += cost
+            while self.ocupat_bytes > self.capacitate_bytes:
+                _, evacuat = self._intrari.popitem(last=False)
+                self.ocupat_bytes -= len(evacuat) + COST_INTRARE
+                self.evacuari += 1
+
+    def inregistreaza_304(self) -> None:
+        with self._lock:
+            self.raspunsuri_304 += 1
+
+    def goleste(self) -> None:
+        with self._lock:
+            self._intrari.clear()
+            self.ocupat_bytes = 0
+
+    def statistici(self) -> Dict[str, Any]:
+        with self._lock:
+            cereri = self.hits + self.misses
+            return {
+                "intrari": len(self._intrari),
+                "ocupat_bytes": self.ocupat_bytes,
+                "capacitate_bytes": self.capacitate_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evacuari": self.evacuari,
+                "raspunsuri_304": self.raspunsuri_304,
+                "rata_hit": round(self.hits / cereri, 4) if cereri else 0.0
+            }
+
+# ============== Cache partajat între procese ==============
+
+# Fișierul cache-ului partajat (little-endian):
+#
+#   antet (4096 B): MAGIC | versiune u32 | sloturi u32 | workeri u32 | rezervat u32 |
+#                   capacitate_date u64 | cap u64 | coada u64 | intrari u64 | evacuari u64 |
+#                   hits, misses, 304 ale workerilor opriți (u64 × 3),
+#                   apoi la offset 256 câte un slot per worker: pid | hits | misses | 304 (u64 × 4)
+#   index (sloturi × 32 B): cheie (16 B, blake2b) | offset u64 | lungime u32 | ocupat u32
+#   date (capacitate_date B): jurnal circular de înregistrări
+#                   cheie (16 B) | lungime u32 | marcaj u32 | corp (completat la multiplu de 8)
+#
+# `cap` și `coada` sunt offset-uri logice (cresc monoton; poziția fizică este
+# offset % capacitate_date). Înregistrările vii sunt în [coada, cap).
+MAGIC_PARTAJAT = b"USVP"
+VERSIUNE_PARTAJAT = 1
+ANTET_PARTAJAT = struct.Struct("<4sIIIIQQQQQQQQ")
+OFFSET_WORKERI = 256
+WORKER = struct.Struct("<QQQQ")
+WORKERI_MAX = 60
+DIMENSIUNE_ANTET = 4096
+SLOT = struct.Struct("<16sQII")
+INREGISTRARE = struct.Struct("<16sII")
+
+# Marcajul de sfârșit de regiune: înregistrarea următoare începe de la poziția 0
+MARCAJ_SALT = 1
+
+# Gradul maxim de ocupare a indexului; peste el se evacuează cele mai vechi intrări
+OCUPARE_INDEX = 0.75
+
+# Dimensiunea medie presupusă a unei intrări, pentru dimensionarea indexului [bytes]
+INTRARE_MEDIE = 2048
+
+def _aliniat(n: int) -> int:
+    return (n + 7) & ~7
+
+def cale_cache_partajat() -> str:
+    """Fișier nou pentru cache-ul partajat: în /dev/shm (tmpfs) dacă există, altfel în directorul temporar."""
+    director = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(director, f"usv-cache-{os.getpid()}.bin")
+
+class CacheRezultatePartajat:
+    """
+    Cache de rezultate partajat de mai multe procese server (USV_WORKERI_HTTP),
+    într-un fișier mapat în memorie: un rezultat calculat într-un proces este
+    servit de toate. Aceeași interfață ca CacheRezultate.
+
+    Corpurile sunt scrise într-un jurnal circular, iar un index cu adresare
+    deschisă (sondare liniară, ștergere prin deplasare înapoi) le găsește
+    după cheie. Evacuarea pornește de la coada jurnalului: intrările cele mai
+    vechi sunt scoase din index înainte ca spațiul lor să fie suprascris.
+    Evacuarea aproximează LRU: un hit pe o intrare din jumătatea mai veche a
+    jurnalului o rescrie la cap (lock exclusiv, o copiere), deci o intrare
+    folosită nu este evacuată înaintea celor nefolosite de când ea a fost
+    scrisă; ordinea între intrările aceleiași jumătăți rămâne cea a scrierii.
+    Hit-urile pe intrările recente nu scriu nimic în zona comună.
+
+    Citirile țin un lock partajat (flock LOCK_SH), scrierile și evacuarea un
+    lock exclusiv; firele aceluiași proces sunt serializate de un lock local.
+    Contoarele de hits/misses sunt per proces, în slotul propriu din antet
+    (un singur scriitor), iar statisticile globale sunt suma lor.
+    """
+
+    def __init__(self, cale: str):
+        if fcntl is None:
+            raise RuntimeError("Cache-ul partajat necesită fcntl (Linux, macOS)")
+        self.cale = cale
+        self._fisier = open(cale, "r+b")
+        self._mm = mmap.mmap(self._fisier.fileno(), 0)
+        self._lock = threading.Lock()
+        antet = ANTET_PARTAJAT.unpack_from(self._mm, 0)
+        if antet[0] != MAGIC_PARTAJAT or antet[1] != VERSIUNE_PARTAJAT:
+            raise ValueError(f"Fișier de cache partajat invalid: {cale}")
+        self.sloturi = antet[2]
+        self._masca = self.sloturi - 1
+        self.capacitate_bytes = antet[5]
+        self._date = DIMENSIUNE_ANTET + self.sloturi * SLOT.size
+        self._intrari_max = int(self.sloturi * OCUPARE_INDEX)
+        self.pid = os.getpid()
+        with self._exclusiv():
+            self._worker = self._inregistreaza_worker()
+
+    @classmethod
+    def creeaza(cls, cale: str, capacitate_bytes: int) -> None:
+        """Creează fișierul (gol) pentru bugetul dat; apelat de procesul principal, înaintea workerilor."""
+        capacitate = _aliniat(max(capacitate_bytes, 64 * 1024))
+        sloturi = 1 << max(10, (capacitate // INTRARE_MEDIE - 1).bit_length())
+        with open(cale, "wb") as f:
+            f.truncate(DIMENSIUNE_ANTET + sloturi * SLOT.size + capacitate)
+            f.write(ANTET_PARTAJAT.pack(MAGIC_PARTAJAT, VERSIUNE_PARTAJAT, sloturi, WORKERI_MAX, 0,
+                                        capacitate, 0, 0, 0, 0, 0, 0, 0))
+
+    # ---- Lock-uri și antet ----
+
+    @contextmanager
+    def _exclusiv(self) -> Iterator[None]:
+        with self._lock:
+            fcntl.flock(self._fisier.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fisier.fileno(), fcntl.LOCK_UN)
+
+    @contextmanager
+    def _partajat(self) -> Iterator[None]:
+        with self._lock:
+            fcntl.flock(self._fisier.fileno(), fcntl.LOCK_SH)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._fisier.fileno(), fcntl.LOCK_UN)
+
+    def _antet(self) -> List[Any]:
+        return list(ANTET_PARTAJAT.unpack_from(self._mm, 0))
+
+    def _scrie_antet(self, antet: List[Any]) -> None:
+        ANTET_PARTAJAT.pack_into(self._mm, 0, *antet)
+
+    def _inregistreaza_worker(self) -> int:
+        """Slotul de contoare al procesului; preia slotul unui proces oprit (contoarele lui trec în total)."""
+        liber = None
+        for w in range(WORKERI_MAX):
+            pid = WORKER.unpack_from(self._mm, OFFSET_WORKERI + w * WORKER.size)[0]
+            if pid == self.pid:
+                return w
+            if liber is None and (pid == 0 or not _proces_activ(pid)):
+                liber = w
+        if liber is None:
+            raise RuntimeError(f"Cache partajat: cel mult {WORKERI_MAX} procese")
+        self._retrage_worker(liber)
+        WORKER.pack_into(self._mm, OFFSET_WORKERI + liber * WORKER.size, self.pid, 0, 0, 0)
+        return liber
+
+    def _retrage_worker(self, w: int) -> None:
+        _, hits, misses, r304 = WORKER.unpack_from(self._mm, OFFSET_WORKERI + w * WORKER.size)
+        antet = self._antet()
+        antet[10] += hits
+        antet[11] += misses
+        antet[12] += r304
+        self._scrie_antet(antet)
+        WORKER.pack_into(self._mm, OFFSET_WORKERI + w * WORKER.size, 0, 0, 0, 0)
+
+    def _numara(self, camp: int) -> None:
+        """Incrementează un contor al procesului (1 hits, 2 misses, 3 304); apelat sub self._lock."""
+        offset = OFFSET_WORKERI + self._worker * WORKER.size
+        valori = list(WORKER.unpack_from(self._mm, offset))
+        valori[camp] += 1
+        WORKER.pack_into(self._mm, offset, *valori)
+
+    # ---- Index ----
+
+    @staticmethod
+    def _hash(cheie: str) -> bytes:
+        return hashlib.blake2b(cheie.encode("utf-8"), digest_size=16).digest()
+
+    def _acasa(self, h: bytes) -> int:
+        return int.from_bytes(h[:8], "little") & self._masca
+
+    def _cauta(self, h: bytes) -> Optional[int]:
+        """Slotul cheii h sau None; sondare liniară până la primul slot liber."""
+        i = self._acasa(h)
+        for _ in range(self.sloturi):
+            cheie, _, _, ocupat = SLOT.unpack_from(self._mm, DIMENSIUNE_ANTET + i * SLOT.size)
+            if not ocupat:
+                return None
+            if cheie == h:
+                return i
+            i = (i + 1) & self._masca
+        return None
+
+    def _sterge_slot(self, i: int) -> None:
+        """Ștergere prin deplasare înapoi: lanțurile de sondare rămân continue, fără marcaje de ștergere."""
+        j = i
+        while True:
+            j = (j + 1) & self._masca
+            slot = SLOT.unpack_from(self._mm, DIMENSIUNE_ANTET + j * SLOT.size)
+            if not slot[3]:
+                break
+            k = self._acasa(slot[0])
+            # Slotul j poate fi mutat în i doar dacă poziția lui de bază nu este în (i, j]
+            if (i < k <= j) if i <= j else (k > i or k <= j):
+                continue
+            SLOT.pack_into(self._mm, DIMENSIUNE_ANTET + i * SLOT.size, *slot)
+            i = j
+        SLOT.pack_into(self._mm, DIMENSIUNE_ANTET + i * SLOT.size, b"\0" * 16, 0, 0, 0)
+
+    def _evacueaza(self, antet: List[Any]) -> None:
+        """Avansează coada peste cea mai veche înregistrare, scoțând-o din index dacă este încă vie."""
+        C, coada = self.capacitate_bytes, antet[7]
+        poz = coada % C
+        if C - poz < INREGISTRARE.size:
+            antet[7] += C - poz
+            return
+        h, lungime, marcaj = INREGISTRARE.unpack_from(self._mm, self._date + poz)
+        if marcaj == MARCAJ_SALT:
+            antet[7] += C - poz
+            return
+        i = self._cauta(h)
+        if i is not None and SLOT.unpack_from(self._mm, DIMENSIUNE_ANTET + i * SLOT.size)[1] == coada:
+            self._sterge_slot(i)
+            antet[8] -= 1
+            antet[9] += 1
+        antet[7] += INREGISTRARE.size + _aliniat(lungime)
+
+    # ---- Interfața CacheRezultate ----
+
+    def get(self, cheie: str) -> Optional[bytes]:
+        h = self._hash(cheie)
+        with self._partajat():
+            i = self._cauta(h)
+            if i is None:
+                self._numara(2)
+                return None
+            _, offset, lungime, _ = SLOT.unpack_from(self._mm, DIMENSIUNE_ANTET + i * SLOT.size)
+            inceput = self._date + offset % self.capacitate_bytes + INREGISTRARE.size
+            valoare = self._mm[inceput:inceput + lungime]
+            self._numara(1)
+            antet = self._antet()
+            # Intrare în jumătatea mai veche a jurnalului: o mutăm la cap
+            promoveaza = 2 * (antet[6] - offset) > antet[6] - antet[7]
+        if promoveaza:
+            self._scrie(h, valoare)
+        return valoare
+
+    def put(self, cheie: str, valoare: bytes) -> None:
+        if INREGISTRARE.size + _aliniat(len(valoare)) > self.capacitate_bytes:
+            return  # Nu încape niciodată; nu evacuăm tot cache-ul pentru ea
+        self._scrie(self._hash(cheie), valoare)
+
+    def _scrie(self, h: bytes, valoare: bytes) -> None:
+        """Adaugă înregistrarea la capul jurnalului, înlocuind-o pe cea veche a cheii h."""
+        C = self.capacitate_bytes
+        marime = INREGISTRARE.size + _aliniat(len(valoare))
+        with self._exclusiv():
+            antet = self._antet()
+            i = self._cauta(h)
+            if i is not None:
+                # Vechea înregistrare rămâne moartă în jurnal până la evacuare
+                self._sterge_slot(i)
+                antet[8] -= 1
+
+            # Înregistrarea nu se rupe la capătul regiunii: o începem de la poziția 0
+            cap = antet[6]
+            poz = cap % C
+            cap_nou = cap + (C - poz if poz + marime > C else 0)
+            while antet[7] < cap and (cap_nou + marime - antet[7] > C or antet[8] >= self._intrari_max):
+                self._evacueaza(antet)
+            if cap_nou != cap:
+                if C - poz >= INREGISTRARE.size:
+                    INREGISTRARE.pack_into(self._mm, self._date + poz, b"\0" * 16, 0, MARCAJ_SALT)
+                if antet[7] == cap:
+                    antet[7] = cap_nou
+
+            inceput = self._date + cap_nou % C
+            INREGISTRARE.pack_into(self._mm, inceput, h, len(valoare), 0)
+            self._mm[inceput + INREGISTRARE.size:inceput + INREGISTRARE.size + len(valoare)] = valoare
+            j = self._acasa(h)
+            while SLOT.unpack_from(self._mm, DIMENSIUNE_ANTET + j * SLOT.size)[3]:
+                j = (j + 1) & self._masca
+            SLOT.pack_into(self._mm, DIMENSIUNE_ANTET + j * SLOT.size, h, cap_nou, len(valoare), 1)
+            antet[6] = cap_nou + marime
+            antet[8] += 1
+            self._scrie_antet(antet)
+
+    def inregistreaza_304(self) -> None:
+        with self._lock:
+            self._numara(3)
+
+    def goleste(self) -> None:
+        with self._exclusiv():
+            self._mm[DIMENSIUNE_ANTET:self._date] = bytes(self._date - DIMENSIUNE_ANTET)
+            antet = self._antet()
+            antet[6] = antet[7] = antet[8] = 0
+            self._scrie_antet(antet)
+
+    def statistici(self) -> Dict[str, Any]:
+        with self._partajat():
+            antet = self._antet()
+            workeri = [WORKER.unpack_from(self._mm, OFFSET_WORKERI + w * WORKER.size) for w in range(WORKERI_MAX)]
+        workeri = [w for w in workeri if w[0]]
+        hits = antet[10] + sum(w[1] for w in workeri)
+        misses = antet[11] + sum(w[2] for w in workeri)
+
+        def rata(h: int, m: int) -> float:
+            return round(h / (h + m), 4) if h + m else 0.0
+
+        return {
+            "intrari": antet[8],
+            "ocupat_bytes": antet[6] - antet[7],
+            "capacitate_bytes": self.capacitate_bytes,
+            "hits": hits,
+            "misses": misses,
+            "evacuari": antet[9],
+            "raspunsuri_304": antet[12] + sum(w[3] for w in workeri),
+            "rata_hit": rata(hits, misses),
+            "partajat": True,
+            "pid": self.pid,
+            "workeri": [
+                {"pid": pid, "hits": h, "misses": m, "raspunsuri_304": r304, "rata_hit": rata(h, m)}
+                for pid, h, m, r304 in workeri
+            ],
+        }
+
+    def inchide(self) -> None:
+        """Trece contoarele procesului în total și eliberează slotul (la oprirea workerului)."""
+        with self._exclusiv():
+            self._retrage_worker(self._worker)
+        self._mm.close()
+        self._fisier.close()
+
+def _proces_activ(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def amprenta_vehicul(vehicle: Any) -> str:
+    """
+    Hash canonic al modelului validat (fără `nume`, care nu intră în calcule),
+    legat de versiunea modulelor de calcul.
+    """
+    date = vehicle.model_dump(exclude={"nume"})
+    canonic = json.dumps(date, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{VERSIUNE_CALCUL}|{canonic}".encode("utf-8")).hexdigest()
+
+def cheie_capitol(amprenta: str, capitol: str, parametri: Optional[Dict[str, Any]] = None) -> str:
+    """Cheia unei intrări: vehicul + capitol + parametrii cererii."""
+    extra = json.dumps(parametri or {}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{amprenta}|{capitol}|{extra}".encode("utf-8")).hexdigest()[:32]
+
+def etag_potrivit(if_none_match: Optional[str], etag: str) -> bool:
+    """Verifică antetul If-None-Match (listă de ETag-uri, `*`, prefix W/)."""
+    if not if_none_match:
+        return False
+    for valoare in if_none_match.split(","):
+        valoare = valoare.strip()
+        if valoare.startswith("W/"):
+            valoare = valoare[2:]
+        if valoare == "*" or valoare == etag:
+            return True
+    return False
@@ -1 +1,2 @@
 # USV Diploma Calculator - Calculation Modules
+__version__ = "1.1.4"
@@ -4,11 +4,14 @@ Conform: Frățilă, Mărculeșcu - "Sistemele de frânare ale autovehiculelor"
 """
 
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
+
+from .esantionare import reduce_serii
+from .vehicule import ContextVehicul, in_liste
 
 G = 9.81
 
-def calculate_braking(vehicle: Any) -> Dict[str, Any]:
+def calculate_braking(vehicle: Any, max_puncte: Optional[int] = None) -> Dict[str, Any]:
     """
     Calculează performanțele de frânare ale automobilului.
 
@@ -16,19 +19,35 @@ def calculate_braking(vehicle: Any) -> Dict[str, Any]:
     - Decelerația maximă
     - Distanța și timpul de frânare
     - Repartizarea forțelor de frânare
+
+    max_puncte limitează numărul de puncte al caracteristicilor de frânare
+    (LTTB); None = rezoluția completă.
+    """
+    return in_liste(calculate_braking_ctx(ContextVehicul([vehicle]), max_puncte)[0])
+
+def calculate_braking_batch(vehicles: Sequence[Any], max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
     """
+    Performanțele de frânare pentru un lot de vehicule.
+
+    Mărimile dependente de vehicul sunt vectori (V, 1); caracteristicile
+    distanță/timp depind doar de aderență și viteză și se calculează o dată.
+    """
+    return in_liste(calculate_braking_ctx(ContextVehicul(vehicles), max_puncte))
+
+def calculate_braking_ctx(ctx: ContextVehicul, max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Calculează frânarea pentru vehiculele unui context."""
 
     # Parametri vehicul
-    m = vehicle.masa.masaTotala  # [kg]
-    greutate = m * G  # [N]
+    m = ctx.m  # [kg]
+    greutate = ctx.greutate  # [N]
 
     # Repartizare masă
-    repartizare_fata = vehicle.masa.repartizareFata / 100
-    repartizare_spate = vehicle.masa.repartizareSpate / 100
+    repartizare_fata = ctx.repartizare_fata
+    repartizare_spate = ctx.repartizare_spate
 
     # Coordonate centru masă
-    L = vehicle.dimensiuni.ampatament / 1000  # Ampatament [m]
-    h_g = vehicle.masa.inaltimeCentruMasa / 1000  # Înălțime centru masă [m]
+    L = ctx.L  # Ampatament [m]
+    h_g = ctx.h_g  # Înălțime centru masă [m]
 
     # Distanțe de la centrul de masă la punți
     L1 = L * repartizare_spate  # Distanța până la puntea față [m]
@@ -79,8 +98,8 @@ def calculate_braking(vehicle: Any) -> Dict[str, Any]:
         rezultate_aderenta[nume] = {
             "coef_aderenta": phi,
             "deceleratie_m_s2": round(a_fr, 2),
-            "distante_m": np.round(distante, 2).tolist(),
-            "timpi_s": np.round(timpi, 2).tolist()
+            "distante_m": np.round(distante, 2),
+            "timpi_s": np.round(timpi, 2)
         }
 
     # Valori la 100 km/h (benchmark standard)
@@ -94,44 +113,186 @@ def calculate_braking(vehicle: Any) -> Dict[str, Any]:
     # Puterea medie de frânare
     P_fr_med = E_cin / t_100 / 1000  # [kW]
 
-    return {
-        "parametri_vehicul": {
-            "masa_kg": m,
-            "ampatament_m": round(L, 3),
-            "inaltime_centru_masa_m": round(h_g, 3),
-            "distanta_L1_m": round(L1, 3),
-            "distanta_L2_m": round(L2, 3)
-        },
-        "deceleratie_maxima": {
-            "formula": "a_fr = φ · g",
-            "valoare_m_s2": round(a_fr_max, 2),
-            "valoare_g": round(a_fr_max / G, 2),
-            "coef_aderenta_uscat": phi_uscat
-        },
-        "repartizare_franare": {
-            "formula": "F_f/F_s = (L2 + h_g·φ) / (L1 - h_g·φ)",
-            "raport_ideal": round(raport_ideal, 3),
-            "forta_fata_N": round(F_f_max, 2),
-            "forta_spate_N": round(F_s_max, 2),
-            "procent_fata": round(procent_fata, 1),
-            "procent_spate": round(100 - procent_fata, 1),
-            "forta_normala_fata_N": round(N_f, 2),
-            "forta_normala_spate_N": round(N_s, 2)
-        },
-        "franare_100_kmh": {
-            "distanta_m": round(s_100, 2),
-            "timp_s": round(t_100, 2),
-            "energie_cinetica_kJ": round(E_cin / 1000, 2),
-            "putere_medie_kW": round(P_fr_med, 2)
-        },
-        "caracteristici_franare": {
-            "viteze_kmh": viteze_kmh.tolist(),
-            "conditii": rezultate_aderenta
-        },
-        "formule": {
-            "distanta": "s_fr = v² / (2 · a_fr)",
-            "timp": "t_fr = v / a_fr",
-            "forta_normala_fata": "N_f = G·(L2 + h_g·a/g) / L",
-            "forta_normala_spate": "N_s = G·(L1 - h_g·a/g) / L"
-        }
+    # Caracteristicile tuturor condițiilor împart axa de viteze: reducere comună
+    conditii = list(rezultate_aderenta.values())
+    lista_viteze, serii = reduce_serii(
+        viteze_kmh, [c[k] for c in conditii for k in ("distante_m", "timpi_s")], max_puncte
+    )
+    for c, distante, timpi in zip(conditii, serii[0::2], serii[1::2]):
+        c["distante_m"], c["timpi_s"] = distante, timpi
+
+    rezultate = []
+    for j, vehicle in enumerate(ctx.vehicule):
+        rezultate.append({
+            "parametri_vehicul": {
+                "masa_kg": vehicle.masa.masaTotala,
+                "ampatament_m": round(float(L[j, 0]), 3),
+                "inaltime_centru_masa_m": round(float(h_g[j, 0]), 3),
+                "distanta_L1_m": round(float(L1[j, 0]), 3),
+                "distanta_L2_m": round(float(L2[j, 0]), 3)
+            },
+            "deceleratie_maxima": {
+                "formula": "a_fr = φ · g",
+                "valoare_m_s2": round(a_fr_max, 2),
+                "valoare_g": round(a_fr_max / G, 2),
+                "coef_aderenta_uscat": phi_uscat
+            },
+            "repartizare_franare": {
+                "formula": "F_f/F_s = (L2 + h_g·φ) / (L1 - h_g·φ)",
+                "raport_ideal": round(float(raport_ideal[j, 0]), 3),
+                "forta_fata_N": round(float(F_f_max[j, 0]), 2),
+                "forta_spate_N": round(float(F_s_max[j, 0]), 2),
+                "procent_fata": round(float(procent_fata[j, 0]), 1),
+                "procent_spate": round(100 - float(procent_fata[j, 0]), 1),
+                "forta_normala_fata_N": round(float(N_f[j, 0]), 2),
+                "forta_normala_spate_N": round(float(N_s[j, 0]), 2)
+            },
+            "franare_100_kmh": {
+                "distanta_m": round(s_100, 2),
+                "timp_s": round(t_100, 2),
+                "energie_cinetica_kJ": round(float(E_cin[j, 0]) / 1000, 2),
+                "putere_medie_kW": round(float(P_fr_med[j, 0]), 2)
+            },
+            "caracteristici_franare": {
+                "viteze_kmh": lista_viteze,
+                "conditii": rezultate_aderenta
+            },
+            "formule": {
+                "distanta": "s_fr = v² / (2 · a_fr)",
+                "timp": "t_fr = v / a_fr",
+                "forta_normala_fata": "N_f = G·(L2 + h_g·a/g) / L",
+                "forta_normala_spate": "N_s = G·(L1 - h_g·a/g) / L"
+            }
+        })
+
+    return rezultate
+
+# ============== Grilă de frânare ==============
+
+# Ordinea axelor în tabelele dense ale grilei
+AXE_GRILA = ("aderenta", "viteza_kmh", "panta_procente", "timp_reactie_s", "stare_incarcare")
+
+def grila_franare(vehicle: Any, aderente: Sequence[float], viteze_kmh: Sequence[float],
+                  pante_procente: Sequence[float] = (0.0,), timpi_reactie_s: Sequence[float] = (1.0,),
+                  stari_incarcare: Sequence[float] = (1.0,)) -> Dict[str, Any]:
+    """Grila de frânare pentru un singur vehicul (vezi `grila_franare_ctx`)."""
+    return in_liste(grila_franare_ctx(
+        ContextVehicul([vehicle]), aderente, viteze_kmh, pante_procente, timpi_reactie_s, stari_incarcare
+    )[0])
+
+def grila_franare_ctx(ctx: ContextVehicul, aderente: Sequence[float], viteze_kmh: Sequence[float],
+                      pante_procente: Sequence[float] = (0.0,), timpi_reactie_s: Sequence[float] = (1.0,),
+                      stari_incarcare: Sequence[float] = (1.0,)) -> List[Dict[str, Any]]:
+    """
+    Frânarea pe produsul cartezian aderență × viteză × pantă × timp de
+    reacție × stare de încărcare, calculat într-o singură operație
+    vectorizată (tablouri (V, A, S, P, R, Î), fără bucle Python).
+
+    - panta: în procente, pozitivă la urcare, negativă la coborâre;
+      decelerația este a = g·(φ·cos α + sin α)
+    - stare_incarcare: fracțiunea din sarcina utilă, 0 = gol, 1 = plin
+      (m = m_gol + λ·(m_total - m_gol)); poziția centrului de masă este
+      considerată aceeași pentru toate stările de încărcare
+    - timpul de reacție al conducătorului adaugă spațiul parcurs cu viteză
+      constantă: s_op = v·t_r + v² / (2·a)
+
+    Forțele pe punți corespund frânării la limita de aderență (repartiție
+    ideală): N_f = G·cos α·(L2 + φ·h_g) / L, N_s = G·cos α·(L1 - φ·h_g) / L.
+    Toate tabelele sunt dense, cu axele în ordinea AXE_GRILA; mărimile care
+    nu depind de o axă (ex. forțele față de viteză) sunt repetate pe ea.
+    """
+    phi = np.asarray(aderente, dtype=float)
+    v_kmh = np.asarray(viteze_kmh, dtype=float)
+    pante = np.asarray(pante_procente, dtype=float)
+    t_r = np.asarray(timpi_reactie_s, dtype=float)
+    lam = np.asarray(stari_incarcare, dtype=float)
+    forma = (len(phi), len(v_kmh), len(pante), len(t_r), len(lam))
+
+    def pe_axa(x: np.ndarray, axa: int) -> np.ndarray:
+        """Vectorul unei axe ca tablou (1, …, n, …, 1) pentru broadcast cu (V, A, S, P, R, Î)."""
+        dimensiuni = [1] * 6
+        dimensiuni[axa + 1] = -1
+        return x.reshape(dimensiuni)
+
+    def pe_vehicul(x: np.ndarray) -> np.ndarray:
+        return x.reshape(-1, 1, 1, 1, 1, 1)
+
+    phi_g = pe_axa(phi, 0)
+    v_ms = pe_axa(v_kmh, 1) / 3.6
+    alfa = np.arctan(pe_axa(pante, 2) / 100)
+    t_r_g = pe_axa(t_r, 3)
+    lam_g = pe_axa(lam, 4)
+
+    L = pe_vehicul(ctx.L)
+    h_g = pe_vehicul(ctx.h_g)
+    L1 = L * pe_vehicul(ctx.repartizare_spate)  # Centrul de masă → puntea față [m]
+    L2 = L * pe_vehicul(ctx.repartizare_fata)   # Centrul de masă → puntea spate [m]
+
+    # Puntea spate nu trebuie să se descarce complet la aderența maximă a grilei
+    descarcat = (L1[:, 0, 0, 0, 0, 0] - phi.max() * h_g[:, 0, 0, 0, 0, 0]) <= 0
+    if descarcat.any():
+        raise ValueError(
+            f"La φ = {phi.max():g} puntea spate se descarcă complet (L1 ≤ φ·h_g); "
+            "reduceți aderența maximă a grilei"
+        )
+
+    # Decelerația și frânarea propriu-zisă
+    a_fr = G * (phi_g * np.cos(alfa) + np.sin(alfa))  # [m/s²]
+    if (a_fr <= 0).any():
+        raise ValueError("Pe pantele de coborâre ale grilei vehiculul nu se poate opri (φ·cos α + sin α ≤ 0)")
+    s_fr = v_ms**2 / (2 * a_fr)
+    t_fr = v_ms / a_fr
+
+    # Oprirea, cu timpul de reacție
+    s_op = v_ms * t_r_g + s_fr
+    t_op = t_r_g + t_fr
+
+    # Forțele pe punți
+    masa = pe_vehicul(ctx.m_gol) + lam_g * (pe_vehicul(ctx.m) - pe_vehicul(ctx.m_gol))  # [kg]
+    G_cos = masa * G * np.cos(alfa)  # Componenta normală a greutății [N]
+    N_f = G_cos * (L2 + h_g * phi_g) / L
+    N_s = G_cos * (L1 - h_g * phi_g) / L
+    raport_ideal = (L2 + h_g * phi_g) / (L1 - h_g * phi_g)
+    procent_fata = (L2 + h_g * phi_g) / L * 100
+
+    tabele = {
+        "deceleratie_m_s2": np.round(a_fr, 2),
+        "distanta_franare_m": np.round(s_fr, 2),
+        "timp_franare_s": np.round(t_fr, 2),
+        "distanta_oprire_m": np.round(s_op, 2),
+        "timp_oprire_s": np.round(t_op, 2),
+        "forta_normala_fata_N": np.round(N_f, 2),
+        "forta_normala_spate_N": np.round(N_s, 2),
+        "forta_franare_fata_N": np.round(phi_g * N_f, 2),
+        "forta_franare_spate_N": np.round(phi_g * N_s, 2),
+        "raport_ideal": np.round(raport_ideal, 3),
+        "procent_fata": np.round(procent_fata, 1)
     }
+    masa_r = np.round(masa, 1)
+
+    rezultate = []
+    for j in range(ctx.n):
+        rezultat: Dict[str, Any] = {
+            "axe": {
+                "ordine": list(AXE_GRILA),
+                "aderenta": phi,
+                "viteza_kmh": v_kmh,
+                "panta_procente": pante,
+                "timp_reactie_s": t_r,
+                "stare_incarcare": lam
+            },
+            "masa_kg": masa_r[j].reshape(-1)
+        }
+        # Tabelele comune tuturor vehiculelor au prima dimensiune 1
+        for nume, x in tabele.items():
+            rezultat[nume] = np.broadcast_to(x[min(j, x.shape[0] - 1)], forma)
+        rezultat["formule"] = {
+            "deceleratie": "a_fr = g · (φ·cos α + sin α)",
+            "distanta_oprire": "s_op = v · t_r + v² / (2 · a_fr)",
+            "forta_normala_fata": "N_f = G·cos α·(L2 + φ·h_g) / L",
+            "forta_normala_spate": "N_s = G·cos α·(L1 - φ·h_g) / L",
+            "raport_ideal": "F_f/F_s = (L2 + h_g·φ) / (L1 - h_g·φ)"
+        }
+        rezultate.append(rezultat)
+
+    return rezultate
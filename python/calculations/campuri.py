@@ -0,0 +1,49 @@
+"""
+Câmpurile vehiculului care pot varia într-un studiu parametric
+Fără dependențe grele: este importat și la validarea cererilor, la pornire.
+"""
+
+# Câmpurile numerice din VehicleParams → (secțiune, proprietatea din context, divizor de unități)
+CAMPURI_CONTEXT = {
+    "masaTotala": ("masa", "m", 1),
+    "repartizareFata": ("masa", "repartizare_fata", 100),
+    "repartizareSpate": ("masa", "repartizare_spate", 100),
+    "inaltimeCentruMasa": ("masa", "h_g", 1000),
+    "ampatament": ("dimensiuni", "L", 1000),
+    "coefRulare": ("pneu", "f", 1),
+    "razaDinamica": ("pneu", "r_d", 1),
+    "coefAerodinamic": ("aerodinamic", "Cx", 1),
+    "arieFrontala": ("aerodinamic", "A", 1),
+    "putereMaxima": ("motor", "P_max", 1),
+    "turatiePutereMax": ("motor", "n_P", 1),
+    "turatieMaxima": ("motor", "n_max", 1),
+    "turatieRalanti": ("motor", "n_min", 1),
+    "raportPrincipal": ("transmisie", "i_0", 1),
+    "randamentTransmisie": ("transmisie", "eta_t", 1),
+}
+
+# Câmpurile de intrare ("secțiune.câmp") de care depinde rezultatul fiecărui
+# capitol; folosite de sesiunile interactive pentru a recalcula doar
+# capitolele afectate de o modificare. Câmpurile care nu apar nicăieri
+# (ex. nume, cilindree, dimensiunile de gabarit) nu declanșează recalcularea.
+_AER = ("aerodinamic.coefAerodinamic", "aerodinamic.arieFrontala")
+_MOTOR = ("motor.tip", "motor.putereMaxima", "motor.turatiePutereMax", "motor.turatieMaxima",
+          "motor.turatieRalanti", "motor.curbaCuplu")
+_TRANSMISIE = ("transmisie.raporturiCV", "transmisie.raportPrincipal", "transmisie.randamentTransmisie")
+
+DEPENDENTE_CAPITOLE = {
+    "rezistente": frozenset(("masa.masaTotala", "pneu.coefRulare") + _AER),
+    "tractiune": frozenset(("masa.masaTotala", "pneu.coefRulare", "pneu.razaDinamica", "motor.cuplMaxim")
+                           + _AER + _MOTOR + _TRANSMISIE),
+    "performante": frozenset(("masa.masaTotala", "pneu.coefRulare", "pneu.razaDinamica")
+                             + _AER + _MOTOR + _TRANSMISIE),
+    "franare": frozenset(("masa.masaTotala", "dimensiuni.ampatament", "masa.inaltimeCentruMasa",
+                          "masa.repartizareFata", "masa.repartizareSpate")),
+}
+
+# Parametrii condițiilor de frânare care pot fi tratați ca incerți (Monte
+# Carlo), cu valorile de referință din Cap. 5.3 și din grila de frânare
+PARAMETRI_SCENARIU = {
+    "aderenta": 0.8,
+    "timp_reactie_s": 1.0,
+}
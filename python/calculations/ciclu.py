@@ -0,0 +1,312 @@
+"""
+Consumul de energie și de combustibil pe cicluri de conducere
+Simulare cvasistatică (de la roată spre motor) a unei urme de viteză: treapta,
+punctul de funcționare al motorului și puterea de tracțiune sunt determinate
+pentru toate momentele, toate treptele și toate vehiculele dintr-o singură
+evaluare vectorizată, fără integrare pas cu pas.
+"""
+
+import csv
+import os
+import threading
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+from .esantionare import reduce_serii
+from .resistance import forte_rezistenta
+from .traction import forta_tractiune, turatie_motor
+from .vehicule import ContextVehicul, calcul_pe_grupe, in_liste
+
+# Ciclurile livrate cu aplicația; USV_CICLURI poate indica un director
+# suplimentar cu urme CSV proprii (aceleași coloane)
+DIRECTOR_CICLURI = os.path.join(os.path.dirname(__file__), "date_cicluri")
+
+# Combustibil: putere calorică inferioară [J/kg], densitate [kg/L], CO2 [kg/kg]
+COMBUSTIBILI = {
+    "benzina": {"putere_calorica": 43.0e6, "densitate": 0.745, "co2": 3.09},
+    "diesel": {"putere_calorica": 42.8e6, "densitate": 0.835, "co2": 3.16},
+}
+
+# Modelul Willans al consumului: P_comb = (P_e + P_frecare) / η_indicat,
+# presiunea medie de frecare după Heywood: p_mf = 0.97 + 0.15·(n/1000) + 0.05·(n/1000)² [bar]
+RANDAMENT_INDICAT = {"benzina": 0.36, "diesel": 0.42}
+
+# Turația minimă în mers (treaptă cuplată, ambreiaj închis), raportată la ralanti
+RAPORT_TURATIE_MERS = 1.25
+
+# Limita numărului de elemente vehicule × trepte × momente evaluate odată
+ELEMENTE_MAX_BLOC = 1_000_000
+
+class Ciclu:
+    """Urma de viteză (și, opțional, de pantă) a unui ciclu, eșantionată cu pas constant."""
+
+    def __init__(self, nume: str, viteze_kmh: Sequence[float], pas_s: float = 1.0,
+                 pante_procente: Optional[Sequence[float]] = None):
+        self.nume = nume
+        self.pas_s = float(pas_s)
+        self.viteze_ms = np.asarray(viteze_kmh, dtype=float) / 3.6
+        self.pante = (np.zeros_like(self.viteze_ms) if pante_procente is None
+                      else np.asarray(pante_procente, dtype=float))
+        if self.viteze_ms.ndim != 1 or len(self.viteze_ms) < 2:
+            raise ValueError(f"Ciclul {nume}: urma necesită cel puțin două puncte")
+        if self.pante.shape != self.viteze_ms.shape:
+            raise ValueError(f"Ciclul {nume}: urma de pantă are altă lungime decât urma de viteză")
+        if not np.isfinite(self.viteze_ms).all() or (self.viteze_ms < 0).any():
+            raise ValueError(f"Ciclul {nume}: vitezele trebuie să fie finite și nenegative")
+
+    @property
+    def durata_s(self) -> float:
+        return (len(self.viteze_ms) - 1) * self.pas_s
+
+    @classmethod
+    def din_csv(cls, nume: str, cale: str) -> "Ciclu":
+        """
+        Citește o urmă CSV cu coloanele timp_s, viteza_kmh și opțional
+        panta_procente (liniile care încep cu # sunt comentarii). Urmele cu
+        pas neuniform sunt reeșantionate liniar la pasul minim.
+        """
+        with open(cale, newline="", encoding="utf-8") as fisier:
+            linii = csv.DictReader(l for l in fisier if l.strip() and not l.startswith("#"))
+            randuri = list(linii)
+        if not randuri or not {"timp_s", "viteza_kmh"} <= set(randuri[0]):
+            raise ValueError(f"Ciclul {nume}: CSV-ul necesită coloanele timp_s și viteza_kmh")
+        t = np.array([float(r["timp_s"]) for r in randuri])
+        v = np.array([float(r["viteza_kmh"]) for r in randuri])
+        p = np.array([float(r.get("panta_procente") or 0) for r in randuri])
+        pasi = np.diff(t)
+        if (pasi <= 0).any():
+            raise ValueError(f"Ciclul {nume}: timpii trebuie să fie strict crescători")
+        pas = float(pasi.min())
+        if not np.allclose(pasi, pas):
+            grila = np.arange(t[0], t[-1] + pas / 2, pas)
+            v, p = np.interp(grila, t, v), np.interp(grila, t, p)
+        return cls(nume, v, pas, p)
+
+_cicluri: Dict[str, Ciclu] = {}
+_lock_cicluri = threading.Lock()
+
+def directoare_cicluri() -> List[str]:
+    directoare = [DIRECTOR_CICLURI]
+    if os.environ.get("USV_CICLURI"):
+        directoare.append(os.environ["USV_CICLURI"])
+    return directoare
+
+def cicluri_disponibile() -> Dict[str, str]:
+    """Numele ciclurilor livrate/locale → calea fișierului CSV (directorul local are prioritate)."""
+    cicluri = {}
+    for director in directoare_cicluri():
+        if os.path.isdir(director):
+            for fisier in sorted(os.listdir(director)):
+                if fisier.lower().endswith(".csv"):
+                    cicluri[os.path.splitext(fisier)[0].lower()] = os.path.join(director, fisier)
+    return cicluri
+
+def ciclu_standard(nume: str) -> Ciclu:
+    """Ciclul livrat cu numele dat, citit o singură dată per proces."""
+    nume = nume.lower()
+    with _lock_cicluri:
+        if nume not in _cicluri:
+            disponibile = cicluri_disponibile()
+            if nume not in disponibile:
+                raise ValueError(f"Ciclu necunoscut: {nume} (disponibile: {', '.join(disponibile)})")
+            _cicluri[nume] = Ciclu.din_csv(nume, disponibile[nume])
+        return _cicluri[nume]
+
+def simuleaza_cicluri(vehicle: Any, cicluri: Sequence[Ciclu], urma: bool = False,
+                      max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Consumul unui vehicul pe fiecare ciclu (vezi `simuleaza_cicluri_ctx`)."""
+    return in_liste(simuleaza_cicluri_ctx(ContextVehicul([vehicle]), cicluri, urma, max_puncte)[0])
+
+def simuleaza_cicluri_batch(vehicles: Sequence[Any], cicluri: Sequence[Ciclu], urma: bool = False,
+                            max_puncte: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """Lot de vehicule × lot de cicluri; rezultatele în ordinea vehiculelor, apoi a ciclurilor."""
+    return in_liste(calcul_pe_grupe(vehicles, lambda ctx: simuleaza_cicluri_ctx(ctx, cicluri, urma, max_puncte)))
+
+def simuleaza_cicluri_ctx(ctx: ContextVehicul, cicluri: Sequence[Ciclu], urma: bool = False,
+                          max_puncte: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Energia și consumul pentru toate combinațiile vehicul × ciclu.
+
+    Urmele ciclurilor sunt concatenate într-o singură axă de timp, iar pe
+    fiecare interval [t_i, t_i+1] se folosesc viteza medie și accelerația
+    (v_i+1 - v_i) / Δt. Pe grila vehicule × trepte × intervale (V, K, T):
+
+    - forța la roată: rezistențele (Cap. 3, `forte_rezistenta`) plus inerția
+      m · δ_k · a, cu δ_k = 1.04 + 0.05 · i_k²
+    - turația n_k și cuplul necesar M_k = F · r_d / (i_k · η_t); treapta
+      aleasă este cea mai mare în care n_mers ≤ n_k ≤ n_max și M_k nu
+      depășește cuplul disponibil (Cap. 4, `forta_tractiune`), unde
+      n_mers = RAPORT_TURATIE_MERS · n_ralanti
+    - sub n_mers în treapta 1 motorul rămâne la n_mers (patinarea
+      ambreiajului, inclusă în pierderile transmisiei); oprit → ralanti;
+      forță la roată negativă → frâne, cu alimentarea întreruptă dacă
+      roțile antrenează motorul peste n_mers
+    - intervalele în care nicio treaptă nu poate furniza forța cerută sunt
+      urmate la limita motorului și numărate în `intervale_neurmarite`
+
+    Consumul folosește modelul Willans: P_comb = (P_e + P_frecare(n)) / η_ind.
+    Cu `urma`, rezultatul include mărimile pe fiecare interval (reduse la
+    max_puncte puncte, LTTB).
+    """
+    viteze = np.concatenate([c.viteze_ms for c in cicluri])
+    pante = np.concatenate([c.pante for c in cicluri])
+    pasi = np.concatenate([np.full(len(c.viteze_ms), c.pas_s) for c in cicluri])
+    lungimi = np.array([len(c.viteze_ms) for c in cicluri])
+    # Intervalele care traversează granița dintre două cicluri sunt eliminate
+    capete = np.cumsum(lungimi)
+    pastrate = np.ones(len(viteze) - 1, dtype=bool)
+    pastrate[capete[:-1] - 1] = False
+    v = ((viteze[1:] + viteze[:-1]) / 2)[pastrate]
+    dt = pasi[:-1][pastrate]
+    a = (np.diff(viteze) / pasi[:-1])[pastrate]
+    alfa = np.arctan((pante[1:] + pante[:-1]) / 200)[pastrate]
+    inceputuri = np.concatenate([[0], np.cumsum(lungimi - 1)[:-1]])
+
+    K = ctx.i_cv.shape[1]
+    T = len(v)
+    bloc = max(1, ELEMENTE_MAX_BLOC // (K * T))
+    rezultate: List[List[Dict[str, Any]]] = []
+    for start in range(0, ctx.n, bloc):
+        randuri = np.arange(start, min(start + bloc, ctx.n))
+        rezultate.extend(_simuleaza_bloc(ctx, randuri, cicluri, v, a, alfa, dt, inceputuri, urma, max_puncte))
+    return rezultate
+
+def _simuleaza_bloc(ctx: ContextVehicul, randuri: np.ndarray, cicluri: Sequence[Ciclu],
+                    v: np.ndarray, a: np.ndarray, alfa: np.ndarray, dt: np.ndarray,
+                    inceputuri: np.ndarray, urma: bool, max_puncte: Optional[int]) -> List[List[Dict[str, Any]]]:
+    """Simularea pentru rândurile `randuri` ale contextului, pe toate ciclurile concatenate."""
+    def col(x: np.ndarray) -> np.ndarray:
+        return x[randuri]  # (R, 1)
+
+    def pe_treapta(x: np.ndarray) -> np.ndarray:
+        return x[randuri][:, :, np.newaxis]  # (R, K) → (R, K, 1)
+
+    m, greutate, r_d, eta_t = col(ctx.m), col(ctx.greutate), col(ctx.r_d), col(ctx.eta_t)
+    n_ralanti, n_max = col(ctx.n_min), col(ctx.n_max)
+    n_min = n_ralanti * RAPORT_TURATIE_MERS
+    i_cv = ctx.i_cv[randuri]
+    K = i_cv.shape[1]
+    T = len(v)
+
+    # Rezistențele la înaintare (R, T)
+    F_r, F_a, F_p = forte_rezistenta(col(ctx.f), greutate, col(ctx.Cx), col(ctx.A), v, alfa)
+    F_rez = F_r + F_a + F_p
+
+    # Forța la roată și cuplul necesar în fiecare treaptă (R, K, T)
+    i_total = pe_treapta(ctx.i_total)
+    r_d_k, eta_t_k = r_d[:, :, np.newaxis], eta_t[:, :, np.newaxis]
+    n_min_k, n_max_k = n_min[:, :, np.newaxis], n_max[:, :, np.newaxis]
+    delta = 1 + 0.04 + 0.05 * i_cv[:, :, np.newaxis]**2
+    F_roata = F_rez[:, np.newaxis, :] + m[:, :, np.newaxis] * delta * a
+    n_k = turatie_motor(v, i_total, r_d_k)
+    n_functionare = np.clip(n_k, n_min_k, n_max_k)
+    M_disp = ctx.motor.cuplu(n_functionare, randuri)
+    F_disp = forta_tractiune(M_disp, i_total, eta_t_k, r_d_k)
+
+    in_domeniu = (n_k >= n_min_k) & (n_k <= n_max_k)
+    posibila = in_domeniu & (F_roata <= F_disp)
+    exista = posibila.any(axis=1)
+
+    # Treapta: cea mai mare posibilă; altfel treapta 1 sub turația minimă
+    # (ambreiaj patinat), altfel treapta cu forța disponibilă maximă
+    treapta = K - 1 - np.argmax(posibila[:, ::-1, :], axis=1)
+    sub_treapta_1 = n_k[:, 0, :] < n_min
+    treapta[~exista & sub_treapta_1] = 0
+    rest = ~exista & ~sub_treapta_1
+    if rest.any():
+        prima = np.arange(K)[:, np.newaxis] == 0
+        maxima = np.argmax(np.where(in_domeniu | prima, F_disp, -np.inf), axis=1)
+        treapta[rest] = maxima[rest]
+
+    # Mărimile în treapta aleasă (R, T)
+    i_sel = np.take_along_axis(ctx.i_total[randuri], treapta, axis=1)
+    F_sel = F_rez + m * (1 + 0.04 + 0.05 * np.take_along_axis(i_cv, treapta, axis=1)**2) * a
+    n_roti = turatie_motor(v, i_sel, r_d)
+    n_sel = np.clip(n_roti, n_min, n_max)
+    F_lim = np.minimum(F_sel, forta_tractiune(ctx.motor.cuplu(n_sel, randuri), i_sel, eta_t, r_d))
+    urmarit = F_lim == F_sel
+
+    # Punctul de funcționare al motorului; oprit → ralanti, fără treaptă
+    oprit = (v == 0) & (a <= 0)
+    tractiune = (F_lim > 0) & ~oprit
+    M_e = np.where(tractiune, F_lim * r_d / (i_sel * eta_t), 0.0)
+    n_e = np.where(oprit, n_ralanti, n_sel)
+    P_e = M_e * n_e * np.pi / 30  # [W]
+    P_roata = np.where(oprit, 0.0, F_lim * v)  # [W]; negativ = frânare
+    treapta_raport = np.where(oprit, 0, treapta + 1)
+
+    # Consumul (Willans): alimentare întreruptă când roțile antrenează motorul
+    tip = ctx.tip_motor[randuri]
+    diesel = tip == "diesel"
+    eta_ind = np.where(diesel, RANDAMENT_INDICAT["diesel"], RANDAMENT_INDICAT["benzina"])
+    H_i = np.where(diesel, COMBUSTIBILI["diesel"]["putere_calorica"], COMBUSTIBILI["benzina"]["putere_calorica"])
+    V_d = col(ctx.cilindree) / 1e6  # [m³]
+    n_1000 = n_e / 1000
+    p_mf = (0.97 + 0.15 * n_1000 + 0.05 * n_1000**2) * 1e5  # [Pa]
+    P_frecare = p_mf * V_d * n_e / 120  # [W], motor în 4 timpi
+    intrerupt = (F_sel <= 0) & ~oprit & (n_roti >= n_min)
+    debit = np.where(intrerupt, 0.0, (P_e + P_frecare) / eta_ind / H_i)  # [kg/s]
+
+    # Sume pe cicluri (reduceat pe axa de timp)
+    def pe_cicluri(x: np.ndarray) -> np.ndarray:
+        return np.add.reduceat(x * dt, inceputuri, axis=-1)
+
+    distanta = pe_cicluri(np.broadcast_to(v, F_sel.shape))  # [m]
+    E_rulare = pe_cicluri(F_r * v)
+    E_aer = pe_cicluri(F_a * v)
+    E_panta = pe_cicluri(F_p * v)
+    E_tractiune = pe_cicluri(np.maximum(P_roata, 0))
+    E_franare = -pe_cicluri(np.minimum(np.where(oprit, 0.0, F_sel * v), 0))
+    E_motor = pe_cicluri(P_e)
+    combustibil = pe_cicluri(debit)  # [kg]
+    neurmarite = np.add.reduceat(~urmarit & ~oprit, inceputuri, axis=-1)
+    timpi_trepte = np.stack([pe_cicluri((treapta_raport == k).astype(float)) for k in range(K + 1)], axis=-1)
+
+    rezultate = []
+    for r in range(len(randuri)):
+        combustibil_tip = COMBUSTIBILI["diesel" if diesel[r, 0] else "benzina"]
+        pe_vehicul = []
+        for c, ciclu in enumerate(cicluri):
+            km = distanta[r, c] / 1000
+            litri = combustibil[r, c] / combustibil_tip["densitate"]
+            rezultat: Dict[str, Any] = {
+                "ciclu": ciclu.nume,
+                "durata_s": round(ciclu.durata_s, 2),
+                "distanta_km": round(float(km), 3),
+                "viteza_medie_kmh": round(float(km / ciclu.durata_s * 3600), 2),
+                "energie_kWh": {
+                    "rulare": round(float(E_rulare[r, c]) / 3.6e6, 4),
+                    "aerodinamica": round(float(E_aer[r, c]) / 3.6e6, 4),
+                    "panta": round(float(E_panta[r, c]) / 3.6e6, 4),
+                    "tractiune_roata": round(float(E_tractiune[r, c]) / 3.6e6, 4),
+                    "franare": round(float(E_franare[r, c]) / 3.6e6, 4),
+                    "motor": round(float(E_motor[r, c]) / 3.6e6, 4),
+                    "pierderi_transmisie": round(float(E_motor[r, c] - E_tractiune[r, c]) / 3.6e6, 4)
+                },
+                "combustibil": {
+                    "tip": "diesel" if diesel[r, 0] else "benzina",
+                    "masa_kg": round(float(combustibil[r, c]), 4),
+                    "volum_l": round(float(litri), 4),
+                    "consum_l_100km": round(float(litri / km * 100), 2) if km > 0 else None,
+                    "co2_g_km": round(float(combustibil[r, c] * combustibil_tip["co2"] * 1000 / km), 1) if km > 0 else None
+                },
+                "timp_pe_trepte_s": {("ralanti" if k == 0 else str(k)): round(float(timpi_trepte[r, c, k]), 2)
+                                     for k in range(K + 1)},
+                "intervale_neurmarite": int(neurmarite[r, c])
+            }
+            if urma:
+                sfarsit = inceputuri[c + 1] if c + 1 < len(cicluri) else T
+                felie = slice(inceputuri[c], sfarsit)
+                timp = np.cumsum(dt[felie]) - dt[felie] / 2
+                timp_r, serii = reduce_serii(timp, [
+                    np.round(v[felie] * 3.6, 2), treapta_raport[r, felie].astype(float),
+                    np.round(n_e[r, felie], 0), np.round(M_e[r, felie], 2),
+                    np.round(P_roata[r, felie] / 1000, 3), np.round(debit[r, felie] * 1000, 4)
+                ], max_puncte)
+                rezultat["urma"] = dict(zip(
+                    ("timp_s", "viteza_kmh", "treapta", "turatie_rot_min", "cuplu_Nm", "putere_roata_kW", "debit_combustibil_g_s"),
+                    [np.round(timp_r, 2)] + serii
+                ))
+            pe_vehicul.append(rezultat)
+        rezultate.append(pe_vehicul)
+    return rezultate
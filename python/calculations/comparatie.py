@@ -0,0 +1,156 @@
+"""
+Compararea mai multor vehicule pe o axă de viteze comună
+Toate curbele sunt evaluate direct pe aceeași grilă de viteze (nu pe
+turațiile fiecărui motor), astfel încât seriile sunt aliniate punct cu punct
+și diferențele față de vehiculul de referință se obțin prin scădere.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+from .indicatori import indicatori_cheie
+from .performance import demarare
+from .resistance import forte_rezistenta
+from .traction import forta_tractiune, turatie_motor
+from .vehicule import ContextVehicul, calcul_pe_grupe
+
+G = 9.81
+
+# Numărul maxim de puncte al axei de viteze comune
+PUNCTE_MAX_AXA = 100_000
+
+# Seriile comparate și numărul de zecimale cu care sunt returnate
+SERII_COMPARATIE = {
+    "rezistenta_totala_N": 2,
+    "putere_rezistenta_kW": 2,
+    "forta_tractiune_N": 2,
+    "putere_tractiune_kW": 2,
+    "factor_dinamic": 4,
+    "acceleratie_m_s2": 3,
+    "panta_maxima_procente": 2,
+    "timp_demarare_s": 2,
+    "treapta": 0,
+}
+
+def grila_viteze(vehicles: Sequence[Any], viteza_max_kmh: Optional[float] = None,
+                 pas_kmh: float = 1.0, max_puncte: Optional[int] = None) -> np.ndarray:
+    """
+    Axa de viteze comună [km/h], de la 0 la viteza_max_kmh (implicit viteza
+    teoretică maximă a celui mai rapid vehicul, rotunjită în sus la pas).
+
+    Cu max_puncte, pasul este mărit astfel încât grila să aibă cel mult
+    max_puncte puncte: reducerea LTTB ar alege alte viteze pentru fiecare
+    vehicul și ar strica alinierea seriilor. O grilă de peste
+    PUNCTE_MAX_AXA puncte ridică ValueError.
+    """
+    if viteza_max_kmh is None:
+        v_teoretice = [np.pi * v.pneu.razaDinamica * v.motor.turatieMaxima
+                       / (30 * min(v.transmisie.raporturiCV) * v.transmisie.raportPrincipal) * 3.6
+                       for v in vehicles]
+        viteza_max_kmh = np.ceil(max(v_teoretice) / pas_kmh) * pas_kmh
+    if max_puncte is not None:
+        pas_kmh = max(pas_kmh, viteza_max_kmh / (max_puncte - 1))
+    nr_puncte = int(np.ceil(viteza_max_kmh / pas_kmh - 1e-9)) + 1
+    if nr_puncte > PUNCTE_MAX_AXA:
+        raise ValueError(f"Axa de viteze are {nr_puncte} puncte (maxim {PUNCTE_MAX_AXA}); măriți pas_kmh")
+    return np.linspace(0, viteza_max_kmh, nr_puncte)
+
+def serii_viteza_ctx(ctx: ContextVehicul, viteze_kmh: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Curbele vehiculelor unui context pe axa viteze_kmh, ca tablouri (V, S).
+
+    Forța de tracțiune, puterea și factorul dinamic sunt înfășurătorile peste
+    treptele în care turația se află în [n_min, n_max]; accelerația și panta
+    maximă folosesc treapta cea mai favorabilă la fiecare viteză (returnată
+    în `treapta`). Unde nicio treaptă nu acoperă viteza, valoarea este NaN.
+    Timpul de demarare este cel din Cap. 5 (înfășurătoarea accelerațiilor),
+    NaN peste viteza maximă.
+    """
+    v_ms = viteze_kmh / 3.6
+    greutate, f = ctx.greutate, ctx.f
+
+    F_r, F_a, _ = forte_rezistenta(f, greutate, ctx.Cx, ctx.A, v_ms)
+    F_rez = F_r + F_a
+
+    # Grila vehicule × trepte × viteze (V, K, S)
+    def col(x: np.ndarray) -> np.ndarray:
+        return x[:, :, np.newaxis]
+
+    i_total = col(ctx.i_total)
+    n = turatie_motor(v_ms, i_total, col(ctx.r_d))
+    in_domeniu = (n >= col(ctx.n_min)) & (n <= col(ctx.n_max))
+    F_t = np.where(in_domeniu, forta_tractiune(ctx.motor.cuplu(n), i_total, col(ctx.eta_t), col(ctx.r_d)), -np.inf)
+    delta = 1 + 0.04 + 0.05 * col(ctx.i_cv)**2
+    a_k = (F_t - F_rez[:, np.newaxis, :]) / (col(greutate) / G * delta)
+
+    acoperit = in_domeniu.any(axis=1)
+    treapta = np.argmax(a_k, axis=1)
+    F_t_max = np.where(acoperit, F_t.max(axis=1), np.nan)
+    D = (F_t_max - F_a) / greutate
+    a = np.where(acoperit, np.take_along_axis(a_k, treapta[:, np.newaxis, :], axis=1)[:, 0, :], np.nan)
+
+    indicatori = indicatori_cheie(ctx)
+    v_ms_lot = np.broadcast_to(v_ms, (ctx.n, len(v_ms)))
+    _, t, _ = demarare(v_ms_lot, ctx.i_cv, ctx.i_0, ctx.eta_t, ctx.r_d, ctx.n_min,
+                       ctx.n_max, ctx.motor, greutate, f, ctx.Cx, ctx.A)
+    t = np.where(viteze_kmh <= indicatori["viteza_maxima_kmh"][:, np.newaxis], t, np.nan)
+
+    return {
+        "rezistenta_totala_N": np.broadcast_to(F_rez, (ctx.n, len(v_ms))),
+        "putere_rezistenta_kW": F_rez * v_ms / 1000,
+        "forta_tractiune_N": F_t_max,
+        "putere_tractiune_kW": F_t_max * v_ms / 1000,
+        "factor_dinamic": D,
+        "acceleratie_m_s2": np.maximum(a, 0),
+        "panta_maxima_procente": (D - f) * 100,
+        "timp_demarare_s": t,
+        "treapta": np.where(acoperit, treapta + 1, np.nan),
+        "indicatori": indicatori,
+    }
+
+def _lista(x: np.ndarray, zecimale: int) -> List[Optional[float]]:
+    """Seria rotunjită, cu None în locul valorilor nefinite (JSON nu are NaN)."""
+    x = np.round(x, zecimale)
+    if zecimale == 0:
+        return [None if np.isnan(e) else int(e) for e in x]
+    return np.where(np.isfinite(x), x, None).tolist()
+
+def compara_vehicule(vehicles: Sequence[Any], referinta: int = 0,
+                     viteza_max_kmh: Optional[float] = None, pas_kmh: float = 1.0,
+                     max_puncte: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Curbele vehiculelor pe o axă de viteze comună și diferențele lor față
+    de vehiculul `referinta` (vehicul - referință, punct cu punct).
+
+    Vehiculele cu același număr de trepte sunt evaluate împreună, într-un
+    singur calcul vectorizat; diferența este None unde una dintre serii
+    lipsește (viteza nu este acoperită de nicio treaptă).
+    """
+    viteze_kmh = grila_viteze(vehicles, viteza_max_kmh, pas_kmh, max_puncte)
+    serii = calcul_pe_grupe(vehicles, lambda ctx: _pe_vehicul(serii_viteza_ctx(ctx, viteze_kmh), ctx.n))
+    baza = serii[referinta]
+
+    vehicule = []
+    for vehicle, s in zip(vehicles, serii):
+        rezultat: Dict[str, Any] = {
+            "nume": vehicle.nume,
+            "serii": {k: _lista(s[k], z) for k, z in SERII_COMPARATIE.items()},
+            "indicatori": {k: round(float(x), 2) for k, x in s["indicatori"].items()},
+        }
+        if s is not baza:
+            rezultat["diferente"] = {k: _lista(s[k] - baza[k], z)
+                                     for k, z in SERII_COMPARATIE.items() if k != "treapta"}
+            rezultat["diferente_indicatori"] = {k: round(float(x - baza["indicatori"][k]), 2)
+                                                for k, x in s["indicatori"].items()}
+        vehicule.append(rezultat)
+
+    return {
+        "viteze_kmh": np.round(viteze_kmh, 2).tolist(),
+        "referinta": referinta,
+        "vehicule": vehicule,
+    }
+
+def _pe_vehicul(serii: Dict[str, Any], n: int) -> List[Dict[str, Any]]:
+    """Împarte seriile (V, S) și indicatorii (V,) ai unui context pe vehicule."""
+    return [{k: ({i: x[j] for i, x in v.items()} if isinstance(v, dict) else v[j])
+             for k, v in serii.items()} for j in range(n)]
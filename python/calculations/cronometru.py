@@ -0,0 +1,41 @@
+"""
+Cronometrarea etapelor de calcul
+Duratele se colectează doar dacă cererea curentă a pornit un colector
+(ContextVar); în rest `etapa` nu măsoară nimic.
+"""
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from typing import Dict, Iterator, Optional
+
+_colector: ContextVar[Optional[Dict[str, float]]] = ContextVar("colector_etape", default=None)
+
+def porneste(etape: Optional[Dict[str, float]] = None) -> Token:
+    """Activează colectarea în contextul curent; returnează tokenul pentru `opreste`."""
+    return _colector.set({} if etape is None else etape)
+
+def opreste(token: Token) -> None:
+    _colector.reset(token)
+
+def etape() -> Optional[Dict[str, float]]:
+    """Duratele colectate în contextul curent [ms], sau None dacă nu se colectează."""
+    return _colector.get()
+
+def adauga(nume: str, durata_ms: float) -> None:
+    colector = _colector.get()
+    if colector is not None:
+        colector[nume] = colector.get(nume, 0.0) + durata_ms
+
+@contextmanager
+def etapa(nume: str) -> Iterator[None]:
+    """Măsoară blocul ca etapa `nume` (duratele repetate se cumulează)."""
+    colector = _colector.get()
+    if colector is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        colector[nume] = colector.get(nume, 0.0) + (time.perf_counter() - t0) * 1000
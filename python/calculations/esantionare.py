@@ -0,0 +1,92 @@
+"""
+Reducerea curbelor la un număr maxim de puncte pentru grafice
+Algoritmul Largest-Triangle-Three-Buckets (Steinarsson, 2013), extins la
+mai multe serii care împart aceeași axă x și la mai multe rânduri (V, S)
+"""
+
+import numpy as np
+from typing import List, Optional, Sequence, Tuple
+
+# Bugetul minim: primul punct, ultimul punct și cel puțin un bucket între ele
+PUNCTE_MINIME = 3
+
+def indici_lttb(x: np.ndarray, serii: Sequence[np.ndarray], max_puncte: int) -> np.ndarray:
+    """
+    Indicii celor max_puncte puncte păstrate din fiecare rând al curbelor.
+
+    x și fiecare serie au forma (..., S); dimensiunile din față sunt rânduri
+    independente (ex. trepte × vehicule). Primul și ultimul punct sunt
+    păstrate; punctele interioare sunt împărțite în max_puncte - 2 bucket-uri
+    consecutive, iar din fiecare bucket se alege punctul care formează
+    triunghiul de arie maximă cu punctul ales în bucket-ul anterior și media
+    bucket-ului următor. Pentru mai multe serii, aria este suma ariilor pe
+    serii, fiecare serie fiind normată cu amplitudinea ei pe rând, astfel
+    încât toate seriile rămân pe aceeași axă x.
+
+    Bucla este doar peste bucket-uri; rândurile sunt procesate împreună.
+    Rezultatul are forma (..., max_puncte) și este crescător pe fiecare rând.
+    """
+    x = np.asarray(x, dtype=float)
+    forma = x.shape
+    S = forma[-1]
+    n = int(max_puncte)
+    if n < PUNCTE_MINIME:
+        raise ValueError(f"Bugetul de puncte trebuie să fie cel puțin {PUNCTE_MINIME}")
+    if S <= n:
+        return np.broadcast_to(np.arange(S), forma)
+
+    Y = np.stack([np.broadcast_to(np.asarray(s, dtype=float), forma).reshape(-1, S) for s in serii])  # (M, R, S)
+    x = x.reshape(-1, S)
+    R = x.shape[0]
+
+    amplitudine = np.ptp(Y, axis=-1, keepdims=True)
+    Y = (Y - Y.min(axis=-1, keepdims=True)) / np.where(amplitudine > 0, amplitudine, 1.0)
+
+    # Bucket-urile interioare [limite[i], limite[i + 1]), ca matrice de indici
+    # (nb, w) completată cu ultimul punct al bucket-ului (nu schimbă maximul)
+    limite = np.floor(np.linspace(1, S - 1, n - 1)).astype(int)
+    latime = int(np.diff(limite).max())
+    pozitii = np.minimum(limite[:-1, np.newaxis] + np.arange(latime), limite[1:, np.newaxis] - 1)
+    x_b = x[:, pozitii]  # (R, nb, w)
+    Y_b = Y[:, :, pozitii]  # (M, R, nb, w)
+
+    # Punctul C al fiecărui bucket: media bucket-ului următor, iar pentru ultimul, ultimul punct
+    numar = np.diff(limite)
+    x_c = np.concatenate([np.add.reduceat(x[:, :-1], limite[:-1], axis=-1)[:, 1:] / numar[1:], x[:, -1:]], axis=-1)
+    Y_c = np.concatenate([np.add.reduceat(Y[..., :-1], limite[:-1], axis=-1)[..., 1:] / numar[1:], Y[..., -1:]], axis=-1)
+
+    randuri = np.arange(R)
+    indici = np.empty((R, n), dtype=int)
+    indici[:, 0] = 0
+    indici[:, -1] = S - 1
+    a = np.zeros(R, dtype=int)
+    for i in range(n - 2):
+        x_a = x[randuri, a]
+        y_a = Y[:, randuri, a]
+        # Aria (dublă) a triunghiului A-B-C pentru fiecare candidat B, însumată pe serii
+        arie = np.abs(
+            (x_a - x_c[:, i])[:, np.newaxis] * (Y_b[:, :, i] - y_a[..., np.newaxis])
+            - (x_a[:, np.newaxis] - x_b[:, i]) * (Y_c[:, :, i] - y_a)[..., np.newaxis]
+        ).sum(axis=0)
+        a = pozitii[i, np.argmax(arie, axis=-1)]
+        indici[:, i + 1] = a
+
+    return indici.reshape(forma[:-1] + (n,))
+
+def reduce_serii(x: np.ndarray, serii: Sequence[np.ndarray],
+                 max_puncte: Optional[int]) -> Tuple[np.ndarray, List[np.ndarray]]:
+    """
+    Axa x și seriile reduse la cel mult max_puncte puncte pe rând (LTTB).
+
+    Cu max_puncte None sau mai mare decât numărul de puncte, tablourile sunt
+    returnate neschimbate. Altfel x este extinsă la forma seriilor, astfel
+    încât fiecare rând are propria axă redusă.
+    """
+    x = np.asarray(x)
+    if max_puncte is None or x.shape[-1] <= max_puncte:
+        return x, list(serii)
+    forma = np.broadcast_shapes(x.shape, *(np.shape(s) for s in serii))
+    x = np.broadcast_to(x, forma)
+    indici = indici_lttb(x, serii, max_puncte)
+    return (np.take_along_axis(x, indici, axis=-1),
+            [np.take_along_axis(np.broadcast_to(s, forma), indici, axis=-1) for s in serii])
@@ -0,0 +1,318 @@
+"""
+Propagarea incertitudinii parametrilor prin calculul complet (Monte Carlo)
+Eșantioanele sunt evaluate pe blocuri; curbele sunt rezumate prin histograme
+per punct, astfel încât memoria nu depinde de numărul de eșantioane.
+"""
+
+import numpy as np
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .campuri import CAMPURI_CONTEXT, PARAMETRI_SCENARIU
+from .cronometru import etapa
+from .indicatori import indicatori_cheie
+from .performance import timpi_demarare
+from .vehicule import ContextVehicul
+
+G = 9.81
+RHO = 1.225
+
+# Grilele comune tuturor eșantioanelor (benzile de percentile sunt per punct)
+VITEZE_REZISTENTE_KMH = np.arange(0, 201, 5.0)
+VITEZE_DINAMICE_KMH = np.arange(0, 201, 1.0)
+VITEZE_FRANARE_KMH = np.arange(10, 151, 10.0)
+PUNCTE_TURATIE = 50
+
+# Clasele histogramelor per punct; intervalul este amplitudinea blocului
+# pilot extinsă cu MARJA_LIMITE de fiecare parte (valorile din afară sunt
+# numărate separat și estimate prin minimul/maximul exact)
+CLASE_HISTOGRAMA = 1024
+MARJA_LIMITE = 0.25
+
+def valoare_baza(baza: Any, camp: str) -> float:
+    """Valoarea câmpului pentru vehiculul de bază (sau valoarea de referință a scenariului)."""
+    if camp in PARAMETRI_SCENARIU:
+        return PARAMETRI_SCENARIU[camp]
+    sectiune = CAMPURI_CONTEXT[camp][0]
+    return float(getattr(getattr(baza, sectiune), camp))
+
+def seed_aleator() -> int:
+    """Un seed nou, returnat clientului pentru reproducerea rulării."""
+    return int(np.random.SeedSequence().entropy)
+
+def esantioneaza(baza: Any, distributii: Sequence[Dict[str, Any]], n: int,
+                 rng: np.random.Generator) -> Dict[str, np.ndarray]:
+    """
+    n valori pentru fiecare parametru incert:
+
+    - normala: medie (implicit valoarea vehiculului), abatere sau
+      abatere_relativa (σ = abatere_relativa · |medie|); cu minim/maxim
+      distribuția este trunchiată (inversarea funcției de repartiție)
+    - uniforma: între minim și maxim
+    - triunghiulara: minim, mod (implicit valoarea vehiculului), maxim
+    """
+    valori = {}
+    for d in distributii:
+        camp, tip = d["camp"], d["tip"]
+        baza_camp = valoare_baza(baza, camp)
+        if tip == "uniforma":
+            x = rng.uniform(d["minim"], d["maxim"], n)
+        elif tip == "triunghiulara":
+            mod = baza_camp if d.get("mod") is None else d["mod"]
+            x = rng.triangular(d["minim"], mod, d["maxim"], n)
+        else:
+            medie = baza_camp if d.get("medie") is None else d["medie"]
+            abatere = d["abatere"] if d.get("abatere") is not None else d["abatere_relativa"] * abs(medie)
+            minim = -np.inf if d.get("minim") is None else d["minim"]
+            maxim = np.inf if d.get("maxim") is None else d["maxim"]
+            if np.isinf(minim) and np.isinf(maxim):
+                x = medie + abatere * rng.standard_normal(n)
+            else:
+                from scipy.special import ndtr, ndtri
+                F_a, F_b = ndtr((minim - medie) / abatere), ndtr((maxim - medie) / abatere)
+                x = np.clip(medie + abatere * ndtri(F_a + rng.random(n) * (F_b - F_a)), minim, maxim)
+        valori[camp] = x
+    return valori
+
+def evalueaza(baza: Any, valori: Dict[str, np.ndarray], n: int) -> Tuple[Dict[str, np.ndarray], Dict[str, np.ndarray]]:
+    """
+    Curbele (N, S) și indicatorii (N,) ai celor n variante ale vehiculului.
+
+    Curbele sunt pe grilele comune ale modulului, cu chei "capitol.serie":
+    rezistențele pe teren plan, caracteristica motorului (pe turațiile
+    vehiculului de bază), înfășurătorile forței de tracțiune, factorului
+    dinamic și accelerației peste trepte (0 unde nicio treaptă nu acoperă
+    viteza), timpul de demarare și distanțele de frânare/oprire.
+    """
+    vehicul = {c: v for c, v in valori.items() if c in CAMPURI_CONTEXT}
+    ctx = ContextVehicul.cu_variatii(baza, vehicul) if vehicul else ContextVehicul([baza] * n)
+    phi = np.broadcast_to(valori.get("aderenta", PARAMETRI_SCENARIU["aderenta"]), (n,))[:, np.newaxis]
+    t_r = np.broadcast_to(valori.get("timp_reactie_s", PARAMETRI_SCENARIU["timp_reactie_s"]), (n,))[:, np.newaxis]
+
+    f, greutate, Cx, A = ctx.f, ctx.greutate, ctx.Cx, ctx.A
+    curbe = {}
+
+    # Rezistențe (Cap. 3)
+    v = VITEZE_REZISTENTE_KMH / 3.6
+    forta_totala = f * greutate + 0.5 * RHO * Cx * A * v**2
+    curbe["rezistente.forta_totala_N"] = forta_totala
+    curbe["rezistente.putere_necesara_kW"] = forta_totala * v / 1000
+
+    # Caracteristica motorului pe turațiile vehiculului de bază
+    turatii = np.linspace(baza.motor.turatieRalanti, baza.motor.turatieMaxima, PUNCTE_TURATIE)
+    M_e = ctx.motor.cuplu(np.broadcast_to(turatii, (n, PUNCTE_TURATIE)))
+    curbe["tractiune.cuplu_Nm"] = M_e
+    curbe["tractiune.putere_kW"] = M_e * turatii * 2 * np.pi / 60 / 1000
+
+    # Tracțiune și dinamică pe grila vehicule × trepte × viteze (N, K, S);
+    # reducerile peste trepte sunt pe axa din mijloc (maxime între felii)
+    i_total = (ctx.i_cv * ctx.i_0)[:, :, np.newaxis]
+    v = VITEZE_DINAMICE_KMH / 3.6
+    r_d = ctx.r_d[:, :, np.newaxis]
+    n_motor = 30 * v * i_total / (np.pi * r_d)
+    in_domeniu = (n_motor >= ctx.n_min[:, :, np.newaxis]) & (n_motor <= ctx.n_max[:, :, np.newaxis])
+    F_t = ctx.motor.cuplu(n_motor) * (i_total * ctx.eta_t[:, :, np.newaxis] / r_d)
+    D = (F_t - 0.5 * RHO * (Cx * A)[:, :, np.newaxis] * v**2) / greutate[:, :, np.newaxis]
+    delta = (1 + 0.04 + 0.05 * ctx.i_cv**2)[:, :, np.newaxis]
+    a = np.where(in_domeniu, (D - f[:, :, np.newaxis]) * (G / delta), 0).max(axis=1)
+    np.maximum(a, 0, out=a)
+    acoperit = in_domeniu.any(axis=1)
+    curbe["tractiune.forta_tractiune_N"] = np.where(in_domeniu, F_t, 0).max(axis=1)
+    curbe["performante.factor_dinamic"] = np.where(acoperit, np.where(in_domeniu, D, -np.inf).max(axis=1), 0)
+    curbe["performante.acceleratie_m_s2"] = a
+
+    # Demararea până la 100 km/h (minimul 0.1 m/s², ca în Cap. 5)
+    demarare = VITEZE_DINAMICE_KMH <= 100
+    curbe["performante.timp_demarare_s"] = timpi_demarare(
+        np.broadcast_to(VITEZE_DINAMICE_KMH[demarare] / 3.6, (n, int(demarare.sum()))),
+        np.maximum(a[:, demarare], 0.1)
+    )
+
+    # Frânare (Cap. 5.3) cu aderența și timpul de reacție eșantionate
+    v = VITEZE_FRANARE_KMH / 3.6
+    s_fr = v**2 / (2 * phi * G)
+    curbe["franare.distanta_franare_m"] = s_fr
+    curbe["franare.distanta_oprire_m"] = v * t_r + s_fr
+
+    indicatori = indicatori_cheie(ctx)
+    v_100 = 100 / 3.6
+    indicatori["distanta_franare_100_m"] = v_100**2 / (2 * phi[:, 0] * G)
+    indicatori["distanta_oprire_100_m"] = v_100 * t_r[:, 0] + indicatori["distanta_franare_100_m"]
+    return curbe, indicatori
+
+def axe_curbe(baza: Any) -> Dict[str, Dict[str, np.ndarray]]:
+    """Axele x ale curbelor, per capitol."""
+    return {
+        "rezistente": {"viteze_kmh": VITEZE_REZISTENTE_KMH},
+        "tractiune": {
+            "turatii_rot_min": np.linspace(baza.motor.turatieRalanti, baza.motor.turatieMaxima, PUNCTE_TURATIE),
+            "viteze_kmh": VITEZE_DINAMICE_KMH
+        },
+        "performante": {
+            "viteze_kmh": VITEZE_DINAMICE_KMH,
+            "viteze_demarare_kmh": VITEZE_DINAMICE_KMH[VITEZE_DINAMICE_KMH <= 100]
+        },
+        "franare": {"viteze_kmh": VITEZE_FRANARE_KMH}
+    }
+
+def bloc_montecarlo(baza: Any, distributii: Sequence[Dict[str, Any]], seed: int, index: int, n: int,
+                    limite: Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]] = None) -> Dict[str, Any]:
+    """
+    Evaluează blocul `index` de n eșantioane și returnează rezumatul lui.
+
+    Generatorul blocului este derivat din (seed, index), deci rezultatul nu
+    depinde de ordinea sau de paralelismul evaluării blocurilor. Eșantioanele
+    fizic invalide (parametri nepozitivi, rezultate nefinite) sunt excluse și
+    numărate. Fără `limite` (blocul pilot), limitele histogramelor sunt
+    calculate din acest bloc și returnate pentru blocurile următoare.
+    """
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(index,)))
+    with etapa("montecarlo.esantionare"):
+        valori = esantioneaza(baza, distributii, n, rng)
+    with etapa("montecarlo.evaluare"), np.errstate(all="ignore"):
+        curbe, indicatori = evalueaza(baza, valori, n)
+
+    # Toți parametrii sunt fizic pozitivi (timpul de reacție poate fi nul)
+    valide = np.ones(n, dtype=bool)
+    for camp, x in valori.items():
+        valide &= (x >= 0) if camp == "timp_reactie_s" else (x > 0)
+    for x in list(curbe.values()) + list(indicatori.values()):
+        valide &= np.isfinite(x).reshape(n, -1).all(axis=1)
+    curbe = {k: x[valide] for k, x in curbe.items()}
+
+    with etapa("montecarlo.histograme"):
+        if limite is None:
+            limite = {}
+            for k, x in curbe.items():
+                if len(x) == 0:
+                    raise ValueError("Toate eșantioanele blocului pilot sunt fizic invalide; verificați distribuțiile")
+                mic, mare = x.min(axis=0), x.max(axis=0)
+                marja = np.maximum((mare - mic) * MARJA_LIMITE, np.maximum(np.abs(mare), 1.0) * 1e-9)
+                limite[k] = (mic - marja, mare + marja)
+        histograme = {k: histograme_puncte(x, *limite[k]) for k, x in curbe.items()}
+
+    return {
+        "esantioane": n,
+        "excluse": int(n - valide.sum()),
+        "limite": limite,
+        "histograme": histograme,
+        "sume": {k: x.sum(axis=0) for k, x in curbe.items()},
+        "minime": {k: x.min(axis=0, initial=np.inf) for k, x in curbe.items()},
+        "maxime": {k: x.max(axis=0, initial=-np.inf) for k, x in curbe.items()},
+        "indicatori": {k: x[valide] for k, x in indicatori.items()},
+        "parametri": {k: np.asarray(x)[valide] for k, x in valori.items()}
+    }
+
+def histograme_puncte(x: np.ndarray, mic: np.ndarray, mare: np.ndarray,
+                      clase: int = CLASE_HISTOGRAMA) -> np.ndarray:
+    """
+    Histogramele valorilor x (N, S) per punct, (S, clase + 2): clasa 0
+    numără valorile sub `mic`, ultima valorile peste `mare`.
+    """
+    S = x.shape[1]
+    clasa = np.floor((x - mic) / (mare - mic) * clase).astype(np.int64) + 1
+    clasa = np.where(x < mic, 0, np.minimum(clasa, clase))
+    clasa = np.where(x > mare, clase + 1, clasa)
+    return np.bincount((np.arange(S) * (clase + 2) + clasa).ravel(),
+                       minlength=S * (clase + 2)).reshape(S, clase + 2)
+
+def percentile_histograme(histograme: np.ndarray, mic: np.ndarray, mare: np.ndarray,
+                          minime: np.ndarray, maxime: np.ndarray, percentile: Sequence[float]) -> np.ndarray:
+    """
+    Percentilele (P, S) estimate din histogramele per punct, cu interpolare
+    liniară în clasă; eroarea este cel mult lățimea unei clase. Percentilele
+    căzute în clasele de depășire sunt limitate la minimul/maximul exact.
+    """
+    S, C = histograme.shape
+    clase = C - 2
+    cumulat = np.cumsum(histograme, axis=1)
+    total = cumulat[:, -1:]
+    latime = (mare - mic) / clase
+    rezultat = np.empty((len(percentile), S))
+    for k, p in enumerate(percentile):
+        rang = p / 100 * total  # (S, 1)
+        clasa = np.minimum((cumulat < rang).sum(axis=1), C - 1)
+        inainte = np.where(clasa > 0, np.take_along_axis(cumulat, np.maximum(clasa - 1, 0)[:, np.newaxis], 1)[:, 0], 0)
+        in_clasa = histograme[np.arange(S), clasa]
+        fractie = np.where(in_clasa > 0, (rang[:, 0] - inainte) / np.maximum(in_clasa, 1), 0)
+        valoare = mic + (clasa - 1 + fractie) * latime
+        valoare = np.where(clasa == 0, minime, np.where(clasa == C - 1, maxime, valoare))
+        rezultat[k] = np.clip(valoare, minime, maxime)
+    return rezultat
+
+class AcumulatorMonteCarlo:
+    """Combină rezumatele blocurilor și produce benzile de percentile și distribuțiile."""
+
+    def __init__(self, pilot: Dict[str, Any]):
+        self.limite = pilot["limite"]
+        self.esantioane = 0
+        self.excluse = 0
+        self.histograme = {k: np.zeros_like(h) for k, h in pilot["histograme"].items()}
+        self.sume: Dict[int, Dict[str, np.ndarray]] = {}
+        self.minime = {k: np.full_like(m, np.inf) for k, m in pilot["minime"].items()}
+        self.maxime = {k: np.full_like(m, -np.inf) for k, m in pilot["maxime"].items()}
+        self.indicatori: Dict[int, Dict[str, np.ndarray]] = {}
+        self.parametri: Dict[int, Dict[str, np.ndarray]] = {}
+        self.adauga(0, pilot)
+
+    def adauga(self, index: int, bloc: Dict[str, Any]) -> None:
+        """
+        Adaugă rezumatul blocului `index`. Blocurile pot sosi în orice ordine;
+        sumele și eșantioanele scalare sunt combinate la final în ordinea
+        blocurilor, astfel încât rezultatul este reproductibil exact.
+        """
+        self.esantioane += bloc["esantioane"]
+        self.excluse += bloc["excluse"]
+        for k in self.histograme:
+            self.histograme[k] += bloc["histograme"][k]
+            np.minimum(self.minime[k], bloc["minime"][k], out=self.minime[k])
+            np.maximum(self.maxime[k], bloc["maxime"][k], out=self.maxime[k])
+        self.sume[index] = bloc["sume"]
+        self.indicatori[index] = bloc["indicatori"]
+        self.parametri[index] = bloc["parametri"]
+
+    def _concateneaza(self, blocuri: Dict[int, Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+        ordine = sorted(blocuri)
+        return {k: np.concatenate([blocuri[i][k] for i in ordine]) for k in blocuri[ordine[0]]}
+
+    def rezultat(self, baza: Any, percentile: Sequence[float], clase_distributie: int) -> Dict[str, Any]:
+        """Benzile de percentile ale curbelor și distribuțiile indicatorilor și parametrilor."""
+        valide = self.esantioane - self.excluse
+        if valide == 0:
+            raise ValueError("Toate eșantioanele au rezultate nefinite (parametri fizic invalizi)")
+        nume_p = [f"P{p:g}" for p in percentile]
+
+        curbe: Dict[str, Dict[str, Any]] = {c: {k: np.round(x, 2) for k, x in axe.items()}
+                                            for c, axe in axe_curbe(baza).items()}
+        for cheie, h in self.histograme.items():
+            capitol, serie = cheie.split(".", 1)
+            suma = sum(self.sume[i][cheie] for i in sorted(self.sume))
+            benzi = percentile_histograme(h, *self.limite[cheie], self.minime[cheie], self.maxime[cheie], percentile)
+            curbe[capitol][serie] = dict(
+                {p: np.round(b, 4) for p, b in zip(nume_p, benzi)},
+                medie=np.round(suma / valide, 4),
+                minim=np.round(self.minime[cheie], 4),
+                maxim=np.round(self.maxime[cheie], 4)
+            )
+
+        return {
+            "esantioane": self.esantioane,
+            "esantioane_excluse": self.excluse,
+            "percentile": list(percentile),
+            "curbe": curbe,
+            "indicatori": {k: distributie(x, percentile, clase_distributie)
+                           for k, x in self._concateneaza(self.indicatori).items()},
+            "parametri": {k: distributie(x, percentile, clase_distributie)
+                          for k, x in self._concateneaza(self.parametri).items()}
+        }
+
+def distributie(x: np.ndarray, percentile: Sequence[float], clase: int) -> Dict[str, Any]:
+    """Statisticile exacte și histograma unei mărimi scalare eșantionate."""
+    frecvente, limite = np.histogram(x, bins=clase)
+    return {
+        "medie": round(float(x.mean()), 4),
+        "abatere": round(float(x.std()), 4),
+        "minim": round(float(x.min()), 4),
+        "maxim": round(float(x.max()), 4),
+        "percentile": {f"P{p:g}": round(float(v), 4) for p, v in zip(percentile, np.percentile(x, percentile))},
+        "histograma": {"limite": np.round(limite, 4), "frecvente": frecvente}
+    }
@@ -0,0 +1,64 @@
+"""
+Indicatori cheie ai vehiculului (viteză maximă, demarare, frânare, putere)
+Calcul redus, fără curbe, pentru studii parametrice pe multe variante
+"""
+
+import numpy as np
+from typing import Dict, Tuple
+
+from .performance import demarare
+from .puncte_caracteristice import puncte_caracteristice_ctx
+from .vehicule import ContextVehicul
+
+G = 9.81
+RHO = 1.225
+
+# Coeficientul de aderență pentru frânarea de referință (asfalt uscat)
+PHI_REFERINTA = 0.8
+
+def demarare_0_100(ctx: ContextVehicul) -> Tuple[np.ndarray, np.ndarray]:
+    """Timpul [s] și spațiul [m] de demarare 0-100 km/h (V,), pe înfășurătoarea accelerațiilor (pas 1 km/h)."""
+    viteze = np.broadcast_to(np.linspace(0, 100, 101) / 3.6, (ctx.n, 101))
+    _, t, s = demarare(
+        viteze, ctx.i_cv, ctx.i_0, ctx.eta_t, ctx.r_d, ctx.n_min, ctx.n_max,
+        ctx.motor, ctx.greutate, ctx.f, ctx.Cx, ctx.A
+    )
+    return t[:, -1], s[:, -1]
+
+def indicatori_cheie(ctx: ContextVehicul) -> Dict[str, np.ndarray]:
+    """
+    Indicatorii cheie pentru vehiculele unui context, ca vectori (V,).
+
+    - viteza_maxima_kmh: cea mai mare viteză de echilibru D = f peste toate
+      treptele (sau viteza la n_max), rafinată exact (`puncte_caracteristice`)
+    - timp_0_100_s, spatiu_0_100_m: integrare pe înfășurătoarea accelerațiilor
+    - panta_maxima_procente: (D_max - f) · 100
+    - distanta_franare_100_m: s = v² / (2 · φ · g), φ = 0.8
+    - putere_100_kmh_kW: puterea rezistențelor pe teren plan la 100 km/h
+    """
+    f = ctx.f
+    greutate = ctx.greutate
+
+    # Viteza maximă și factorul dinamic maxim, rafinate exact în toate treptele
+    puncte = puncte_caracteristice_ctx(ctx, schimbari=False)
+    v_max = puncte["viteza_maxima_kmh"]
+
+    # Demarare 0-100 km/h
+    t, s = demarare_0_100(ctx)
+
+    # Panta maximă
+    panta = puncte["panta_maxima_procente"]
+
+    # Frânare și putere la 100 km/h
+    v_100 = 100 / 3.6
+    s_fr = np.full(ctx.n, v_100**2 / (2 * PHI_REFERINTA * G))
+    P_100 = ((f * greutate + 0.5 * RHO * ctx.Cx * ctx.A * v_100**2) * v_100 / 1000)[:, 0]
+
+    return {
+        "viteza_maxima_kmh": v_max,
+        "timp_0_100_s": t,
+        "spatiu_0_100_m": s,
+        "panta_maxima_procente": panta,
+        "distanta_franare_100_m": s_fr,
+        "putere_100_kmh_kW": P_100
+    }
@@ -0,0 +1,130 @@
+"""
+Tabelul de demarare și intervalele de viteză (v1 → v2)
+Timpul și spațiul cumulate de demarare sunt calculate o singură dată, la
+rezoluție fină până la viteza maximă; orice interval, precum și inversările
+viteză → timp și timp → viteză, se obțin apoi prin căutare binară și
+interpolare liniară în tabel.
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .indicatori import indicatori_cheie
+from .performance import demarare
+from .vehicule import ContextVehicul, calcul_pe_grupe
+
+# Pasul implicit al tabelului [km/h]
+PAS_TABEL_KMH = 0.1
+
+# Intervalele raportate implicit (demarare și elasticitate) [km/h]
+INTERVALE_STANDARD = ((0, 60), (0, 100), (60, 100), (80, 120))
+
+class TabelDemarare:
+    """
+    Vitezele [m/s], timpii [s] și spațiile [m] cumulate de la 0, pe o grilă
+    fină de la 0 la viteza maximă. Toate trei sunt monoton crescătoare
+    (accelerația are minimul 0.1 m/s², ca în Cap. 5), deci fiecare coloană
+    poate fi folosită ca axă de căutare.
+    """
+
+    def __init__(self, v_ms: np.ndarray, t: np.ndarray, s: np.ndarray):
+        self.v_ms = v_ms
+        self.t = t
+        self.s = s
+
+    @property
+    def viteza_maxima_kmh(self) -> float:
+        return float(self.v_ms[-1] * 3.6)
+
+    def in_bytes(self) -> bytes:
+        """Forma compactă (pentru cache): coloanele v, t, s ca float64 consecutive."""
+        return np.stack([self.v_ms, self.t, self.s]).astype("<f8").tobytes()
+
+    @classmethod
+    def din_bytes(cls, date: bytes) -> "TabelDemarare":
+        v_ms, t, s = np.frombuffer(date, dtype="<f8").reshape(3, -1)
+        return cls(v_ms, t, s)
+
+    def _pe_axa(self, axa: np.ndarray, valori: Sequence[float], coloana: np.ndarray) -> np.ndarray:
+        """Interpolarea coloanei la valorile date pe axa dată; NaN în afara tabelului."""
+        x = np.asarray(valori, dtype=float)
+        return np.where((x >= axa[0]) & (x <= axa[-1]), np.interp(x, axa, coloana), np.nan)
+
+    def intervale(self, perechi: Sequence[Tuple[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Timpii [s] și spațiile [m] pentru intervalele (v1, v2) [km/h]."""
+        perechi = np.asarray(perechi, dtype=float).reshape(-1, 2) / 3.6
+        t = self._pe_axa(self.v_ms, perechi.ravel(), self.t).reshape(-1, 2)
+        s = self._pe_axa(self.v_ms, perechi.ravel(), self.s).reshape(-1, 2)
+        return t[:, 1] - t[:, 0], s[:, 1] - s[:, 0]
+
+    def la_viteze(self, viteze_kmh: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Timpul și spațiul de demarare de la 0 până la vitezele date."""
+        v = np.asarray(viteze_kmh, dtype=float) / 3.6
+        return self._pe_axa(self.v_ms, v, self.t), self._pe_axa(self.v_ms, v, self.s)
+
+    def la_timpi(self, timpi_s: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Viteza [km/h] și spațiul atinse după timpii dați."""
+        return self._pe_axa(self.t, timpi_s, self.v_ms) * 3.6, self._pe_axa(self.t, timpi_s, self.s)
+
+    def la_distante(self, distante_m: Sequence[float]) -> Tuple[np.ndarray, np.ndarray]:
+        """Viteza [km/h] și timpul la care sunt parcurse distanțele date."""
+        return self._pe_axa(self.s, distante_m, self.v_ms) * 3.6, self._pe_axa(self.s, distante_m, self.t)
+
+def tabel_demarare(vehicle: Any, pas_kmh: float = PAS_TABEL_KMH) -> TabelDemarare:
+    """Tabelul de demarare al unui vehicul (vezi `tabele_demarare_ctx`)."""
+    return tabele_demarare_ctx(ContextVehicul([vehicle]), pas_kmh)[0]
+
+def tabele_demarare_batch(vehicles: Sequence[Any], pas_kmh: float = PAS_TABEL_KMH) -> List[TabelDemarare]:
+    """Tabelele de demarare pentru un lot, în ordinea vehiculelor."""
+    return calcul_pe_grupe(vehicles, lambda ctx: tabele_demarare_ctx(ctx, pas_kmh))
+
+def tabele_demarare_ctx(ctx: ContextVehicul, pas_kmh: float = PAS_TABEL_KMH) -> List[TabelDemarare]:
+    """
+    Tabelele de demarare ale vehiculelor unui context, de la 0 la viteza
+    maximă (intersecția D = f, ca în indicatorii cheie), cu pasul pas_kmh.
+
+    Grilele de lungimi diferite sunt evaluate împreună (V, S), completate cu
+    viteza maximă (dv = 0), ca în Cap. 5; fiecare tabel păstrează doar
+    punctele proprii.
+    """
+    v_max = indicatori_cheie(ctx)["viteza_maxima_kmh"]
+    nr_puncte = np.maximum(np.ceil(v_max / pas_kmh - 1e-9).astype(int) + 1, 2)
+    pas = v_max / (nr_puncte - 1)
+    viteze = np.minimum(np.arange(nr_puncte.max()) * pas[:, np.newaxis], v_max[:, np.newaxis]) / 3.6
+
+    _, t, s = demarare(viteze, ctx.i_cv, ctx.i_0, ctx.eta_t, ctx.r_d, ctx.n_min, ctx.n_max,
+                       ctx.motor, ctx.greutate, ctx.f, ctx.Cx, ctx.A)
+    return [TabelDemarare(viteze[j, :n].copy(), t[j, :n].copy(), s[j, :n].copy())
+            for j, n in enumerate(nr_puncte)]
+
+def tabel_demarare_bytes(vehicle: Any, pas_kmh: float = PAS_TABEL_KMH) -> bytes:
+    """Tabelul unui vehicul în forma din cache (rulat în pool-ul de calcul)."""
+    return tabel_demarare(vehicle, pas_kmh).in_bytes()
+
+def _lista(x: np.ndarray, zecimale: int = 2) -> List[Optional[float]]:
+    x = np.round(x, zecimale)
+    return np.where(np.isfinite(x), x, None).tolist()
+
+def interogheaza(tabel: TabelDemarare, intervale: Sequence[Tuple[float, float]] = INTERVALE_STANDARD,
+                 viteze_kmh: Sequence[float] = (), timpi_s: Sequence[float] = (),
+                 distante_m: Sequence[float] = ()) -> Dict[str, Any]:
+    """
+    Răspunsurile la interogări pentru un tabel: intervale v1 → v2, timp și
+    spațiu până la viteze, viteză și spațiu după timpi, viteză și timp la
+    distanțe. Valorile în afara tabelului (peste viteza maximă) sunt None.
+    """
+    t_int, s_int = tabel.intervale(intervale)
+    t_v, s_v = tabel.la_viteze(viteze_kmh)
+    v_t, s_t = tabel.la_timpi(timpi_s)
+    v_s, t_s = tabel.la_distante(distante_m)
+    return {
+        "viteza_maxima_kmh": round(tabel.viteza_maxima_kmh, 2),
+        "puncte_tabel": len(tabel.v_ms),
+        "intervale": [
+            {"de_la_kmh": v1, "pana_la_kmh": v2, "timp_s": t, "spatiu_m": s}
+            for (v1, v2), t, s in zip(intervale, _lista(t_int), _lista(s_int))
+        ],
+        "la_viteze": {"viteze_kmh": list(viteze_kmh), "timpi_s": _lista(t_v), "spatii_m": _lista(s_v)},
+        "la_timpi": {"timpi_s": list(timpi_s), "viteze_kmh": _lista(v_t), "spatii_m": _lista(s_t)},
+        "la_distante": {"distante_m": list(distante_m), "viteze_kmh": _lista(v_s), "timpi_s": _lista(t_s)},
+    }
@@ -0,0 +1,194 @@
+"""
+Caracteristica exterioară a motorului
+Formula Leiderman-Khlystov și curbele de cuplu măsurate, evaluate prin
+tabele de interpolare comune tuturor capitolelor
+"""
+
+import hashlib
+import threading
+import numpy as np
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+def coeficienti_leiderman(engine_type) -> tuple:
+    """Coeficienții (a, b, c) ai formulei Leiderman-Khlystov după tipul motorului."""
+    # engine_type poate fi și un tablou de tipuri (calcul pe loturi)
+    diesel = np.asarray(engine_type) == 'diesel'
+    a = np.where(diesel, 0.53, 0.87)  # benzină: a=0.87
+    b = np.where(diesel, 1.56, 1.13)  # benzină: b=1.13
+    c = np.where(diesel, 1.09, 1.0)   # benzină: c=1.0
+    return a, b, c
+
+def engine_characteristic_leiderman(n: np.ndarray, P_max: float, n_P: float,
+                                     engine_type: str = 'benzina') -> tuple:
+    """
+    Calculează caracteristica exterioară a motorului folosind formula Leiderman-Khlystov.
+
+    P_e = P_max · (a·x + b·x² - c·x³), unde x = n/n_P
+
+    Coeficienți:
+    - Benzină: a=0.87, b=1.13, c=1.0
+    - Diesel: a=0.53, b=1.56, c=1.09
+    """
+
+    a, b, c = coeficienti_leiderman(engine_type)
+
+    x = n / n_P
+
+    # Putere [kW]
+    P_e = P_max * (a * x + b * x**2 - c * x**3)
+    P_e = np.maximum(P_e, 0)  # Evită valori negative
+
+    # Cuplu [N·m]
+    # M_e = (P_e · 1000 · 60) / (2π · n)
+    with np.errstate(divide='ignore', invalid='ignore'):  # n = 0
+        M_e = np.where(n > 0, (P_e * 1000 * 60) / (2 * np.pi * n), 0)
+
+    return P_e, M_e
+
+# ============== Tabele de cuplu ==============
+
+# Numărul de noduri al tabelelor pentru curbele de cuplu măsurate
+PUNCTE_TABEL = 513
+
+# Tabelele curbelor măsurate, memorate după amprenta conținutului
+MEMORIE_TABELE = 256
+_tabele_masurate: "OrderedDict[str, Tuple[float, float, np.ndarray]]" = OrderedDict()
+_lock_tabele = threading.Lock()
+
+def _coeficienti_hermite(y: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    Coeficienții (c0, c1, c2, c3) ai polinoamelor Hermite cubice pe celulele
+    unei grile uniforme, din valorile y și derivatele d în noduri (derivate
+    față de indicele nodului, adică înmulțite cu pasul grilei).
+    Forma (..., T) → (..., T - 1, 4).
+    """
+    y0, y1 = y[..., :-1], y[..., 1:]
+    d0, d1 = d[..., :-1], d[..., 1:]
+    return np.stack([y0, d0, 3 * (y1 - y0) - 2 * d0 - d1, 2 * (y0 - y1) + d0 + d1], axis=-1)
+
+def amprenta_curba(turatii: Sequence[float], cupluri: Sequence[float]) -> str:
+    """Amprenta (SHA-256) unei curbe de cuplu măsurate."""
+    h = hashlib.sha256(np.asarray(turatii, dtype="<f8").tobytes())
+    h.update(np.asarray(cupluri, dtype="<f8").tobytes())
+    return h.hexdigest()
+
+def tabel_curba_masurata(turatii: Sequence[float], cupluri: Sequence[float]) -> Tuple[float, float, np.ndarray]:
+    """
+    Tabelul (n_start, pas, coeficienți (PUNCTE_TABEL - 1, 4)) al unei curbe
+    de cuplu la sarcină plină măsurate.
+
+    Punctele sunt sortate după turație, iar turațiile repetate (frecvente în
+    înregistrările de pe standul de probă) sunt mediate. Curba este
+    interpolată cu spline cubic monoton pe porțiuni (PCHIP, fără oscilații
+    între puncte) și eșantionată pe o grilă uniformă, cu valorile și
+    derivatele spline-ului în noduri. Tabelul se calculează o singură dată
+    per curbă și se memorează după amprenta conținutului.
+    """
+    cheie = amprenta_curba(turatii, cupluri)
+    with _lock_tabele:
+        tabel = _tabele_masurate.get(cheie)
+        if tabel is not None:
+            _tabele_masurate.move_to_end(cheie)
+            return tabel
+
+    # Import amânat: scipy se încarcă lent și doar motoarele măsurate îl folosesc
+    from scipy.interpolate import PchipInterpolator
+
+    n = np.asarray(turatii, dtype=float)
+    M = np.asarray(cupluri, dtype=float)
+    n_unic, inversa = np.unique(n, return_inverse=True)
+    if len(n_unic) < 2:
+        raise ValueError("Curba de cuplu necesită cel puțin două turații distincte")
+    M_unic = np.bincount(inversa, weights=M) / np.bincount(inversa)
+
+    spline = PchipInterpolator(n_unic, M_unic)
+    noduri = np.linspace(n_unic[0], n_unic[-1], PUNCTE_TABEL)
+    pas = float(noduri[1] - noduri[0])
+    tabel = (float(noduri[0]), pas, _coeficienti_hermite(spline(noduri), spline.derivative()(noduri) * pas))
+
+    with _lock_tabele:
+        _tabele_masurate[cheie] = tabel
+        while len(_tabele_masurate) > MEMORIE_TABELE:
+            _tabele_masurate.popitem(last=False)
+    return tabel
+
+class TabeleMotor:
+    """
+    Cuplul la sarcină plină al V motoare, ca tabele Hermite cubice pe grile
+    uniforme de turație: n_start (V,), pas (V,), coeficienți (V, T - 1, 4).
+
+    Motoarele fără curbă măsurată au tabelul formulei Leiderman-Khlystov
+    (cuplul este pătratic în turație, deci reprodus exact de polinoamele
+    Hermite); cele cu curbă măsurată au tabelul ei (`tabel_curba_masurata`).
+    Toate capitolele evaluează motorul prin același nucleu vectorizat
+    (`cuplu`): indicele celulei se obține aritmetic, fără căutare.
+    """
+
+    def __init__(self, n_start: np.ndarray, pas: np.ndarray, coeficienti: np.ndarray):
+        self.n_start = n_start
+        self.pas = pas
+        self.coeficienti = coeficienti
+
+    @classmethod
+    def construieste(cls, P_max: np.ndarray, n_P: np.ndarray, engine_type: np.ndarray,
+                     n_max: np.ndarray, curbe: Sequence[Optional[Tuple[Sequence[float], Sequence[float]]]]) -> "TabeleMotor":
+        """
+        Tabelele pentru V motoare; P_max, n_P, engine_type, n_max sunt vectori
+        coloană (V, 1), curbe[j] este (turații, cupluri) sau None.
+
+        Dacă niciun motor nu are curbă măsurată, tabelele Leiderman au un
+        singur interval [0, n_max] (exacte și minime ca memorie, pentru
+        loturile mari ale studiilor parametrice).
+        """
+        masurate = [j for j, c in enumerate(curbe) if c is not None]
+        T = PUNCTE_TABEL if masurate else 2
+
+        # Leiderman: M_e = k · (a + b·x - c·x²), x = n / n_P, k = P_max · 60000 / (2π · n_P)
+        a, b, c = coeficienti_leiderman(engine_type)
+        k = P_max * 1000 * 60 / (2 * np.pi * n_P)
+        n_max = np.broadcast_to(n_max, np.shape(P_max))
+        pas = (n_max / (T - 1))[:, 0]
+        x = np.linspace(0, 1, T) * n_max / n_P  # (V, T)
+        y = k * (a + b * x - c * x**2)
+        d = k * (b - 2 * c * x) / n_P * pas[:, np.newaxis]
+        n_start = np.zeros(len(pas))
+        coeficienti = _coeficienti_hermite(y, d)
+
+        # Variantele aceluiași vehicul (studii parametrice) împart obiectul curbei
+        tabele = {}
+        for j in masurate:
+            cheie = tuple(id(x) for x in curbe[j])
+            if cheie not in tabele:
+                tabele[cheie] = tabel_curba_masurata(*curbe[j])
+            n_start[j], pas[j], coeficienti[j] = tabele[cheie]
+        return cls(n_start, pas, coeficienti)
+
+    def cuplu(self, n: np.ndarray, randuri: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Cuplul M_e [N·m] la turațiile n, de forma (R, ...): rândul r folosește
+        tabelul motorului randuri[r] (implicit motorul r). În afara tabelului
+        cuplul este extins constant; este nul pentru n ≤ 0 și nu scade sub 0.
+        """
+        n = np.asarray(n, dtype=float)
+        if randuri is None:
+            randuri = np.arange(n.shape[0])
+        forma = (-1,) + (1,) * (n.ndim - 1)
+        r = np.asarray(randuri).reshape(forma)
+        celule = self.coeficienti.shape[1]
+
+        t = np.clip((n - self.n_start[r]) / self.pas[r], 0, celule)
+        if celule == 1:
+            # Un singur interval (numai motoare Leiderman): fără indexarea celulelor
+            c = self.coeficienti[r, 0]  # (R, 1, …, 4)
+        else:
+            i = np.minimum(t.astype(int), celule - 1)
+            t -= i
+            c = self.coeficienti[r, i]  # (..., 4)
+        M_e = ((c[..., 3] * t + c[..., 2]) * t + c[..., 1]) * t + c[..., 0]
+        return np.where(n > 0, np.maximum(M_e, 0), 0)
+
+    def caracteristica(self, n: np.ndarray, randuri: Optional[np.ndarray] = None) -> tuple:
+        """Puterea P_e [kW] = M_e · 2π · n / 60000 și cuplul M_e [N·m] la turațiile n."""
+        M_e = self.cuplu(n, randuri)
+        return M_e * 2 * np.pi * n / 60000, M_e
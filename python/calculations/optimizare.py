@@ -0,0 +1,220 @@
+"""
+Optimizarea rapoartelor de transmitere
+Căutare în spațiul (raporturiCV, raportPrincipal) cu front Pareto pentru
+timpul 0-100 km/h, viteza maximă și panta maximă.
+"""
+
+import time
+import numpy as np
+from typing import Any, Dict, Optional, Tuple
+
+from .indicatori import demarare_0_100
+from .puncte_caracteristice import puncte_caracteristice_ctx
+from .vehicule import ContextVehicul
+
+def evalueaza_transmisii(vehicle: Any, i_cv: np.ndarray, i_0: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Evaluează simultan C transmisii candidate pentru același vehicul.
+
+    i_cv are forma (C, K), i_0 forma (C,). Candidații sunt variante ale
+    vehiculului într-un singur context (`ContextVehicul.cu_variatii`):
+    viteza maximă, factorul dinamic și panta vin din rezolvitorul exact al
+    punctelor caracteristice, iar timpul 0-100 km/h din integrarea
+    indicatorilor cheie, ca în Cap. 5 și în studiile parametrice.
+    Returnează vectori (C,): timpul 0-100 km/h, viteza maximă (și treapta
+    în care se atinge), viteza maximă în ultima treaptă, factorul dinamic
+    maxim în treapta 1 și panta maximă [%].
+    """
+    ctx = ContextVehicul.cu_variatii(vehicle, {"raportPrincipal": i_0}, rapoarte_cv=i_cv)
+    puncte = puncte_caracteristice_ctx(ctx, schimbari=False)
+    timp_0_100, _ = demarare_0_100(ctx)
+
+    return {
+        "timp_0_100_s": timp_0_100,
+        "viteza_maxima_kmh": puncte["viteza_maxima_kmh"],
+        "treapta_vmax": puncte["treapta_viteza_maxima"],
+        # Treptele fără echilibru D = f (NaN) nu ating nicio viteză maximă
+        "viteza_maxima_ultima_treapta_kmh": np.nan_to_num(puncte["v_max_trepte_kmh"][:, -1]),
+        "factor_dinamic_treapta_1": puncte["D_max_trepte"][:, 0],
+        "panta_maxima_procente": puncte["panta_maxima_procente"]
+    }
+
+def front_pareto(obiective: np.ndarray) -> np.ndarray:
+    """
+    Indicii punctelor nedominate; obiective (N, M) sunt toate de minimizat.
+    """
+    mai_bun_sau_egal = np.all(obiective[:, np.newaxis, :] <= obiective[np.newaxis, :, :], axis=2)
+    strict_mai_bun = np.any(obiective[:, np.newaxis, :] < obiective[np.newaxis, :, :], axis=2)
+    dominat = np.any(mai_bun_sau_egal & strict_mai_bun, axis=0)
+    return np.flatnonzero(~dominat)
+
+def _obiective(evaluare: Dict[str, np.ndarray]) -> np.ndarray:
+    # Minimizăm timpul; maximizăm viteza și panta
+    return np.column_stack((
+        evaluare["timp_0_100_s"],
+        -evaluare["viteza_maxima_kmh"],
+        -evaluare["panta_maxima_procente"]
+    ))
+
+def optimizeaza_transmisie(vehicle: Any, psi_max: float = 0.35,
+                           v_max_min_kmh: Optional[float] = None,
+                           raport_treapta_min: float = 1.1,
+                           limite_treapta_1: Optional[Tuple[float, float]] = None,
+                           limite_treapta_finala: Optional[Tuple[float, float]] = None,
+                           limite_raport_principal: Optional[Tuple[float, float]] = None,
+                           candidati_runda: int = 1000, evaluari_max: int = 20000,
+                           buget_timp_s: float = 5.0, runde_fara_progres: int = 3,
+                           puncte_front_max: int = 50,
+                           seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Caută rapoartele de transmitere și returnează frontul Pareto.
+
+    Obiective: timp 0-100 km/h (min), viteză maximă (max), pantă maximă (max).
+    Restricții:
+    - factorul dinamic maxim în treapta 1 ≥ psi_max
+    - viteza maximă în ultima treaptă ≥ v_max_min_kmh (dacă este dată)
+    - raportul dintre două trepte consecutive i_k / i_(k+1) ≥ raport_treapta_min
+
+    Prima rundă eșantionează aleator limitele (implicit ±30% față de
+    transmisia actuală, în spațiu logaritmic); rundele următoare perturbă
+    membrii frontului cu pas descrescător. Căutarea se oprește la epuizarea
+    bugetului de timp, a numărului de evaluări sau după runde_fara_progres
+    runde fără membri noi în front. Candidații unei runde sunt evaluați
+    vectorizat, într-un singur context, în workerul care rulează căutarea
+    (fără fire suplimentare: cererea ocupă un singur loc în pool-ul de
+    calcul). Din front se returnează cel mult puncte_front_max
+    soluții, distribuite uniform după timpul 0-100 km/h.
+    """
+    start = time.perf_counter()
+    rng = np.random.default_rng(seed)
+
+    i_cv_ref = np.array(vehicle.transmisie.raporturiCV, dtype=float)
+    i_0_ref = vehicle.transmisie.raportPrincipal
+    K = len(i_cv_ref)
+
+    def limite(valori, ref):
+        lo, hi = valori if valori is not None else (0.7 * ref, 1.3 * ref)
+        return np.log(lo), np.log(hi)
+
+    lim_1 = limite(limite_treapta_1, i_cv_ref[0])
+    lim_K = limite(limite_treapta_finala, i_cv_ref[-1])
+    lim_0 = limite(limite_raport_principal, i_0_ref)
+
+    def aleator(nr: int) -> np.ndarray:
+        """Candidați în spațiu logaritmic: coloanele 0..K-1 trepte, K raport principal."""
+        x = np.empty((nr, K + 1))
+        x[:, 0] = rng.uniform(*lim_1, nr)
+        x[:, K - 1] = rng.uniform(*lim_K, nr)
+        if K > 2:
+            u = np.sort(rng.uniform(0, 1, (nr, K - 2)), axis=1)
+            x[:, 1:K - 1] = x[:, :1] + u * (x[:, K - 1:K] - x[:, :1])
+        x[:, K] = rng.uniform(*lim_0, nr)
+        return x
+
+    def mutatii(parinti: np.ndarray, nr: int, sigma: float) -> np.ndarray:
+        x = parinti[rng.integers(0, len(parinti), nr)] + rng.normal(0, sigma, (nr, K + 1))
+        x[:, :K] = -np.sort(-x[:, :K], axis=1)  # trepte descrescătoare
+        x[:, 0] = np.clip(x[:, 0], *lim_1)
+        x[:, K - 1] = np.clip(x[:, K - 1], *lim_K)
+        x[:, K] = np.clip(x[:, K], *lim_0)
+        return x
+
+    def evalueaza(x: np.ndarray) -> Dict[str, np.ndarray]:
+        return evalueaza_transmisii(vehicle, np.exp(x[:, :K]), np.exp(x[:, K]))
+
+    def fezabil(x: np.ndarray, ev: Dict[str, np.ndarray]) -> np.ndarray:
+        ok = ev["factor_dinamic_treapta_1"] >= psi_max
+        if K > 1:
+            ok &= np.all(np.diff(x[:, :K], axis=1) <= -np.log(raport_treapta_min), axis=1)
+        if v_max_min_kmh is not None:
+            ok &= ev["viteza_maxima_ultima_treapta_kmh"] >= v_max_min_kmh
+        return ok
+
+    front_x = np.empty((0, K + 1))
+    front_ev: Dict[str, np.ndarray] = {}
+    evaluari = 0
+    fezabile = 0
+    runde = 0
+    fara_progres = 0
+    durata_runda = 0.0
+    oprire = "evaluari_max"
+
+    while evaluari < evaluari_max:
+        if time.perf_counter() - start + durata_runda > buget_timp_s:
+            oprire = "buget_timp"
+            break
+        t_runda = time.perf_counter()
+        nr = min(candidati_runda, evaluari_max - evaluari)
+
+        if len(front_x) == 0:
+            x = aleator(nr)
+        else:
+            nr_aleator = nr // 4
+            sigma = 0.08 * 0.75 ** runde
+            x = np.vstack((aleator(nr_aleator), mutatii(front_x, nr - nr_aleator, sigma)))
+
+        ev = evalueaza(x)
+        evaluari += len(x)
+        runde += 1
+
+        ok = fezabil(x, ev)
+        fezabile += int(ok.sum())
+        if ok.any():
+            toate_x = np.vstack((front_x, x[ok]))
+            toate_ev = {k: np.concatenate((front_ev.get(k, np.empty(0)), ev[k][ok])) for k in ev}
+            idx = front_pareto(_obiective(toate_ev))
+            membri_noi = int(np.sum(idx >= len(front_x)))
+            front_x = toate_x[idx]
+            front_ev = {k: v[idx] for k, v in toate_ev.items()}
+        else:
+            membri_noi = 0
+
+        fara_progres = 0 if membri_noi else fara_progres + 1
+        durata_runda = time.perf_counter() - t_runda
+        if fara_progres >= runde_fara_progres:
+            oprire = "convergenta"
+            break
+
+    referinta = evalueaza_transmisii(vehicle, i_cv_ref[np.newaxis, :], np.array([i_0_ref]))
+
+    def descriere(ev: Dict[str, np.ndarray], j: int) -> Dict[str, Any]:
+        return {
+            "timp_0_100_s": round(float(ev["timp_0_100_s"][j]), 2),
+            "viteza_maxima_kmh": round(float(ev["viteza_maxima_kmh"][j]), 2),
+            "treapta_vmax": int(ev["treapta_vmax"][j]),
+            "panta_maxima_procente": round(float(ev["panta_maxima_procente"][j]), 2),
+            "factor_dinamic_treapta_1": round(float(ev["factor_dinamic_treapta_1"][j]), 4)
+        }
+
+    ordine = np.argsort(front_ev["timp_0_100_s"]) if len(front_x) else np.empty(0, dtype=int)
+    if len(ordine) > puncte_front_max:
+        ordine = ordine[np.unique(np.linspace(0, len(ordine) - 1, puncte_front_max).round().astype(int))]
+    pareto = []
+    for j in ordine:
+        pareto.append({
+            "raporturiCV": np.round(np.exp(front_x[j, :K]), 3).tolist(),
+            "raportPrincipal": round(float(np.exp(front_x[j, K])), 3),
+            **descriere(front_ev, j)
+        })
+
+    return {
+        "referinta": {
+            "raporturiCV": i_cv_ref.tolist(),
+            "raportPrincipal": i_0_ref,
+            **descriere(referinta, 0)
+        },
+        "pareto": pareto,
+        "restrictii": {
+            "psi_max": psi_max,
+            "v_max_min_kmh": v_max_min_kmh,
+            "raport_treapta_min": raport_treapta_min
+        },
+        "statistici": {
+            "evaluari": evaluari,
+            "fezabile": fezabile,
+            "runde": runde,
+            "marime_front": len(front_x),
+            "oprire": oprire,
+            "durata_s": round(time.perf_counter() - start, 3)
+        }
+    }
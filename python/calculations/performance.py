@@ -4,27 +4,120 @@ Conform: Stoicescu - "Proiectarea performanțelor de tracțiune"
 """
 
 import numpy as np
-from scipy import integrate
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from .cronometru import etapa
+from .esantionare import reduce_serii
+from .motor import TabeleMotor, engine_characteristic_leiderman
+from .puncte_caracteristice import puncte_caracteristice_ctx, puncte_pe_vehicul
+from .vehicule import ContextVehicul, calcul_pe_grupe, in_liste
 
 G = 9.81
 RHO = 1.225
 
-def engine_characteristic(n: np.ndarray, P_max: float, n_P: float,
-                          engine_type: str = 'benzina') -> tuple:
-    """Caracteristica motor Leiderman-Khlystov"""
-    if engine_type == 'diesel':
-        a, b, c = 0.53, 1.56, 1.09
-    else:
-        a, b, c = 0.87, 1.13, 1.0
+# Caracteristica motor Leiderman-Khlystov (implementare comună)
+engine_characteristic = engine_characteristic_leiderman
+
+# Viteza finală implicită a demarării [km/h] (limitată la v_max pentru
+# vehiculele mai lente) și numărul maxim de puncte al grilei de demarare
+VITEZA_FINALA_IMPLICITA = 100.0
+PUNCTE_MAX_DEMARARE = 100_000
+
+def acceleratii_maxime(v_ms: np.ndarray, i_cv: np.ndarray, i_0: np.ndarray,
+                       eta_t: np.ndarray, r_d: np.ndarray, n_min: np.ndarray,
+                       n_max: np.ndarray, motor: TabeleMotor, greutate: np.ndarray,
+                       f: np.ndarray, Cx: np.ndarray, A: np.ndarray,
+                       delta_roti: float = 0.04,
+                       delta_base: float = 0.05,
+                       randuri_motor: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Înfășurătoarea accelerațiilor maxime a(v) peste toate treptele.
+
+    Evaluare simultană pe grila vehicule × trepte × viteze (V, K, S): pentru
+    fiecare viteză se păstrează accelerația maximă dintre treptele în care
+    turația motorului se află în [n_min, n_max]. Parametrii scalari sunt
+    vectori coloană (V, 1), v_ms are forma (V, S), i_cv are forma (V, K).
+    Rândul j folosește motorul randuri_motor[j] din `motor` (implicit j).
+    Rezultatul (V, S) are minimul 0.1 m/s² (evitare div/0).
+    """
+    def col(x):
+        return np.asarray(x)[:, :, np.newaxis]  # (V, 1) -> (V, 1, 1)
+
+    # Grila este ținută ca (V, K, S): maximul peste trepte este pe axa din
+    # mijloc (maxime între felii contigue), mult mai rapid decât pe o axă de lungime K
+    i_total = (i_cv * i_0)[:, :, np.newaxis]  # (V, K, 1)
+    delta = (1 + delta_roti + delta_base * i_cv**2)[:, :, np.newaxis]
+
+    v = v_ms[:, np.newaxis, :]  # (V, 1, S)
+    # Turația corespunzătoare fiecărei viteze în fiecare treaptă (V, K, S)
+    n = (30 * v * i_total) / (np.pi * col(r_d))
+    in_domeniu = (n >= col(n_min)) & (n <= col(n_max))
+
+    M_e = motor.cuplu(n, randuri_motor)
+    F_t = (M_e * i_total * col(eta_t)) / col(r_d)
+    F_a = 0.5 * RHO * col(Cx) * col(A) * v**2
+    D = (F_t - F_a) / col(greutate)
+    a = np.where(in_domeniu, np.maximum((D - col(f)) * G / delta, 0), 0)
 
-    x = n / n_P
-    P_e = P_max * (a * x + b * x**2 - c * x**3)
-    P_e = np.maximum(P_e, 0)
-    M_e = np.where(n > 0, (P_e * 1000 * 60) / (2 * np.pi * n), 0)
-    return P_e, M_e
+    return np.maximum(a.max(axis=1), 0.1)
 
-def calculate_performance(vehicle: Any) -> Dict[str, Any]:
+def timpi_demarare(v_ms: np.ndarray, a: np.ndarray) -> np.ndarray:
+    """
+    Timpul cumulat de demarare t = ∫(1/a)dv pe fiecare rând (V, S),
+    regula trapezelor pe 1/a.
+    """
+    dv = np.diff(v_ms, axis=-1)
+    inv_a = 1.0 / a
+    t = np.zeros(np.broadcast(v_ms, a).shape)
+    np.cumsum(dv * (inv_a[..., 1:] + inv_a[..., :-1]) / 2.0, axis=-1, out=t[..., 1:])
+    return t
+
+def spatii_demarare(v_ms: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Spațiul cumulat de demarare s = ∫v·dt pe fiecare rând (V, S), regula trapezelor."""
+    dt = np.diff(t, axis=-1)
+    s = np.zeros(np.broadcast(v_ms, t).shape)
+    np.cumsum(dt * (v_ms[..., 1:] + v_ms[..., :-1]) / 2.0, axis=-1, out=s[..., 1:])
+    return s
+
+def demarare(v_ms: np.ndarray, i_cv: np.ndarray, i_0: np.ndarray,
+             eta_t: np.ndarray, r_d: np.ndarray, n_min: np.ndarray,
+             n_max: np.ndarray, motor: TabeleMotor, greutate: np.ndarray,
+             f: np.ndarray, Cx: np.ndarray, A: np.ndarray,
+             delta_roti: float = 0.04,
+             delta_base: float = 0.05,
+             randuri_motor: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Accelerația, timpul și spațiul cumulate de demarare (V, S) pe grila
+    crescătoare v_ms (aceiași parametri ca `acceleratii_maxime`).
+
+    Înfășurătoarea are salturi la vitezele de intrare și ieșire din fiecare
+    treaptă (n_min, n_max), unde trapezele pe grila dată ar depinde de pas.
+    Integrarea se face pe grila completată cu vitezele de salt, de o parte și
+    de alta a fiecăruia, iar rezultatul este citit înapoi în nodurile grilei
+    date; timpii nu depind astfel (practic) de pasul ales.
+    """
+    # Vitezele [m/s] la n_min și n_max în fiecare treaptă (V, 2K), în limitele grilei
+    viteza_pe_turatie = np.pi * r_d / (30 * i_cv * i_0)
+    salturi = np.concatenate([n_min * viteza_pe_turatie, n_max * viteza_pe_turatie], axis=1)
+    completata = np.concatenate([v_ms, salturi * (1 - 1e-12), salturi * (1 + 1e-12)], axis=1)
+    np.clip(completata, v_ms[:, :1], v_ms[:, -1:], out=completata)
+
+    # Sortare stabilă: nodurile date rămân înaintea salturilor egale cu ele
+    ordine = np.argsort(completata, axis=1, kind="stable")
+    v = np.take_along_axis(completata, ordine, axis=1)
+    a = acceleratii_maxime(v, i_cv, i_0, eta_t, r_d, n_min, n_max, motor, greutate,
+                           f, Cx, A, delta_roti, delta_base, randuri_motor)
+    t = timpi_demarare(v, a)
+    s = spatii_demarare(v, t)
+
+    pozitii = np.empty_like(ordine)
+    np.put_along_axis(pozitii, ordine, np.arange(ordine.shape[1])[np.newaxis, :], axis=1)
+    pozitii = pozitii[:, :v_ms.shape[1]]
+    return tuple(np.take_along_axis(x, pozitii, axis=1) for x in (a, t, s))
+
+def calculate_performance(vehicle: Any, pas_demarare_kmh: float = 1.0,
+                          viteza_finala_kmh: Optional[float] = None,
+                          max_puncte: Optional[int] = None) -> Dict[str, Any]:
     """
     Calculează performanțele dinamice ale automobilului.
 
@@ -32,52 +125,73 @@ def calculate_performance(vehicle: Any) -> Dict[str, Any]:
     - 5.1 Performanțe dinamice de trecere
     - 5.2 Performanțe de demarare
     - 5.3 Performanțe de frânare
+
+    Demararea se calculează pe grila 0 … viteza_finala_kmh cu pasul
+    pas_demarare_kmh. Implicit (None) viteza finală este 100 km/h, limitată
+    la v_max pentru vehiculele care nu ating 100 km/h; math.inf înseamnă
+    până la v_max. O viteză finală dată explicit, nepozitivă sau peste v_max,
+    ca și o grilă de peste PUNCTE_MAX_DEMARARE puncte, ridică ValueError.
+    Pentru vehiculele cu v_max sub 100 km/h, timp_0_100_s și spatiu_0_100_m
+    sunt None. Indicatorii sunt
+    calculați la rezoluția completă; max_puncte limitează doar numărul de
+    puncte al fiecărei curbe returnate (LTTB).
+    """
+    return in_liste(calculate_performance_ctx(
+        ContextVehicul([vehicle]), pas_demarare_kmh, viteza_finala_kmh, max_puncte
+    )[0])
+
+def calculate_performance_batch(vehicles: Sequence[Any], pas_demarare_kmh: float = 1.0,
+                                viteza_finala_kmh: Optional[float] = None,
+                                max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
     """
+    Performanțele dinamice pentru un lot de vehicule.
 
-    # Parametri
-    m = vehicle.masa.masaTotala
-    greutate = m * G
-    f = vehicle.pneu.coefRulare
-    Cx = vehicle.aerodinamic.coefAerodinamic
-    A = vehicle.aerodinamic.arieFrontala
-    r_d = vehicle.pneu.razaDinamica
+    Vehiculele sunt grupate după numărul de trepte; în fiecare grupă calculul
+    se face pe tablouri vehicule × eșantioane. Rezultatele sunt returnate în
+    ordinea de intrare.
+    """
+    return in_liste(calcul_pe_grupe(
+        vehicles, lambda ctx: calculate_performance_ctx(ctx, pas_demarare_kmh, viteza_finala_kmh, max_puncte)
+    ))
+
+def calculate_performance_ctx(ctx: ContextVehicul, pas_demarare_kmh: float = 1.0,
+                              viteza_finala_kmh: Optional[float] = None,
+                              max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Performanțele pentru vehiculele unui context (același număr de trepte)."""
 
-    P_max = vehicle.motor.putereMaxima
-    n_P = vehicle.motor.turatiePutereMax
-    n_max = vehicle.motor.turatieMaxima
-    n_min = vehicle.motor.turatieRalanti
-    tip_motor = vehicle.motor.tip
+    # Parametri (vectori coloană (V, 1))
+    greutate = ctx.greutate
+    f = ctx.f
+    Cx = ctx.Cx
+    A = ctx.A
+    r_d = ctx.r_d
 
-    i_cv = np.array(vehicle.transmisie.raporturiCV)
-    i_0 = vehicle.transmisie.raportPrincipal
-    eta_t = vehicle.transmisie.randamentTransmisie
+    n_max = ctx.n_max
+    n_min = ctx.n_min
+
+    i_cv = ctx.i_cv  # (V, K)
+    i_0 = ctx.i_0
+    eta_t = ctx.eta_t
 
     # Factor mase rotative (aproximativ)
     # δ = 1 + δ_roți + δ_transmisie · i²
     delta_roti = 0.04
     delta_base = 0.05
 
-    # Vectori pentru calcule
-    n_motor = np.linspace(n_min, n_max, 50)
-    P_e, M_e = engine_characteristic(n_motor, P_max, n_P, tip_motor)
-
     # ==================== 5.1 PERFORMANȚE DINAMICE ====================
 
-    caracteristica_tractiune = []
-    caracteristica_puteri = []
-    caracteristica_dinamica = []
-    caracteristica_acceleratii = []
+    trepte = []
 
-    for idx, i_k in enumerate(i_cv):
-        i_total = i_k * i_0
+    for k in range(i_cv.shape[1]):
+        i_k = i_cv[:, k:k + 1]
         delta = 1 + delta_roti + delta_base * i_k**2
 
-        # Viteza
-        v_ms = (np.pi * r_d * n_motor) / (30 * i_total)
+        # Viteza (cinematica pe trepte din context)
+        v_ms = ctx.viteze_trepte_ms[:, k]
         v_kmh = v_ms * 3.6
 
         # Forța de tracțiune
-        F_t = (M_e * i_total * eta_t) / r_d
+        F_t = ctx.forte_tractiune[:, k]
 
         # Rezistența aerodinamică
         F_a = 0.5 * RHO * Cx * A * v_ms**2
@@ -85,9 +199,6 @@ def calculate_performance(vehicle: Any) -> Dict[str, Any]:
         # Rezistența la rulare
         F_r = f * greutate
 
-        # Forța disponibilă
-        F_disp = F_t - F_a - F_r
-
         # Puterea de tracțiune
         P_t = F_t * v_ms / 1000  # [kW]
 
@@ -100,139 +211,167 @@ def calculate_performance(vehicle: Any) -> Dict[str, Any]:
         # Accelerația a = (D - f) · g / δ
         a = np.where(D > f, (D - f) * G / delta, 0)
 
-        caracteristica_tractiune.append({
-            "treapta": idx + 1,
-            "viteze_kmh": np.round(v_kmh, 2).tolist(),
-            "forte_tractiune_N": np.round(F_t, 2).tolist(),
-            "forte_rezistenta_N": np.round(F_a + F_r, 2).tolist()
-        })
-
-        caracteristica_puteri.append({
-            "treapta": idx + 1,
-            "viteze_kmh": np.round(v_kmh, 2).tolist(),
-            "putere_tractiune_kW": np.round(P_t, 2).tolist(),
-            "putere_rezistenta_kW": np.round(P_rez, 2).tolist()
+        v_kmh_r = np.round(v_kmh, 2)
+        D_r = np.round(D, 4)
+
+        trepte.append({
+            "delta": delta[:, 0],
+            "viteze_kmh": v_kmh_r,
+            "forte_tractiune_N": np.round(F_t, 2),
+            "forte_rezistenta_N": np.round(F_a + F_r, 2),
+            "putere_tractiune_kW": np.round(P_t, 2),
+            "putere_rezistenta_kW": np.round(P_rez, 2),
+            "factor_dinamic": D_r,
+            "acceleratii_m_s2": np.round(a, 3)
         })
 
-        caracteristica_dinamica.append({
-            "treapta": idx + 1,
-            "viteze_kmh": np.round(v_kmh, 2).tolist(),
-            "factor_dinamic": np.round(D, 4).tolist()
-        })
-
-        caracteristica_acceleratii.append({
-            "treapta": idx + 1,
-            "delta": round(delta, 3),
-            "viteze_kmh": np.round(v_kmh, 2).tolist(),
-            "acceleratii_m_s2": np.round(a, 3).tolist()
-        })
+    # Viteza maximă, panta maximă și punctele de schimbare: rafinate exact pe
+    # caracteristica motorului, în toate treptele (v_max poate fi într-o
+    # treaptă inferioară ultimei)
+    with etapa("performante.puncte_caracteristice"):
+        puncte = puncte_caracteristice_ctx(ctx)
+    v_max = puncte["viteza_maxima_kmh"][:, np.newaxis]
 
     # ==================== 5.2 PERFORMANȚE DEMARARE ====================
 
     # Calculăm timpul și spațiul de demarare prin integrare numerică
-    # Folosim prima treaptă pentru început, apoi schimbăm trepte
-
-    viteze_demarare = np.linspace(0, 100, 101)  # 0-100 km/h
+    # Grila de viteze: 0 până la viteza finală (implicit 100 km/h sau v_max,
+    # dacă este mai mică; inf = v_max)
+    if viteza_finala_kmh is None:
+        viteze_finale = np.minimum(v_max[:, 0], VITEZA_FINALA_IMPLICITA)
+    elif np.isinf(viteza_finala_kmh):
+        viteze_finale = v_max[:, 0].copy()
+    else:
+        if viteza_finala_kmh <= 0:
+            raise ValueError("Viteza finală a demarării trebuie să fie pozitivă")
+        peste = np.flatnonzero(viteza_finala_kmh > np.round(v_max[:, 0], 2))
+        if len(peste):
+            raise ValueError(
+                f"Viteza finală a demarării ({viteza_finala_kmh:g} km/h) depășește viteza maximă "
+                f"a vehiculului ({v_max[peste[0], 0]:.2f} km/h)"
+            )
+        viteze_finale = np.full(ctx.n, float(viteza_finala_kmh))
+    nr_puncte = np.ceil(viteze_finale / pas_demarare_kmh - 1e-9).astype(int) + 1
+
+    # Sub 100 km/h grila continuă cu același pas până la 100 km/h (cel mult
+    # v_max), pentru indicatorii 0-100; curba returnată se oprește la viteza finală
+    pas = viteze_finale / (nr_puncte - 1)
+    viteze_limita = np.maximum(viteze_finale, np.minimum(v_max[:, 0], 100.0))
+    nr_integrare = np.maximum(np.ceil(viteze_limita / pas - 1e-9).astype(int) + 1, nr_puncte)
+    if nr_integrare.max() > PUNCTE_MAX_DEMARARE:
+        raise ValueError(
+            f"Grila de demarare are {nr_integrare.max()} puncte (maxim {PUNCTE_MAX_DEMARARE}); "
+            f"măriți pas_demarare_kmh"
+        )
+
+    # Grile de lungimi diferite sunt completate cu viteza limită (dv = 0)
+    indici = np.arange(nr_integrare.max())
+    viteze_demarare = np.minimum(indici * pas[:, np.newaxis], viteze_limita[:, np.newaxis])
+    viteze_demarare[np.arange(ctx.n), nr_puncte - 1] = viteze_finale
+    viteze_demarare[np.arange(ctx.n), nr_integrare - 1] = viteze_limita
     viteze_demarare_ms = viteze_demarare / 3.6
 
-    # Interpolare accelerație pentru fiecare viteză
-    acceleratii_envelope = []
-
-    for v in viteze_demarare_ms:
-        max_a = 0
-        for idx, i_k in enumerate(i_cv):
-            i_total = i_k * i_0
-            delta = 1 + delta_roti + delta_base * i_k**2
-
-            # Turația corespunzătoare acestei viteze
-            n = (30 * v * i_total) / (np.pi * r_d)
-
-            if n_min <= n <= n_max:
-                _, M_e_val = engine_characteristic(np.array([n]), P_max, n_P, tip_motor)
-                F_t = (M_e_val[0] * i_total * eta_t) / r_d
-                F_a = 0.5 * RHO * Cx * A * v**2
-                D = (F_t - F_a) / greutate
-                a = max(0, (D - f) * G / delta)
-                max_a = max(max_a, a)
-
-        acceleratii_envelope.append(max(max_a, 0.1))  # minim 0.1 pentru evitare div/0
-
-    acceleratii_envelope = np.array(acceleratii_envelope)
-
-    # Timp de demarare: t = ∫(1/a)dv
-    timp_demarare = [0]
-    for i in range(1, len(viteze_demarare_ms)):
-        dv = viteze_demarare_ms[i] - viteze_demarare_ms[i-1]
-        a_med = (acceleratii_envelope[i] + acceleratii_envelope[i-1]) / 2
-        dt = dv / a_med
-        timp_demarare.append(timp_demarare[-1] + dt)
-
-    timp_demarare = np.array(timp_demarare)
-
-    # Spațiu de demarare: s = ∫v·dt
-    spatiu_demarare = [0]
-    for i in range(1, len(viteze_demarare_ms)):
-        v_med = (viteze_demarare_ms[i] + viteze_demarare_ms[i-1]) / 2
-        dt = timp_demarare[i] - timp_demarare[i-1]
-        ds = v_med * dt
-        spatiu_demarare.append(spatiu_demarare[-1] + ds)
-
-    spatiu_demarare = np.array(spatiu_demarare)
-
-    # Timp 0-100 km/h
-    timp_0_100 = float(timp_demarare[-1])
-    spatiu_0_100 = float(spatiu_demarare[-1])
-
-    # Viteza maximă - calculată din ultima treaptă la turație maximă
-    i_min = i_cv[-1] * i_0  # Raport minim (ultima treaptă)
-    v_max_teoretica = (np.pi * r_d * n_max) / (30 * i_min) * 3.6  # km/h
-
-    # Alternativ: găsim viteza unde D = f (accelerație 0)
-    # Căutăm în caracteristica dinamică a ultimei trepte
-    ultima_treapta = caracteristica_dinamica[-1]
-    viteze_ultima = np.array(ultima_treapta["viteze_kmh"])
-    factor_d_ultima = np.array(ultima_treapta["factor_dinamic"])
-
-    # Găsim viteza maximă prin interpolare liniară unde D = f
-    # Căutăm punctul de intersecție (unde D trece de la > f la < f)
-    v_max = v_max_teoretica  # valoare implicită
-    for i in range(len(factor_d_ultima) - 1):
-        if factor_d_ultima[i] >= f and factor_d_ultima[i + 1] < f:
-            # Interpolare liniară pentru a găsi exact unde D = f
-            v1, v2 = viteze_ultima[i], viteze_ultima[i + 1]
-            d1, d2 = factor_d_ultima[i], factor_d_ultima[i + 1]
-            # v_max = v1 + (f - d1) * (v2 - v1) / (d2 - d1)
-            if d2 != d1:
-                v_max = float(v1 + (f - d1) * (v2 - v1) / (d2 - d1))
-            else:
-                v_max = float(v1)
-            break
+    with etapa("performante.demarare"):
+        # Timp de demarare t = ∫(1/a)dv și spațiu s = ∫v·dt, integrate cu
+        # salturile înfășurătoarii la schimbarea treptelor
+        acceleratii_envelope, timp_demarare, spatiu_demarare = demarare(
+            viteze_demarare_ms, i_cv, i_0, eta_t, r_d, n_min, n_max,
+            ctx.motor, greutate, f, Cx, A, delta_roti, delta_base
+        )
 
     # Accelerația maximă
-    a_max = float(np.max(acceleratii_envelope))
+    a_max = acceleratii_envelope.max(axis=1)
 
     # Panta maximă
     # La limită: D_max = f + tan(α_max)
-    D_max = float(np.max([np.max(c["factor_dinamic"]) for c in caracteristica_dinamica]))
-    panta_maxima = np.degrees(np.arctan(D_max - f))
-
-    return {
-        "caracteristica_tractiune": caracteristica_tractiune,
-        "caracteristica_puteri": caracteristica_puteri,
-        "caracteristica_dinamica": caracteristica_dinamica,
-        "caracteristica_acceleratii": caracteristica_acceleratii,
-        "demarare": {
-            "viteze_kmh": viteze_demarare.tolist(),
-            "timpi_s": np.round(timp_demarare, 2).tolist(),
-            "spatii_m": np.round(spatiu_demarare, 2).tolist(),
-            "acceleratii_m_s2": np.round(acceleratii_envelope, 3).tolist()
-        },
-        "performante_cheie": {
-            "viteza_maxima_kmh": round(v_max, 2),
-            "acceleratie_maxima_m_s2": round(a_max, 3),
-            "timp_0_100_s": round(timp_0_100, 2),
-            "spatiu_0_100_m": round(spatiu_0_100, 2),
-            "panta_maxima_grade": round(panta_maxima, 2),
-            "panta_maxima_procente": round(np.tan(np.radians(panta_maxima)) * 100, 2)
-        }
-    }
+    panta_maxima = np.degrees(np.arctan(puncte["D_max"] - f[:, 0]))
+
+    viteze_demarare_r = np.round(viteze_demarare, 2)
+    timp_demarare_r = np.round(timp_demarare, 2)
+    spatiu_demarare_r = np.round(spatiu_demarare, 2)
+    acceleratii_r = np.round(acceleratii_envelope, 3)
+
+    # Curbele pe trepte: fiecare grafic este redus separat, pe toate treptele
+    # și vehiculele odată (tablouri (K, V, S))
+    def grafic(*chei: str):
+        return reduce_serii(np.stack([t["viteze_kmh"] for t in trepte]),
+                            [np.stack([t[c] for t in trepte]) for c in chei], max_puncte)
+
+    v_tr, (F_t_tr, F_rez_tr) = grafic("forte_tractiune_N", "forte_rezistenta_N")
+    v_p, (P_t_p, P_rez_p) = grafic("putere_tractiune_kW", "putere_rezistenta_kW")
+    v_d, (D_d,) = grafic("factor_dinamic")
+    v_a, (a_a,) = grafic("acceleratii_m_s2")
+
+    rezultate = []
+    for j in range(ctx.n):
+        caracteristica_tractiune = []
+        caracteristica_puteri = []
+        caracteristica_dinamica = []
+        caracteristica_acceleratii = []
+
+        for idx, t in enumerate(trepte):
+            caracteristica_tractiune.append({
+                "treapta": idx + 1,
+                "viteze_kmh": v_tr[idx, j],
+                "forte_tractiune_N": F_t_tr[idx, j],
+                "forte_rezistenta_N": F_rez_tr[idx, j]
+            })
+
+            caracteristica_puteri.append({
+                "treapta": idx + 1,
+                "viteze_kmh": v_p[idx, j],
+                "putere_tractiune_kW": P_t_p[idx, j],
+                "putere_rezistenta_kW": P_rez_p[idx, j]
+            })
+
+            caracteristica_dinamica.append({
+                "treapta": idx + 1,
+                "viteze_kmh": v_d[idx, j],
+                "factor_dinamic": D_d[idx, j]
+            })
+
+            caracteristica_acceleratii.append({
+                "treapta": idx + 1,
+                "delta": round(float(t["delta"][j]), 3),
+                "viteze_kmh": v_a[idx, j],
+                "acceleratii_m_s2": a_a[idx, j]
+            })
+
+        # Timp 0-100 km/h (None dacă vehiculul nu atinge 100 km/h)
+        m_j = nr_integrare[j]
+        timp_0_100 = spatiu_0_100 = None
+        if viteze_limita[j] >= 100.0:
+            timp_0_100 = round(float(np.interp(100 / 3.6, viteze_demarare_ms[j, :m_j], timp_demarare[j, :m_j])), 2)
+            spatiu_0_100 = round(float(np.interp(100 / 3.6, viteze_demarare_ms[j, :m_j], spatiu_demarare[j, :m_j])), 2)
+
+        n_j = nr_puncte[j]
+
+        v_dem, (t_dem, s_dem, a_dem) = reduce_serii(
+            viteze_demarare_r[j, :n_j],
+            [timp_demarare_r[j, :n_j], spatiu_demarare_r[j, :n_j], acceleratii_r[j, :n_j]],
+            max_puncte
+        )
+
+        rezultate.append({
+            "caracteristica_tractiune": caracteristica_tractiune,
+            "caracteristica_puteri": caracteristica_puteri,
+            "caracteristica_dinamica": caracteristica_dinamica,
+            "caracteristica_acceleratii": caracteristica_acceleratii,
+            "demarare": {
+                "viteze_kmh": v_dem,
+                "timpi_s": t_dem,
+                "spatii_m": s_dem,
+                "acceleratii_m_s2": a_dem
+            },
+            "performante_cheie": {
+                "viteza_maxima_kmh": round(float(v_max[j, 0]), 2),
+                "acceleratie_maxima_m_s2": round(float(a_max[j]), 3),
+                "timp_0_100_s": timp_0_100,
+                "spatiu_0_100_m": spatiu_0_100,
+                "panta_maxima_grade": round(float(panta_maxima[j]), 2),
+                "panta_maxima_procente": round(float(np.tan(np.radians(panta_maxima[j])) * 100), 2)
+            },
+            "puncte_caracteristice": puncte_pe_vehicul(puncte, j)
+        })
+
+    return rezultate
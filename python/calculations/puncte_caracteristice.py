@@ -0,0 +1,283 @@
+"""
+Punctele caracteristice ale dinamicii (viteza maximă, panta maximă, schimbarea treptelor)
+Punctele sunt determinate exact pe caracteristica motorului, nu pe grila de
+eșantionare: fiecare este încadrat pe grilă și rafinat apoi vectorizat, pentru
+toate vehiculele, treptele și perechile de trepte odată (regula falsi Illinois
+pentru rădăcini și pentru zerourile derivatei la maxime).
+"""
+
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .traction import forta_tractiune, turatie_motor
+from .vehicule import ContextVehicul, calcul_pe_grupe, in_liste
+
+G = 9.81
+RHO = 1.225
+
+# Numărul de puncte pe care se caută intersecțiile accelerațiilor a două trepte
+PUNCTE_SCHIMBARE = 64
+
+# Toleranța relativă a rafinării și numărul maxim de iterații
+TOLERANTA = 1e-9
+ITERATII_MAX = 60
+
+def radacina_incadrata(fn: Callable[[np.ndarray], np.ndarray], a: np.ndarray, b: np.ndarray,
+                       fa: np.ndarray, fb: np.ndarray, toleranta: float = TOLERANTA,
+                       iteratii_max: int = ITERATII_MAX) -> np.ndarray:
+    """
+    Rădăcinile fn(x) = 0 din intervalele [a, b], cu fa · fb ≤ 0, prin regula
+    falsi modificată (Illinois), vectorizat pe toate intervalele odată.
+    Un interval se închide când pasul estimării scade sub toleranta · |b|;
+    rafinarea se oprește când toate sunt închise sau după iteratii_max
+    evaluări ale lui fn.
+    """
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    fa, fb = np.array(fa, dtype=float), np.array(fb, dtype=float)
+    for _ in range(iteratii_max):
+        prag = toleranta * np.maximum(np.abs(b), 1)
+        if np.all(np.abs(b - a) <= prag):
+            break
+        with np.errstate(divide="ignore", invalid="ignore"):
+            c = np.where(fb != fa, b - fb * (b - a) / (fb - fa), (a + b) / 2)
+        c = np.where(np.isfinite(c), c, (a + b) / 2)
+        fc = fn(c)
+        schimba = fc * fb < 0
+        a, fa = np.where(schimba, b, a), np.where(schimba, fb, fa / 2)
+        pas, b, fb = np.abs(c - b), c, fc
+        # Rădăcina exactă sau pas sub toleranță: intervalul se închide în c
+        gata = (fc == 0) | (pas <= prag)
+        a, fa = np.where(gata, c, a), np.where(gata, fc, fa)
+    return b
+
+def maxim_incadrat(fn: Callable[[np.ndarray], np.ndarray], a: np.ndarray, b: np.ndarray,
+                   toleranta: float = TOLERANTA, iteratii_max: int = ITERATII_MAX) -> np.ndarray:
+    """
+    Punctele de maxim ale lui fn în intervalele [a, b], ca rădăcini ale
+    derivatei centrale fn(x + h) - fn(x - h) (h = 10⁻³ · (b - a)). fn trebuie
+    să accepte o axă finală suplimentară (cele două puncte ale diferenței),
+    astfel încât fiecare iterație este o singură evaluare.
+
+    Intervalele în care derivata nu schimbă semnul (maxim la capăt) returnează
+    capătul cu valoarea mai mare. Pentru funcții pătratice (motorul
+    Leiderman) rădăcina derivatei centrale este exact vârful parabolei.
+    """
+    a, b = np.array(a, dtype=float), np.array(b, dtype=float)
+    h = 1e-3 * (b - a)
+
+    def derivata(x: np.ndarray) -> np.ndarray:
+        y = fn(np.stack([x + h, x - h], axis=-1))
+        return y[..., 0] - y[..., 1]
+
+    fa, fb = derivata(a), derivata(b)
+    incadrat = (fa >= 0) & (fb <= 0)
+    capat = np.where(fa < 0, a, b)  # derivata fără schimbare de semn: maximul la capăt
+    a_r, fa_r = np.where(incadrat, a, capat), np.where(incadrat, fa, 0.0)
+    b_r, fb_r = np.where(incadrat, b, capat), np.where(incadrat, fb, 0.0)
+    return radacina_incadrata(derivata, a_r, b_r, fa_r, fb_r, toleranta, iteratii_max)
+
+class DinamicaTrepte:
+    """
+    Factorul dinamic și accelerația în fiecare treaptă, ca funcții de turație,
+    pentru tablouri de forma (V, K', ...), unde K' indexează treptele din
+    `trepte` (implicit toate).
+    """
+
+    def __init__(self, ctx: ContextVehicul, trepte: Optional[np.ndarray] = None):
+        self.ctx = ctx
+        i_cv = ctx.i_cv if trepte is None else ctx.i_cv[:, trepte]
+        self.i_total = i_cv * ctx.i_0
+        self.delta = 1 + 0.04 + 0.05 * i_cv**2
+
+    def _forma(self, x: np.ndarray, n: np.ndarray) -> np.ndarray:
+        return x.reshape(x.shape + (1,) * (n.ndim - x.ndim))
+
+    def viteza(self, n: np.ndarray) -> np.ndarray:
+        """Viteza [m/s] la turația n."""
+        return n * np.pi * self._forma(self.ctx.r_d, n) / (30 * self._forma(self.i_total, n))
+
+    def turatie(self, v_ms: np.ndarray) -> np.ndarray:
+        """Turația [rot/min] la viteza v_ms."""
+        return turatie_motor(v_ms, self._forma(self.i_total, v_ms), self._forma(self.ctx.r_d, v_ms))
+
+    def factor_dinamic(self, n: np.ndarray) -> np.ndarray:
+        """D = (F_t - F_a) / G la turația n."""
+        c = self.ctx
+        v = self.viteza(n)
+        F_t = forta_tractiune(c.motor.cuplu(n), self._forma(self.i_total, n),
+                              self._forma(c.eta_t, n), self._forma(c.r_d, n))
+        F_a = 0.5 * RHO * self._forma(c.Cx * c.A, n) * v**2
+        return (F_t - F_a) / self._forma(c.greutate, n)
+
+    def acceleratie(self, n: np.ndarray) -> np.ndarray:
+        """a = (D - f) · g / δ la turația n (poate fi negativă)."""
+        return (self.factor_dinamic(n) - self._forma(self.ctx.f, n)) * G / self._forma(self.delta, n)
+
+def puncte_caracteristice(vehicle: Any, schimbari: bool = True) -> Dict[str, Any]:
+    """Punctele caracteristice ale unui vehicul (vezi `puncte_caracteristice_ctx`)."""
+    return in_liste(puncte_pe_vehicul(puncte_caracteristice_ctx(ContextVehicul([vehicle]), schimbari), 0))
+
+def puncte_caracteristice_batch(vehicles: Sequence[Any], schimbari: bool = True) -> List[Dict[str, Any]]:
+    """Punctele caracteristice pentru un lot, în ordinea vehiculelor."""
+    def pe_context(ctx: ContextVehicul) -> List[Dict[str, Any]]:
+        p = puncte_caracteristice_ctx(ctx, schimbari)
+        return [puncte_pe_vehicul(p, j) for j in range(ctx.n)]
+
+    return in_liste(calcul_pe_grupe(vehicles, pe_context))
+
+def puncte_caracteristice_ctx(ctx: ContextVehicul, schimbari: bool = True) -> Dict[str, np.ndarray]:
+    """
+    Punctele caracteristice ale vehiculelor unui context, ca tablouri.
+
+    Pe trepte (V, K):
+    - v_max_trepte_kmh: cea mai mare viteză la care D ≥ f (intersecția D = f,
+      sau viteza la n_max dacă D > f pe tot domeniul; NaN dacă D < f peste tot)
+    - limitata_turatie: True unde viteza maximă a treptei este dată de n_max
+    - D_max_trepte, n_D_max_trepte, v_D_max_trepte_kmh: maximul factorului
+      dinamic și turația/viteza la care apare
+    Pe vehicul (V,):
+    - viteza_maxima_kmh, treapta_viteza_maxima: maximul peste trepte (poate
+      fi într-o treaptă inferioară ultimei; 0 dacă nicio treaptă nu are D ≥ f)
+    - D_max: maximul factorului dinamic peste trepte
+    - panta_trepte_procente (V, K), panta_maxima_procente (V,): (D_max - f) · 100,
+      relația D_max = f + tg α_max din Cap. 5
+    Cu `schimbari`, pe perechi de trepte (V, K - 1): v_schimbare_kmh,
+    n_inainte, n_dupa și criteriu_schimbare (0 = accelerații egale,
+    1 = turația maximă în treapta inferioară, 2 = turația minimă în treapta
+    superioară), punctul care maximizează accelerația.
+    """
+    K = ctx.i_cv.shape[1]
+    dinamica = DinamicaTrepte(ctx)
+    n_min, n_max = ctx.n_min[:, :, np.newaxis], ctx.n_max[:, :, np.newaxis]
+    f = ctx.f[:, :, np.newaxis]
+
+    # Încadrarea pe grila motorului (V, K, S)
+    n = np.broadcast_to(ctx.n_motor[:, np.newaxis, :], (ctx.n, K, ctx.n_motor.shape[1]))
+    D = dinamica.factor_dinamic(n)
+    S = n.shape[-1]
+
+    # Viteza maximă pe trepte: ultimul punct cu D ≥ f și intersecția următoare
+    peste = D >= f
+    ultim = S - 1 - np.argmax(peste[..., ::-1], axis=-1)
+    exista = peste.any(axis=-1)
+    limitata = exista & (ultim == S - 1)
+    j = np.minimum(ultim, S - 2)[..., np.newaxis]
+    n_a = np.take_along_axis(n, j, axis=-1)[..., 0]
+    n_b = np.take_along_axis(n, j + 1, axis=-1)[..., 0]
+    g_a = np.take_along_axis(D, j, axis=-1)[..., 0] - f[..., 0]
+    g_b = np.take_along_axis(D, j + 1, axis=-1)[..., 0] - f[..., 0]
+    # Treptele fără intersecție nu se mai rafinează (interval de lungime nulă)
+    fara = limitata | ~exista
+    n_a, g_a = np.where(fara, n_b, n_a), np.where(fara, g_b, g_a)
+    n_v_max = radacina_incadrata(lambda x: dinamica.factor_dinamic(x) - ctx.f, n_a, n_b, g_a, g_b)
+    n_v_max = np.where(limitata, n_max[..., 0], n_v_max)
+    v_max_trepte = np.where(exista, dinamica.viteza(n_v_max) * 3.6, np.nan)
+
+    # Maximul factorului dinamic pe trepte: încadrat între vecinii maximului de pe grilă
+    i_max = np.argmax(D, axis=-1)[..., np.newaxis]
+    n_st = np.take_along_axis(n, np.maximum(i_max - 1, 0), axis=-1)[..., 0]
+    n_dr = np.take_along_axis(n, np.minimum(i_max + 1, S - 1), axis=-1)[..., 0]
+    n_D_max = maxim_incadrat(dinamica.factor_dinamic, n_st, n_dr)
+    D_max_trepte = np.maximum(dinamica.factor_dinamic(n_D_max), np.take_along_axis(D, i_max, axis=-1)[..., 0])
+
+    treapta_v_max = np.argmax(np.where(exista, v_max_trepte, -np.inf), axis=1)
+    rezultat = {
+        "v_max_trepte_kmh": v_max_trepte,
+        "limitata_turatie": limitata,
+        "D_max_trepte": D_max_trepte,
+        "n_D_max_trepte": n_D_max,
+        "v_D_max_trepte_kmh": dinamica.viteza(n_D_max) * 3.6,
+        "viteza_maxima_kmh": np.nan_to_num(
+            np.take_along_axis(v_max_trepte, treapta_v_max[:, np.newaxis], axis=1)[:, 0]
+        ),
+        "treapta_viteza_maxima": treapta_v_max + 1,
+        "D_max": D_max_trepte.max(axis=1),
+        "panta_trepte_procente": (D_max_trepte - ctx.f) * 100,
+        "panta_maxima_procente": (D_max_trepte.max(axis=1) - ctx.f[:, 0]) * 100,
+    }
+    if schimbari and K > 1:
+        rezultat.update(_puncte_schimbare(ctx))
+    return rezultat
+
+def _puncte_schimbare(ctx: ContextVehicul) -> Dict[str, np.ndarray]:
+    """
+    Vitezele de schimbare k → k+1 care maximizează accelerația: intersecția
+    a_k(v) = a_k+1(v) în domeniul comun al celor două trepte, limitată de
+    n_max în treapta k și de n_min în treapta k+1.
+    """
+    K = ctx.i_cv.shape[1]
+    # Treptele inferioare și superioare ale perechilor, evaluate împreună (V, 2K - 2)
+    perechi = DinamicaTrepte(ctx, np.concatenate([np.arange(K - 1), np.arange(1, K)]))
+
+    def turatii(v: np.ndarray) -> np.ndarray:
+        return perechi.turatie(np.concatenate([v, v], axis=1))
+
+    # Domeniul comun de viteze (V, K - 1)
+    v_sus = perechi.viteza(np.broadcast_to(ctx.n_max, perechi.i_total.shape))[:, :K - 1]
+    v_jos = perechi.viteza(np.broadcast_to(ctx.n_min, perechi.i_total.shape))[:, K - 1:]
+    suprapuse = v_jos < v_sus
+
+    def diferenta(v: np.ndarray) -> np.ndarray:
+        a = perechi.acceleratie(turatii(v))
+        return a[:, :K - 1] - a[:, K - 1:]
+
+    # Prima viteză la care treapta superioară accelerează mai bine (V, K - 1, S)
+    t = np.linspace(0, 1, PUNCTE_SCHIMBARE)
+    v = v_jos[..., np.newaxis] + (v_sus - v_jos)[..., np.newaxis] * t
+    h = diferenta(v)
+    sub = h < 0
+    prima = np.argmax(sub, axis=-1)
+    exista = sub.any(axis=-1)
+
+    j = np.maximum(prima - 1, 0)[..., np.newaxis]
+    v_a = np.take_along_axis(v, j, axis=-1)[..., 0]
+    v_b = np.take_along_axis(v, j + 1, axis=-1)[..., 0]
+    h_a = np.take_along_axis(h, j, axis=-1)[..., 0]
+    h_b = np.take_along_axis(h, j + 1, axis=-1)[..., 0]
+    criteriu = np.where(~suprapuse | ~exista, 1, np.where(prima == 0, 2, 0))
+    v_a, h_a = np.where(criteriu == 0, v_a, v_b), np.where(criteriu == 0, h_a, h_b)
+    v_egal = radacina_incadrata(diferenta, v_a, v_b, h_a, h_b)
+
+    v_schimbare = np.where(criteriu == 1, v_sus, np.where(criteriu == 2, v_jos, v_egal))
+    return {
+        "v_schimbare_kmh": v_schimbare * 3.6,
+        "n_inainte": turatii(v_schimbare)[:, :K - 1],
+        "n_dupa": turatii(v_schimbare)[:, K - 1:],
+        "criteriu_schimbare": criteriu,
+    }
+
+CRITERII_SCHIMBARE = ("acceleratii_egale", "turatie_maxima", "turatie_minima_treapta_urmatoare")
+
+def _valoare(x: float, zecimale: int) -> Optional[float]:
+    return round(float(x), zecimale) if np.isfinite(x) else None
+
+def puncte_pe_vehicul(p: Dict[str, np.ndarray], j: int) -> Dict[str, Any]:
+    """Rezultatul JSON al vehiculului j din tablourile unui context."""
+    trepte = []
+    for k in range(p["v_max_trepte_kmh"].shape[1]):
+        trepte.append({
+            "treapta": k + 1,
+            "viteza_maxima_kmh": _valoare(p["v_max_trepte_kmh"][j, k], 2),
+            "limitata_de": "turatie_maxima" if p["limitata_turatie"][j, k] else "rezistente",
+            "factor_dinamic_maxim": _valoare(p["D_max_trepte"][j, k], 5),
+            "panta_maxima_procente": _valoare(p["panta_trepte_procente"][j, k], 3),
+            "turatie_factor_dinamic_maxim": _valoare(p["n_D_max_trepte"][j, k], 0),
+            "viteza_factor_dinamic_maxim_kmh": _valoare(p["v_D_max_trepte_kmh"][j, k], 2),
+        })
+    rezultat: Dict[str, Any] = {
+        "viteza_maxima_kmh": _valoare(p["viteza_maxima_kmh"][j], 2),
+        "treapta_viteza_maxima": int(p["treapta_viteza_maxima"][j]),
+        "factor_dinamic_maxim": _valoare(p["D_max"][j], 5),
+        "panta_maxima_procente": _valoare(p["panta_maxima_procente"][j], 3),
+        "trepte": trepte,
+    }
+    if "v_schimbare_kmh" in p:
+        rezultat["schimbari"] = [{
+            "din_treapta": k + 1,
+            "in_treapta": k + 2,
+            "viteza_kmh": _valoare(p["v_schimbare_kmh"][j, k], 2),
+            "turatie_inainte_rot_min": _valoare(p["n_inainte"][j, k], 0),
+            "turatie_dupa_rot_min": _valoare(p["n_dupa"][j, k], 0),
+            "criteriu": CRITERII_SCHIMBARE[int(p["criteriu_schimbare"][j, k])],
+        } for k in range(p["v_schimbare_kmh"].shape[1])]
+    return rezultat
@@ -4,13 +4,30 @@ Conform: Untaru et al. - "Dinamica autovehiculelor pe roți" (1981)
 """
 
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+
+from .esantionare import reduce_serii
+from .vehicule import ContextVehicul, in_liste
 
 # Constante fizice
 G = 9.81  # Accelerația gravitațională [m/s²]
 RHO = 1.225  # Densitatea aerului la 20°C [kg/m³]
 
-def calculate_resistances(vehicle: Any) -> Dict[str, Any]:
+def forte_rezistenta(f: np.ndarray, greutate: np.ndarray, Cx: np.ndarray, A: np.ndarray,
+                     v_ms: np.ndarray, alfa: Any = 0.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rezistențele la rulare, aerodinamică și la pantă [N] pentru vitezele v_ms
+    și unghiurile alfa [rad]; parametrii vehiculului sunt vectori coloană
+    (V, 1), iar rezultatele se obțin prin broadcast cu v_ms și alfa.
+
+    F_r = f · G · cos(α), F_a = 0.5 · ρ · Cx · A · v², F_p = G · sin(α)
+    """
+    forta_rulare = f * greutate * np.cos(alfa)
+    forta_aer = 0.5 * RHO * Cx * A * v_ms**2
+    forta_panta = greutate * np.sin(alfa)
+    return forta_rulare, forta_aer, forta_panta
+
+def calculate_resistances(vehicle: Any, max_puncte: Optional[int] = None) -> Dict[str, Any]:
     """
     Calculează rezistențele la înaintare ale autovehiculului.
 
@@ -19,33 +36,46 @@ def calculate_resistances(vehicle: Any) -> Dict[str, Any]:
     - Rezistența aerodinamică (F_a)
     - Rezistența la urcarea pantei (F_p)
     - Rezistența totală (F_t)
+
+    max_puncte limitează numărul de puncte al fiecărei curbe (LTTB, vezi
+    `esantionare.indici_lttb`); None = rezoluția completă.
+    """
+    return in_liste(calculate_resistances_ctx(ContextVehicul([vehicle]), max_puncte)[0])
+
+def calculate_resistances_batch(vehicles: Sequence[Any], max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
     """
+    Rezistențele la înaintare pentru un lot de vehicule.
 
-    # Extragere parametri
-    m = vehicle.masa.masaTotala  # Masa totală [kg]
-    f = vehicle.pneu.coefRulare  # Coeficient rezistență rulare
-    Cx = vehicle.aerodinamic.coefAerodinamic  # Coeficient aerodinamic
-    A = vehicle.aerodinamic.arieFrontala  # Arie frontală [m²]
+    Calculul se face pe tablouri vehicule × viteze (V, S); rezultatele sunt
+    returnate per vehicul, în ordinea de intrare.
+    """
+    return in_liste(calculate_resistances_ctx(ContextVehicul(vehicles), max_puncte))
+
+def calculate_resistances_ctx(ctx: ContextVehicul, max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Calculează rezistențele pentru vehiculele unui context."""
+
+    # Extragere parametri (vectori coloană (V, 1))
+    f = ctx.f  # Coeficient rezistență rulare
+    Cx = ctx.Cx  # Coeficient aerodinamic
+    A = ctx.A  # Arie frontală [m²]
 
     # Greutatea vehiculului
-    greutate = m * G  # [N]
+    greutate = ctx.greutate  # [N]
 
     # Vector viteze pentru calcul [km/h]
     viteze_kmh = np.arange(0, 201, 5)  # 0 la 200 km/h, pas 5
     viteze_ms = viteze_kmh / 3.6  # Conversie în m/s
 
     # 1. Rezistența la rulare F_r = f · G · cos(α)
-    # Pentru teren plan (α = 0), cos(0) = 1
-    forta_rulare = f * greutate  # [N] - constantă
-
-    # 2. Rezistența aerodinamică F_a = 0.5 · ρ · Cx · A · v²
-    forta_aer = 0.5 * RHO * Cx * A * viteze_ms**2  # [N]
+    # Pentru teren plan (α = 0), cos(0) = 1 → constantă [N]
+    # 2. Rezistența aerodinamică F_a = 0.5 · ρ · Cx · A · v² [N]
+    forta_rulare, forta_aer, _ = forte_rezistenta(f, greutate, Cx, A, viteze_ms)
 
     # 3. Rezistența la urcarea pantei F_p = G · sin(α)
     # Calculăm pentru câteva unghiuri tipice
     unghiuri_grade = [0, 5, 10, 15, 20, 25, 30]
     unghiuri_rad = np.radians(unghiuri_grade)
-    forte_panta = [greutate * np.sin(alpha) for alpha in unghiuri_rad]
+    forte_panta = greutate * np.sin(unghiuri_rad)
 
     # Panta maximă teoretică (aderență ~ 0.8)
     phi = 0.8  # Coeficient de aderență
@@ -61,39 +91,135 @@ def calculate_resistances(vehicle: Any) -> Dict[str, Any]:
     # ψ = f + (ρ · Cx · A · v²) / (2 · G)
     psi = f + (RHO * Cx * A * viteze_ms**2) / (2 * greutate)
 
-    return {
-        "parametri_intrare": {
-            "masa_totala_kg": m,
-            "greutate_N": round(greutate, 2),
-            "coef_rulare": f,
-            "coef_aerodinamic": Cx,
-            "arie_frontala_m2": A
-        },
-        "rezistenta_rulare": {
-            "formula": "F_r = f · G · cos(α)",
-            "valoare_N": round(forta_rulare, 2),
-            "descriere": "Constantă pe teren plan"
-        },
-        "rezistenta_aerodinamica": {
-            "formula": "F_a = 0.5 · ρ · Cx · A · v²",
-            "viteze_kmh": viteze_kmh.tolist(),
-            "forte_N": np.round(forta_aer, 2).tolist()
-        },
-        "rezistenta_panta": {
-            "formula": "F_p = G · sin(α)",
-            "unghiuri_grade": unghiuri_grade,
-            "forte_N": [round(f, 2) for f in forte_panta],
-            "panta_maxima_grade": round(panta_maxima_grad, 2)
-        },
-        "rezistenta_totala": {
-            "formula": "F_t = F_r + F_a",
-            "viteze_kmh": viteze_kmh.tolist(),
-            "forte_N": np.round(forta_totala, 2).tolist(),
-            "putere_necesara_kW": np.round(putere_necesara, 2).tolist()
-        },
-        "coef_rezistenta_totala": {
-            "formula": "ψ = f + (ρ · Cx · A · v²) / (2 · G)",
-            "viteze_kmh": viteze_kmh.tolist(),
-            "psi": np.round(psi, 4).tolist()
-        }
-    }
+    # Rotunjire o singură dată pentru tot lotul
+    forte_panta_r = np.round(forte_panta, 2)
+
+    # Fiecare curbă este redusă separat, pe tot lotul (axa de viteze devine (V, S))
+    viteze_aer, (forta_aer_r,) = reduce_serii(viteze_kmh, [np.round(forta_aer, 2)], max_puncte)
+    viteze_totala, (forta_totala_r, putere_r) = reduce_serii(
+        viteze_kmh, [np.round(forta_totala, 2), np.round(putere_necesara, 2)], max_puncte
+    )
+    viteze_psi, (psi_r,) = reduce_serii(viteze_kmh, [np.round(psi, 4)], max_puncte)
+
+    def rand(x: np.ndarray, j: int) -> np.ndarray:
+        return x if x.ndim == 1 else x[j]
+
+    rezultate = []
+    for j, vehicle in enumerate(ctx.vehicule):
+        rezultate.append({
+            "parametri_intrare": {
+                "masa_totala_kg": vehicle.masa.masaTotala,
+                "greutate_N": round(float(greutate[j, 0]), 2),
+                "coef_rulare": vehicle.pneu.coefRulare,
+                "coef_aerodinamic": vehicle.aerodinamic.coefAerodinamic,
+                "arie_frontala_m2": vehicle.aerodinamic.arieFrontala
+            },
+            "rezistenta_rulare": {
+                "formula": "F_r = f · G · cos(α)",
+                "valoare_N": round(float(forta_rulare[j, 0]), 2),
+                "descriere": "Constantă pe teren plan"
+            },
+            "rezistenta_aerodinamica": {
+                "formula": "F_a = 0.5 · ρ · Cx · A · v²",
+                "viteze_kmh": rand(viteze_aer, j),
+                "forte_N": forta_aer_r[j]
+            },
+            "rezistenta_panta": {
+                "formula": "F_p = G · sin(α)",
+                "unghiuri_grade": unghiuri_grade,
+                "forte_N": forte_panta_r[j],
+                "panta_maxima_grade": round(float(panta_maxima_grad[j, 0]), 2)
+            },
+            "rezistenta_totala": {
+                "formula": "F_t = F_r + F_a",
+                "viteze_kmh": rand(viteze_totala, j),
+                "forte_N": forta_totala_r[j],
+                "putere_necesara_kW": putere_r[j]
+            },
+            "coef_rezistenta_totala": {
+                "formula": "ψ = f + (ρ · Cx · A · v²) / (2 · G)",
+                "viteze_kmh": rand(viteze_psi, j),
+                "psi": psi_r[j]
+            }
+        })
+
+    return rezultate
+
+# ============== Hărți de rezistență ==============
+
+# Ordinea axelor în tabelele hărții
+AXE_HARTA = ("viteza_kmh", "panta_procente", "vant_kmh", "altitudine_m")
+
+def densitate_aer(altitudine_m: Any) -> np.ndarray:
+    """
+    Densitatea aerului în atmosfera standard (ISA, troposferă):
+    ρ(h) = ρ0 · (1 - 2.25577·10⁻⁵ · h)^4.2559
+    """
+    return RHO * (1 - 2.25577e-5 * np.asarray(altitudine_m, dtype=float)) ** 4.2559
+
+def harta_rezistente(vehicle: Any, viteze_kmh: Sequence[float], pante_procente: Sequence[float] = (0.0,),
+                     vant_kmh: Sequence[float] = (0.0,), altitudini_m: Sequence[float] = (0.0,)) -> Dict[str, Any]:
+    """Harta de rezistență pentru un singur vehicul (vezi `harta_rezistente_ctx`)."""
+    return in_liste(harta_rezistente_ctx(
+        ContextVehicul([vehicle]), viteze_kmh, pante_procente, vant_kmh, altitudini_m
+    )[0])
+
+def harta_rezistente_ctx(ctx: ContextVehicul, viteze_kmh: Sequence[float],
+                         pante_procente: Sequence[float] = (0.0,), vant_kmh: Sequence[float] = (0.0,),
+                         altitudini_m: Sequence[float] = (0.0,)) -> List[Dict[str, Any]]:
+    """
+    Rezistența totală și puterea necesară pe produsul cartezian viteză ×
+    pantă × vânt × altitudine, într-o singură operație vectorizată
+    (tablouri (V, S, P, W, H)).
+
+    - panta: în procente, pozitivă la urcare: F_r = f·G·cos α, F_p = G·sin α
+    - vântul: viteza din față (negativă = vânt din spate); rezistența
+      aerodinamică folosește viteza relativă v_r = v + v_w, cu semn:
+      F_a = 0.5·ρ·Cx·A·v_r·|v_r|
+    - altitudinea: densitatea aerului după atmosfera standard (`densitate_aer`)
+
+    Tabelele sunt dense, cu axele în ordinea AXE_HARTA. Pentru hărți mari,
+    apelantul împarte axa vitezelor în tile-uri (vezi `serviciu.tila_harta_rezistente`).
+    """
+    v_kmh = np.asarray(viteze_kmh, dtype=float)
+    pante = np.asarray(pante_procente, dtype=float)
+    vant = np.asarray(vant_kmh, dtype=float)
+    altitudini = np.asarray(altitudini_m, dtype=float)
+
+    v_ms = v_kmh.reshape(1, -1, 1, 1, 1) / 3.6
+    alfa = np.arctan(pante.reshape(1, 1, -1, 1, 1) / 100)
+    v_rel = v_ms + vant.reshape(1, 1, 1, -1, 1) / 3.6  # Viteza față de aer [m/s]
+    rho = densitate_aer(altitudini).reshape(1, 1, 1, 1, -1)
+
+    def pe_vehicul(x: np.ndarray) -> np.ndarray:
+        return x.reshape(-1, 1, 1, 1, 1)
+
+    greutate = pe_vehicul(ctx.greutate)
+    forta_rulare = pe_vehicul(ctx.f) * greutate * np.cos(alfa)  # (V, 1, P, 1, 1)
+    forta_panta = greutate * np.sin(alfa)  # (V, 1, P, 1, 1)
+    forta_aer = 0.5 * rho * pe_vehicul(ctx.Cx) * pe_vehicul(ctx.A) * v_rel * np.abs(v_rel)  # (V, S, 1, W, H)
+    forta_totala = forta_rulare + forta_panta + forta_aer  # (V, S, P, W, H)
+    putere_necesara = forta_totala * v_ms / 1000  # [kW]
+
+    rezultate = []
+    for j in range(ctx.n):
+        rezultate.append({
+            "axe": {
+                "ordine": list(AXE_HARTA),
+                "viteza_kmh": v_kmh,
+                "panta_procente": pante,
+                "vant_kmh": vant,
+                "altitudine_m": altitudini
+            },
+            "densitate_aer_kg_m3": np.round(rho.reshape(-1), 4),
+            "forta_totala_N": np.round(forta_totala[j], 2),
+            "putere_necesara_kW": np.round(putere_necesara[j], 3),
+            "formule": {
+                "forta_totala": "F_t = f·G·cos α + G·sin α + 0.5·ρ(h)·Cx·A·v_r·|v_r|",
+                "viteza_relativa": "v_r = v + v_w",
+                "densitate_aer": "ρ(h) = ρ0 · (1 - 2.25577·10⁻⁵ · h)^4.2559",
+                "putere_necesara": "P = F_t · v"
+            }
+        })
+
+    return rezultate
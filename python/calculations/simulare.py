@@ -0,0 +1,320 @@
+"""
+Simularea demarării în domeniul timpului
+Integrarea dinamicii longitudinale cu strategie de schimbare a treptelor,
+timp de schimbare (întreruperea tracțiunii) și patinarea ambreiajului la pornire
+"""
+
+import numpy as np
+from typing import Any, Dict, List, Optional, Sequence
+
+from .esantionare import indici_lttb
+from .vehicule import ContextVehicul, calcul_pe_grupe
+
+G = 9.81
+RHO = 1.225
+
+# Pasul maxim de integrare [s]
+PAS_INTEGRARE_S = 0.25
+
+# Toleranțele de declanșare după localizarea unui eveniment
+EPS_TURATIE = 1e-6  # [rot/min]
+EPS_VITEZA = 1e-9   # [m/s]
+EPS_TIMP = 1e-9     # [s]
+
+STRATEGIE_IMPLICITA = {
+    "timp_schimbare_s": 0.3,
+    "turatie_schimbare_rpm": None,  # None → turația maximă
+    "turatie_lansare_rpm": None     # None → turația cuplului maxim
+}
+
+def _hermite(s: np.ndarray, y0: np.ndarray, y1: np.ndarray, d0: np.ndarray, d1: np.ndarray) -> np.ndarray:
+    """Interpolarea Hermite cubică pe [0, 1], cu derivatele d0, d1 scalate la lungimea intervalului."""
+    return ((2 * s - 3) * s**2 + 1) * y0 + ((s - 2) * s + 1) * s * d0 + (3 - 2 * s) * s**2 * y1 + (s - 1) * s**2 * d1
+
+def simuleaza_demarare(vehicle: Any, strategii: Optional[Sequence[Dict[str, Any]]] = None,
+                       viteza_tinta_kmh: float = 100.0, pas_timp_s: float = 0.05,
+                       t_max_s: float = 60.0, max_puncte: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Simulează demararea unui vehicul pentru una sau mai multe strategii de
+    schimbare a treptelor.
+    """
+    simulari = simuleaza_demarare_ctx(ContextVehicul([vehicle]), strategii,
+                                      viteza_tinta_kmh, pas_timp_s, t_max_s, max_puncte)[0]
+    return {"viteza_tinta_kmh": viteza_tinta_kmh, "simulari": simulari}
+
+def simuleaza_demarare_batch(vehicles: Sequence[Any], strategii: Optional[Sequence[Dict[str, Any]]] = None,
+                             viteza_tinta_kmh: float = 100.0, pas_timp_s: float = 0.05,
+                             t_max_s: float = 60.0, max_puncte: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """Simularea pentru un lot de vehicule; rezultatele în ordinea de intrare."""
+    return calcul_pe_grupe(vehicles, lambda ctx: simuleaza_demarare_ctx(
+        ctx, strategii, viteza_tinta_kmh, pas_timp_s, t_max_s, max_puncte))
+
+def simuleaza_demarare_ctx(ctx: ContextVehicul, strategii: Optional[Sequence[Dict[str, Any]]] = None,
+                           viteza_tinta_kmh: float = 100.0, pas_timp_s: float = 0.05,
+                           t_max_s: float = 60.0, max_puncte: Optional[int] = None) -> List[List[Dict[str, Any]]]:
+    """
+    Simulează demararea de pe loc pentru toate combinațiile vehicul × strategie.
+
+    Cele N = V · S simulări avansează împreună, cu pași Runge-Kutta de ordinul
+    4 evaluați vectorial pentru toate simulările, fiecare cu propriul timp și
+    propriul pas (cel mult PAS_INTEGRARE_S, aliniat la grila pas_timp_s a
+    urmelor). Starea discretă (treapta, schimbarea în curs, ambreiajul,
+    simulările încheiate) se modifică doar la evenimente, localizate separat
+    pentru fiecare simulare: un eveniment scurtează doar pasul simulării
+    respective, nu și al celorlalte, deci costul crește cu durata simulată,
+    nu cu numărul total de evenimente din lot.
+
+    - turația de schimbare atinsă → începe schimbarea (tracțiune nulă pe
+      durata timp_schimbare_s, apoi treapta următoare); în ultima treaptă,
+      atingerea turației maxime încheie simularea
+    - sfârșitul unei schimbări (pasul se oprește exact la el)
+    - viteza țintă atinsă → simularea se încheie
+
+    Sub turația de lansare ambreiajul patinează: motorul rămâne la turația
+    de lansare și transmite cuplul corespunzător. Pragurile de turație sunt
+    praguri de viteză în treapta curentă; momentul atingerii lor este găsit
+    pe interpolarea Hermite cubică a pasului, care este apoi refăcut până la
+    acel moment.
+
+    Urmele sunt înregistrate cu pasul pas_timp_s și la fiecare eveniment; cu
+    max_puncte, fiecare urmă este redusă la cel mult max_puncte puncte (LTTB
+    pe toate mărimile ei), după calculul timpilor și spațiilor țintă.
+
+    Returnează, per vehicul, lista rezultatelor pe strategii.
+    """
+    strategii = [dict(STRATEGIE_IMPLICITA, **(s or {})) for s in (strategii or [{}])]
+    V, S = ctx.n, len(strategii)
+    K = ctx.i_cv.shape[1]
+    N = V * S
+
+    # Parametrii per simulare (N,): vehiculul j, strategia s → indicele j · S + s
+    iv = np.repeat(np.arange(V), S)
+
+    def per_sim(x: np.ndarray) -> np.ndarray:
+        return np.asarray(x)[iv, 0]
+
+    m = per_sim(ctx.m)
+    F_f = per_sim(ctx.f) * per_sim(ctx.greutate)
+    r_d, eta_t = per_sim(ctx.r_d), per_sim(ctx.eta_t)
+    n_min, n_max = per_sim(ctx.n_min), per_sim(ctx.n_max)
+    k_aer = 0.5 * RHO * per_sim(ctx.Cx) * per_sim(ctx.A)
+    i_total = ctx.i_total[iv]                          # (N, K)
+    delta = 1 + 0.04 + 0.05 * ctx.i_cv[iv]**2          # (N, K)
+
+    def din_strategii(cheie: str, implicit: np.ndarray) -> np.ndarray:
+        valori = np.array([np.nan if s[cheie] is None else s[cheie] for s in strategii], dtype=float)
+        valori = np.tile(valori, V)
+        return np.where(np.isnan(valori), implicit, valori)
+
+    n_cuplu_max = np.take_along_axis(ctx.n_motor, np.argmax(ctx.M_e, axis=1)[:, np.newaxis], axis=1)
+    t_schimbare = din_strategii("timp_schimbare_s", np.zeros(N))
+    n_schimbare = np.minimum(din_strategii("turatie_schimbare_rpm", n_max), n_max)
+    n_lansare = np.clip(din_strategii("turatie_lansare_rpm", per_sim(n_cuplu_max)), n_min, n_max)
+    v_tinta = viteza_tinta_kmh / 3.6
+
+    # Starea: timpul, viteza și spațiul fiecărei simulări, plus starea discretă
+    t = np.zeros(N)
+    v = np.zeros(N)
+    x = np.zeros(N)
+    treapta = np.zeros(N, dtype=int)
+    sfarsit_schimbare = np.full(N, -np.inf)
+    activ = np.ones(N, dtype=bool)
+    cuplat = np.zeros(N, dtype=bool)  # ambreiajul nu mai patinează
+    timp_tinta = np.full(N, np.nan)
+    spatiu_tinta = np.full(N, np.nan)
+    schimbari: List[List[Dict[str, Any]]] = [[] for _ in range(N)]
+    evaluari = 0
+
+    rand = np.arange(N)
+    motor = ctx.motor
+
+    # Constantele treptei curente (N,), actualizate la fiecare schimbare:
+    # n = k_n · v, F_t = k_F · M_e(n), cu M_e din tabelele de cuplu ale contextului
+    const = {}
+
+    def actualizeaza_treapta() -> None:
+        i_t = i_total[rand, treapta]
+        const["k_n"] = 30 * i_t / (np.pi * r_d)
+        const["k_F"] = i_t * eta_t / r_d
+        const["m_red"] = m * delta[rand, treapta]
+
+    actualizeaza_treapta()
+
+    def coloana(c: np.ndarray, v: np.ndarray) -> np.ndarray:
+        return c if v.ndim == 1 else c[:, np.newaxis]
+
+    def acceleratie(v: np.ndarray, in_schimbare: np.ndarray) -> np.ndarray:
+        """
+        Accelerația la vitezele v (N,) sau (N, T), cu tracțiunea întreruptă
+        pentru simulările in_schimbare (N,).
+        """
+        nonlocal evaluari
+        evaluari += 1
+        # Sub turația de lansare ambreiajul patinează
+        M_e = motor.cuplu(np.maximum(coloana(const["k_n"], v) * v, coloana(n_lansare, v)), iv)
+        F_t = np.where(coloana(in_schimbare, v), 0.0, coloana(const["k_F"], v) * M_e)
+        a = (F_t - coloana(F_f, v) - coloana(k_aer, v) * v**2) / coloana(const["m_red"], v)
+        # De pe loc vehiculul nu se deplasează înapoi
+        return np.where((v <= 0) & (a < 0), 0.0, a)
+
+    def pas_rk4(h: np.ndarray, a0: np.ndarray, in_schimbare: np.ndarray) -> tuple:
+        """Un pas RK4 de lungime h (N,) din starea curentă (cu accelerația a0); (v, x) la t + h."""
+        v2 = v + 0.5 * h * a0
+        a2 = acceleratie(v2, in_schimbare)
+        v3 = v + 0.5 * h * a2
+        a3 = acceleratie(v3, in_schimbare)
+        v4 = v + h * a3
+        a4 = acceleratie(v4, in_schimbare)
+        v_nou = v + h / 6 * (a0 + 2 * a2 + 2 * a3 + a4)
+        x_nou = x + h / 6 * (v + 2 * v2 + 2 * v3 + v4)
+        return v_nou, x_nou
+
+    def praguri() -> np.ndarray:
+        """Cea mai mică viteză-prag (N,) a fiecărei simulări în starea curentă."""
+        prag_turatie = np.where(treapta < K - 1, n_schimbare, n_max)
+        prag = np.where(t + EPS_TIMP < sfarsit_schimbare, np.inf, prag_turatie / const["k_n"])
+        prag = np.minimum(prag, np.where(cuplat, np.inf, n_lansare / const["k_n"]))
+        return np.minimum(prag, v_tinta)
+
+    def aplica_evenimente(indici: np.ndarray) -> None:
+        """Actualizează starea discretă a simulărilor date pentru condițiile îndeplinite."""
+        selectie = np.zeros(N, dtype=bool)
+        selectie[indici] = True
+        ajuns = selectie & activ & (v >= v_tinta - EPS_VITEZA)
+        timp_tinta[ajuns] = t[ajuns]
+        spatiu_tinta[ajuns] = x[ajuns]
+        activ[ajuns] = False
+
+        liber = selectie & activ & ~(t + EPS_TIMP < sfarsit_schimbare)
+        n = const["k_n"] * v
+        cuplat[selectie & (n >= n_lansare - EPS_TURATIE)] = True
+        limitat = liber & (treapta == K - 1) & (n >= n_max - EPS_TURATIE)
+        activ[limitat] = False
+
+        schimba = liber & (treapta < K - 1) & (n >= n_schimbare - EPS_TURATIE)
+        for j in np.flatnonzero(schimba):
+            schimbari[j].append({
+                "t_s": round(float(t[j]), 3),
+                "din_treapta": int(treapta[j]) + 1,
+                "in_treapta": int(treapta[j]) + 2,
+                "viteza_kmh": round(float(v[j]) * 3.6, 2),
+                "turatie_rpm": round(float(n[j]), 0)
+            })
+        treapta[schimba] += 1
+        sfarsit_schimbare[schimba] = t[schimba] + t_schimbare[schimba]
+        if schimba.any():
+            actualizeaza_treapta()
+
+    # Punctele urmelor: (simulare, t, v, x, treapta, turație, a, în schimbare)
+    puncte: List[np.ndarray] = []
+
+    def inregistreaza(indici: np.ndarray, t: np.ndarray, v: np.ndarray, x: np.ndarray,
+                      a: np.ndarray) -> None:
+        """Punctele (t, v, x, a) ale simulărilor indici, în treapta lor curentă."""
+        puncte.append(np.stack([
+            indici, t, v * 3.6, x, treapta[indici] + 1,
+            np.maximum(const["k_n"][indici] * v, n_lansare[indici]), a,
+            t + EPS_TIMP < sfarsit_schimbare[indici]
+        ]))
+
+    aplica_evenimente(rand)
+    inregistreaza(rand, t, v, x, acceleratie(v, t + EPS_TIMP < sfarsit_schimbare))
+    # Punctele grilei urmelor dintr-un pas
+    grila_pas = np.arange(int(np.ceil(PAS_INTEGRARE_S / pas_timp_s)) + 1)
+    pasi = 0
+    pasi_max = int(np.ceil(t_max_s / PAS_INTEGRARE_S)) + 4 * (K + 2) + 10
+    while activ.any() and pasi < pasi_max:
+        pasi += 1
+        # Pasul fiecărei simulări: cel mult PAS_INTEGRARE_S, oprit la
+        # sfârșitul schimbării în curs și la t_max
+        in_schimbare = t + EPS_TIMP < sfarsit_schimbare
+        sfarsit = np.minimum(t + PAS_INTEGRARE_S, t_max_s)
+        sfarsit = np.where(in_schimbare, np.minimum(sfarsit, sfarsit_schimbare), sfarsit)
+        h = np.where(activ, sfarsit - t, 0.0)
+
+        prag = praguri()
+        a0 = acceleratie(v, in_schimbare)
+        v1, x1 = pas_rk4(h, a0, in_schimbare)
+        a1 = acceleratie(v1, in_schimbare)
+
+        # Pragurile depășite în pas: momentul atingerii (prin bisecție, pe
+        # interpolarea Hermite a pasului), apoi pasul refăcut până la el
+        depasit = activ & (v1 >= prag) & (v < prag)
+        if depasit.any():
+            jos, sus = np.zeros(N), np.ones(N)
+            for _ in range(40):
+                mijloc = 0.5 * (jos + sus)
+                sub = _hermite(mijloc, v, v1, a0 * h, a1 * h) < prag
+                jos = np.where(sub, mijloc, jos)
+                sus = np.where(sub, sus, mijloc)
+            h = np.where(depasit, sus * h, h)
+            v_refacut, x_refacut = pas_rk4(h, a0, in_schimbare)
+            v1 = np.where(depasit, np.maximum(v_refacut, prag), v1)
+            x1 = np.where(depasit, x_refacut, x1)
+            a1 = acceleratie(v1, in_schimbare)
+        t1 = t + h
+
+        # Punctele grilei din interiorul pasului, pe interpolarea Hermite
+        grila = (np.floor(t / pas_timp_s + 1e-9)[:, np.newaxis] + 1 + grila_pas) * pas_timp_s
+        interior = activ[:, np.newaxis] & (grila < t1[:, np.newaxis] - EPS_TIMP)
+        if interior.any():
+            s = (grila - t[:, np.newaxis]) / np.where(h > 0, h, 1.0)[:, np.newaxis]
+            v_g = _hermite(s, *(y[:, np.newaxis] for y in (v, v1, a0 * h, a1 * h)))
+            x_g = _hermite(s, *(y[:, np.newaxis] for y in (x, x1, v * h, v1 * h)))
+            a_g = acceleratie(v_g, in_schimbare)
+            inregistreaza(np.nonzero(interior)[0], grila[interior], v_g[interior], x_g[interior],
+                          a_g[interior])
+
+        # Sfârșitul pasului aliniat la grilă, dacă este pe ea
+        grila_sfarsit = np.round(t1 / pas_timp_s) * pas_timp_s
+        pe_grila = activ & (np.abs(t1 - grila_sfarsit) <= EPS_TIMP)
+        t = np.where(activ, np.where(pe_grila, grila_sfarsit, t1), t)
+        v = np.where(activ, v1, v)
+        x = np.where(activ, x1, x)
+
+        # Sfârșitul pasului: pe grilă, la evenimente și la t_max, cu starea dinaintea evenimentului
+        sfarsit_schimbare_atins = activ & in_schimbare & (np.abs(t - sfarsit_schimbare) <= EPS_TIMP)
+        la_t_max = activ & (t >= t_max_s - EPS_TIMP)
+        eveniment = depasit | sfarsit_schimbare_atins
+        de_inregistrat = np.flatnonzero(pe_grila | eveniment | la_t_max)
+        if len(de_inregistrat):
+            if sfarsit_schimbare_atins.any():
+                # Tracțiunea revine la sfârșitul schimbării
+                a1 = acceleratie(v, t + EPS_TIMP < sfarsit_schimbare)
+            inregistreaza(de_inregistrat, t[de_inregistrat], v[de_inregistrat], x[de_inregistrat],
+                          a1[de_inregistrat])
+        if eveniment.any():
+            aplica_evenimente(np.flatnonzero(eveniment))
+        activ &= ~la_t_max
+
+    # Punctele tuturor simulărilor, grupate pe simulare în ordinea timpului
+    puncte_toate = np.concatenate(puncte, axis=1)
+    puncte_toate = puncte_toate[:, np.argsort(puncte_toate[0], kind="stable")]
+    limite = np.searchsorted(puncte_toate[0], np.arange(N + 1))
+    puncte_toate = puncte_toate[1:]
+
+    rezultate: List[List[Dict[str, Any]]] = [[] for _ in range(V)]
+    for j in range(N):
+        urma = puncte_toate[:, limite[j]:limite[j + 1]]
+        # Punctele duplicate (un eveniment pe grilă)
+        pastrat = np.concatenate([[True], np.diff(urma[0]) > 0]) if urma.shape[1] else np.zeros(0, bool)
+        urma = urma[:, pastrat]
+        if max_puncte is not None and urma.shape[1] > max_puncte:
+            urma = urma[:, indici_lttb(urma[0], urma[1:], max_puncte)]
+        rezultate[iv[j]].append({
+            "strategie": strategii[j % S],
+            "timp_tinta_s": None if np.isnan(timp_tinta[j]) else round(float(timp_tinta[j]), 3),
+            "spatiu_tinta_m": None if np.isnan(spatiu_tinta[j]) else round(float(spatiu_tinta[j]), 2),
+            "schimbari": schimbari[j],
+            "urma": {
+                "timp_s": np.round(urma[0], 3).tolist(),
+                "viteza_kmh": np.round(urma[1], 2).tolist(),
+                "spatiu_m": np.round(urma[2], 2).tolist(),
+                "treapta": urma[3].astype(int).tolist(),
+                "turatie_rpm": np.round(urma[4], 0).tolist(),
+                "acceleratie_ms2": np.round(urma[5], 3).tolist(),
+                "in_schimbare": urma[6].astype(bool).tolist()
+            },
+            "statistici": {"pasi": pasi, "evaluari_rhs": evaluari}
+        })
+    return rezultate
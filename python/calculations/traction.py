@@ -4,41 +4,37 @@ Conform: Frățilă, Untaru, Poțîncu - "Calculul și construcția automobilelo
 """
 
 import numpy as np
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Sequence
+
+from .esantionare import reduce_serii
+from .motor import engine_characteristic_leiderman  # păstrat pentru compatibilitate
+from .vehicule import ContextVehicul, calcul_pe_grupe, in_liste
 
 G = 9.81  # Accelerația gravitațională [m/s²]
 RHO = 1.225  # Densitatea aerului [kg/m³]
 
-def engine_characteristic_leiderman(n: np.ndarray, P_max: float, n_P: float,
-                                     engine_type: str = 'benzina') -> tuple:
-    """
-    Calculează caracteristica exterioară a motorului folosind formula Leiderman-Khlystov.
-
-    P_e = P_max · (a·x + b·x² - c·x³), unde x = n/n_P
-
-    Coeficienți:
-    - Benzină: a=0.87, b=1.13, c=1.0
-    - Diesel: a=0.53, b=1.56, c=1.09
-    """
-
-    if engine_type == 'diesel':
-        a, b, c = 0.53, 1.56, 1.09
-    else:  # benzină
-        a, b, c = 0.87, 1.13, 1.0
-
-    x = n / n_P
-
-    # Putere [kW]
-    P_e = P_max * (a * x + b * x**2 - c * x**3)
-    P_e = np.maximum(P_e, 0)  # Evită valori negative
-
-    # Cuplu [N·m]
-    # M_e = (P_e · 1000 · 60) / (2π · n)
-    M_e = np.where(n > 0, (P_e * 1000 * 60) / (2 * np.pi * n), 0)
-
-    return P_e, M_e
-
-def calculate_traction(vehicle: Any) -> Dict[str, Any]:
+# Descrierea caracteristicii motorului: polinomul Leiderman-Khlystov sau
+# curba de cuplu măsurată, interpolată PCHIP (vezi motor.tabel_curba_masurata)
+MOTOR_SINTETIC = {
+    "sursa": "Leiderman-Khlystov",
+    "formula_putere": "P_e = P_max · (a·x + b·x² - c·x³)",
+    "formula_cuplu": "M_e = (P_e · 1000 · 60) / (2π · n)",
+}
+MOTOR_MASURAT = {
+    "sursa": "curba_masurata",
+    "interpolare": "PCHIP (spline cubic monoton pe porțiuni) pe punctele cuplului măsurat",
+    "formula_putere": "P_e = M_e · 2π · n / (1000 · 60)",
+}
+
+def turatie_motor(v_ms: np.ndarray, i_total: np.ndarray, r_d: np.ndarray) -> np.ndarray:
+    """Turația motorului [rot/min] la viteza v_ms: n = (30 · i_t · v) / (π · r_d)."""
+    return 30 * v_ms * i_total / (np.pi * r_d)
+
+def forta_tractiune(M_e: np.ndarray, i_total: np.ndarray, eta_t: np.ndarray, r_d: np.ndarray) -> np.ndarray:
+    """Forța de tracțiune la roată [N]: F_t = (M_e · i_t · η_t) / r_d."""
+    return M_e * i_total * eta_t / r_d
+
+def calculate_traction(vehicle: Any, max_puncte: Optional[int] = None) -> Dict[str, Any]:
     """
     Calculează caracteristicile de tracțiune ale autovehiculului.
 
@@ -47,38 +43,47 @@ def calculate_traction(vehicle: Any) -> Dict[str, Any]:
     - Rapoarte de transmitere
     - Forța de tracțiune per treaptă
     - Viteza maximă teoretică
+
+    max_puncte limitează numărul de puncte al fiecărei curbe (LTTB);
+    None = rezoluția completă.
+    """
+    return in_liste(calculate_traction_ctx(ContextVehicul([vehicle]), max_puncte)[0])
+
+def calculate_traction_batch(vehicles: Sequence[Any], max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Caracteristicile de tracțiune pentru un lot de vehicule.
+
+    Vehiculele sunt grupate după numărul de trepte; în fiecare grupă calculul
+    se face pe tablouri vehicule × turații (V, S).
     """
+    return in_liste(calcul_pe_grupe(vehicles, lambda ctx: calculate_traction_ctx(ctx, max_puncte)))
+
+def calculate_traction_ctx(ctx: ContextVehicul, max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Tracțiunea pentru vehiculele unui context (același număr de trepte)."""
 
     # Parametri motor
-    P_max = vehicle.motor.putereMaxima  # [kW]
-    n_P = vehicle.motor.turatiePutereMax  # [rot/min]
-    M_max = vehicle.motor.cuplMaxim  # [N·m]
-    n_M = vehicle.motor.turatieCuplMax  # [rot/min]
-    n_max = vehicle.motor.turatieMaxima  # [rot/min]
-    n_min = vehicle.motor.turatieRalanti  # [rot/min]
-    tip_motor = vehicle.motor.tip
+    n_max = ctx.n_max  # [rot/min]
 
     # Parametri transmisie
-    i_cv = np.array(vehicle.transmisie.raporturiCV)  # Rapoarte cutie viteze
-    i_0 = vehicle.transmisie.raportPrincipal  # Raport transmisie principală
-    eta_t = vehicle.transmisie.randamentTransmisie  # Randament transmisie
+    i_cv = ctx.i_cv  # Rapoarte cutie viteze (V, K)
+    i_0 = ctx.i_0  # Raport transmisie principală
+    eta_t = ctx.eta_t  # Randament transmisie
 
     # Parametri roți
-    r_d = vehicle.pneu.razaDinamica  # [m]
+    r_d = ctx.r_d  # [m]
 
     # Parametri vehicul
-    m = vehicle.masa.masaTotala  # [kg]
-    greutate = m * G  # [N]
-    f = vehicle.pneu.coefRulare
-    Cx = vehicle.aerodinamic.coefAerodinamic
-    A = vehicle.aerodinamic.arieFrontala  # [m²]
+    greutate = ctx.greutate  # [N]
+    f = ctx.f
+    Cx = ctx.Cx
+    A = ctx.A  # [m²]
 
-    # Caracteristica exterioară motor
-    n_motor = np.linspace(n_min, n_max, 100)
-    P_e, M_e = engine_characteristic_leiderman(n_motor, P_max, n_P, tip_motor)
+    # Caracteristica exterioară motor (formula Leiderman, vezi motor.py)
+    n_motor = ctx.n_motor  # (V, S)
+    P_e, M_e = ctx.caracteristica_motor
 
     # Găsim cuplul maxim real din caracteristică
-    M_e_max = np.max(M_e)
+    M_e_max = ctx.M_e_max
 
     # Calculul rapoartelor de transmitere
     # i_max = (G · ψ_max · r_d) / (M_max · η_t)
@@ -91,67 +96,88 @@ def calculate_traction(vehicle: Any) -> Dict[str, Any]:
     psi_min = f + (RHO * Cx * A * v_max_estimat**2) / (2 * greutate)
     i_t_min = (greutate * psi_min * r_d) / (M_e_max * eta_t)
 
+    # Curbele de tracțiune ale tuturor treptelor, reduse într-un singur apel (V, K, S)
+    viteze_r, (forte_r,) = reduce_serii(
+        np.round(ctx.viteze_trepte_ms * 3.6, 2), [np.round(ctx.forte_tractiune, 2)], max_puncte
+    )
+
     # Forța de tracțiune și viteza pentru fiecare treaptă
-    trepte_tractiune = []
+    trepte = []
 
-    for idx, i_k in enumerate(i_cv):
-        i_total = i_k * i_0
+    for k in range(i_cv.shape[1]):
+        i_total = ctx.i_total[:, k:k + 1]
 
         # Viteza la fiecare turație: v = (π · r_d · n) / (30 · i_t) [m/s]
-        v_ms = (np.pi * r_d * n_motor) / (30 * i_total)
+        v_ms = ctx.viteze_trepte_ms[:, k]
         v_kmh = v_ms * 3.6
 
-        # Forța de tracțiune: F_t = (M_e · i_t · η_t) / r_d
-        F_t = (M_e * i_total * eta_t) / r_d
-
-        trepte_tractiune.append({
-            "treapta": idx + 1,
-            "raport_cv": round(i_k, 3),
-            "raport_total": round(i_total, 3),
-            "viteze_kmh": np.round(v_kmh, 2).tolist(),
-            "forte_tractiune_N": np.round(F_t, 2).tolist(),
-            "viteza_min_kmh": round(float(np.min(v_kmh)), 2),
-            "viteza_max_kmh": round(float(np.max(v_kmh)), 2)
-        })
+        # Forța de tracțiune (context): F_t = (M_e · i_t · η_t) / r_d
+        trepte.append((
+            i_total,
+            viteze_r[:, k],
+            forte_r[:, k],
+            np.min(v_kmh, axis=1),
+            np.max(v_kmh, axis=1)
+        ))
 
     # Viteza maximă teoretică (în treapta superioară)
-    v_max_teoretica = (np.pi * r_d * n_max) / (30 * i_cv[-1] * i_0) * 3.6
+    v_max_teoretica = (np.pi * r_d * n_max) / (30 * i_cv[:, -1:] * i_0) * 3.6
 
     # Calculul rapoartelor geometrice
     # i_k = i_1 · q^(k-1), unde q = (i_n/i_1)^(1/(n-1))
-    n_trepte = len(i_cv)
-    q = (i_cv[-1] / i_cv[0]) ** (1 / (n_trepte - 1))
-    rapoarte_geometrice = [i_cv[0] * (q ** k) for k in range(n_trepte)]
-
-    return {
-        "parametri_motor": {
-            "putere_maxima_kW": P_max,
-            "turatie_putere_max": n_P,
-            "cuplu_maxim_Nm": M_max,
-            "cuplu_maxim_calculat_Nm": round(M_e_max, 2),
-            "tip_motor": tip_motor
-        },
-        "caracteristica_motor": {
-            "formula_putere": "P_e = P_max · (a·x + b·x² - c·x³)",
-            "formula_cuplu": "M_e = (P_e · 1000 · 60) / (2π · n)",
-            "turatii_rot_min": np.round(n_motor, 0).tolist(),
-            "puteri_kW": np.round(P_e, 2).tolist(),
-            "cupluri_Nm": np.round(M_e, 2).tolist()
-        },
-        "rapoarte_transmisie": {
-            "rapoarte_cv": i_cv.tolist(),
-            "raport_principal": i_0,
-            "randament": eta_t,
-            "i_total_max": round(i_cv[0] * i_0, 3),
-            "i_total_min": round(i_cv[-1] * i_0, 3),
-            "raport_maxim_teoretic": round(i_t_max, 3),
-            "raport_minim_teoretic": round(i_t_min, 3),
-            "q_progresie_geometrica": round(q, 4),
-            "rapoarte_geometrice_ideale": [round(r, 3) for r in rapoarte_geometrice]
-        },
-        "tractiune_pe_trepte": trepte_tractiune,
-        "viteza_maxima": {
-            "teoretica_kmh": round(v_max_teoretica, 2),
-            "formula": "v_max = (π · r_d · n_max) / (30 · i_min)"
-        }
-    }
+    n_trepte = i_cv.shape[1]
+    q = (i_cv[:, -1:] / i_cv[:, :1]) ** (1 / (n_trepte - 1))
+    rapoarte_geometrice = i_cv[:, :1] * (q ** np.arange(n_trepte))
+
+    turatii_r, (puteri_r, cupluri_r) = reduce_serii(
+        np.round(n_motor, 0), [np.round(P_e, 2), np.round(M_e, 2)], max_puncte
+    )
+    rapoarte_geometrice_r = np.round(rapoarte_geometrice, 3)
+
+    rezultate = []
+    for j, vehicle in enumerate(ctx.vehicule):
+        trepte_tractiune = []
+        for k, (i_total, v_r, F_r, v_min, v_max) in enumerate(trepte):
+            trepte_tractiune.append({
+                "treapta": k + 1,
+                "raport_cv": round(float(i_cv[j, k]), 3),
+                "raport_total": round(float(i_total[j, 0]), 3),
+                "viteze_kmh": v_r[j],
+                "forte_tractiune_N": F_r[j],
+                "viteza_min_kmh": round(float(v_min[j]), 2),
+                "viteza_max_kmh": round(float(v_max[j]), 2)
+            })
+
+        rezultate.append({
+            "parametri_motor": {
+                "putere_maxima_kW": vehicle.motor.putereMaxima,
+                "turatie_putere_max": vehicle.motor.turatiePutereMax,
+                "cuplu_maxim_Nm": vehicle.motor.cuplMaxim,
+                "cuplu_maxim_calculat_Nm": round(float(M_e_max[j, 0]), 2),
+                "tip_motor": vehicle.motor.tip
+            },
+            "caracteristica_motor": {
+                **(MOTOR_SINTETIC if getattr(vehicle.motor, "curbaCuplu", None) is None else MOTOR_MASURAT),
+                "turatii_rot_min": turatii_r[j],
+                "puteri_kW": puteri_r[j],
+                "cupluri_Nm": cupluri_r[j]
+            },
+            "rapoarte_transmisie": {
+                "rapoarte_cv": i_cv[j],
+                "raport_principal": vehicle.transmisie.raportPrincipal,
+                "randament": vehicle.transmisie.randamentTransmisie,
+                "i_total_max": round(float(i_cv[j, 0] * i_0[j, 0]), 3),
+                "i_total_min": round(float(i_cv[j, -1] * i_0[j, 0]), 3),
+                "raport_maxim_teoretic": round(float(i_t_max[j, 0]), 3),
+                "raport_minim_teoretic": round(float(i_t_min[j, 0]), 3),
+                "q_progresie_geometrica": round(float(q[j, 0]), 4),
+                "rapoarte_geometrice_ideale": rapoarte_geometrice_r[j]
+            },
+            "tractiune_pe_trepte": trepte_tractiune,
+            "viteza_maxima": {
+                "teoretica_kmh": round(float(v_max_teoretica[j, 0]), 2),
+                "formula": "v_max = (π · r_d · n_max) / (30 · i_min)"
+            }
+        })
+
+    return rezultate
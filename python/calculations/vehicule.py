@@ -0,0 +1,233 @@
+"""
+Contextul de calcul al vehiculelor (mărimi derivate, calculate o singură dată)
+Mărimile scalare ale fiecărui vehicul sunt stivuite în vectori coloană (V, 1)
+"""
+
+import numpy as np
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .campuri import CAMPURI_CONTEXT
+from .cronometru import etapa
+from .motor import TabeleMotor
+
+G = 9.81  # Accelerația gravitațională [m/s²]
+
+# Numărul de turații pe care se eșantionează caracteristica motorului. Grila este
+# comună tuturor capitolelor (înainte: 100 de puncte în Cap. 4, 50 în Cap. 5), ca
+# o singură evaluare a motorului să servească toate curbele; s-a păstrat rezoluția mai fină
+PUNCTE_MOTOR = 100
+
+class ContextVehicul:
+    """
+    Contextul de calcul pentru un lot de V vehicule.
+
+    Parametrii de intrare și mărimile derivate (caracteristica motorului,
+    cinematica pe trepte) sunt proprietăți evaluate la prima utilizare și
+    memorate, astfel încât toate capitolele consumă aceleași tablouri.
+
+    Fiecare mărime scalară devine un vector coloană (V, 1), astfel încât
+    operațiile cu o grilă de eșantionare (S,) produc direct tablouri (V, S):
+    rândul j corespunde vehiculului j din lot.
+    """
+
+    def __init__(self, vehicles: Sequence[Any], nr_puncte: int = PUNCTE_MOTOR):
+        self.vehicule = list(vehicles)
+        self.n = len(self.vehicule)
+        self.nr_puncte = nr_puncte
+
+    @classmethod
+    def cu_variatii(cls, baza: Any, valori: Dict[str, np.ndarray],
+                    nr_puncte: int = PUNCTE_MOTOR,
+                    rapoarte_cv: Optional[np.ndarray] = None) -> "ContextVehicul":
+        """
+        Context pentru N variante ale aceluiași vehicul.
+
+        `valori` asociază câmpuri din CAMPURI_CONTEXT cu vectori (N,); restul
+        parametrilor sunt cei ai vehiculului de bază. Variantele nu sunt
+        materializate ca modele: vectorii sunt scriși direct în proprietățile
+        memorate ale contextului. rapoarte_cv (N, K) dă rapoartele cutiei de
+        viteze ale fiecărei variante (ex. transmisiile candidate ale optimizării).
+        """
+        n = len(rapoarte_cv) if rapoarte_cv is not None else len(next(iter(valori.values())))
+        ctx = cls([baza] * n, nr_puncte)
+        for camp, valoare in valori.items():
+            _, proprietate, divizor = CAMPURI_CONTEXT[camp]
+            ctx.__dict__[proprietate] = np.asarray(valoare, dtype=float).reshape(n, 1) / divizor
+        if rapoarte_cv is not None:
+            ctx.__dict__["i_cv"] = np.asarray(rapoarte_cv, dtype=float).reshape(n, -1)
+        return ctx
+
+    def _coloana(self, extrage) -> np.ndarray:
+        return np.array([extrage(v) for v in self.vehicule], dtype=float)[:, np.newaxis]
+
+    # Masă și rulare
+    @cached_property
+    def m(self) -> np.ndarray:
+        return self._coloana(lambda v: v.masa.masaTotala)  # [kg]
+
+    @cached_property
+    def m_gol(self) -> np.ndarray:
+        return self._coloana(lambda v: v.masa.masaGoala)  # [kg]
+
+    @cached_property
+    def greutate(self) -> np.ndarray:
+        return self.m * G  # [N]
+
+    @cached_property
+    def f(self) -> np.ndarray:
+        return self._coloana(lambda v: v.pneu.coefRulare)
+
+    @cached_property
+    def r_d(self) -> np.ndarray:
+        return self._coloana(lambda v: v.pneu.razaDinamica)  # [m]
+
+    # Aerodinamică
+    @cached_property
+    def Cx(self) -> np.ndarray:
+        return self._coloana(lambda v: v.aerodinamic.coefAerodinamic)
+
+    @cached_property
+    def A(self) -> np.ndarray:
+        return self._coloana(lambda v: v.aerodinamic.arieFrontala)  # [m²]
+
+    # Motor
+    @cached_property
+    def P_max(self) -> np.ndarray:
+        return self._coloana(lambda v: v.motor.putereMaxima)  # [kW]
+
+    @cached_property
+    def n_P(self) -> np.ndarray:
+        return self._coloana(lambda v: v.motor.turatiePutereMax)  # [rot/min]
+
+    @cached_property
+    def n_max(self) -> np.ndarray:
+        return self._coloana(lambda v: v.motor.turatieMaxima)  # [rot/min]
+
+    @cached_property
+    def n_min(self) -> np.ndarray:
+        return self._coloana(lambda v: v.motor.turatieRalanti)  # [rot/min]
+
+    @cached_property
+    def cilindree(self) -> np.ndarray:
+        return self._coloana(lambda v: v.motor.cilindree)  # [cm³]
+
+    @cached_property
+    def tip_motor(self) -> np.ndarray:
+        return np.array([v.motor.tip for v in self.vehicule])[:, np.newaxis]
+
+    # Transmisie
+    @cached_property
+    def i_cv(self) -> np.ndarray:
+        """Rapoartele cutiei de viteze (V, K); necesită același număr de trepte."""
+        return np.array([v.transmisie.raporturiCV for v in self.vehicule], dtype=float)
+
+    @cached_property
+    def i_0(self) -> np.ndarray:
+        return self._coloana(lambda v: v.transmisie.raportPrincipal)
+
+    @cached_property
+    def eta_t(self) -> np.ndarray:
+        return self._coloana(lambda v: v.transmisie.randamentTransmisie)
+
+    # Geometrie (frânare)
+    @cached_property
+    def L(self) -> np.ndarray:
+        return self._coloana(lambda v: v.dimensiuni.ampatament) / 1000  # [m]
+
+    @cached_property
+    def h_g(self) -> np.ndarray:
+        return self._coloana(lambda v: v.masa.inaltimeCentruMasa) / 1000  # [m]
+
+    @cached_property
+    def repartizare_fata(self) -> np.ndarray:
+        return self._coloana(lambda v: v.masa.repartizareFata) / 100
+
+    @cached_property
+    def repartizare_spate(self) -> np.ndarray:
+        return self._coloana(lambda v: v.masa.repartizareSpate) / 100
+
+    # Caracteristica motorului pe grila comună de turații
+    @cached_property
+    def n_motor(self) -> np.ndarray:
+        """Grila de turații n_min … n_max (V, S)."""
+        return np.linspace(self.n_min[:, 0], self.n_max[:, 0], self.nr_puncte, axis=1)
+
+    @cached_property
+    def motor(self) -> TabeleMotor:
+        """Tabelele de cuplu ale motoarelor (curba măsurată, dacă există, altfel Leiderman)."""
+        curbe = []
+        for v in self.vehicule:
+            curba = getattr(v.motor, "curbaCuplu", None)
+            curbe.append(None if curba is None else (curba.turatii, curba.cupluri))
+        return TabeleMotor.construieste(self.P_max, self.n_P, self.tip_motor, self.n_max, curbe)
+
+    @cached_property
+    def caracteristica_motor(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Puterea [kW] și cuplul [N·m] pe grila n_motor (V, S)."""
+        with etapa("context.motor"):
+            return self.motor.caracteristica(self.n_motor)
+
+    @property
+    def P_e(self) -> np.ndarray:
+        return self.caracteristica_motor[0]
+
+    @property
+    def M_e(self) -> np.ndarray:
+        return self.caracteristica_motor[1]
+
+    @cached_property
+    def M_e_max(self) -> np.ndarray:
+        return np.max(self.M_e, axis=1, keepdims=True)  # [N·m]
+
+    # Cinematica pe trepte
+    @cached_property
+    def i_total(self) -> np.ndarray:
+        """Rapoartele totale i_k · i_0 (V, K)."""
+        return self.i_cv * self.i_0
+
+    @cached_property
+    def viteze_trepte_ms(self) -> np.ndarray:
+        """Viteza v = (π · r_d · n) / (30 · i_t) în fiecare treaptă (V, K, S) [m/s]."""
+        return (np.pi * self.r_d * self.n_motor)[:, np.newaxis, :] / (30 * self.i_total)[:, :, np.newaxis]
+
+    @cached_property
+    def forte_tractiune(self) -> np.ndarray:
+        """Forța F_t = (M_e · i_t · η_t) / r_d în fiecare treaptă (V, K, S) [N]."""
+        return (self.M_e[:, np.newaxis, :] * self.i_total[:, :, np.newaxis]
+                * self.eta_t[:, :, np.newaxis]) / self.r_d[:, :, np.newaxis]
+
+def in_liste(obj: Any) -> Any:
+    """
+    Convertește tablourile numpy dintr-un rezultat în liste Python.
+
+    Funcțiile *_ctx păstrează curbele ca tablouri (fără conversie), iar
+    serializarea le transformă direct în JSON sau în coloane binare.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, dict):
+        return {k: in_liste(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [in_liste(v) for v in obj]
+    return obj
+
+def grupe_dupa_trepte(vehicles: Sequence[Any]) -> Dict[int, List[int]]:
+    """Indicii vehiculelor grupați după numărul de trepte ale cutiei de viteze."""
+    grupe: Dict[int, List[int]] = {}
+    for idx, v in enumerate(vehicles):
+        grupe.setdefault(len(v.transmisie.raporturiCV), []).append(idx)
+    return grupe
+
+def calcul_pe_grupe(vehicles: Sequence[Any],
+                    calcul: Callable[[ContextVehicul], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Rulează un calcul pe contexte grupate după numărul de trepte și
+    returnează rezultatele în ordinea de intrare.
+    """
+    rezultate: List[Dict[str, Any]] = [None] * len(vehicles)
+    for indici in grupe_dupa_trepte(vehicles).values():
+        grupa = calcul(ContextVehicul([vehicles[i] for i in indici]))
+        for idx, rezultat in zip(indici, grupa):
+            rezultate[idx] = rezultat
+    return rezultate
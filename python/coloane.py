@@ -0,0 +1,143 @@
+"""
+Format binar pe coloane pentru rezultatele cu multe curbe
+Tablourile numpy sunt scrise direct (fără conversie în liste Python), o
+singură dată pentru conținut identic (ex. axa de viteze comună mai multor
+caracteristici), iar structura rezultatului este descrisă de un antet JSON.
+
+Secțiune (little-endian):
+
+    antet fix (16 B): "USVC" | versiune u16 | rezervat u16 | lungime_antet u32 | lungime_date u32
+    antet JSON (lungime_antet B, completat cu spații la multiplu de 8):
+        {"nume": ..., "structura": ..., "coloane": [{"dtype", "forma", "offset"}, ...]}
+    date (lungime_date B): coloanele, fiecare aliniată la 8 B față de începutul datelor
+
+În `structura`, fiecare tablou este înlocuit cu {"$c": indice_coloana}.
+Un răspuns poate conține mai multe secțiuni concatenate (ex. /calculate/all),
+fiecare de lungime multiplu de 8, astfel încât coloanele pot fi citite
+direct ca Float64Array / Float32Array.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+MEDIA_TYPE = "application/vnd.usv.coloane"
+MAGIC = b"USVC"
+VERSIUNE = 1
+ANTET_FIX = struct.Struct("<4sHHII")
+
+def _aliniat(n: int) -> int:
+    return (n + 7) & ~7
+
+def _tip_coloana(tablou: np.ndarray, precizie: int) -> np.dtype:
+    if tablou.dtype.kind == "f":
+        return np.dtype("<f4") if precizie == 32 else np.dtype("<f8")
+    if tablou.dtype.kind in "iu":
+        return np.dtype("<i4") if tablou.size == 0 or np.abs(tablou).max() < 2**31 else np.dtype("<i8")
+    if tablou.dtype.kind == "b":
+        return np.dtype("|u1")
+    raise TypeError(f"Tip de tablou nesuportat: {tablou.dtype}")
+
+def codifica(obj: Any, nume: str = "", precizie: int = 64) -> bytes:
+    """
+    Codifică un rezultat (dicționare/liste cu tablouri numpy) ca secțiune binară.
+
+    Valorile nefinite ridică ValueError, ca la serializarea JSON.
+    """
+    coloane: List[Dict[str, Any]] = []
+    blocuri: List[bytes] = []
+    indici: Dict[Tuple[str, Tuple[int, ...], bytes], int] = {}
+    offset = 0
+
+    def coloana(tablou: np.ndarray) -> Dict[str, int]:
+        nonlocal offset
+        tip = _tip_coloana(tablou, precizie)
+        if tip.kind == "f" and not np.isfinite(tablou).all():
+            raise ValueError("Valori nefinite în rezultat")
+        date = np.ascontiguousarray(tablou, dtype=tip).tobytes()
+        cheie = (tip.str, tablou.shape, date)
+        if cheie not in indici:
+            indici[cheie] = len(coloane)
+            coloane.append({"dtype": tip.str, "forma": list(tablou.shape), "offset": offset})
+            lungime = _aliniat(len(date))
+            blocuri.append(date + b"\0" * (lungime - len(date)))
+            offset += lungime
+        return {"$c": indici[cheie]}
+
+    def structura(x: Any) -> Any:
+        if isinstance(x, np.ndarray):
+            return coloana(x)
+        if isinstance(x, dict):
+            return {k: structura(v) for k, v in x.items()}
+        if isinstance(x, (list, tuple)):
+            return [structura(v) for v in x]
+        if isinstance(x, np.generic):
+            return x.item()
+        return x
+
+    antet = json.dumps(
+        {"nume": nume, "structura": structura(obj), "coloane": coloane},
+        ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+    antet += b" " * (_aliniat(len(antet)) - len(antet))
+    return ANTET_FIX.pack(MAGIC, VERSIUNE, 0, len(antet), offset) + antet + b"".join(blocuri)
+
+def decodifica(date: bytes) -> Dict[str, Any]:
+    """
+    Decodifică una sau mai multe secțiuni concatenate → {nume: rezultat},
+    cu tablourile ca vederi numpy asupra bufferului.
+    """
+    return dict(sectiuni(date))
+
+def sectiuni(date: bytes) -> Iterator[Tuple[str, Any]]:
+    """
+    Secțiunile concatenate, în ordine, ca perechi (nume, rezultat); numele
+    se pot repeta (ex. capitolele mai multor variante ale unui proiect).
+    """
+    buf = memoryview(date)
+    poz = 0
+    while poz < len(buf):
+        magic, versiune, _, lungime_antet, lungime_date = ANTET_FIX.unpack_from(buf, poz)
+        if magic != MAGIC or versiune != VERSIUNE:
+            raise ValueError("Secțiune binară invalidă")
+        poz += ANTET_FIX.size
+        antet = json.loads(bytes(buf[poz:poz + lungime_antet]))
+        poz += lungime_antet
+        baza = poz
+        poz += lungime_date
+
+        tablouri = [
+            np.frombuffer(buf, dtype=c["dtype"], count=int(np.prod(c["forma"])),
+                          offset=baza + c["offset"]).reshape(c["forma"])
+            for c in antet["coloane"]
+        ]
+
+        def reconstruieste(x: Any) -> Any:
+            if isinstance(x, dict):
+                if len(x) == 1 and "$c" in x:
+                    return tablouri[x["$c"]]
+                return {k: reconstruieste(v) for k, v in x.items()}
+            if isinstance(x, list):
+                return [reconstruieste(v) for v in x]
+            return x
+
+        yield antet["nume"], reconstruieste(antet["structura"])
+
+def precizie_acceptata(accept: Optional[str]) -> Optional[int]:
+    """
+    Negocierea formatului din antetul Accept: None pentru JSON, altfel
+    precizia coloanelor (64 implicit, 32 cu parametrul `precizie=32`).
+    """
+    if not accept:
+        return None
+    for tip in accept.split(","):
+        parti = [p.strip() for p in tip.split(";")]
+        if parti[0].lower() != MEDIA_TYPE:
+            continue
+        parametri = dict(p.split("=", 1) for p in parti[1:] if "=" in p)
+        if parametri.get("q", "1").strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        return 32 if parametri.get("precizie", "").strip() == "32" else 64
+    return None
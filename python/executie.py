@@ -0,0 +1,131 @@
+"""
+Executor pentru calculele CPU-intensive
+Calculele rulează într-un pool de fire sau procese, în afara buclei asyncio,
+cu coadă limitată, respingere la saturare și timeout per cerere.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+MODURI = ("thread", "process", "inline")
+
+class ExecutorSaturat(Exception):
+    """Toți workerii sunt ocupați și coada de așteptare este plină."""
+
+class TimeoutCalcul(Exception):
+    """Calculul nu s-a încheiat în timpul alocat cererii."""
+
+class ExecutorCalcule:
+    """
+    Pool gestionat pentru funcțiile din pachetul `calculations`.
+
+    - mod: "thread" (ThreadPoolExecutor), "process" (ProcessPoolExecutor)
+      sau "inline" (rulare directă în bucla asyncio, ca înainte)
+    - workeri: numărul de fire/procese
+    - coada_max: numărul maxim de lucrări care așteaptă un worker liber;
+      peste workeri + coada_max cererile sunt respinse (ExecutorSaturat)
+    - timeout_s: timpul maxim de așteptare al unei cereri (TimeoutCalcul)
+    """
+
+    def __init__(self, mod: str = "thread", workeri: Optional[int] = None,
+                 coada_max: Optional[int] = None, timeout_s: float = 30.0):
+        if mod not in MODURI:
+            raise ValueError(f"Mod de execuție necunoscut: {mod} (disponibile: {', '.join(MODURI)})")
+        self.mod = mod
+        self.workeri = workeri or os.cpu_count() or 1
+        self.coada_max = self.workeri * 2 if coada_max is None else coada_max
+        self.timeout_s = timeout_s
+        self._pool: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self.in_lucru = 0
+        self.finalizate = 0
+        self.respinse = 0
+        self.expirate = 0
+
+    @classmethod
+    def din_mediu(cls) -> "ExecutorCalcule":
+        """Configurare din variabilele de mediu USV_EXECUTIE, USV_WORKERI, USV_COADA, USV_TIMEOUT_S."""
+        workeri = os.environ.get("USV_WORKERI")
+        coada = os.environ.get("USV_COADA")
+        return cls(
+            mod=os.environ.get("USV_EXECUTIE", "thread"),
+            workeri=int(workeri) if workeri else None,
+            coada_max=int(coada) if coada else None,
+            timeout_s=float(os.environ.get("USV_TIMEOUT_S", "30"))
+        )
+
+    def _pool_activ(self) -> Executor:
+        if self._pool is None:
+            if self.mod == "process":
+                self._pool = ProcessPoolExecutor(max_workers=self.workeri)
+            else:
+                self._pool = ThreadPoolExecutor(max_workers=self.workeri, thread_name_prefix="calcul")
+        return self._pool
+
+    def _ocupa(self) -> None:
+        with self._lock:
+            if self.in_lucru >= self.workeri + self.coada_max:
+                self.respinse += 1
+                raise ExecutorSaturat()
+            self.in_lucru += 1
+
+    def _elibereaza(self, *_: Any) -> None:
+        with self._lock:
+            self.in_lucru -= 1
+            self.finalizate += 1
+
+    async def ruleaza(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Rulează fn(*args) în pool și așteaptă rezultatul, cu timeout."""
+        if self.mod == "inline":
+            return fn(*args)
+
+        self._ocupa()
+        try:
+            viitor = self._pool_activ().submit(fn, *args)
+        except BaseException:
+            self._elibereaza()
+            raise
+        # Locul este eliberat când lucrarea se termină efectiv, nu la timeout:
+        # un calcul abandonat ocupă în continuare un worker.
+        viitor.add_done_callback(self._elibereaza)
+
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(viitor), self.timeout_s)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self.expirate += 1
+            raise TimeoutCalcul()
+
+    async def incalzeste(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Rulează fn(*args) în afara buclei asyncio, fără să ocupe locuri în
+        coadă și fără timeout. În modul "process" rulează o dată în fiecare
+        worker (fiecare proces își încarcă propriile module); în celelalte
+        moduri modulele sunt comune procesului și ajunge o singură rulare.
+        """
+        if self.mod == "process":
+            pool = self._pool_activ()
+            viitoare = [asyncio.wrap_future(pool.submit(fn, *args)) for _ in range(self.workeri)]
+            return (await asyncio.gather(*viitoare))[0]
+        return await asyncio.to_thread(fn, *args)
+
+    def statistici(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "mod": self.mod,
+                "workeri": self.workeri,
+                "coada_max": self.coada_max,
+                "timeout_s": self.timeout_s,
+                "in_lucru": self.in_lucru,
+                "finalizate": self.finalizate,
+                "respinse_429": self.respinse,
+                "expirate": self.expirate
+            }
+
+    def opreste(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
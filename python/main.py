@@ -3,16 +3,34 @@ USV Diploma Calculator - Python Backend
 Calcule tehnice pentru proiecte de diplomă Autovehicule Rutiere
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Query, Body, Header, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional
-import numpy as np
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from pydantic import ValidationError
+from functools import partial
+from itertools import islice, product
+from typing import Any, Dict, List, Optional
+import asyncio
+import json
+import math
+import os
+import time
 
-from calculations.resistance import calculate_resistances
-from calculations.traction import calculate_traction
-from calculations.performance import calculate_performance
-from calculations.braking import calculate_braking
+from modele import (
+    VehicleDimensions, VehicleMass, TireParams, EngineParams,
+    TransmissionParams, AerodynamicParams, VehicleParams, OptimizareTransmisie,
+    CerereSweep, CerereComparatie, CerereIntervale, SimulareDemarare, SimulareCicluri, GrilaFranare, HartaRezistente, CerereMonteCarlo,
+    ProiectNou, VariantaNoua
+)
+from cache import CacheRezultate, CacheRezultatePartajat, amprenta_vehicul, cheie_capitol, etag_potrivit
+from executie import ExecutorCalcule, ExecutorSaturat, TimeoutCalcul
+from proiecte import DepozitProiecte
+from metrici import MiddlewareMetrici, RegistruMetrici, etapa_din_start, masurare_curenta, ruleaza_masurat
+from calculations import cronometru
+
+# Modulele de calcul (numpy, scipy) nu se importă aici, ci în endpoint-urile
+# care le folosesc: /health răspunde fără să aștepte încărcarea lor, iar
+# încălzirea din fundal (USV_INCALZIRE) le încarcă imediat după pornire.
 
 app = FastAPI(
     title="USV Diploma Calculator API",
@@ -27,108 +45,997 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "ETag", "X-Numar-Tile", "X-Numar-Variante", "X-Numar-Puncte"],
 )
 
-# ============== Pydantic Models ==============
-
-class VehicleDimensions(BaseModel):
-    lungime: float
-    latime: float
-    inaltime: float
-    ampatament: float
-    ecartamentFata: float
-    ecartamentSpate: float
-    gardaSol: float
-    consolaFata: float
-    consolaSpate: float
-
-class VehicleMass(BaseModel):
-    masaGoala: float
-    masaTotala: float
-    capacitateIncarcare: float
-    repartizareFata: float
-    repartizareSpate: float
-    inaltimeCentruMasa: float
-
-class TireParams(BaseModel):
-    dimensiune: str
-    latime: float
-    raportProfil: float
-    diametruJanta: float
-    razaStatica: float
-    razaDinamica: float
-    coefRulare: float
-
-class EngineParams(BaseModel):
-    tip: str
-    cilindree: float
-    putereMaxima: float
-    turatiePutereMax: float
-    cuplMaxim: float
-    turatieCuplMax: float
-    turatieMaxima: float
-    turatieRalanti: float
-
-class TransmissionParams(BaseModel):
-    tipTransmisie: str
-    numarTrepte: int
-    raporturiCV: List[float]
-    raportPrincipal: float
-    randamentTransmisie: float
-
-class AerodynamicParams(BaseModel):
-    coefAerodinamic: float
-    arieFrontala: float
-
-class VehicleParams(BaseModel):
-    nume: str
-    dimensiuni: VehicleDimensions
-    masa: VehicleMass
-    pneu: TireParams
-    motor: EngineParams
-    transmisie: TransmissionParams
-    aerodinamic: AerodynamicParams
+# Durate pe etape (antetul Server-Timing) și metrici agregate (/metrics)
+registru_metrici = RegistruMetrici()
+app.add_middleware(MiddlewareMetrici, registru=registru_metrici)
+
+# ============== Execuție calcule ==============
+
+# Pool de calcul (USV_EXECUTIE=thread|process|inline, USV_WORKERI, USV_COADA, USV_TIMEOUT_S)
+executor = ExecutorCalcule.din_mediu()
+
+@app.on_event("shutdown")
+def _opreste_executor():
+    executor.opreste()
+
+# Încălzirea căii de calcul (importuri grele + un calcul complet) pornește
+# după primul /health reușit, ca să nu întârzie răspunsul lui, sau după
+# USV_INCALZIRE_S secunde dacă nu vine niciun /health. USV_INCALZIRE=0 o dezactivează.
+incalzire: Dict[str, Any] = {"stare": "dezactivata", "durata_ms": None}
+
+async def _incalzeste():
+    from serviciu import incalzeste
+
+    try:
+        incalzire["durata_ms"] = round(await executor.incalzeste(incalzeste), 1)
+        incalzire["stare"] = "gata"
+    except Exception as e:
+        # Încălzirea este doar o optimizare: erorile apar la primul calcul real
+        incalzire["stare"] = f"eroare: {e}"
+
+def _porneste_incalzirea():
+    """Rulează în bucla asyncio; lucrarea propriu-zisă rulează în executor."""
+    if incalzire["stare"] == "programata":
+        incalzire["stare"] = "in_curs"
+        asyncio.get_running_loop().create_task(_incalzeste())
+
+@app.on_event("startup")
+async def _programeaza_incalzirea():
+    if os.environ.get("USV_INCALZIRE", "1") != "0":
+        incalzire["stare"] = "programata"
+        asyncio.get_running_loop().call_later(
+            float(os.environ.get("USV_INCALZIRE_S", "2")), _porneste_incalzirea
+        )
+
+async def _in_executor(fn, *args):
+    """
+    Rulează un calcul în pool; saturarea → 429, depășirea timpului → 504.
+
+    Etapele măsurate în worker (coadă, calcul, serializare) și, la cerere,
+    profilul cProfile sunt adăugate la măsurarea cererii curente.
+    """
+    masurare = masurare_curenta()
+    profil = masurare is not None and masurare.profil
+    try:
+        rezultat, etape, profil_calcul = await executor.ruleaza(
+            ruleaza_masurat, fn, profil, time.time(), *args
+        )
+    except ExecutorSaturat:
+        raise HTTPException(status_code=429, detail="Server ocupat, reîncercați",
+                            headers={"Retry-After": "1"})
+    except TimeoutCalcul:
+        raise HTTPException(status_code=504, detail="Calculul a depășit timpul alocat")
+    for nume, ms in etape.items():
+        cronometru.adauga(nume, ms)
+    if profil_calcul:
+        masurare.profile_calcul.append(profil_calcul)
+    return rezultat
+
+# ============== Cache rezultate ==============
+
+# Bugetul de memorie al cache-ului [MB] (variabila de mediu USV_CACHE_MB). Cu mai
+# multe procese server (USV_WORKERI_HTTP > 1), procesul principal creează un
+# cache partajat și îi transmite calea prin USV_CACHE_PARTAJAT.
+CAPACITATE_CACHE = int(float(os.environ.get("USV_CACHE_MB", "64")) * 1024 * 1024)
+if os.environ.get("USV_CACHE_PARTAJAT"):
+    cache = CacheRezultatePartajat(os.environ["USV_CACHE_PARTAJAT"])
+else:
+    cache = CacheRezultate(CAPACITATE_CACHE)
+
+@app.on_event("shutdown")
+def _inchide_cache():
+    if isinstance(cache, CacheRezultatePartajat):
+        cache.inchide()
+
+# Depozitul de proiecte (variabila de mediu USV_PROIECTE: calea bazei SQLite),
+# deschis la prima folosire, astfel încât pornirea nu atinge discul
+CALE_PROIECTE = os.environ.get("USV_PROIECTE") or os.path.join(os.path.expanduser("~"), ".usv-diploma", "proiecte.sqlite3")
+_depozit: Dict[str, DepozitProiecte] = {}
+
+def depozit(creeaza: bool = True) -> Optional[DepozitProiecte]:
+    """Depozitul de proiecte; cu creeaza=False, None dacă baza nu există încă."""
+    if "proiecte" not in _depozit:
+        if not creeaza and not os.path.exists(CALE_PROIECTE):
+            return None
+        _depozit.setdefault("proiecte", DepozitProiecte(CALE_PROIECTE))
+    return _depozit["proiecte"]
+
+@app.on_event("shutdown")
+def _inchide_depozitul():
+    if "proiecte" in _depozit:
+        _depozit.pop("proiecte").inchide()
+
+def _parametri(capitol: str, pas_demarare_kmh: float, viteza_finala_kmh: Optional[float],
+               max_puncte: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """Parametrii cererii care influențează rezultatul capitolului."""
+    parametri: Dict[str, Any] = {}
+    if capitol in ("performante", "all"):
+        parametri.update(pas_demarare_kmh=pas_demarare_kmh, viteza_finala_kmh=viteza_finala_kmh)
+    if max_puncte is not None:
+        parametri["max_puncte"] = max_puncte
+    return parametri or None
+
+def _cheie(amprenta: str, capitol: str, pas_demarare_kmh: float, viteza_finala_kmh: Optional[float],
+           precizie: Optional[int] = None, max_puncte: Optional[int] = None) -> str:
+    """Cheia de cache a unui capitol; formatul binar are intrări separate de JSON."""
+    parametri = _parametri(capitol, pas_demarare_kmh, viteza_finala_kmh, max_puncte)
+    if precizie is not None:
+        parametri = dict(parametri or {}, format=f"coloane{precizie}")
+    return cheie_capitol(amprenta, capitol, parametri)
+
+async def _rezultate(vehicule: List[VehicleParams], nume_capitole: List[str],
+                     pas_demarare_kmh: float = 1.0, viteza_finala_kmh: Optional[float] = None,
+                     amprente: Optional[List[str]] = None,
+                     precizie: Optional[int] = None,
+                     max_puncte: Optional[int] = None,
+                     persista: bool = False) -> List[Dict[str, Any]]:
+    """
+    Rezultatele serializate (bytes) per vehicul și capitol.
+
+    Intrările lipsă din cache sunt căutate în depozitul de proiecte (dacă
+    există), iar vehiculele cu capitole încă lipsă se calculează împreună în
+    pool-ul de calcul; cu persista, rezultatele calculate sunt păstrate și
+    în depozit. Erorile de calcul sunt returnate ca excepții, per vehicul și
+    capitol.
+    """
+    if amprente is None:
+        amprente = [amprenta_vehicul(v) for v in vehicule]
+    chei = [
+        {n: _cheie(a, n, pas_demarare_kmh, viteza_finala_kmh, precizie, max_puncte) for n in nume_capitole}
+        for a in amprente
+    ]
+
+    rezultate: List[Dict[str, Any]] = [{} for _ in vehicule]
+    lipsa: List[int] = []
+    with cronometru.etapa("cache"):
+        for j in range(len(vehicule)):
+            for n in nume_capitole:
+                corp = cache.get(chei[j][n])
+                if corp is not None:
+                    rezultate[j][n] = corp
+            if len(rezultate[j]) < len(nume_capitole):
+                lipsa.append(j)
+
+    depozit_proiecte = depozit(creeaza=persista)
+    if lipsa and depozit_proiecte is not None:
+        with cronometru.etapa("depozit"):
+            gasite = await asyncio.to_thread(depozit_proiecte.rezultate, [
+                chei[j][n] for j in lipsa for n in nume_capitole if n not in rezultate[j]
+            ])
+        for j in lipsa:
+            for n in nume_capitole:
+                corp = gasite.get(chei[j][n])
+                if corp is not None:
+                    cache.put(chei[j][n], corp)
+                    rezultate[j][n] = corp
+        lipsa = [j for j in lipsa if len(rezultate[j]) < len(nume_capitole)]
+
+    # Vehiculele cu capitole lipsă se calculează în pool, într-o singură lucrare
+    if lipsa:
+        from serviciu import calculeaza_capitole
+        necesare = [n for n in nume_capitole if any(n not in rezultate[j] for j in lipsa)]
+        calculate = await _in_executor(
+            calculeaza_capitole, [vehicule[j] for j in lipsa], necesare,
+            pas_demarare_kmh, viteza_finala_kmh, precizie, max_puncte
+        )
+        noi = []
+        for j, capitole_j in zip(lipsa, calculate):
+            for n, r in capitole_j.items():
+                if n in rezultate[j]:
+                    continue
+                if not isinstance(r, Exception):
+                    cache.put(chei[j][n], r)
+                    noi.append((chei[j][n], amprente[j], r))
+                rezultate[j][n] = r
+        if persista and noi:
+            # Scrierea (tranzacție pe disc) rulează pe un fir separat, nu în bucla asyncio
+            with cronometru.etapa("depozit"):
+                await asyncio.to_thread(depozit_proiecte.salveaza_rezultate, noi)
+
+    return rezultate
+
+async def _raspuns(vehicle: VehicleParams, capitol: str, if_none_match: Optional[str],
+                   accept: Optional[str] = None, pas_demarare_kmh: float = 1.0,
+                   viteza_finala_kmh: Optional[float] = None,
+                   max_puncte: Optional[int] = None) -> Response:
+    """
+    Răspunsul unui endpoint de calcul, cu ETag derivat din cheia de cache.
+
+    Dacă If-None-Match conține ETag-ul curent se răspunde 304 fără calcul
+    și fără serializare. Cu `Accept: application/vnd.usv.coloane` (opțional
+    `;precizie=32`) corpul este în formatul binar pe coloane în loc de JSON.
+    Cu max_puncte, fiecare curbă este redusă la cel mult atâtea puncte (LTTB).
+    """
+    from coloane import MEDIA_TYPE as MEDIA_COLOANE, precizie_acceptata
+    from serviciu import CAPITOLE
+
+    etapa_din_start("intrare")
+    precizie = precizie_acceptata(accept)
+    antete = {"Vary": "Accept"}
+    amprenta = amprenta_vehicul(vehicle)
+    antete["ETag"] = '"%s"' % _cheie(amprenta, capitol, pas_demarare_kmh, viteza_finala_kmh, precizie, max_puncte)
+    if etag_potrivit(if_none_match, antete["ETag"]):
+        cache.inregistreaza_304()
+        return Response(status_code=304, headers=antete)
+
+    nume_capitole = list(CAPITOLE) if capitol == "all" else [capitol]
+    rezultate = (await _rezultate([vehicle], nume_capitole, pas_demarare_kmh, viteza_finala_kmh,
+                                  [amprenta], precizie, max_puncte))[0]
+    for r in rezultate.values():
+        if isinstance(r, ValueError):
+            # Parametri respinși de calcul (ex. viteza finală peste v_max, rezultate nefinite)
+            raise HTTPException(status_code=422, detail=str(r))
+        if isinstance(r, Exception):
+            raise r
+
+    if precizie is not None:
+        # Secțiunile binare se concatenează direct
+        corp = b"".join(rezultate[n] for n in nume_capitole)
+        return Response(content=corp, media_type=MEDIA_COLOANE, headers=antete)
+
+    if capitol == "all":
+        corp = b"{" + b",".join(b'"' + n.encode() + b'":' + rezultate[n] for n in nume_capitole) + b"}"
+    else:
+        corp = rezultate[capitol]
+    return Response(content=corp, media_type="application/json", headers=antete)
 
 # ============== API Endpoints ==============
 
+# Bugetul de puncte per curbă (parametru comun endpoint-urilor de calcul)
+MAX_PUNCTE = Query(None, ge=3, description="Numărul maxim de puncte per curbă (LTTB)")
+
+# Grila de demarare (Cap. 5); o viteză finală explicită nu poate depăși
+# viteza maximă a vehiculului, cea implicită (100 km/h) este limitată la ea
+PAS_DEMARARE = Query(1.0, ge=0.01, description="Pasul grilei de viteze la demarare [km/h]")
+VITEZA_FINALA = Query(None, gt=0, description="Viteza finală a demarării [km/h] (implicit 100 sau v_max)")
+PANA_LA_VMAX = Query(False, description="Demararea până la viteza maximă (în locul vitezei finale)")
+
+def _viteza_finala(viteza_finala_kmh: Optional[float], pana_la_vmax: bool) -> Optional[float]:
+    """Viteza finală transmisă calculelor; inf = până la viteza maximă a fiecărui vehicul."""
+    return math.inf if pana_la_vmax else viteza_finala_kmh
+
 @app.get("/")
 async def root():
     return {"message": "USV Diploma Calculator API", "version": "1.0.0"}
 
 @app.get("/health")
 async def health_check():
-    return {"status": "healthy", "service": "python-backend"}
+    _porneste_incalzirea()
+    return {"status": "healthy", "service": "python-backend", "incalzire": incalzire["stare"]}
+
+@app.get("/executie/statistici")
+async def executor_stats():
+    """Starea pool-ului de calcul (mod, workeri, lucrări în curs, respinse)"""
+    return executor.statistici()
+
+@app.get("/cache/statistici")
+async def cache_stats():
+    """Statistici cache rezultate (hits, misses, evacuări, memorie ocupată)"""
+    return cache.statistici()
+
+@app.get("/metrics")
+async def metrics(format: str = Query("prometheus", pattern="^(prometheus|json)$")):
+    """Metrici agregate: cereri, latențe pe endpoint și etapă, lucrări în curs"""
+    stare_executor = executor.statistici()
+    stare_cache = cache.statistici()
+    if format == "json":
+        return {**registru_metrici.statistici(), "executie": stare_executor, "cache": stare_cache}
+    extra = {
+        "usv_executie_in_lucru": stare_executor["in_lucru"],
+        "usv_executie_respinse_total": stare_executor["respinse_429"],
+        "usv_executie_expirate_total": stare_executor["expirate"],
+        "usv_cache_hits_total": stare_cache["hits"],
+        "usv_cache_misses_total": stare_cache["misses"],
+        "usv_cache_ocupat_bytes": stare_cache["ocupat_bytes"]
+    }
+    # Cache partajat: contoarele fiecărui proces server (cererile și latențele sunt ale procesului care răspunde)
+    for contor in ("hits", "misses"):
+        for w in stare_cache.get("workeri", []):
+            extra[f'usv_cache_worker_{contor}_total{{pid="{w["pid"]}"}}'] = w[contor]
+    return PlainTextResponse(registru_metrici.prometheus(extra))
 
 @app.post("/calculate/rezistente")
-async def calc_resistances(vehicle: VehicleParams):
+async def calc_resistances(vehicle: VehicleParams, if_none_match: Optional[str] = Header(None),
+                           accept: Optional[str] = Header(None),
+                           max_puncte: Optional[int] = MAX_PUNCTE):
     """Calculează rezistențele la înaintare (Cap. 3)"""
-    return calculate_resistances(vehicle)
+    return await _raspuns(vehicle, "rezistente", if_none_match, accept, max_puncte=max_puncte)
+
+@app.post("/calculate/rezistente/harta")
+async def calc_resistance_map(cerere: HartaRezistente, request: Request, accept: Optional[str] = Header(None)):
+    """
+    Harta rezistenței totale și a puterii necesare pe viteză × pantă × vânt × altitudine.
+
+    Harta este calculată și transmisă pe tile-uri de viteze consecutive (cel
+    mult `puncte_tila` puncte fiecare): linii NDJSON, sau secțiuni binare
+    concatenate cu `Accept: application/vnd.usv.coloane`. Memoria nu depinde
+    de dimensiunea hărții; dacă clientul închide conexiunea, calculul se
+    oprește la tile-ul curent.
+    """
+    from coloane import MEDIA_TYPE as MEDIA_COLOANE, precizie_acceptata
+    from serviciu import json_bytes, tila_harta_rezistente
+
+    etapa_din_start("intrare")
+    precizie = precizie_acceptata(accept)
+    axe = {nume: axa.lista_valori() for nume, axa in cerere.axe_harta().items()}
+    viteze = axe.pop("viteze_kmh")
+    randuri = cerere.randuri_tila()
+    numar_tile = math.ceil(len(viteze) / randuri)
+
+    async def flux():
+        start = time.perf_counter()
+        index = 0
+        while index < numar_tile:
+            if await request.is_disconnected():
+                return
+            rand = index * randuri
+            try:
+                tila = await _in_executor(
+                    tila_harta_rezistente, cerere.vehicul,
+                    dict(axe, viteze_kmh=viteze[rand:rand + randuri]), index, rand, precizie
+                )
+            except HTTPException as e:
+                if e.status_code == 429:
+                    # Pool saturat: reîncercăm tile-ul în loc să întrerupem fluxul
+                    await asyncio.sleep(0.05)
+                    continue
+                if precizie is None:
+                    yield json_bytes({"eroare": e.detail, "tila": index}) + b"\n"
+                return
+            yield tila
+            index += 1
+        if precizie is None:
+            yield json_bytes({"rezumat": {
+                "tile": numar_tile,
+                "puncte": len(viteze) * math.prod(len(a) for a in axe.values()),
+                "durata_s": round(time.perf_counter() - start, 3)
+            }}) + b"\n"
+
+    return StreamingResponse(flux(), media_type=MEDIA_COLOANE if precizie is not None else "application/x-ndjson",
+                             headers={"X-Numar-Tile": str(numar_tile)})
 
 @app.post("/calculate/tractiune")
-async def calc_traction(vehicle: VehicleParams):
+async def calc_traction(vehicle: VehicleParams, if_none_match: Optional[str] = Header(None),
+                        accept: Optional[str] = Header(None),
+                        max_puncte: Optional[int] = MAX_PUNCTE):
     """Calculează caracteristicile de tracțiune (Cap. 4)"""
-    return calculate_traction(vehicle)
+    return await _raspuns(vehicle, "tractiune", if_none_match, accept, max_puncte=max_puncte)
 
 @app.post("/calculate/performante")
-async def calc_performance(vehicle: VehicleParams):
+async def calc_performance(
+    vehicle: VehicleParams,
+    pas_demarare_kmh: float = PAS_DEMARARE,
+    viteza_finala_kmh: Optional[float] = VITEZA_FINALA,
+    pana_la_vmax: bool = PANA_LA_VMAX,
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None),
+    max_puncte: Optional[int] = MAX_PUNCTE
+):
     """Calculează performanțele dinamice (Cap. 5)"""
-    return calculate_performance(vehicle)
+    return await _raspuns(vehicle, "performante", if_none_match, accept, pas_demarare_kmh,
+                          _viteza_finala(viteza_finala_kmh, pana_la_vmax), max_puncte)
+
+@app.post("/calculate/performante/intervale")
+async def calc_acceleration_intervals(cerere: CerereIntervale):
+    """
+    Timpul și spațiul pentru intervale arbitrare v1 → v2 (demarare, elasticitate)
+    și inversările viteză ↔ timp ↔ spațiu.
+
+    Tabelul de demarare al vehiculului (0 → v_max, pasul `pas_kmh`) se
+    calculează o singură dată și este păstrat în cache-ul de rezultate;
+    interogările următoare pentru același vehicul sunt doar căutări binare.
+    """
+    from calculations.intervale import TabelDemarare, interogheaza, tabel_demarare_bytes
+
+    etapa_din_start("intrare")
+    cheie = cheie_capitol(amprenta_vehicul(cerere.vehicul), "tabel_demarare", {"pas_kmh": cerere.pas_kmh})
+    with cronometru.etapa("cache"):
+        corp = cache.get(cheie)
+    if corp is None:
+        corp = await _in_executor(tabel_demarare_bytes, cerere.vehicul, cerere.pas_kmh)
+        cache.put(cheie, corp)
+    with cronometru.etapa("interogare"):
+        return interogheaza(TabelDemarare.din_bytes(corp), cerere.intervale,
+                            cerere.viteze_kmh, cerere.timpi_s, cerere.distante_m)
 
 @app.post("/calculate/franare")
-async def calc_braking(vehicle: VehicleParams):
+async def calc_braking(vehicle: VehicleParams, if_none_match: Optional[str] = Header(None),
+                       accept: Optional[str] = Header(None),
+                       max_puncte: Optional[int] = MAX_PUNCTE):
     """Calculează performanțele de frânare (Cap. 5.3)"""
-    return calculate_braking(vehicle)
+    return await _raspuns(vehicle, "franare", if_none_match, accept, max_puncte=max_puncte)
+
+@app.post("/calculate/franare/grila")
+async def calc_braking_grid(cerere: GrilaFranare, if_none_match: Optional[str] = Header(None),
+                            accept: Optional[str] = Header(None)):
+    """
+    Frânarea pe o grilă aderență × viteză × pantă × timp de reacție × încărcare.
+
+    Răspunsul conține tabele dense (axele în ordinea `axe.ordine`) cu
+    distanțele, timpii și forțele pe punți; cache, ETag și formatul binar
+    funcționează ca la celelalte endpoint-uri /calculate/*.
+    """
+    from coloane import MEDIA_TYPE as MEDIA_COLOANE, precizie_acceptata
+    from serviciu import grila_franare_serializata
+
+    etapa_din_start("intrare")
+    precizie = precizie_acceptata(accept)
+    axe = cerere.axe()
+    parametri = dict(axe, format=f"coloane{precizie}") if precizie is not None else axe
+    cheie = cheie_capitol(amprenta_vehicul(cerere.vehicul), "franare_grila", parametri)
+    antete = {"Vary": "Accept", "ETag": '"%s"' % cheie}
+    if etag_potrivit(if_none_match, antete["ETag"]):
+        cache.inregistreaza_304()
+        return Response(status_code=304, headers=antete)
+
+    with cronometru.etapa("cache"):
+        corp = cache.get(cheie)
+    if corp is None:
+        try:
+            corp = await _in_executor(grila_franare_serializata, cerere.vehicul, axe, precizie)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        cache.put(cheie, corp)
+    return Response(content=corp, media_type=MEDIA_COLOANE if precizie is not None else "application/json",
+                    headers=antete)
 
 @app.post("/calculate/all")
-async def calc_all(vehicle: VehicleParams):
+async def calc_all(vehicle: VehicleParams, if_none_match: Optional[str] = Header(None),
+                   accept: Optional[str] = Header(None),
+                   pas_demarare_kmh: float = PAS_DEMARARE,
+                   viteza_finala_kmh: Optional[float] = VITEZA_FINALA,
+                   pana_la_vmax: bool = PANA_LA_VMAX,
+                   max_puncte: Optional[int] = MAX_PUNCTE):
     """Calculează toate capitolele"""
+    return await _raspuns(vehicle, "all", if_none_match, accept, pas_demarare_kmh,
+                          _viteza_finala(viteza_finala_kmh, pana_la_vmax), max_puncte)
+
+# ============== Optimizare ==============
+
+@app.post("/optimize/transmisie")
+async def optimize_transmission(cerere: OptimizareTransmisie):
+    """Caută rapoartele de transmitere optime (front Pareto 0-100 / v_max / pantă)"""
+    from calculations.optimizare import optimizeaza_transmisie
+
+    etapa_din_start("intrare")
+    if cerere.buget_timp_s >= executor.timeout_s:
+        # USV_TIMEOUT_S configurat sub limita modelului
+        raise HTTPException(status_code=422, detail=f"buget_timp_s trebuie să fie sub timpul maxim "
+                                                    f"al unei cereri ({executor.timeout_s:g} s)")
+    return await _in_executor(partial(
+        optimizeaza_transmisie, cerere.vehicul,
+        psi_max=cerere.psi_max,
+        v_max_min_kmh=cerere.v_max_min_kmh,
+        raport_treapta_min=cerere.raport_treapta_min,
+        limite_treapta_1=cerere.limite_treapta_1,
+        limite_treapta_finala=cerere.limite_treapta_finala,
+        limite_raport_principal=cerere.limite_raport_principal,
+        candidati_runda=cerere.candidati_runda,
+        evaluari_max=cerere.evaluari_max,
+        buget_timp_s=cerere.buget_timp_s,
+        runde_fara_progres=cerere.runde_fara_progres,
+        puncte_front_max=cerere.puncte_front_max,
+        seed=cerere.seed
+    ))
+
+@app.post("/simulate/demarare")
+async def simulate_launch(cerere: SimulareDemarare):
+    """Simularea demarării în domeniul timpului, pentru una sau mai multe strategii de schimbare"""
+    from calculations.simulare import simuleaza_demarare
+
+    etapa_din_start("intrare")
+    return await _in_executor(
+        simuleaza_demarare, cerere.vehicul,
+        [s.model_dump() for s in cerere.strategii],
+        cerere.viteza_tinta_kmh, cerere.pas_timp_s, cerere.t_max_s, cerere.max_puncte
+    )
+
+@app.get("/cicluri")
+async def list_cycles():
+    """Ciclurile de conducere disponibile local (livrate și din USV_CICLURI)"""
+    from calculations.ciclu import cicluri_disponibile, ciclu_standard
+
+    cicluri = []
+    for nume in cicluri_disponibile():
+        ciclu = ciclu_standard(nume)
+        cicluri.append({
+            "nume": nume,
+            "durata_s": ciclu.durata_s,
+            "pas_s": ciclu.pas_s,
+            "viteza_maxima_kmh": round(float(ciclu.viteze_ms.max() * 3.6), 2)
+        })
+    return {"cicluri": cicluri}
+
+@app.post("/simulate/cicluri")
+async def simulate_cycles(cerere: SimulareCicluri):
+    """Energia și consumul de combustibil pe cicluri de conducere, pentru un lot de vehicule"""
+    from calculations.ciclu import Ciclu, ciclu_standard, simuleaza_cicluri_batch
+
+    etapa_din_start("intrare")
+    try:
+        cicluri = [ciclu_standard(nume) for nume in cerere.cicluri] + [
+            Ciclu(c.nume, c.viteze_kmh, c.pas_s, c.pante_procente) for c in cerere.cicluri_personalizate
+        ]
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    rezultate = await _in_executor(
+        simuleaza_cicluri_batch, cerere.vehicule, cicluri, cerere.urma, cerere.max_puncte
+    )
     return {
-        "rezistente": calculate_resistances(vehicle),
-        "tractiune": calculate_traction(vehicle),
-        "performante": calculate_performance(vehicle),
-        "franare": calculate_braking(vehicle)
+        "vehicule": [{"nume": v.nume, "cicluri": r} for v, r in zip(cerere.vehicule, rezultate)]
     }
 
+@app.post("/calculate/montecarlo")
+async def calc_montecarlo(cerere: CerereMonteCarlo):
+    """
+    Propagarea incertitudinii parametrilor (Monte Carlo).
+
+    Eșantioanele sunt generate din distribuțiile cerute și evaluate pe
+    blocuri de marime_bloc, în paralel în pool-ul de calcul (cel mult un bloc
+    per worker); fiecare bloc returnează doar histograme per punct, deci
+    memoria nu depinde de numărul de eșantioane. Primul bloc (pilot) fixează
+    limitele histogramelor. Cu același seed, număr de eșantioane și mărime
+    de bloc rezultatul este identic, indiferent de numărul de workeri; fără
+    seed se generează unul, returnat în răspuns.
+
+    Eșantioanele fiecărui bloc sunt generate din (seed, indicele blocului),
+    iar blocul pilot fixează limitele histogramelor: cu altă marime_bloc,
+    același seed dă alte eșantioane și alte valori (statistic echivalente,
+    dar nu identice). Pentru reproducere se păstrează și marime_bloc.
+    """
+    from calculations.incertitudine import AcumulatorMonteCarlo, bloc_montecarlo, seed_aleator
+    from serviciu import json_bytes
+
+    etapa_din_start("intrare")
+    start = time.perf_counter()
+    seed = cerere.seed if cerere.seed is not None else seed_aleator()
+    distributii = [d.model_dump() for d in cerere.distributii]
+    marimi = [min(cerere.marime_bloc, cerere.esantioane - s) for s in range(0, cerere.esantioane, cerere.marime_bloc)]
+
+    async def bloc(index: int, limite=None):
+        while True:
+            try:
+                return await _in_executor(
+                    bloc_montecarlo, cerere.vehicul, distributii, seed, index, marimi[index], limite
+                )
+            except HTTPException as e:
+                if e.status_code != 429:
+                    raise
+                # Pool saturat (alte cereri): reîncercăm blocul
+                await asyncio.sleep(0.05)
+
+    try:
+        acumulator = AcumulatorMonteCarlo(await bloc(0))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    ramase = iter(range(1, len(marimi)))
+
+    async def lucrator():
+        for index in ramase:
+            acumulator.adauga(index, await bloc(index, acumulator.limite))
+
+    await asyncio.gather(*(lucrator() for _ in range(min(executor.workeri, len(marimi) - 1))))
+
+    with cronometru.etapa("montecarlo.rezumat"):
+        try:
+            rezultat = acumulator.rezultat(cerere.vehicul, cerere.percentile, cerere.clase_distributie)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+    rezultat["seed"] = seed
+    rezultat["blocuri"] = len(marimi)
+    rezultat["durata_s"] = round(time.perf_counter() - start, 3)
+    return Response(content=json_bytes(rezultat), media_type="application/json")
+
+# ============== Studii parametrice ==============
+
+@app.post("/sweep")
+async def sweep(cerere: CerereSweep, request: Request):
+    """
+    Studiu parametric pe produsul cartezian al axelor, transmis ca NDJSON.
+
+    Punctele sunt generate leneș și evaluate pe blocuri de marime_bloc;
+    fiecare bloc este trimis imediat ce este gata, iar memoria nu depinde de
+    numărul total de puncte. Dacă clientul închide conexiunea, studiul se
+    oprește la blocul curent.
+    """
+    from serviciu import json_bytes, linii_sweep
+
+    etapa_din_start("intrare")
+    campuri = [axa.camp for axa in cerere.axe]
+    axe = [axa.lista_valori() for axa in cerere.axe]
+    numar_puncte = math.prod(len(a) for a in axe)
+
+    async def flux():
+        start = time.perf_counter()
+        puncte = product(*axe)
+        index = 0
+        bloc = list(islice(puncte, cerere.marime_bloc))
+        while bloc:
+            if await request.is_disconnected():
+                return
+            try:
+                linii = await _in_executor(linii_sweep, cerere.vehicul, campuri, bloc, index)
+            except HTTPException as e:
+                if e.status_code == 429:
+                    # Pool saturat: reîncercăm blocul în loc să întrerupem fluxul
+                    await asyncio.sleep(0.05)
+                    continue
+                yield json_bytes({"eroare": e.detail, "index": index}) + b"\n"
+                return
+            yield linii
+            index += len(bloc)
+            bloc = list(islice(puncte, cerere.marime_bloc))
+        yield json_bytes({"rezumat": {
+            "puncte": index,
+            "durata_s": round(time.perf_counter() - start, 3)
+        }}) + b"\n"
+
+    return StreamingResponse(flux(), media_type="application/x-ndjson",
+                             headers={"X-Numar-Puncte": str(numar_puncte)})
+
+# ============== Sesiuni interactive ==============
+
+@app.websocket("/ws/sesiune")
+async def sesiune_interactiva(websocket: WebSocket):
+    """
+    Sesiune de editare interactivă cu recalculare incrementală.
+
+    Clientul trimite vehiculul o dată ({"tip": "init", "vehicul": ...,
+    "optiuni": ...}), apoi modificări pe câmpuri ({"tip": "patch", "id": ...,
+    "modificari": [{"cale": "aerodinamic.coefAerodinamic", "valoare": 0.32}]}).
+    Se recalculează doar capitolele care depind de câmpurile modificate
+    (calculations/campuri.py), prin cache și pool-ul de calcul, iar răspunsul
+    "delta" conține doar valorile schimbate. Modificările sosite în timpul
+    unui calcul sunt comasate și tratate împreună, astfel încât tastarea
+    rapidă nu acumulează calcule pentru stări deja depășite.
+    """
+    from serviciu import CAPITOLE, json_bytes
+    from sesiune import SesiuneCalcul
+
+    await websocket.accept()
+    sesiune = SesiuneCalcul()
+    coada: asyncio.Queue = asyncio.Queue()
+
+    async def citeste():
+        try:
+            while True:
+                await coada.put(await websocket.receive_text())
+        except WebSocketDisconnect:
+            await coada.put(None)
+
+    async def trimite(mesaj: Dict[str, Any]):
+        await websocket.send_text(json_bytes(mesaj).decode("utf-8"))
+
+    cititor = asyncio.create_task(citeste())
+    try:
+        while True:
+            mesaje = [await coada.get()]
+            while not coada.empty():
+                mesaje.append(coada.get_nowait())
+
+            complet = False
+            confirmate: List[Any] = []
+            for text in mesaje:
+                if text is None:
+                    return
+                id_mesaj = None
+                try:
+                    mesaj = json.loads(text)
+                    if not isinstance(mesaj, dict):
+                        raise ValueError("Mesajul trebuie să fie un obiect JSON")
+                    id_mesaj = mesaj.get("id")
+                    if mesaj.get("tip") == "init":
+                        sesiune.initializeaza(mesaj.get("vehicul"), mesaj.get("optiuni"))
+                        complet = True
+                    elif mesaj.get("tip") == "patch":
+                        if not sesiune.initializata:
+                            raise ValueError("Sesiunea nu este inițializată (trimiteți întâi 'init')")
+                        sesiune.aplica(mesaj.get("modificari") or [])
+                    else:
+                        raise ValueError(f"Tip de mesaj necunoscut: {mesaj.get('tip')}")
+                    confirmate.append(id_mesaj)
+                except ValidationError as e:
+                    await trimite({"tip": "eroare", "id": id_mesaj,
+                                   "erori": json.loads(e.json(include_url=False))})
+                except ValueError as e:
+                    await trimite({"tip": "eroare", "id": id_mesaj, "erori": [str(e)]})
+
+            if not confirmate:
+                continue
+
+            nume_capitole = [n for n in CAPITOLE if n in sesiune.nesincronizate]
+            optiuni = sesiune.optiuni
+            rezultate: Dict[str, Any] = {}
+            erori: Dict[str, str] = {}
+            while nume_capitole:
+                try:
+                    rezultate = (await _rezultate(
+                        [sesiune.vehicul], nume_capitole, optiuni.pas_demarare_kmh,
+                        _viteza_finala(optiuni.viteza_finala_kmh, optiuni.pana_la_vmax),
+                        max_puncte=optiuni.max_puncte
+                    ))[0]
+                    break
+                except HTTPException as e:
+                    if e.status_code == 429 and coada.empty():
+                        # Pool saturat: reîncercăm, dacă între timp nu a sosit o stare mai nouă
+                        await asyncio.sleep(0.05)
+                        continue
+                    # Capitolele rămân nesincronizate și sunt reluate la următoarea modificare
+                    erori = {n: e.detail for n in nume_capitole}
+                    break
+
+            modificari: List[Dict[str, Any]] = []
+            for n, r in rezultate.items():
+                if isinstance(r, Exception):
+                    sesiune.invalideaza(n)
+                    erori[n] = str(r)
+                else:
+                    modificari.extend(sesiune.inregistreaza(n, json.loads(r)))
+
+            if complet:
+                await trimite({"tip": "complet", "versiune": sesiune.versiune, "id": confirmate,
+                               "rezultate": sesiune.rezultate, "erori": erori})
+            else:
+                await trimite({"tip": "delta", "versiune": sesiune.versiune, "id": confirmate,
+                               "recalculate": list(rezultate), "modificari": modificari, "erori": erori})
+    except WebSocketDisconnect:
+        pass
+    finally:
+        cititor.cancel()
+
+# ============== Calcul pe loturi ==============
+
+@app.post("/calculate/batch")
+async def calc_batch(
+    vehicule: List[Any] = Body(..., description="Lista de VehicleParams"),
+    pas_demarare_kmh: float = PAS_DEMARARE,
+    viteza_finala_kmh: Optional[float] = VITEZA_FINALA,
+    pana_la_vmax: bool = PANA_LA_VMAX,
+    max_puncte: Optional[int] = MAX_PUNCTE
+):
+    """
+    Calculează toate capitolele pentru un lot de vehicule.
+
+    Fiecare vehicul este validat separat; un vehicul invalid (sau un calcul
+    eșuat) este raportat cu status "eroare" fără să respingă tot lotul.
+    Rezultatele sunt returnate în ordinea de intrare.
+    """
+    from serviciu import CAPITOLE, json_bytes
+
+    etapa_din_start("intrare")
+    valide: List[VehicleParams] = []
+    pozitii: List[int] = []
+    elemente: List[Optional[bytes]] = [None] * len(vehicule)
+    numar_erori = 0
+
+    for idx, date in enumerate(vehicule):
+        try:
+            with cronometru.etapa("validare"):
+                valide.append(VehicleParams.model_validate(date))
+            pozitii.append(idx)
+        except ValidationError as e:
+            numar_erori += 1
+            elemente[idx] = json_bytes({
+                "index": idx,
+                "status": "eroare",
+                "erori": json.loads(e.json(include_url=False))
+            })
+
+    nume_capitole = list(CAPITOLE)
+    rezultate = await _rezultate(valide, nume_capitole, pas_demarare_kmh,
+                                 _viteza_finala(viteza_finala_kmh, pana_la_vmax),
+                                 precizie=None, max_puncte=max_puncte)
+
+    for j, idx in enumerate(pozitii):
+        erori = [f"{n}: {r}" for n, r in rezultate[j].items() if isinstance(r, Exception)]
+        if erori:
+            numar_erori += 1
+            elemente[idx] = json_bytes({
+                "index": idx,
+                "nume": valide[j].nume,
+                "status": "eroare",
+                "erori": erori
+            })
+            continue
+        elemente[idx] = (
+            b'{"index":' + str(idx).encode() +
+            b',"nume":' + json_bytes(valide[j].nume) +
+            b',"status":"ok","rezultate":{' +
+            b",".join(b'"' + n.encode() + b'":' + rezultate[j][n] for n in nume_capitole) +
+            b"}}"
+        )
+
+    corp = (
+        b'{"numar_vehicule":' + str(len(vehicule)).encode() +
+        b',"numar_erori":' + str(numar_erori).encode() +
+        b',"vehicule":[' + b",".join(elemente) + b"]}"
+    )
+    return Response(content=corp, media_type="application/json")
+
+@app.post("/calculate/comparatie")
+async def calc_comparison(cerere: CerereComparatie):
+    """
+    Compară mai multe vehicule pe o axă de viteze comună: serii aliniate și
+    diferențele față de vehiculul de referință.
+    """
+    from calculations.comparatie import compara_vehicule
+
+    etapa_din_start("intrare")
+    try:
+        return await _in_executor(
+            compara_vehicule, cerere.vehicule, cerere.referinta,
+            cerere.viteza_max_kmh, cerere.pas_kmh, cerere.max_puncte
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+# ============== Proiecte ==============
+
+# Variantele unui proiect redeschis sunt citite (sau calculate) pe blocuri de atâtea variante
+VARIANTE_BLOC = 32
+
+@app.get("/proiecte")
+async def list_projects():
+    """Proiectele salvate (cele modificate recent primele), cu numărul de variante."""
+    return await asyncio.to_thread(depozit().proiecte)
+
+@app.post("/proiecte")
+async def create_project(cerere: ProiectNou):
+    """Creează un proiect gol."""
+    return await asyncio.to_thread(depozit().creeaza_proiect, cerere.nume, cerere.descriere)
+
+@app.get("/proiecte/statistici")
+async def project_store_stats():
+    """Statistici depozit proiecte (proiecte, variante, rezultate păstrate, bytes)"""
+    return await asyncio.to_thread(depozit().statistici)
+
+@app.get("/proiecte/{id_proiect}")
+async def get_project(id_proiect: int):
+    """Proiectul cu istoricul variantelor (parametrii fiecărei variante, în ordinea salvării)."""
+    proiect = await asyncio.to_thread(depozit().proiect, id_proiect)
+    if proiect is None:
+        raise HTTPException(status_code=404, detail="Proiect inexistent")
+    return proiect
+
+@app.delete("/proiecte/{id_proiect}")
+async def delete_project(id_proiect: int):
+    """Șterge proiectul și rezultatele pe care nu le mai folosește alt proiect."""
+    if not await asyncio.to_thread(depozit().sterge_proiect, id_proiect):
+        raise HTTPException(status_code=404, detail="Proiect inexistent")
+    return {"sters": id_proiect}
+
+@app.post("/proiecte/{id_proiect}/variante")
+async def save_variant(id_proiect: int, cerere: VariantaNoua,
+                       pas_demarare_kmh: float = PAS_DEMARARE,
+                       viteza_finala_kmh: Optional[float] = VITEZA_FINALA,
+                       pana_la_vmax: bool = PANA_LA_VMAX,
+                       max_puncte: Optional[int] = MAX_PUNCTE):
+    """
+    Adaugă o variantă la istoricul proiectului și păstrează în depozit
+    rezultatele tuturor capitolelor, ca JSON și ca secțiuni binare float64
+    (refolosite din cache dacă există), astfel încât redeschiderea
+    proiectului cu aceiași parametri de calcul nu mai calculează nimic.
+    Erorile de calcul sunt raportate per capitol; varianta rămâne salvată.
+    """
+    from serviciu import CAPITOLE
+
+    etapa_din_start("intrare")
+    viteza_finala_kmh = _viteza_finala(viteza_finala_kmh, pana_la_vmax)
+    varianta = await asyncio.to_thread(depozit().adauga_varianta, id_proiect, cerere.vehicul, cerere.nota)
+    if varianta is None:
+        raise HTTPException(status_code=404, detail="Proiect inexistent")
+    erori: Dict[str, str] = {}
+    for precizie in (None, 64):
+        rezultate = (await _rezultate([cerere.vehicul], list(CAPITOLE), pas_demarare_kmh, viteza_finala_kmh,
+                                      [varianta["amprenta"]], precizie, max_puncte, persista=True))[0]
+        erori.update({n: str(r) for n, r in rezultate.items() if isinstance(r, Exception)})
+    return {**varianta, "erori": erori}
+
+@app.get("/proiecte/{id_proiect}/rezultate")
+async def open_project(id_proiect: int, request: Request, accept: Optional[str] = Header(None),
+                       pas_demarare_kmh: float = PAS_DEMARARE,
+                       viteza_finala_kmh: Optional[float] = VITEZA_FINALA,
+                       pana_la_vmax: bool = PANA_LA_VMAX,
+                       max_puncte: Optional[int] = MAX_PUNCTE):
+    """
+    Redeschiderea unui proiect: rezultatele tuturor capitolelor pentru
+    fiecare variantă, transmise pe blocuri în ordinea istoricului.
+
+    Rezultatele vin din cache, apoi din depozit; doar cele lipsă (variante
+    nesalvate cu acești parametri, versiune nouă a calculelor) se calculează
+    și sunt păstrate pentru următoarea deschidere. Răspunsul este NDJSON (o
+    linie per variantă, apoi `rezumat`) sau, cu `Accept:
+    application/vnd.usv.coloane`, secțiuni binare: pentru fiecare variantă o
+    secțiune `varianta`, urmată de secțiunile capitolelor.
+    """
+    from coloane import MEDIA_TYPE as MEDIA_COLOANE, codifica, precizie_acceptata
+    from serviciu import CAPITOLE, json_bytes
+
+    etapa_din_start("intrare")
+    precizie = precizie_acceptata(accept)
+    viteza_finala_kmh = _viteza_finala(viteza_finala_kmh, pana_la_vmax)
+    proiect = await asyncio.to_thread(depozit().proiect, id_proiect)
+    if proiect is None:
+        raise HTTPException(status_code=404, detail="Proiect inexistent")
+    variante = proiect["variante"]
+    nume_capitole = list(CAPITOLE)
+
+    def element(varianta: Dict[str, Any], rezultate: Optional[Dict[str, bytes]], erori: List[Any]) -> bytes:
+        antet: Dict[str, Any] = {k: varianta[k] for k in ("id", "nume", "nota", "creat")}
+        if precizie is not None:
+            antet["status"] = "eroare" if erori else "ok"
+            if erori:
+                return codifica(dict(antet, erori=erori), "varianta")
+            return codifica(antet, "varianta") + b"".join(rezultate[n] for n in nume_capitole)
+        if erori:
+            return json_bytes({"varianta": antet, "status": "eroare", "erori": erori}) + b"\n"
+        return (
+            b'{"varianta":' + json_bytes(antet) + b',"status":"ok","rezultate":{' +
+            b",".join(b'"' + n.encode() + b'":' + rezultate[n] for n in nume_capitole) +
+            b"}}\n"
+        )
+
+    async def flux():
+        start = time.perf_counter()
+        k = 0
+        while k < len(variante):
+            if await request.is_disconnected():
+                return
+            bloc = variante[k:k + VARIANTE_BLOC]
+            valide: List[VehicleParams] = []
+            pozitii: List[int] = []
+            erori: List[List[Any]] = [[] for _ in bloc]
+            for i, v in enumerate(bloc):
+                try:
+                    valide.append(VehicleParams.model_validate(v["parametri"]))
+                    pozitii.append(i)
+                except ValidationError as e:
+                    erori[i] = json.loads(e.json(include_url=False))
+            try:
+                rezultate = await _rezultate(valide, nume_capitole, pas_demarare_kmh, viteza_finala_kmh,
+                                             None, precizie, max_puncte, persista=True)
+            except HTTPException as e:
+                if e.status_code == 429:
+                    # Pool saturat: reîncercăm blocul în loc să întrerupem fluxul
+                    await asyncio.sleep(0.05)
+                    continue
+                eroare = {"eroare": e.detail, "varianta": bloc[0]["id"]}
+                yield json_bytes(eroare) + b"\n" if precizie is None else codifica(eroare, "eroare")
+                return
+            gasite: List[Optional[Dict[str, bytes]]] = [None] * len(bloc)
+            for i, r in zip(pozitii, rezultate):
+                erori[i] = [f"{n}: {x}" for n, x in r.items() if isinstance(x, Exception)]
+                gasite[i] = r
+            yield b"".join(element(v, r, e) for v, r, e in zip(bloc, gasite, erori))
+            k += len(bloc)
+        rezumat = {"variante": len(variante), "durata_s": round(time.perf_counter() - start, 3)}
+        yield json_bytes({"rezumat": rezumat}) + b"\n" if precizie is None else codifica(rezumat, "rezumat")
+
+    return StreamingResponse(flux(), media_type="application/x-ndjson" if precizie is None else MEDIA_COLOANE,
+                             headers={"X-Numar-Variante": str(len(variante)), "Vary": "Accept"})
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="127.0.0.1", port=8000)
+
+    port = int(os.environ.get("USV_PORT", "8000"))
+    workeri_http = int(os.environ.get("USV_WORKERI_HTTP", "1"))
+    if workeri_http <= 1:
+        uvicorn.run(app, host="127.0.0.1", port=port)
+    else:
+        # Mai multe procese server: fiecare importă modulul din nou, deci starea
+        # comună (cache-ul partajat) și împărțirea nucleelor între pool-urile de
+        # calcul se transmit prin mediu
+        from cache import cale_cache_partajat
+
+        cale = cale_cache_partajat()
+        CacheRezultatePartajat.creeaza(cale, CAPACITATE_CACHE)
+        os.environ["USV_CACHE_PARTAJAT"] = cale
+        os.environ.setdefault("USV_WORKERI", str(max(1, (os.cpu_count() or 1) // workeri_http)))
+        try:
+            uvicorn.run("main:app", host="127.0.0.1", port=port, workers=workeri_http)
+        finally:
+            os.remove(cale)
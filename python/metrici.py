@@ -0,0 +1,264 @@
+"""
+Instrumentarea cererilor: durate pe etape, antetul Server-Timing, metrici
+agregate (/metrics) și profilare cProfile la cerere.
+"""
+
+import cProfile
+import io
+import json
+import pstats
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from calculations import cronometru
+
+# Limitele histogramelor de latență [ms]
+LIMITE_MS = (1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Numărul de funcții afișate în rezumatul cProfile
+LINII_PROFIL = 30
+
+class Histograma:
+    def __init__(self, limite: Tuple[float, ...] = LIMITE_MS):
+        self.limite = limite
+        self.numar = [0] * (len(limite) + 1)  # ultimul: +Inf
+        self.suma = 0.0
+        self.total = 0
+
+    def observa(self, valoare: float) -> None:
+        i = 0
+        while i < len(self.limite) and valoare > self.limite[i]:
+            i += 1
+        self.numar[i] += 1
+        self.suma += valoare
+        self.total += 1
+
+    def cumulat(self) -> List[Tuple[str, int]]:
+        rezultat, acumulat = [], 0
+        for limita, n in zip([str(l) for l in self.limite] + ["+Inf"], self.numar):
+            acumulat += n
+            rezultat.append((limita, acumulat))
+        return rezultat
+
+class RegistruMetrici:
+    """Contoare și histograme pe endpoint și etapă, protejate de un lock."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.cereri: Dict[Tuple[str, str, int], int] = {}
+        self.durate: Dict[str, Histograma] = {}
+        self.etape: Dict[Tuple[str, str], Histograma] = {}
+        self.in_lucru = 0
+
+    def incepe(self) -> None:
+        with self._lock:
+            self.in_lucru += 1
+
+    def termina(self, metoda: str, ruta: str, status: int, durata_ms: float,
+                etape: Dict[str, float]) -> None:
+        with self._lock:
+            self.in_lucru -= 1
+            cheie = (metoda, ruta, status)
+            self.cereri[cheie] = self.cereri.get(cheie, 0) + 1
+            self.durate.setdefault(ruta, Histograma()).observa(durata_ms)
+            for nume, ms in etape.items():
+                self.etape.setdefault((ruta, nume), Histograma()).observa(ms)
+
+    def statistici(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_lucru": self.in_lucru,
+                "cereri": [
+                    {"metoda": m, "ruta": r, "status": s, "numar": n}
+                    for (m, r, s), n in sorted(self.cereri.items())
+                ],
+                "durate_ms": {
+                    r: {"numar": h.total, "suma": round(h.suma, 3), "histograma": dict(h.cumulat())}
+                    for r, h in sorted(self.durate.items())
+                },
+                "etape_ms": {
+                    f"{r} {e}": {"numar": h.total, "suma": round(h.suma, 3), "histograma": dict(h.cumulat())}
+                    for (r, e), h in sorted(self.etape.items())
+                }
+            }
+
+    def prometheus(self, extra: Optional[Dict[str, float]] = None) -> str:
+        """Export în formatul text Prometheus."""
+        linii = []
+
+        def histograma(nume: str, etichete: str, h: Histograma) -> None:
+            for limita, n in h.cumulat():
+                linii.append(f'{nume}_bucket{{{etichete},le="{limita}"}} {n}')
+            linii.append(f"{nume}_sum{{{etichete}}} {h.suma:.3f}")
+            linii.append(f"{nume}_count{{{etichete}}} {h.total}")
+
+        with self._lock:
+            linii.append("# TYPE usv_cereri_total counter")
+            for (m, r, s), n in sorted(self.cereri.items()):
+                linii.append(f'usv_cereri_total{{metoda="{m}",ruta="{r}",status="{s}"}} {n}')
+            linii.append("# TYPE usv_cereri_in_lucru gauge")
+            linii.append(f"usv_cereri_in_lucru {self.in_lucru}")
+            linii.append("# TYPE usv_durata_cerere_ms histogram")
+            for r, h in sorted(self.durate.items()):
+                histograma("usv_durata_cerere_ms", f'ruta="{r}"', h)
+            linii.append("# TYPE usv_durata_etapa_ms histogram")
+            for (r, e), h in sorted(self.etape.items()):
+                histograma("usv_durata_etapa_ms", f'ruta="{r}",etapa="{e}"', h)
+        tipuri = set()
+        for nume, valoare in (extra or {}).items():
+            # Numele pot avea etichete (`nume{pid="…"}`); tipul apare o singură dată per metrică
+            baza = nume.split("{", 1)[0]
+            if baza not in tipuri:
+                tipuri.add(baza)
+                linii.append(f"# TYPE {baza} gauge")
+            linii.append(f"{nume} {valoare}")
+        return "\n".join(linii) + "\n"
+
+# ============== Măsurarea unei cereri ==============
+
+class Masurare:
+    """Starea de instrumentare a unei cereri (etape, profilare)."""
+
+    def __init__(self, profil: bool = False):
+        self.inceput = time.perf_counter()
+        self.etape: Dict[str, float] = {}
+        self.profil = profil
+        self.profile_calcul: List[str] = []
+
+_masurare: ContextVar[Optional[Masurare]] = ContextVar("masurare", default=None)
+
+def masurare_curenta() -> Optional[Masurare]:
+    return _masurare.get()
+
+def etapa_din_start(nume: str) -> None:
+    """Înregistrează ca etapă timpul scurs de la începutul cererii (ex. rutare + validare)."""
+    m = _masurare.get()
+    if m is not None:
+        cronometru.adauga(nume, (time.perf_counter() - m.inceput) * 1000)
+
+def rezumat_profil(profiler: cProfile.Profile, linii: int = LINII_PROFIL) -> str:
+    text = io.StringIO()
+    pstats.Stats(profiler, stream=text).strip_dirs().sort_stats("cumulative").print_stats(linii)
+    return text.getvalue()
+
+def ruleaza_masurat(fn: Callable[..., Any], profil: bool, trimis_la: float,
+                    *args: Any) -> Tuple[Any, Dict[str, float], Optional[str]]:
+    """
+    Rulează fn(*args) în worker cu propriul colector de etape.
+
+    Returnează rezultatul, etapele (inclusiv așteptarea în coadă) și,
+    la cerere, rezumatul cProfile. Funcție de modul: poate fi trimisă și
+    unui pool de procese.
+    """
+    etape = {"coada": max(time.time() - trimis_la, 0.0) * 1000}
+    token = cronometru.porneste(etape)
+    profiler = cProfile.Profile() if profil else None
+    try:
+        if profiler:
+            profiler.enable()
+        with cronometru.etapa("executie"):
+            rezultat = fn(*args)
+    finally:
+        if profiler:
+            profiler.disable()
+        cronometru.opreste(token)
+    return rezultat, etape, rezumat_profil(profiler) if profiler else None
+
+# ============== Middleware ==============
+
+def _ruta(scope: Dict[str, Any]) -> str:
+    """Șablonul rutei (ex. /calculate/{capitol}), nu calea concretă."""
+    ruta = scope.get("route")
+    if ruta is not None and hasattr(ruta, "path"):
+        return ruta.path
+    endpoint = scope.get("endpoint")
+    app = scope.get("app")
+    if endpoint is not None and app is not None:
+        for r in getattr(app, "routes", []):
+            if getattr(r, "endpoint", None) is endpoint:
+                return r.path
+    return "necunoscuta"
+
+def _cere_profil(scope: Dict[str, Any]) -> bool:
+    for nume, valoare in scope.get("headers", []):
+        if nume == b"x-profil" and valoare.strip() in (b"1", b"true"):
+            return True
+    interogare = scope.get("query_string", b"").decode("latin-1")
+    return any(p in ("profil=1", "profil=true") for p in interogare.split("&"))
+
+def server_timing(etape: Dict[str, float], total_ms: float) -> str:
+    parti = [f"{nume};dur={ms:.3f}" for nume, ms in etape.items()]
+    parti.append(f"total;dur={total_ms:.3f}")
+    return ", ".join(parti)
+
+class MiddlewareMetrici:
+    """
+    Middleware ASGI: cronometrează fiecare cerere HTTP, adaugă antetul
+    Server-Timing, alimentează registrul de metrici și, cu `X-Profil: 1`
+    sau `?profil=1`, înlocuiește corpul cu rezumatul cProfile.
+    """
+
+    def __init__(self, app: Any, registru: RegistruMetrici):
+        self.app = app
+        self.registru = registru
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        masurare = Masurare(profil=_cere_profil(scope))
+        token_m = _masurare.set(masurare)
+        token_c = cronometru.porneste(masurare.etape)
+        self.registru.incepe()
+        status = 500
+        profiler = cProfile.Profile() if masurare.profil else None
+        retinut: Dict[str, Any] = {"start": None, "corp": []}
+
+        async def send_instrumentat(mesaj: Dict[str, Any]) -> None:
+            nonlocal status
+            if mesaj["type"] == "http.response.start":
+                status = mesaj["status"]
+                total = (time.perf_counter() - masurare.inceput) * 1000
+                antete = list(mesaj.get("headers", []))
+                antete.append((b"server-timing", server_timing(masurare.etape, total).encode("latin-1")))
+                mesaj = dict(mesaj, headers=antete)
+                if profiler:
+                    retinut["start"] = mesaj
+                    return
+            elif mesaj["type"] == "http.response.body" and profiler:
+                retinut["corp"].append(mesaj.get("body", b""))
+                if mesaj.get("more_body", False):
+                    return
+                await self._trimite_profil(send, retinut["start"], masurare, profiler)
+                return
+            await send(mesaj)
+
+        try:
+            if profiler:
+                profiler.enable()
+            await self.app(scope, receive, send_instrumentat)
+        finally:
+            if profiler:
+                profiler.disable()
+            cronometru.opreste(token_c)
+            _masurare.reset(token_m)
+            total = (time.perf_counter() - masurare.inceput) * 1000
+            self.registru.termina(scope["method"], _ruta(scope), status, total, masurare.etape)
+
+    async def _trimite_profil(self, send: Callable, start: Dict[str, Any],
+                              masurare: Masurare, profiler: cProfile.Profile) -> None:
+        profiler.disable()
+        corp = json.dumps({
+            "status": start["status"],
+            "etape_ms": {k: round(v, 3) for k, v in masurare.etape.items()},
+            "profil_bucla": rezumat_profil(profiler),
+            "profil_calcul": masurare.profile_calcul
+        }, ensure_ascii=False).encode("utf-8")
+        antete = [(k, v) for k, v in start["headers"]
+                  if k.lower() not in (b"content-type", b"content-length", b"etag")]
+        antete += [(b"content-type", b"application/json"), (b"content-length", str(len(corp)).encode())]
+        await send({"type": "http.response.start", "status": 200, "headers": antete})
+        await send({"type": "http.response.body", "body": corp})
@@ -0,0 +1,421 @@
+"""
+Modele Pydantic pentru parametrii vehiculului
+Folosite de API și de procesele de calcul (trebuie să fie importabile)
+"""
+
+from pydantic import BaseModel, Field, model_validator
+from typing import Annotated, Dict, List, Optional, Tuple
+import math
+
+from calculations.campuri import CAMPURI_CONTEXT, PARAMETRI_SCENARIU
+
+# Mărimile fizice ale vehiculului sunt finite; un vehicul cu mase, raze sau
+# rapoarte nepozitive este respins la validare (în /calculate/batch, doar el)
+Pozitiv = Annotated[float, Field(gt=0, allow_inf_nan=False)]
+Nenegativ = Annotated[float, Field(ge=0, allow_inf_nan=False)]
+Procent = Annotated[float, Field(ge=0, le=100, allow_inf_nan=False)]
+
+class VehicleDimensions(BaseModel):
+    lungime: Pozitiv
+    latime: Pozitiv
+    inaltime: Pozitiv
+    ampatament: Pozitiv
+    ecartamentFata: Pozitiv
+    ecartamentSpate: Pozitiv
+    gardaSol: Nenegativ
+    consolaFata: Nenegativ
+    consolaSpate: Nenegativ
+
+class VehicleMass(BaseModel):
+    masaGoala: Pozitiv
+    masaTotala: Pozitiv
+    capacitateIncarcare: Nenegativ
+    repartizareFata: Procent
+    repartizareSpate: Procent
+    inaltimeCentruMasa: Pozitiv
+
+class TireParams(BaseModel):
+    dimensiune: str
+    latime: Pozitiv
+    raportProfil: Pozitiv
+    diametruJanta: Pozitiv
+    razaStatica: Pozitiv
+    razaDinamica: Pozitiv
+    coefRulare: Nenegativ
+
+# Numărul maxim de puncte al unei curbe de cuplu măsurate
+PUNCTE_MAX_CURBA = 100_000
+
+class CurbaCuplu(BaseModel):
+    """Curba de cuplu la sarcină plină măsurată (ex. înregistrare de pe standul de probă)."""
+    turatii: List[float] = Field(..., min_length=2, max_length=PUNCTE_MAX_CURBA)
+    cupluri: List[float] = Field(..., min_length=2, max_length=PUNCTE_MAX_CURBA)
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "CurbaCuplu":
+        if len(self.turatii) != len(self.cupluri):
+            raise ValueError("Curba de cuplu necesită același număr de turații și cupluri")
+        if not all(n > 0 and math.isfinite(n) for n in self.turatii):
+            raise ValueError("Turațiile curbei de cuplu trebuie să fie pozitive")
+        if not all(M >= 0 and math.isfinite(M) for M in self.cupluri):
+            raise ValueError("Cuplurile curbei de cuplu nu pot fi negative")
+        if len(set(self.turatii)) < 2:
+            raise ValueError("Curba de cuplu necesită cel puțin două turații distincte")
+        return self
+
+class EngineParams(BaseModel):
+    tip: str
+    cilindree: Nenegativ
+    putereMaxima: Pozitiv
+    turatiePutereMax: Pozitiv
+    cuplMaxim: Pozitiv
+    turatieCuplMax: Pozitiv
+    turatieMaxima: Pozitiv
+    turatieRalanti: Pozitiv
+    curbaCuplu: Optional[CurbaCuplu] = None
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "EngineParams":
+        if self.turatieRalanti >= self.turatieMaxima:
+            raise ValueError("Turația de ralanti trebuie să fie mai mică decât turația maximă")
+        return self
+
+class TransmissionParams(BaseModel):
+    tipTransmisie: str
+    numarTrepte: int = Field(..., ge=1)
+    raporturiCV: List[Pozitiv] = Field(..., min_length=1)
+    raportPrincipal: Pozitiv
+    randamentTransmisie: float = Field(..., gt=0, le=1)
+
+class AerodynamicParams(BaseModel):
+    coefAerodinamic: Pozitiv
+    arieFrontala: Pozitiv
+
+class VehicleParams(BaseModel):
+    nume: str
+    dimensiuni: VehicleDimensions
+    masa: VehicleMass
+    pneu: TireParams
+    motor: EngineParams
+    transmisie: TransmissionParams
+    aerodinamic: AerodynamicParams
+
+# Bugetul de timp maxim al unei optimizări [s]: sub timpul maxim al unei cereri
+# (USV_TIMEOUT_S, implicit 30 s), altfel clientul ar primi 504 în timp ce
+# căutarea ține ocupat un worker până la epuizarea propriului buget
+BUGET_OPTIMIZARE_MAX_S = 20.0
+
+class OptimizareTransmisie(BaseModel):
+    vehicul: VehicleParams
+    psi_max: float = 0.35
+    v_max_min_kmh: Optional[float] = None
+    raport_treapta_min: float = Field(1.1, ge=1.0)
+    limite_treapta_1: Optional[Tuple[float, float]] = None
+    limite_treapta_finala: Optional[Tuple[float, float]] = None
+    limite_raport_principal: Optional[Tuple[float, float]] = None
+    candidati_runda: int = Field(1000, gt=0, le=20_000)
+    evaluari_max: int = Field(20000, gt=0)
+    buget_timp_s: float = Field(5.0, gt=0, le=BUGET_OPTIMIZARE_MAX_S)
+    runde_fara_progres: int = Field(3, gt=0)
+    puncte_front_max: int = Field(50, gt=0)
+    seed: Optional[int] = None
+
+class StrategieSchimbare(BaseModel):
+    timp_schimbare_s: float = Field(0.3, ge=0)
+    turatie_schimbare_rpm: Optional[float] = Field(None, gt=0)
+    turatie_lansare_rpm: Optional[float] = Field(None, gt=0)
+
+class SimulareDemarare(BaseModel):
+    vehicul: VehicleParams
+    strategii: List[StrategieSchimbare] = Field(default_factory=lambda: [StrategieSchimbare()],
+                                                min_length=1, max_length=64)
+    viteza_tinta_kmh: float = Field(100.0, gt=0)
+    pas_timp_s: float = Field(0.05, ge=0.001)
+    t_max_s: float = Field(60.0, gt=0, le=600)
+    max_puncte: Optional[int] = Field(None, ge=3)
+
+PUNCTE_MAX_CICLU = 200_000
+
+class CicluPersonalizat(BaseModel):
+    nume: str = Field(..., min_length=1)
+    viteze_kmh: List[float] = Field(..., min_length=2, max_length=PUNCTE_MAX_CICLU)
+    pas_s: float = Field(1.0, gt=0)
+    pante_procente: Optional[List[float]] = None
+
+    @model_validator(mode="after")
+    def _verifica_urma(self):
+        if any(v < 0 for v in self.viteze_kmh):
+            raise ValueError("Vitezele ciclului nu pot fi negative")
+        if self.pante_procente is not None and len(self.pante_procente) != len(self.viteze_kmh):
+            raise ValueError("`pante_procente` trebuie să aibă aceeași lungime ca `viteze_kmh`")
+        return self
+
+class SimulareCicluri(BaseModel):
+    vehicule: List[VehicleParams] = Field(..., min_length=1, max_length=1000)
+    cicluri: List[str] = Field(default_factory=lambda: ["nedc"])
+    cicluri_personalizate: List[CicluPersonalizat] = Field(default_factory=list, max_length=16)
+    urma: bool = False
+    max_puncte: Optional[int] = Field(None, ge=3)
+
+    @model_validator(mode="after")
+    def _verifica_cicluri(self):
+        if not self.cicluri and not self.cicluri_personalizate:
+            raise ValueError("Cel puțin un ciclu (standard sau personalizat) este necesar")
+        return self
+
+INTEROGARI_MAX = 10_000
+
+class CerereIntervale(BaseModel):
+    vehicul: VehicleParams
+    intervale: List[Tuple[float, float]] = Field(
+        default_factory=lambda: [(0, 60), (0, 100), (60, 100), (80, 120)], max_length=INTEROGARI_MAX
+    )
+    viteze_kmh: List[float] = Field(default_factory=list, max_length=INTEROGARI_MAX)
+    timpi_s: List[float] = Field(default_factory=list, max_length=INTEROGARI_MAX)
+    distante_m: List[float] = Field(default_factory=list, max_length=INTEROGARI_MAX)
+    pas_kmh: float = Field(0.1, ge=0.01, le=5)
+
+    @model_validator(mode="after")
+    def _verifica_intervale(self):
+        for v1, v2 in self.intervale:
+            if not 0 <= v1 < v2:
+                raise ValueError(f"Interval invalid {v1} → {v2} km/h: este necesar 0 ≤ v1 < v2")
+        return self
+
+class CerereComparatie(BaseModel):
+    vehicule: List[VehicleParams] = Field(..., min_length=2, max_length=64)
+    referinta: int = Field(0, ge=0)
+    viteza_max_kmh: Optional[float] = Field(None, gt=0)
+    pas_kmh: float = Field(1.0, ge=0.01)
+    max_puncte: Optional[int] = Field(None, ge=3)
+
+    @model_validator(mode="after")
+    def _verifica_comparatie(self):
+        if self.referinta >= len(self.vehicule):
+            raise ValueError("`referinta` trebuie să fie indicele unui vehicul din listă")
+        if self.viteza_max_kmh is not None and self.viteza_max_kmh / self.pas_kmh > PUNCTE_MAX_CURBA:
+            raise ValueError(f"Axa de viteze depășește {PUNCTE_MAX_CURBA} de puncte")
+        return self
+
+# Numărul maxim de puncte ale unui studiu parametric (produsul lungimilor
+# axelor); rezultatele sunt transmise pe blocuri, deci limita privește durata
+# calculului, nu memoria
+PUNCTE_MAX_SWEEP = 1_000_000
+
+class AxaSweep(BaseModel):
+    camp: str
+    valori: Optional[List[float]] = Field(None, max_length=PUNCTE_MAX_CURBA)
+    minim: Optional[float] = None
+    maxim: Optional[float] = None
+    puncte: Optional[int] = Field(None, gt=0, le=PUNCTE_MAX_CURBA)
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "AxaSweep":
+        if self.camp not in CAMPURI_CONTEXT:
+            raise ValueError(f"Câmp necunoscut: {self.camp} (disponibile: {', '.join(CAMPURI_CONTEXT)})")
+        if not self.valori and None in (self.minim, self.maxim, self.puncte):
+            raise ValueError("Axa necesită `valori` sau `minim`, `maxim` și `puncte`")
+        return self
+
+    def __len__(self) -> int:
+        return len(self.valori) if self.valori else self.puncte
+
+    def lista_valori(self) -> List[float]:
+        if self.valori:
+            return list(self.valori)
+        import numpy as np  # amânat: modelele se importă la pornirea serverului
+        return np.linspace(self.minim, self.maxim, self.puncte).tolist()
+
+class CerereSweep(BaseModel):
+    vehicul: VehicleParams
+    axe: List[AxaSweep] = Field(..., min_length=1)
+    marime_bloc: int = Field(512, gt=0, le=10000)
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "CerereSweep":
+        puncte = 1
+        for axa in self.axe:
+            puncte *= len(axa)
+        if puncte > PUNCTE_MAX_SWEEP:
+            raise ValueError(f"Studiul are {puncte} puncte (maxim {PUNCTE_MAX_SWEEP})")
+        return self
+
+# Numărul maxim de puncte ale unei grile de frânare (produsul lungimilor axelor)
+PUNCTE_MAX_GRILA = 500_000
+
+class GrilaFranare(BaseModel):
+    vehicul: VehicleParams
+    aderente: List[float] = Field(default_factory=lambda: [0.8, 0.5, 0.2], min_length=1)
+    viteze_kmh: List[float] = Field(default_factory=lambda: [float(v) for v in range(10, 151, 10)],
+                                    min_length=1)
+    pante_procente: List[float] = Field(default_factory=lambda: [0.0], min_length=1)
+    timpi_reactie_s: List[float] = Field(default_factory=lambda: [1.0], min_length=1)
+    stari_incarcare: List[float] = Field(default_factory=lambda: [1.0], min_length=1)
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "GrilaFranare":
+        if not all(0 < phi <= 1.5 for phi in self.aderente):
+            raise ValueError("Aderențele trebuie să fie în intervalul (0, 1.5]")
+        if not all(v > 0 for v in self.viteze_kmh):
+            raise ValueError("Vitezele trebuie să fie pozitive")
+        if not all(abs(p) < 100 for p in self.pante_procente):
+            raise ValueError("Pantele trebuie să fie în intervalul (-100, 100) %")
+        if not all(t >= 0 for t in self.timpi_reactie_s):
+            raise ValueError("Timpii de reacție nu pot fi negativi")
+        if not all(0 <= lam <= 1 for lam in self.stari_incarcare):
+            raise ValueError("Stările de încărcare trebuie să fie în intervalul [0, 1]")
+        puncte = math.prod(len(axa) for axa in self.axe().values())
+        if puncte > PUNCTE_MAX_GRILA:
+            raise ValueError(f"Grila are {puncte} puncte (maxim {PUNCTE_MAX_GRILA})")
+        # Oprirea trebuie să fie posibilă în cel mai defavorabil punct (aderență minimă, coborâre maximă)
+        alfa = math.atan(min(self.pante_procente) / 100)
+        if min(self.aderente) * math.cos(alfa) + math.sin(alfa) <= 0:
+            raise ValueError("Cu aderența minimă, pe cea mai mare coborâre a grilei vehiculul nu se poate opri")
+        return self
+
+    def axe(self) -> Dict[str, List[float]]:
+        """Axele grilei, ca argumente pentru `grila_franare_ctx`."""
+        return {
+            "aderente": self.aderente,
+            "viteze_kmh": self.viteze_kmh,
+            "pante_procente": self.pante_procente,
+            "timpi_reactie_s": self.timpi_reactie_s,
+            "stari_incarcare": self.stari_incarcare
+        }
+
+# Numărul maxim de puncte ale unei hărți de rezistență; harta este transmisă
+# pe tile-uri, deci limita privește durata calculului, nu memoria
+PUNCTE_MAX_HARTA = 50_000_000
+# Numărul maxim de puncte calculate și serializate într-un tile
+PUNCTE_MAX_TILA = 4_000_000
+
+class AxaHarta(BaseModel):
+    valori: Optional[List[float]] = Field(None, min_length=1)
+    minim: Optional[float] = None
+    maxim: Optional[float] = None
+    puncte: Optional[int] = Field(None, gt=0, le=100_000)
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "AxaHarta":
+        if not self.valori and None in (self.minim, self.maxim, self.puncte):
+            raise ValueError("Axa necesită `valori` sau `minim`, `maxim` și `puncte`")
+        return self
+
+    def __len__(self) -> int:
+        return len(self.valori) if self.valori else self.puncte
+
+    def lista_valori(self) -> List[float]:
+        if self.valori:
+            return list(self.valori)
+        import numpy as np  # amânat: modelele se importă la pornirea serverului
+        return np.linspace(self.minim, self.maxim, self.puncte).tolist()
+
+    def limite(self) -> Tuple[float, float]:
+        if self.valori:
+            return min(self.valori), max(self.valori)
+        return min(self.minim, self.maxim), max(self.minim, self.maxim)
+
+class HartaRezistente(BaseModel):
+    vehicul: VehicleParams
+    viteza_kmh: AxaHarta = Field(default_factory=lambda: AxaHarta(minim=0, maxim=200, puncte=41))
+    panta_procente: AxaHarta = Field(default_factory=lambda: AxaHarta(valori=[0.0]))
+    vant_kmh: AxaHarta = Field(default_factory=lambda: AxaHarta(valori=[0.0]))
+    altitudine_m: AxaHarta = Field(default_factory=lambda: AxaHarta(valori=[0.0]))
+    puncte_tila: int = Field(262_144, gt=0, le=PUNCTE_MAX_TILA)
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "HartaRezistente":
+        if self.viteza_kmh.limite()[0] < 0:
+            raise ValueError("Vitezele nu pot fi negative")
+        if max(abs(p) for p in self.panta_procente.limite()) >= 100:
+            raise ValueError("Pantele trebuie să fie în intervalul (-100, 100) %")
+        altitudine_min, altitudine_max = self.altitudine_m.limite()
+        if altitudine_min < -500 or altitudine_max > 11_000:
+            raise ValueError("Altitudinile trebuie să fie în intervalul [-500, 11000] m (troposferă)")
+        puncte_rand = len(self.panta_procente) * len(self.vant_kmh) * len(self.altitudine_m)
+        if puncte_rand > PUNCTE_MAX_TILA:
+            raise ValueError(
+                f"O viteză a hărții are {puncte_rand} puncte pantă × vânt × altitudine "
+                f"(maxim {PUNCTE_MAX_TILA}); harta se împarte pe tile-uri doar după viteză"
+            )
+        puncte = len(self.viteza_kmh) * puncte_rand
+        if puncte > PUNCTE_MAX_HARTA:
+            raise ValueError(f"Harta are {puncte} puncte (maxim {PUNCTE_MAX_HARTA})")
+        return self
+
+    def axe_harta(self) -> Dict[str, AxaHarta]:
+        return {
+            "viteze_kmh": self.viteza_kmh,
+            "pante_procente": self.panta_procente,
+            "vant_kmh": self.vant_kmh,
+            "altitudini_m": self.altitudine_m
+        }
+
+    def randuri_tila(self) -> int:
+        """Numărul de viteze (rânduri) dintr-un tile, astfel încât tile-ul să aibă cel mult `puncte_tila` puncte."""
+        puncte_rand = len(self.panta_procente) * len(self.vant_kmh) * len(self.altitudine_m)
+        return max(1, self.puncte_tila // puncte_rand)
+
+# Numărul maxim de eșantioane ale unei analize Monte Carlo
+ESANTIOANE_MAX = 1_000_000
+
+class DistributieParametru(BaseModel):
+    camp: str
+    tip: str = Field("normala", pattern="^(normala|uniforma|triunghiulara)$")
+    medie: Optional[float] = None
+    abatere: Optional[float] = Field(None, gt=0)
+    abatere_relativa: Optional[float] = Field(None, gt=0)
+    minim: Optional[float] = None
+    maxim: Optional[float] = None
+    mod: Optional[float] = None
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "DistributieParametru":
+        if self.camp not in CAMPURI_CONTEXT and self.camp not in PARAMETRI_SCENARIU:
+            disponibile = ", ".join(list(CAMPURI_CONTEXT) + list(PARAMETRI_SCENARIU))
+            raise ValueError(f"Câmp necunoscut: {self.camp} (disponibile: {disponibile})")
+        if self.tip == "normala":
+            if (self.abatere is None) == (self.abatere_relativa is None):
+                raise ValueError("Distribuția normală necesită fie `abatere`, fie `abatere_relativa`")
+            if None not in (self.minim, self.maxim) and self.minim >= self.maxim:
+                raise ValueError("Limitele de trunchiere necesită minim < maxim")
+        else:
+            if None in (self.minim, self.maxim) or self.minim >= self.maxim:
+                raise ValueError(f"Distribuția {self.tip} necesită `minim` < `maxim`")
+            if self.mod is not None and not self.minim <= self.mod <= self.maxim:
+                raise ValueError("`mod` trebuie să fie între `minim` și `maxim`")
+        return self
+
+class CerereMonteCarlo(BaseModel):
+    vehicul: VehicleParams
+    distributii: List[DistributieParametru] = Field(..., min_length=1)
+    esantioane: int = Field(10_000, gt=0, le=ESANTIOANE_MAX)
+    seed: Optional[int] = Field(None, ge=0)
+    marime_bloc: int = Field(1024, gt=0, le=16384)
+    percentile: List[float] = Field(default_factory=lambda: [5.0, 50.0, 95.0], min_length=1, max_length=16)
+    clase_distributie: int = Field(50, gt=0, le=1000)
+
+    @model_validator(mode="after")
+    def _verifica(self) -> "CerereMonteCarlo":
+        campuri = [d.camp for d in self.distributii]
+        if len(set(campuri)) != len(campuri):
+            raise ValueError("Fiecare câmp poate avea o singură distribuție")
+        if any(not 0 <= p <= 100 for p in self.percentile):
+            raise ValueError("Percentilele trebuie să fie între 0 și 100")
+        return self
+
+class OptiuniSesiune(BaseModel):
+    """Opțiunile de calcul ale unei sesiuni interactive (aceleași ca parametrii endpoint-urilor)."""
+    pas_demarare_kmh: float = Field(1.0, ge=0.01)
+    viteza_finala_kmh: Optional[float] = Field(None, gt=0)
+    pana_la_vmax: bool = False
+    max_puncte: Optional[int] = Field(None, ge=3)
+
+class ProiectNou(BaseModel):
+    nume: str = Field(..., min_length=1, max_length=200)
+    descriere: Optional[str] = Field(None, max_length=10_000)
+
+class VariantaNoua(BaseModel):
+    """O variantă salvată în istoricul unui proiect; `nota` descrie modificarea."""
+    vehicul: VehicleParams
+    nota: Optional[str] = Field(None, max_length=10_000)
@@ -0,0 +1,237 @@
+"""
+Depozitul local de proiecte (SQLite)
+Un proiect păstrează istoricul variantelor vehiculului (VehicleParams), iar
+corpurile serializate ale capitolelor (JSON și secțiuni binare pe coloane)
+sunt păstrate ca BLOB-uri sub aceleași chei ca în cache-ul de rezultate:
+redeschiderea unui proiect după repornirea backend-ului este o citire, nu
+un recalcul. Rezultatele unei versiuni anterioare a modulelor de calcul
+sunt șterse la deschiderea bazei.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from cache import VERSIUNE_CALCUL, amprenta_vehicul
+from modele import VehicleParams
+
+# Fereastra mapată în memorie a fișierului bazei [bytes]: BLOB-urile sunt
+# citite direct din paginile mapate, fără apeluri read() suplimentare
+MMAP_BYTES = 256 * 1024 * 1024
+
+# Numărul maxim de parametri ai unei interogări (limita SQLite este 999 în versiunile vechi)
+PARAMETRI_INTEROGARE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    cheie TEXT PRIMARY KEY,
+    valoare TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS proiecte (
+    id INTEGER PRIMARY KEY,
+    nume TEXT NOT NULL,
+    descriere TEXT,
+    creat REAL NOT NULL,
+    modificat REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS variante (
+    id INTEGER PRIMARY KEY,
+    proiect INTEGER NOT NULL REFERENCES proiecte(id) ON DELETE CASCADE,
+    nume TEXT NOT NULL,
+    nota TEXT,
+    amprenta TEXT NOT NULL,
+    parametri TEXT NOT NULL,
+    creat REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS variante_proiect ON variante(proiect, id);
+CREATE INDEX IF NOT EXISTS variante_amprenta ON variante(amprenta);
+CREATE TABLE IF NOT EXISTS rezultate (
+    cheie TEXT PRIMARY KEY,
+    amprenta TEXT NOT NULL,
+    date BLOB NOT NULL,
+    creat REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS rezultate_amprenta ON rezultate(amprenta);
+"""
+
+def _proiect(rand: sqlite3.Row) -> Dict[str, Any]:
+    return {k: rand[k] for k in ("id", "nume", "descriere", "creat", "modificat")}
+
+def _varianta(rand: sqlite3.Row) -> Dict[str, Any]:
+    return {k: rand[k] for k in ("id", "nume", "nota", "amprenta", "creat")}
+
+class DepozitProiecte:
+    """
+    Proiectele, variantele și rezultatele lor, într-o bază SQLite locală.
+
+    Conexiunea este partajată de firele serverului și protejată de un lock;
+    rezultatele sunt bytes opaci (corpul răspunsului), ca în CacheRezultate.
+    La o versiune nouă a modulelor de calcul, rezultatele vechi sunt șterse
+    și amprentele variantelor sunt recalculate, astfel încât redeschiderea
+    recalculează (și păstrează din nou) rezultatele o singură dată.
+    """
+
+    def __init__(self, cale: str, versiune_calcul: str = VERSIUNE_CALCUL):
+        if cale != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(cale)), exist_ok=True)
+        self.cale = cale
+        self.versiune_calcul = versiune_calcul
+        self._lock = threading.Lock()
+        self._conexiune = sqlite3.connect(cale, check_same_thread=False, isolation_level=None)
+        self._conexiune.row_factory = sqlite3.Row
+        self._conexiune.execute("PRAGMA journal_mode=WAL")
+        self._conexiune.execute("PRAGMA synchronous=NORMAL")
+        self._conexiune.execute("PRAGMA foreign_keys=ON")
+        self._conexiune.execute(f"PRAGMA mmap_size={MMAP_BYTES}")
+        self._conexiune.executescript(SCHEMA)
+        self.rezultate_invalidate = self._verifica_versiunea()
+
+    def _verifica_versiunea(self) -> int:
+        """Șterge rezultatele altei versiuni de calcul; returnează numărul lor."""
+        c = self._conexiune
+        rand = c.execute("SELECT valoare FROM meta WHERE cheie = 'versiune_calcul'").fetchone()
+        if rand is not None and rand["valoare"] == self.versiune_calcul:
+            return 0
+        with self._lock:
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                sterse = c.execute("DELETE FROM rezultate").rowcount
+                amprente = []
+                for v in c.execute("SELECT id, parametri FROM variante").fetchall():
+                    try:
+                        amprente.append((amprenta_vehicul(VehicleParams.model_validate_json(v["parametri"])), v["id"]))
+                    except ValueError:
+                        pass  # Parametrii nu mai trec validarea; varianta va fi raportată cu eroare
+                c.executemany("UPDATE variante SET amprenta = ? WHERE id = ?", amprente)
+                c.execute("INSERT OR REPLACE INTO meta (cheie, valoare) VALUES ('versiune_calcul', ?)",
+                          (self.versiune_calcul,))
+                c.execute("COMMIT")
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+        return sterse
+
+    # ---- Proiecte și variante ----
+
+    def creeaza_proiect(self, nume: str, descriere: Optional[str] = None) -> Dict[str, Any]:
+        acum = time.time()
+        with self._lock:
+            id_proiect = self._conexiune.execute(
+                "INSERT INTO proiecte (nume, descriere, creat, modificat) VALUES (?, ?, ?, ?)",
+                (nume, descriere, acum, acum)
+            ).lastrowid
+        return {"id": id_proiect, "nume": nume, "descriere": descriere, "creat": acum, "modificat": acum}
+
+    def proiecte(self) -> List[Dict[str, Any]]:
+        """Toate proiectele (cele modificate recent primele), cu numărul de variante."""
+        with self._lock:
+            randuri = self._conexiune.execute(
+                "SELECT p.*, COUNT(v.id) AS numar_variante FROM proiecte p "
+                "LEFT JOIN variante v ON v.proiect = p.id GROUP BY p.id ORDER BY p.modificat DESC"
+            ).fetchall()
+        return [dict(_proiect(r), numar_variante=r["numar_variante"]) for r in randuri]
+
+    def proiect(self, id_proiect: int, parametri: bool = True) -> Optional[Dict[str, Any]]:
+        """Proiectul cu istoricul variantelor (în ordinea salvării); None dacă nu există."""
+        with self._lock:
+            rand = self._conexiune.execute("SELECT * FROM proiecte WHERE id = ?", (id_proiect,)).fetchone()
+            if rand is None:
+                return None
+            variante = self._conexiune.execute(
+                "SELECT * FROM variante WHERE proiect = ? ORDER BY id", (id_proiect,)
+            ).fetchall()
+        rezultat = _proiect(rand)
+        rezultat["variante"] = [
+            dict(_varianta(v), parametri=json.loads(v["parametri"])) if parametri else _varianta(v)
+            for v in variante
+        ]
+        return rezultat
+
+    def adauga_varianta(self, id_proiect: int, vehicul: VehicleParams,
+                        nota: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Adaugă o variantă la istoricul proiectului; None dacă proiectul nu există."""
+        acum = time.time()
+        amprenta = amprenta_vehicul(vehicul)
+        with self._lock:
+            c = self._conexiune
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                if c.execute("UPDATE proiecte SET modificat = ? WHERE id = ?", (acum, id_proiect)).rowcount == 0:
+                    c.execute("ROLLBACK")
+                    return None
+                id_varianta = c.execute(
+                    "INSERT INTO variante (proiect, nume, nota, amprenta, parametri, creat) VALUES (?, ?, ?, ?, ?, ?)",
+                    (id_proiect, vehicul.nume, nota, amprenta, vehicul.model_dump_json(), acum)
+                ).lastrowid
+                c.execute("COMMIT")
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+        return {"id": id_varianta, "nume": vehicul.nume, "nota": nota, "amprenta": amprenta, "creat": acum}
+
+    def sterge_proiect(self, id_proiect: int) -> bool:
+        """Șterge proiectul, variantele lui și rezultatele pe care nu le mai folosește nicio variantă."""
+        with self._lock:
+            c = self._conexiune
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                if c.execute("DELETE FROM proiecte WHERE id = ?", (id_proiect,)).rowcount == 0:
+                    c.execute("ROLLBACK")
+                    return False
+                c.execute("DELETE FROM rezultate WHERE amprenta NOT IN (SELECT amprenta FROM variante)")
+                c.execute("COMMIT")
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+        return True
+
+    # ---- Rezultate ----
+
+    def rezultate(self, chei: List[str]) -> Dict[str, bytes]:
+        """Rezultatele găsite pentru cheile date (cheile lipsă sunt omise)."""
+        gasite: Dict[str, bytes] = {}
+        with self._lock:
+            for k in range(0, len(chei), PARAMETRI_INTEROGARE):
+                parte = chei[k:k + PARAMETRI_INTEROGARE]
+                for rand in self._conexiune.execute(
+                    f"SELECT cheie, date FROM rezultate WHERE cheie IN ({','.join('?' * len(parte))})", parte
+                ):
+                    gasite[rand["cheie"]] = rand["date"]
+        return gasite
+
+    def salveaza_rezultate(self, intrari: Iterable[Tuple[str, str, bytes]]) -> None:
+        """Păstrează rezultatele (cheie, amprenta vehiculului, corp), într-o singură tranzacție."""
+        acum = time.time()
+        with self._lock:
+            c = self._conexiune
+            c.execute("BEGIN IMMEDIATE")
+            try:
+                c.executemany("INSERT OR REPLACE INTO rezultate (cheie, amprenta, date, creat) VALUES (?, ?, ?, ?)",
+                              [(cheie, amprenta, date, acum) for cheie, amprenta, date in intrari])
+                c.execute("COMMIT")
+            except BaseException:
+                c.execute("ROLLBACK")
+                raise
+
+    def statistici(self) -> Dict[str, Any]:
+        with self._lock:
+            c = self._conexiune
+            proiecte = c.execute("SELECT COUNT(*) FROM proiecte").fetchone()[0]
+            variante = c.execute("SELECT COUNT(*) FROM variante").fetchone()[0]
+            rezultate, ocupat = c.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(date)), 0) FROM rezultate").fetchone()
+        return {
+            "cale": self.cale,
+            "versiune_calcul": self.versiune_calcul,
+            "proiecte": proiecte,
+            "variante": variante,
+            "rezultate": rezultate,
+            "rezultate_bytes": ocupat,
+            "rezultate_invalidate": self.rezultate_invalidate,
+        }
+
+    def inchide(self) -> None:
+        with self._lock:
+            self._conexiune.close()
@@ -0,0 +1,524 @@
+"""
+Test de sarcină local pentru backend
+Pornește serverul (`python main.py`) pe un port liber, cu configurația dată
+prin variabile de mediu, și redă profiluri de trafic ale clientului
+Electron, cu sonde /health periodice. Rulează complet offline: clientul
+HTTP/1.1 (conexiuni keep-alive, cel mult 6 per client, ca în Chromium) este
+scris direct pe asyncio.
+
+Utilizare (din directorul python/):
+
+    python sarcina.py                                   # profilul `editare`, 20 s
+    python sarcina.py --profil mixt --clienti 8 --durata 60
+    python sarcina.py --profil clienti --config USV_EXECUTIE=thread --config USV_EXECUTIE=process,USV_WORKERI=4
+    python sarcina.py --url http://127.0.0.1:8000 --profil sweep   # server deja pornit
+
+Profiluri:
+
+    editare   rafale de /calculate/all la fiecare mișcare a unui slider
+              (cereri suprapuse, fără debounce), cu pauze între rafale
+    sweep     studii parametrice /sweep (NDJSON citit integral) și loturi
+              /calculate/batch
+    clienti   mulți clienți simultani, fiecare cu /calculate/all în buclă
+              închisă (o parte din vehicule sunt recerute → cache)
+    mixt      editare + un studiu parametric + clienți interactivi
+
+Pentru fiecare categorie de cereri se raportează debitul, latența
+(p50/p90/p99/p99.9/max), rata de eroare și codurile de stare (429 = pool
+saturat, 504 = timeout); pentru /health, latența sub sarcină. Fiecare
+`--config` pornește un server separat, astfel încât configurațiile se
+compară pe același trafic (același `--seed`).
+"""
+
+import argparse
+import asyncio
+import copy
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from benchmark import _memorie_proces_kb, _port_liber
+from serviciu import VEHICUL_REFERINTA
+
+# Conexiunile simultane ale unui client către aceeași gazdă (limita Chromium)
+CONEXIUNI_CLIENT = 6
+
+PROFILURI = ("editare", "sweep", "clienti", "mixt")
+
+# Numărul implicit de clienți virtuali per profil
+CLIENTI_IMPLICIT = {"editare": 1, "sweep": 2, "clienti": 32, "mixt": 8}
+
+# Vehicule realiste (modificări față de vehiculul de referință din aplicație)
+MODIFICARI_FIXTURI: Dict[str, Dict[str, Dict[str, Any]]] = {
+    "compacta_benzina": {},
+    "oras_benzina": {
+        "masa": {"masaGoala": 980, "masaTotala": 1400, "capacitateIncarcare": 420},
+        "pneu": {"dimensiune": "175/65 R14", "latime": 175, "raportProfil": 65, "diametruJanta": 14,
+                 "razaStatica": 0.279, "razaDinamica": 0.286, "coefRulare": 0.011},
+        "motor": {"cilindree": 999, "putereMaxima": 55, "turatiePutereMax": 6000, "cuplMaxim": 95,
+                  "turatieCuplMax": 3500, "turatieMaxima": 6500, "turatieRalanti": 800},
+        "transmisie": {"raporturiCV": [3.545, 1.904, 1.233, 0.911, 0.725], "raportPrincipal": 4.294},
+        "aerodinamic": {"coefAerodinamic": 0.33, "arieFrontala": 2.05},
+    },
+    "break_diesel": {
+        "masa": {"masaGoala": 1480, "masaTotala": 2080, "capacitateIncarcare": 600},
+        "pneu": {"dimensiune": "225/45 R17", "latime": 225, "raportProfil": 45, "diametruJanta": 17,
+                 "razaStatica": 0.305, "razaDinamica": 0.316, "coefRulare": 0.011},
+        "motor": {"tip": "diesel", "cilindree": 1968, "putereMaxima": 110, "turatiePutereMax": 3500,
+                  "cuplMaxim": 340, "turatieCuplMax": 1750, "turatieMaxima": 4800, "turatieRalanti": 800},
+        "transmisie": {"numarTrepte": 6, "raporturiCV": [3.769, 1.958, 1.257, 0.870, 0.857, 0.717],
+                       "raportPrincipal": 3.450},
+        "aerodinamic": {"coefAerodinamic": 0.29, "arieFrontala": 2.25},
+    },
+    "suv_diesel": {
+        "masa": {"masaGoala": 1850, "masaTotala": 2500, "capacitateIncarcare": 650, "inaltimeCentruMasa": 680},
+        "pneu": {"dimensiune": "235/55 R18", "latime": 235, "raportProfil": 55, "diametruJanta": 18,
+                 "razaStatica": 0.338, "razaDinamica": 0.350, "coefRulare": 0.013},
+        "motor": {"tip": "diesel", "cilindree": 2143, "putereMaxima": 140, "turatiePutereMax": 3800,
+                  "cuplMaxim": 400, "turatieCuplMax": 2000, "turatieMaxima": 4500, "turatieRalanti": 750},
+        "transmisie": {"tipTransmisie": "automata", "numarTrepte": 6,
+                       "raporturiCV": [4.148, 2.370, 1.556, 1.155, 0.859, 0.686], "raportPrincipal": 3.200},
+        "aerodinamic": {"coefAerodinamic": 0.36, "arieFrontala": 2.75},
+    },
+    "sport_benzina": {
+        "masa": {"masaGoala": 1450, "masaTotala": 1850, "capacitateIncarcare": 400, "inaltimeCentruMasa": 480},
+        "pneu": {"dimensiune": "245/40 R18", "latime": 245, "raportProfil": 40, "diametruJanta": 18,
+                 "razaStatica": 0.312, "razaDinamica": 0.322, "coefRulare": 0.012},
+        "motor": {"cilindree": 1984, "putereMaxima": 221, "turatiePutereMax": 6500, "cuplMaxim": 400,
+                  "turatieCuplMax": 2500, "turatieMaxima": 7000, "turatieRalanti": 850},
+        "transmisie": {"numarTrepte": 6, "raporturiCV": [3.909, 2.238, 1.520, 1.156, 0.971, 0.818],
+                       "raportPrincipal": 3.700},
+        "aerodinamic": {"coefAerodinamic": 0.31, "arieFrontala": 2.10},
+    },
+}
+
+def fixturi() -> Dict[str, Dict[str, Any]]:
+    """Vehiculele folosite de profiluri (VehicleParams ca dicționare)."""
+    rezultat = {}
+    for nume, modificari in MODIFICARI_FIXTURI.items():
+        v = copy.deepcopy(VEHICUL_REFERINTA)
+        v["nume"] = nume
+        for sectiune, campuri in modificari.items():
+            v[sectiune].update(campuri)
+        rezultat[nume] = v
+    return rezultat
+
+# Slider-ele din UI: secțiune, câmp, domeniu și pasul unei mișcări
+SLIDERE = (
+    ("aerodinamic", "coefAerodinamic", 0.22, 0.42, 0.002),
+    ("aerodinamic", "arieFrontala", 1.8, 3.0, 0.01),
+    ("masa", "masaTotala", 1200, 2800, 10),
+    ("motor", "putereMaxima", 50, 250, 1),
+    ("transmisie", "raportPrincipal", 2.8, 4.8, 0.01),
+)
+
+# ============== Client HTTP ==============
+
+class ConexiuneHttp:
+    """O conexiune HTTP/1.1 keep-alive; după o eroare este închisă și redeschisă la cererea următoare."""
+
+    def __init__(self, gazda: str, port: int, timeout_s: float):
+        self.gazda = gazda
+        self.port = port
+        self.timeout_s = timeout_s
+        self._citire: Optional[asyncio.StreamReader] = None
+        self._scriere: Optional[asyncio.StreamWriter] = None
+
+    def inchide(self) -> None:
+        if self._scriere is not None:
+            self._scriere.close()
+        self._citire = self._scriere = None
+
+    async def cerere(self, metoda: str, cale: str, corp: bytes = b"") -> Tuple[int, bytes]:
+        """Trimite cererea și citește tot răspunsul; returnează (status, corp)."""
+        try:
+            return await asyncio.wait_for(self._cerere(metoda, cale, corp), self.timeout_s)
+        except BaseException:
+            self.inchide()
+            raise
+
+    async def _cerere(self, metoda: str, cale: str, corp: bytes) -> Tuple[int, bytes]:
+        if self._scriere is None:
+            self._citire, self._scriere = await asyncio.open_connection(self.gazda, self.port)
+        linii = [f"{metoda} {cale} HTTP/1.1", f"Host: {self.gazda}:{self.port}", f"Content-Length: {len(corp)}"]
+        if corp:
+            linii.append("Content-Type: application/json")
+        self._scriere.write(("\r\n".join(linii) + "\r\n\r\n").encode("latin-1") + corp)
+        await self._scriere.drain()
+
+        antet = (await self._citire.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        status = int(antet[0].split()[1])
+        antete = {}
+        for linie in antet[1:]:
+            if ":" in linie:
+                k, v = linie.split(":", 1)
+                antete[k.strip().lower()] = v.strip().lower()
+
+        if antete.get("transfer-encoding") == "chunked":
+            bucati = []
+            while True:
+                marime = int((await self._citire.readline()).split(b";")[0], 16)
+                if marime == 0:
+                    while (await self._citire.readline()) not in (b"\r\n", b""):
+                        pass
+                    break
+                bucati.append((await self._citire.readexactly(marime + 2))[:-2])
+            raspuns = b"".join(bucati)
+        elif "content-length" in antete:
+            raspuns = await self._citire.readexactly(int(antete["content-length"]))
+        else:
+            raspuns = await self._citire.read()
+            self.inchide()
+        if antete.get("connection") == "close":
+            self.inchide()
+        return status, raspuns
+
+class RegistruSarcina:
+    """Latențele [s] și codurile de stare ale cererilor, pe categorii."""
+
+    def __init__(self):
+        self.latente: Dict[str, List[float]] = defaultdict(list)
+        self.statusuri: Dict[str, Counter] = defaultdict(Counter)
+        self.bytes: Counter = Counter()
+
+    def adauga(self, categorie: str, status: str, durata_s: float, lungime: int = 0) -> None:
+        self.latente[categorie].append(durata_s)
+        self.statusuri[categorie][status] += 1
+        self.bytes[categorie] += lungime
+
+    def rezultate(self, durata_s: float) -> Dict[str, Dict[str, Any]]:
+        rezultat = {}
+        for categorie, latente in sorted(self.latente.items()):
+            ms = np.array(latente) * 1000
+            statusuri = self.statusuri[categorie]
+            ok = sum(n for s, n in statusuri.items() if s.isdigit() and int(s) < 400)
+            rezultat[categorie] = {
+                "cereri": len(ms),
+                "ok": ok,
+                "rata_eroare": round(1 - ok / len(ms), 4),
+                "statusuri": dict(sorted(statusuri.items())),
+                "debit_req_s": round(len(ms) / durata_s, 2),
+                "debit_mb_s": round(self.bytes[categorie] / durata_s / 1e6, 3),
+                "p50_ms": round(float(np.percentile(ms, 50)), 2),
+                "p90_ms": round(float(np.percentile(ms, 90)), 2),
+                "p99_ms": round(float(np.percentile(ms, 99)), 2),
+                "p999_ms": round(float(np.percentile(ms, 99.9)), 2),
+                "max_ms": round(float(ms.max()), 2),
+            }
+        return rezultat
+
+class ClientVirtual:
+    """
+    Un client (o fereastră Electron): cel mult CONEXIUNI_CLIENT cereri în
+    zbor, pe conexiuni refolosite. Latența include așteptarea unei conexiuni
+    libere, ca în browser.
+    """
+
+    def __init__(self, gazda: str, port: int, registru: RegistruSarcina, timeout_s: float):
+        self.gazda = gazda
+        self.port = port
+        self.registru = registru
+        self.timeout_s = timeout_s
+        self._libere: List[ConexiuneHttp] = []
+        self._semafor = asyncio.Semaphore(CONEXIUNI_CLIENT)
+
+    async def cerere(self, categorie: str, metoda: str, cale: str, corp: bytes = b"") -> Optional[int]:
+        start = time.perf_counter()
+        async with self._semafor:
+            conexiune = self._libere.pop() if self._libere else ConexiuneHttp(self.gazda, self.port, self.timeout_s)
+            try:
+                status, raspuns = await conexiune.cerere(metoda, cale, corp)
+            except asyncio.TimeoutError:
+                self.registru.adauga(categorie, "timeout_client", time.perf_counter() - start)
+                return None
+            except (OSError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError) as e:
+                self.registru.adauga(categorie, type(e).__name__, time.perf_counter() - start)
+                return None
+            self._libere.append(conexiune)
+        self.registru.adauga(categorie, str(status), time.perf_counter() - start, len(raspuns))
+        return status
+
+    def inchide(self) -> None:
+        for conexiune in self._libere:
+            conexiune.inchide()
+        self._libere.clear()
+
+# ============== Profiluri de trafic ==============
+
+async def _pauza(oprire: asyncio.Event, durata_s: float) -> None:
+    """Așteaptă durata dată sau până la oprire."""
+    try:
+        await asyncio.wait_for(oprire.wait(), durata_s)
+    except asyncio.TimeoutError:
+        pass
+
+def _json(obj: Any) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+def _vehicul_perturbat(rng: np.random.Generator, vehicule: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Un vehicul din fixturi cu 1-2 câmpuri ale slider-elor modificate aleator."""
+    v = copy.deepcopy(vehicule[rng.integers(len(vehicule))])
+    for k in rng.choice(len(SLIDERE), size=rng.integers(1, 3), replace=False):
+        sectiune, camp, minim, maxim, pas = SLIDERE[k]
+        v[sectiune][camp] = round(float(np.clip(v[sectiune][camp] + pas * rng.integers(-20, 21), minim, maxim)), 4)
+    return v
+
+async def client_editare(client: ClientVirtual, rng: np.random.Generator, oprire: asyncio.Event,
+                         vehicule: List[Dict[str, Any]], optiuni: argparse.Namespace) -> None:
+    """
+    Rafale de editare: un slider este tras pe `rafala` poziții, câte o
+    cerere /calculate/all la fiecare poziție (la ~interval_ms), fără să
+    aștepte răspunsurile anterioare; apoi o pauză de 0.5-2 s.
+    """
+    while not oprire.is_set():
+        v = copy.deepcopy(vehicule[rng.integers(len(vehicule))])
+        sectiune, camp, minim, maxim, pas = SLIDERE[rng.integers(len(SLIDERE))]
+        sens = 1 if rng.random() < 0.5 else -1
+        cereri = []
+        for _ in range(optiuni.rafala):
+            valoare = v[sectiune][camp] + sens * pas
+            if not minim <= valoare <= maxim:
+                sens = -sens
+                valoare = v[sectiune][camp] + sens * pas
+            v[sectiune][camp] = round(valoare, 4)
+            cereri.append(asyncio.create_task(client.cerere("calculate/all", "POST", "/calculate/all", _json(v))))
+            await _pauza(oprire, optiuni.interval_ms / 1000 * rng.uniform(0.5, 1.5))
+            if oprire.is_set():
+                break
+        await asyncio.gather(*cereri)
+        await _pauza(oprire, rng.uniform(0.5, 2.0))
+
+async def client_sweep(client: ClientVirtual, rng: np.random.Generator, oprire: asyncio.Event,
+                       vehicule: List[Dict[str, Any]], optiuni: argparse.Namespace) -> None:
+    """Un studiu parametric Cx × masă (/sweep), apoi un lot de vehicule (/calculate/batch)."""
+    while not oprire.is_set():
+        v = vehicule[rng.integers(len(vehicule))]
+        masa = v["masa"]["masaTotala"]
+        await client.cerere("sweep", "POST", "/sweep", _json({
+            "vehicul": v,
+            "axe": [
+                {"camp": "coefAerodinamic", "minim": 0.25, "maxim": 0.40, "puncte": optiuni.puncte_axa},
+                {"camp": "masaTotala", "minim": 0.8 * masa, "maxim": 1.2 * masa, "puncte": optiuni.puncte_axa},
+            ],
+        }))
+        if oprire.is_set():
+            break
+        lot = [_vehicul_perturbat(rng, vehicule) for _ in range(optiuni.lot)]
+        await client.cerere("calculate/batch", "POST", "/calculate/batch", _json(lot))
+        await _pauza(oprire, rng.uniform(0.5, 1.5))
+
+async def client_interactiv(client: ClientVirtual, rng: np.random.Generator, oprire: asyncio.Event,
+                            vehicule: List[Dict[str, Any]], optiuni: argparse.Namespace) -> None:
+    """
+    Buclă închisă: /calculate/all, apoi un timp de gândire exponențial
+    (medie 200 ms). Cu probabilitatea `repetare` se recere un vehicul deja
+    trimis de același client (revenire la o variantă anterioară).
+    """
+    istoric: List[bytes] = []
+    while not oprire.is_set():
+        if istoric and rng.random() < optiuni.repetare:
+            corp = istoric[rng.integers(len(istoric))]
+        else:
+            corp = _json(_vehicul_perturbat(rng, vehicule))
+            istoric.append(corp)
+        await client.cerere("calculate/all", "POST", "/calculate/all", corp)
+        await _pauza(oprire, rng.exponential(0.2))
+
+ClientProfil = Callable[[ClientVirtual, np.random.Generator, asyncio.Event, List[Dict[str, Any]],
+                         argparse.Namespace], Awaitable[None]]
+
+def clienti_profil(profil: str, clienti: int) -> List[ClientProfil]:
+    """Clienții virtuali ai unui profil."""
+    if profil == "editare":
+        return [client_editare] * clienti
+    if profil == "sweep":
+        return [client_sweep] * clienti
+    if profil == "clienti":
+        return [client_interactiv] * clienti
+    editare = max(1, clienti // 4)
+    return [client_editare] * editare + [client_sweep] + [client_interactiv] * max(0, clienti - editare - 1)
+
+async def sonda_health(client: ClientVirtual, oprire: asyncio.Event, interval_s: float,
+                       pid: Optional[int], memorie: List[float]) -> None:
+    """GET /health periodic (ca procesul principal Electron), pe o conexiune proprie; eșantionează memoria serverului."""
+    while not oprire.is_set():
+        await client.cerere("health", "GET", "/health")
+        if pid is not None:
+            memorie.append(_memorie_proces_kb(pid))
+        await _pauza(oprire, interval_s)
+
+async def _get_json(gazda: str, port: int, cale: str) -> Any:
+    """
+    O cerere GET pe o conexiune separată, cu corpul JSON decodificat. Corpul
+    se citește după Content-Length, nu până la închidere: în modul `process`
+    workerii moștenesc socket-urile serverului, deci EOF-ul poate întârzia.
+    """
+    conexiune = ConexiuneHttp(gazda, port, 10)
+    try:
+        _, raspuns = await conexiune.cerere("GET", cale)
+    finally:
+        conexiune.inchide()
+    return json.loads(raspuns)
+
+async def ruleaza_profil(gazda: str, port: int, optiuni: argparse.Namespace,
+                         pid: Optional[int] = None) -> Dict[str, Any]:
+    """Redă profilul pe durata dată; cererile începute înainte de oprire sunt așteptate și numărate."""
+    registru = RegistruSarcina()
+    oprire = asyncio.Event()
+    vehicule = list(fixturi().values())
+    memorie: List[float] = []
+    profil = clienti_profil(optiuni.profil, optiuni.clienti)
+
+    clienti = [ClientVirtual(gazda, port, registru, optiuni.timeout) for _ in profil]
+    sonda = ClientVirtual(gazda, port, registru, optiuni.timeout)
+    start = time.perf_counter()
+    sarcini = [
+        asyncio.create_task(fn(client, np.random.default_rng(np.random.SeedSequence(optiuni.seed, spawn_key=(k,))),
+                               oprire, vehicule, optiuni))
+        for k, (fn, client) in enumerate(zip(profil, clienti))
+    ]
+    sarcini.append(asyncio.create_task(sonda_health(sonda, oprire, optiuni.interval_health, pid, memorie)))
+    await asyncio.sleep(optiuni.durata)
+    oprire.set()
+    await asyncio.gather(*sarcini)
+    durata = time.perf_counter() - start
+    for client in clienti + [sonda]:
+        client.inchide()
+
+    return {
+        "profil": optiuni.profil,
+        "clienti": len(profil),
+        "durata_s": round(durata, 2),
+        "cereri": registru.rezultate(durata),
+        "memorie_server_maxima_kb": max(memorie) if memorie else None,
+        "executie": await _get_json(gazda, port, "/executie/statistici"),
+        "cache": await _get_json(gazda, port, "/cache/statistici"),
+    }
+
+# ============== Server local ==============
+
+class ServerLocal:
+    """
+    `python main.py` pe un port liber, cu variabilele de mediu date și un
+    depozit de proiecte temporar; gata după primul /health reușit și
+    încheierea încălzirii căii de calcul.
+    """
+
+    def __init__(self, mediu: Dict[str, str], timeout_s: float = 120.0):
+        self.mediu = mediu
+        self.timeout_s = timeout_s
+        self.port = _port_liber()
+        self.proces: Optional[subprocess.Popen] = None
+        self._director_temporar = tempfile.TemporaryDirectory()
+
+    def __enter__(self) -> "ServerLocal":
+        director = os.path.dirname(os.path.abspath(__file__))
+        mediu = dict(os.environ, USV_PORT=str(self.port),
+                     USV_PROIECTE=os.path.join(self._director_temporar.name, "proiecte.sqlite3"))
+        mediu.update(self.mediu)
+        self.proces = subprocess.Popen([sys.executable, "main.py"], cwd=director, env=mediu,
+                                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            asyncio.run(self._asteapta())
+        except BaseException:
+            self.__exit__()
+            raise
+        return self
+
+    async def _asteapta(self) -> None:
+        start = time.perf_counter()
+        while True:
+            if self.proces.poll() is not None:
+                raise RuntimeError(f"Serverul s-a oprit la pornire (cod {self.proces.returncode})")
+            if time.perf_counter() - start > self.timeout_s:
+                raise RuntimeError("Serverul nu a pornit în timpul alocat")
+            try:
+                stare = (await _get_json("127.0.0.1", self.port, "/health"))["incalzire"]
+                if stare not in ("programata", "in_curs"):
+                    return
+            except (OSError, ValueError, IndexError):
+                pass
+            await asyncio.sleep(0.05)
+
+    def __exit__(self, *_: Any) -> None:
+        if self.proces is not None and self.proces.poll() is None:
+            self.proces.terminate()
+            self.proces.wait(10)
+        self._director_temporar.cleanup()
+
+def _configuratie(text: str) -> Dict[str, str]:
+    """"USV_EXECUTIE=process,USV_WORKERI=4" → dicționar de variabile de mediu."""
+    mediu = {}
+    for parte in filter(None, (p.strip() for p in text.split(","))):
+        if "=" not in parte:
+            raise argparse.ArgumentTypeError(f"Configurație invalidă (VARIABILA=valoare): {parte}")
+        k, v = parte.split("=", 1)
+        mediu[k.strip()] = v.strip()
+    return mediu
+
+def afiseaza(nume: str, rezultat: Dict[str, Any]) -> None:
+    print(f"\n[{nume}] profil {rezultat['profil']}, {rezultat['clienti']} clienți, {rezultat['durata_s']} s"
+          + (f", memorie server max {rezultat['memorie_server_maxima_kb'] / 1024:.0f} MiB"
+             if rezultat["memorie_server_maxima_kb"] else ""))
+    print(f"{'categorie':<18} {'cereri':>7} {'req/s':>8} {'erori':>7} {'p50':>9} {'p90':>9} "
+          f"{'p99':>9} {'p99.9':>9} {'max':>9}  statusuri")
+    for categorie, r in rezultat["cereri"].items():
+        statusuri = " ".join(f"{s}×{n}" for s, n in r["statusuri"].items())
+        print(f"{categorie:<18} {r['cereri']:>7} {r['debit_req_s']:>8.1f} {r['rata_eroare']:>7.1%} "
+              f"{r['p50_ms']:>7.1f}ms {r['p90_ms']:>7.1f}ms {r['p99_ms']:>7.1f}ms "
+              f"{r['p999_ms']:>7.1f}ms {r['max_ms']:>7.1f}ms  {statusuri}")
+    executie = rezultat["executie"]
+    print(f"executie: {executie['mod']} × {executie['workeri']}, respinse (429) {executie['respinse_429']}, "
+          f"expirate (504) {executie['expirate']}; cache: rata hit {rezultat['cache']['rata_hit']}")
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Test de sarcină local (trafic Electron simulat)")
+    parser.add_argument("--profil", default="editare", choices=PROFILURI)
+    parser.add_argument("--clienti", type=int, help="Numărul de clienți virtuali (implicit depinde de profil)")
+    parser.add_argument("--durata", type=float, default=20.0, help="Durata fiecărei rulări [s]")
+    parser.add_argument("--config", action="append", type=_configuratie, metavar="VAR=val[,VAR=val]",
+                        help="Configurația serverului (variabile de mediu); repetabil pentru comparare")
+    parser.add_argument("--url", help="Server deja pornit (ex. http://127.0.0.1:8000); fără --config")
+    parser.add_argument("--seed", type=int, default=0, help="Seed-ul traficului (același trafic per configurație)")
+    parser.add_argument("--rafala", type=int, default=20, help="Cereri per rafală de editare")
+    parser.add_argument("--interval-ms", type=float, default=30.0, help="Intervalul mediu între mișcările slider-ului")
+    parser.add_argument("--repetare", type=float, default=0.3, help="Probabilitatea de a recere un vehicul (clienti)")
+    parser.add_argument("--puncte-axa", type=int, default=20, help="Puncte pe fiecare axă a unui /sweep")
+    parser.add_argument("--lot", type=int, default=16, help="Vehicule per /calculate/batch")
+    parser.add_argument("--interval-health", type=float, default=0.5, help="Intervalul sondelor /health [s]")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Timeout-ul clientului per cerere [s]")
+    parser.add_argument("--iesire", help="Scrie rezultatele JSON în fișierul dat")
+    optiuni = parser.parse_args(argv)
+    if optiuni.clienti is None:
+        optiuni.clienti = CLIENTI_IMPLICIT[optiuni.profil]
+    if optiuni.url and optiuni.config:
+        parser.error("--config pornește servere locale; nu se combină cu --url")
+
+    rezultate: Dict[str, Any] = {}
+    if optiuni.url:
+        adresa = urlsplit(optiuni.url)
+        rezultate[optiuni.url] = asyncio.run(ruleaza_profil(adresa.hostname, adresa.port or 80, optiuni))
+        afiseaza(optiuni.url, rezultate[optiuni.url])
+    else:
+        for mediu in optiuni.config or [{}]:
+            nume = ",".join(f"{k}={v}" for k, v in mediu.items()) or "implicit"
+            with ServerLocal(mediu) as server:
+                rezultate[nume] = asyncio.run(ruleaza_profil("127.0.0.1", server.port, optiuni, server.proces.pid))
+            afiseaza(nume, rezultate[nume])
+
+    if optiuni.iesire:
+        with open(optiuni.iesire, "w", encoding="utf-8") as f:
+            json.dump({"optiuni": vars(optiuni), "rezultate": rezultate}, f, indent=2, ensure_ascii=False)
+        print(f"\nRezultate salvate în {optiuni.iesire}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
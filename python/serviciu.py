@@ -0,0 +1,180 @@
+"""
+Serviciul de calcul: rularea capitolelor pe loturi și serializarea rezultatelor
+Funcțiile de aici rulează în workerii de calcul (fire sau procese separate)
+"""
+
+import json
+import time
+import numpy as np
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from calculations.resistance import calculate_resistances_ctx, harta_rezistente_ctx
+from calculations.traction import calculate_traction_ctx
+from calculations.performance import calculate_performance_ctx
+from calculations.braking import calculate_braking_ctx, grila_franare_ctx
+from calculations.indicatori import indicatori_cheie
+from calculations.cronometru import etapa
+from calculations.vehicule import ContextVehicul, grupe_dupa_trepte
+from coloane import codifica
+
+CAPITOLE = ("rezistente", "tractiune", "performante", "franare")
+
+# Vehiculul implicit din aplicație (src/types/vehicle.ts)
+VEHICUL_REFERINTA: Dict[str, Any] = {
+    "nume": "Autoturism Nou",
+    "dimensiuni": {"lungime": 4500, "latime": 1800, "inaltime": 1450, "ampatament": 2700,
+                   "ecartamentFata": 1550, "ecartamentSpate": 1540, "gardaSol": 150,
+                   "consolaFata": 900, "consolaSpate": 900},
+    "masa": {"masaGoala": 1350, "masaTotala": 1850, "capacitateIncarcare": 500,
+             "repartizareFata": 58, "repartizareSpate": 42, "inaltimeCentruMasa": 550},
+    "pneu": {"dimensiune": "205/55 R16", "latime": 205, "raportProfil": 55, "diametruJanta": 16,
+             "razaStatica": 0.316, "razaDinamica": 0.308, "coefRulare": 0.012},
+    "motor": {"tip": "benzina", "cilindree": 1600, "putereMaxima": 92, "turatiePutereMax": 5500,
+              "cuplMaxim": 160, "turatieCuplMax": 4000, "turatieMaxima": 6500, "turatieRalanti": 850},
+    "transmisie": {"tipTransmisie": "manuala", "numarTrepte": 5,
+                   "raporturiCV": [3.727, 2.048, 1.393, 1.029, 0.820],
+                   "raportPrincipal": 4.058, "randamentTransmisie": 0.92},
+    "aerodinamic": {"coefAerodinamic": 0.30, "arieFrontala": 2.2}
+}
+
+def capitole(pas_demarare_kmh: float = 1.0, viteza_finala_kmh: Optional[float] = None,
+             max_puncte: Optional[int] = None) -> Dict[str, Callable[[ContextVehicul], List[Dict[str, Any]]]]:
+    """Calculele pe capitole; toate consumă același context de vehicul."""
+    return {
+        "rezistente": lambda ctx: calculate_resistances_ctx(ctx, max_puncte),
+        "tractiune": lambda ctx: calculate_traction_ctx(ctx, max_puncte),
+        "performante": lambda ctx: calculate_performance_ctx(ctx, pas_demarare_kmh, viteza_finala_kmh, max_puncte),
+        "franare": lambda ctx: calculate_braking_ctx(ctx, max_puncte)
+    }
+
+def _json_numpy(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Obiect neserializabil: {type(obj).__name__}")
+
+def json_bytes(obj: Any) -> bytes:
+    """Serializare JSON compactă (valorile nefinite ridică ValueError)."""
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+                      default=_json_numpy).encode("utf-8")
+
+def calcul_lot(calcul: Callable[[ContextVehicul], List[Dict[str, Any]]],
+               ctx: ContextVehicul) -> List[Any]:
+    """
+    Rulează un calcul pe tot lotul; dacă eșuează, reia vehicul cu vehicul
+    pentru ca eroarea să afecteze doar vehiculul problematic.
+    """
+    try:
+        return calcul(ctx)
+    except Exception:
+        rezultate = []
+        for vehicle in ctx.vehicule:
+            try:
+                rezultate.append(calcul(ContextVehicul([vehicle]))[0])
+            except Exception as e:
+                rezultate.append(e)
+        return rezultate
+
+def calculeaza_capitole(vehicule: List[Any], nume_capitole: List[str],
+                        pas_demarare_kmh: float = 1.0,
+                        viteza_finala_kmh: Optional[float] = None,
+                        precizie: Optional[int] = None,
+                        max_puncte: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Calculează capitolele cerute pentru un lot de vehicule.
+
+    Returnează, per vehicul, corpul serializat (bytes) al fiecărui capitol sau
+    excepția apărută la calculul/serializarea lui: JSON implicit, secțiune
+    binară pe coloane (float64/float32) dacă este dată precizia. Curbele sunt
+    reduse la max_puncte puncte înainte de serializare.
+    """
+    calcule = capitole(pas_demarare_kmh, viteza_finala_kmh, max_puncte)
+    rezultate: List[Dict[str, Any]] = [{} for _ in vehicule]
+
+    # Un context pe grupă de vehicule cu același număr de trepte
+    for indici in grupe_dupa_trepte(vehicule).values():
+        ctx = ContextVehicul([vehicule[i] for i in indici])
+        for n in nume_capitole:
+            with etapa(f"calcul.{n}"):
+                lot = calcul_lot(calcule[n], ctx)
+            with etapa(f"serializare.{n}"):
+                for i, r in zip(indici, lot):
+                    if not isinstance(r, Exception):
+                        try:
+                            r = json_bytes(r) if precizie is None else codifica(r, n, precizie)
+                        except ValueError:
+                            r = ValueError("Rezultate nefinite (parametri fizic invalizi)")
+                    rezultate[i][n] = r
+
+    return rezultate
+
+def grila_franare_serializata(vehicul: Any, axe: Dict[str, List[float]],
+                              precizie: Optional[int] = None) -> bytes:
+    """Grila de frânare a unui vehicul, serializată ca JSON sau secțiune binară."""
+    with etapa("calcul.franare_grila"):
+        rezultat = grila_franare_ctx(ContextVehicul([vehicul]), **axe)[0]
+    with etapa("serializare.franare_grila"):
+        if precizie is None:
+            return json_bytes(rezultat)
+        return codifica(rezultat, "franare_grila", precizie)
+
+def tila_harta_rezistente(vehicul: Any, axe: Dict[str, List[float]], index: int, start: int,
+                          precizie: Optional[int] = None) -> bytes:
+    """
+    Un tile al hărții de rezistență: vitezele `axe["viteze_kmh"]` (o felie a
+    axei complete, începând de la rândul `start`) × toate pantele, vânturile
+    și altitudinile. Serializat ca o linie NDJSON sau o secțiune binară.
+    """
+    with etapa("calcul.rezistente_harta"):
+        rezultat = harta_rezistente_ctx(ContextVehicul([vehicul]), **axe)[0]
+    rezultat["tila"] = {"index": index, "rand_start": start, "randuri": len(axe["viteze_kmh"])}
+    with etapa("serializare.rezistente_harta"):
+        if precizie is None:
+            return json_bytes(rezultat) + b"\n"
+        return codifica(rezultat, "rezistente_harta", precizie)
+
+def linii_sweep(baza: Any, campuri: List[str], puncte: Sequence[Tuple[float, ...]],
+                start: int) -> bytes:
+    """
+    Indicatorii cheie pentru un bloc de puncte ale unui studiu parametric,
+    ca linii NDJSON (un obiect per punct).
+    """
+    valori = {c: np.array([p[k] for p in puncte]) for k, c in enumerate(campuri)}
+    indicatori = indicatori_cheie(ContextVehicul.cu_variatii(baza, valori))
+    rotunjite = {
+        "viteza_maxima_kmh": np.round(indicatori["viteza_maxima_kmh"], 2).tolist(),
+        "timp_0_100_s": np.round(indicatori["timp_0_100_s"], 2).tolist(),
+        "distanta_franare_100_m": np.round(indicatori["distanta_franare_100_m"], 2).tolist(),
+        "putere_100_kmh_kW": np.round(indicatori["putere_100_kmh_kW"], 2).tolist()
+    }
+
+    linii = []
+    for j, punct in enumerate(puncte):
+        linie = {"index": start + j, "parametri": dict(zip(campuri, punct))}
+        linie.update({k: v[j] for k, v in rotunjite.items()})
+        try:
+            linii.append(json_bytes(linie))
+        except ValueError:
+            linii.append(json_bytes({
+                "index": start + j,
+                "parametri": dict(zip(campuri, punct)),
+                "eroare": "Rezultate nefinite (parametri fizic invalizi)"
+            }))
+    return b"\n".join(linii) + b"\n"
+
+def incalzeste() -> float:
+    """
+    Încălzirea căii de calcul după pornire: importă modulele de calcul
+    (inclusiv simularea demarării) și rulează toate capitolele, în ambele
+    formate, pe vehiculul de referință. Returnează durata [ms].
+    """
+    inceput = time.perf_counter()
+    from modele import VehicleParams
+    from calculations.simulare import simuleaza_demarare
+
+    vehicul = VehicleParams(**VEHICUL_REFERINTA)
+    calculeaza_capitole([vehicul], list(CAPITOLE))
+    calculeaza_capitole([vehicul], list(CAPITOLE), precizie=32)
+    simuleaza_demarare(vehicul)
+    return (time.perf_counter() - inceput) * 1000
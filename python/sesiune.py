@@ -0,0 +1,168 @@
+"""
+Sesiuni interactive de calcul (WebSocket /ws/sesiune)
+Serverul păstrează vehiculul editat și ultimele rezultate; o modificare a unui
+câmp recalculează doar capitolele care depind de el, iar clientul primește
+doar valorile schimbate.
+"""
+
+import copy
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from modele import OptiuniSesiune, VehicleParams
+from calculations.campuri import DEPENDENTE_CAPITOLE
+
+# Opțiunile de calcul → capitolele afectate (max_puncte reduce curbele tuturor capitolelor)
+DEPENDENTE_OPTIUNI = {
+    "pas_demarare_kmh": frozenset(("performante",)),
+    "viteza_finala_kmh": frozenset(("performante",)),
+    "pana_la_vmax": frozenset(("performante",)),
+    "max_puncte": frozenset(DEPENDENTE_CAPITOLE),
+}
+
+def capitole_afectate(cale: str) -> Set[str]:
+    """
+    Capitolele care depind de câmpul de la calea dată ("secțiune.câmp",
+    opțional cu indici de listă: "transmisie.raporturiCV.2"). O cale care
+    înlocuiește o secțiune întreagă ("motor") afectează toate capitolele
+    care depind de vreun câmp al ei.
+    """
+    parti = cale.split(".")
+    if parti[0] == "optiuni":
+        return set(DEPENDENTE_OPTIUNI.get(".".join(parti[1:]), ()))
+    if len(parti) == 1:
+        prefix = parti[0] + "."
+        return {c for c, campuri in DEPENDENTE_CAPITOLE.items() if any(k.startswith(prefix) for k in campuri)}
+    camp = ".".join(parti[:2])
+    return {c for c, campuri in DEPENDENTE_CAPITOLE.items() if camp in campuri}
+
+def _seteaza(date: Dict[str, Any], cale: str, valoare: Any) -> None:
+    """Scrie valoarea la calea dată; cheile și indicii intermediari trebuie să existe."""
+    parti = cale.split(".")
+    nod: Any = date
+    for k, parte in enumerate(parti):
+        ultima = k == len(parti) - 1
+        if isinstance(nod, list):
+            if not parte.isdigit() or int(parte) >= len(nod):
+                raise ValueError(f"Index invalid în calea '{cale}': {parte}")
+            if ultima:
+                nod[int(parte)] = valoare
+            else:
+                nod = nod[int(parte)]
+        elif isinstance(nod, dict):
+            if parte not in nod:
+                raise ValueError(f"Câmp necunoscut în calea '{cale}': {parte}")
+            if ultima:
+                nod[parte] = valoare
+            else:
+                nod = nod[parte]
+        else:
+            raise ValueError(f"Calea '{cale}' continuă după o valoare simplă")
+
+def diferente(vechi: Any, nou: Any, cale: str) -> List[Dict[str, Any]]:
+    """
+    Modificările care transformă `vechi` în `nou`, ca listă de
+    {"cale", "valoare"}. Dicționarele și listele de obiecte de aceeași
+    lungime sunt comparate element cu element; o serie numerică schimbată
+    este trimisă întreagă (curbele se redesenează oricum în întregime).
+    """
+    if vechi == nou:
+        return []
+    if isinstance(vechi, dict) and isinstance(nou, dict) and vechi.keys() == nou.keys():
+        rezultat: List[Dict[str, Any]] = []
+        for k in nou:
+            rezultat.extend(diferente(vechi[k], nou[k], f"{cale}.{k}"))
+        return rezultat
+    if (isinstance(vechi, list) and isinstance(nou, list) and len(vechi) == len(nou)
+            and all(isinstance(e, (dict, list)) for e in nou)):
+        rezultat = []
+        for k, (a, b) in enumerate(zip(vechi, nou)):
+            rezultat.extend(diferente(a, b, f"{cale}.{k}"))
+        return rezultat
+    return [{"cale": cale, "valoare": nou}]
+
+class SesiuneCalcul:
+    """
+    Starea unei sesiuni interactive: datele vehiculului (dicționar, ca în UI),
+    modelul validat, opțiunile de calcul și ultimele rezultate per capitol.
+
+    Modificările se aplică pe o copie și sunt acceptate doar dacă vehiculul
+    rezultat este valid. Capitolele afectate rămân în `nesincronizate` până
+    când rezultatul lor recalculat este înregistrat, astfel încât un calcul
+    eșuat (timeout, pool saturat) este reluat la următoarea modificare.
+    """
+
+    def __init__(self):
+        self.date: Optional[Dict[str, Any]] = None
+        self.vehicul: Optional[VehicleParams] = None
+        self.optiuni = OptiuniSesiune()
+        self.rezultate: Dict[str, Any] = {}
+        self.nesincronizate: Set[str] = set()
+        self.versiune = 0
+
+    @property
+    def initializata(self) -> bool:
+        return self.vehicul is not None
+
+    def initializeaza(self, vehicul: Dict[str, Any], optiuni: Optional[Dict[str, Any]] = None) -> Set[str]:
+        """Starea inițială a sesiunii; toate capitolele trebuie calculate."""
+        validat = VehicleParams.model_validate(vehicul)
+        optiuni_validate = OptiuniSesiune.model_validate(optiuni or {})
+        self.date = validat.model_dump()
+        self.vehicul = validat
+        self.optiuni = optiuni_validate
+        self.rezultate = {}
+        self.nesincronizate = set(DEPENDENTE_CAPITOLE)
+        self.versiune += 1
+        return set(self.nesincronizate)
+
+    def aplica(self, modificari: Iterable[Dict[str, Any]]) -> Set[str]:
+        """
+        Aplică atomic o listă de modificări {"cale", "valoare"}; ridică
+        ValueError (sau ValidationError) fără să schimbe starea dacă o cale
+        este invalidă sau vehiculul rezultat nu trece validarea.
+
+        Returnează capitolele care trebuie recalculate (inclusiv cele rămase
+        nesincronizate de la modificările anterioare).
+        """
+        date = copy.deepcopy(self.date)
+        optiuni = self.optiuni.model_dump()
+        afectate: Set[str] = set()
+        for m in modificari:
+            cale = m.get("cale")
+            if not isinstance(cale, str) or not cale or "valoare" not in m:
+                raise ValueError("Fiecare modificare trebuie să aibă 'cale' și 'valoare'")
+            if cale.startswith("optiuni."):
+                nume = cale[len("optiuni."):]
+                if nume not in optiuni:
+                    raise ValueError(f"Opțiune necunoscută: {nume}")
+                optiuni[nume] = m["valoare"]
+            else:
+                _seteaza(date, cale, m["valoare"])
+            afectate |= capitole_afectate(cale)
+
+        vehicul = VehicleParams.model_validate(date)
+        optiuni_validate = OptiuniSesiune.model_validate(optiuni)
+        self.optiuni = optiuni_validate
+        self.date = vehicul.model_dump()
+        self.vehicul = vehicul
+        self.nesincronizate |= afectate
+        self.versiune += 1
+        return set(self.nesincronizate)
+
+    def inregistreaza(self, capitol: str, rezultat: Any) -> List[Dict[str, Any]]:
+        """
+        Înregistrează rezultatul recalculat al unui capitol și returnează
+        modificările față de rezultatul anterior (căile încep cu numele
+        capitolului; fără rezultat anterior, capitolul este trimis întreg).
+        """
+        vechi = self.rezultate.get(capitol)
+        self.rezultate[capitol] = rezultat
+        self.nesincronizate.discard(capitol)
+        if vechi is None:
+            return [{"cale": capitol, "valoare": rezultat}]
+        return diferente(vechi, rezultat, capitol)
+
+    def invalideaza(self, capitol: str) -> None:
+        """Capitolul nu mai are un rezultat valid (calculul a eșuat pentru starea curentă)."""
+        self.rezultate.pop(capitol, None)
+        self.nesincronizate.discard(capitol)
@@ -0,0 +1,16 @@
+"""
+Configurarea testelor: backend-ul rulează în același proces (fără pool
+separat și fără încălzire), cu depozitul de proiecte într-un director temporar
+"""
+
+import os
+import sys
+import tempfile
+
+# Modulele backend-ului (main, serviciu, calculations) sunt în python/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ["USV_EXECUTIE"] = "inline"
+os.environ["USV_INCALZIRE"] = "0"
+os.environ.pop("USV_CACHE_PARTAJAT", None)
+os.environ["USV_PROIECTE"] = os.path.join(tempfile.mkdtemp(prefix="usv-teste-"), "proiecte.sqlite3")
@@ -0,0 +1,47 @@
+"""
+Lotul de vehicule: un vehicul invalid este raportat separat, fără să
+împiedice calculul celorlalte
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+def test_vehiculul_invalid_are_eroare_proprie(client):
+    invalid = copy.deepcopy(VEHICUL_REFERINTA)
+    invalid["masa"]["masaTotala"] = -1850
+    greu = copy.deepcopy(VEHICUL_REFERINTA)
+    greu["nume"] = "Autoturism Greu"
+    greu["masa"]["masaTotala"] = 2300
+
+    lot = client.post("/calculate/batch", json=[VEHICUL_REFERINTA, invalid, greu])
+
+    assert lot.status_code == 200
+    corp = lot.json()
+    assert (corp["numar_vehicule"], corp["numar_erori"]) == (3, 1)
+    ok, eroare, ok_greu = corp["vehicule"]
+    assert [v["index"] for v in corp["vehicule"]] == [0, 1, 2]
+    assert eroare["status"] == "eroare" and eroare["erori"]
+    assert "rezultate" not in eroare
+    for vehicul in (ok, ok_greu):
+        assert vehicul["status"] == "ok"
+        assert set(vehicul["rezultate"]) == {"rezistente", "tractiune", "performante", "franare"}
+
+def test_rezultatele_lotului_sunt_cele_individuale(client):
+    invalid = copy.deepcopy(VEHICUL_REFERINTA)
+    del invalid["motor"]
+
+    lot = client.post("/calculate/batch", json=[invalid, VEHICUL_REFERINTA]).json()
+    singur = client.post("/calculate/all", json=VEHICUL_REFERINTA).json()
+
+    assert lot["vehicule"][0]["status"] == "eroare"
+    assert lot["vehicule"][1]["rezultate"]["performante"] == singur["performante"]
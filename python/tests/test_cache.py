@@ -0,0 +1,76 @@
+"""
+Cache-ul de rezultate: evacuarea din cache-ul partajat între procese păstrează
+intrările folosite recent; ETag-ul derivat din cheie permite răspunsuri 304
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from cache import CacheRezultatePartajat, fcntl
+from serviciu import VEHICUL_REFERINTA
+
+partajat = pytest.mark.skipif(fcntl is None, reason="cache-ul partajat necesită fcntl")
+
+VALOARE = bytes(4096)
+
+@pytest.fixture
+def cache(tmp_path):
+    cale = str(tmp_path / "cache.bin")
+    CacheRezultatePartajat.creeaza(cale, 64 * 1024)
+    cache = CacheRezultatePartajat(cale)
+    yield cache
+    cache.inchide()
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+@partajat
+def test_intrarea_folosita_nu_este_evacuata(cache):
+    for k in range(10):
+        cache.put(f"k{k}", VALOARE)
+    assert cache.get("k0") == VALOARE
+
+    for k in range(10, 20):
+        cache.put(f"k{k}", VALOARE)
+
+    assert cache.get("k0") == VALOARE
+    assert cache.get("k1") is None
+    assert cache.statistici()["evacuari"] > 0
+
+@partajat
+def test_hit_recent_nu_rescrie_jurnalul(cache):
+    cache.put("a", VALOARE)
+    cache.put("b", VALOARE)
+    ocupat = cache.statistici()["ocupat_bytes"]
+
+    assert cache.get("b") == VALOARE
+    assert cache.statistici()["ocupat_bytes"] == ocupat
+    assert cache.get("a") == VALOARE
+    assert cache.statistici()["ocupat_bytes"] > ocupat
+
+def test_etag_potrivit_raspunde_304(client):
+    primul = client.post("/calculate/rezistente", json=VEHICUL_REFERINTA)
+    etag = primul.headers["ETag"]
+    repetat = client.post("/calculate/rezistente", json=VEHICUL_REFERINTA,
+                          headers={"If-None-Match": etag})
+
+    assert primul.status_code == 200
+    assert repetat.status_code == 304
+    assert repetat.headers["ETag"] == etag
+    assert repetat.content == b""
+
+def test_vehiculul_modificat_are_alt_etag(client):
+    modificat = copy.deepcopy(VEHICUL_REFERINTA)
+    modificat["aerodinamic"]["coefAerodinamic"] = 0.32
+
+    etag = client.post("/calculate/rezistente", json=VEHICUL_REFERINTA).headers["ETag"]
+    raspuns = client.post("/calculate/rezistente", json=modificat, headers={"If-None-Match": etag})
+
+    assert raspuns.status_code == 200
+    assert raspuns.headers["ETag"] != etag
+    assert raspuns.json() != client.post("/calculate/rezistente", json=VEHICUL_REFERINTA).json()
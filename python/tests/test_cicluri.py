@@ -0,0 +1,33 @@
+"""
+Ciclurile de conducere: distanța și durata NEDC (4 × ECE-15 + EUDC)
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+def _cicluri(client, cicluri):
+    raspuns = client.post("/simulate/cicluri", json={"vehicule": [VEHICUL_REFERINTA], "cicluri": cicluri})
+    assert raspuns.status_code == 200
+    return {c["ciclu"]: c for c in raspuns.json()["vehicule"][0]["cicluri"]}
+
+def test_distanta_nedc(client):
+    nedc = _cicluri(client, ["nedc"])["nedc"]
+
+    assert nedc["durata_s"] == 1180
+    assert nedc["distanta_km"] == pytest.approx(11.0, abs=0.05)
+    assert nedc["viteza_medie_kmh"] == pytest.approx(33.6, abs=0.2)
+    assert nedc["intervale_neurmarite"] == 0
+
+def test_nedc_este_patru_ece15_si_eudc(client):
+    rezultate = _cicluri(client, ["nedc", "ece15", "eudc"])
+
+    partial = 4 * rezultate["ece15"]["distanta_km"] + rezultate["eudc"]["distanta_km"]
+    assert rezultate["nedc"]["distanta_km"] == pytest.approx(partial, abs=2e-3)
@@ -0,0 +1,40 @@
+"""
+Formatul binar pe coloane: aceleași valori ca răspunsul JSON
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from coloane import MEDIA_TYPE, decodifica
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+def _compara(binar, valori, rtol):
+    if isinstance(binar, np.ndarray):
+        np.testing.assert_allclose(binar, np.asarray(valori, dtype=float), rtol=rtol, atol=0)
+    elif isinstance(binar, dict):
+        assert set(binar) == set(valori)
+        for k in binar:
+            _compara(binar[k], valori[k], rtol)
+    elif isinstance(binar, list):
+        assert len(binar) == len(valori)
+        for b, v in zip(binar, valori):
+            _compara(b, v, rtol)
+    else:
+        assert binar == valori
+
+@pytest.mark.parametrize("accept, rtol", [(MEDIA_TYPE, 0), (MEDIA_TYPE + ";precizie=32", 1e-6)])
+def test_binar_are_valorile_din_json(client, accept, rtol):
+    valori = client.post("/calculate/all", json=VEHICUL_REFERINTA).json()
+    raspuns = client.post("/calculate/all", json=VEHICUL_REFERINTA, headers={"Accept": accept})
+
+    assert raspuns.headers["content-type"] == MEDIA_TYPE
+    binar = decodifica(raspuns.content)
+    assert set(binar) == set(valori)
+    _compara(binar, valori, rtol)
@@ -0,0 +1,44 @@
+"""
+Compararea vehiculelor: axa de viteze comună este limitată și când viteza
+maximă a axei este cea implicită
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculations.comparatie import PUNCTE_MAX_AXA, grila_viteze
+from modele import VehicleParams
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+def _vehicule():
+    al_doilea = copy.deepcopy(VEHICUL_REFERINTA)
+    al_doilea["aerodinamic"]["coefAerodinamic"] = 0.35
+    return [VEHICUL_REFERINTA, al_doilea]
+
+def test_comparatie_pe_axa_implicita(client):
+    raspuns = client.post("/calculate/comparatie", json={"vehicule": _vehicule()})
+
+    assert raspuns.status_code == 200
+    assert raspuns.json()["viteze_kmh"][0] == 0
+
+@pytest.mark.parametrize("cerere", [
+    {"pas_kmh": 1e-6},
+    {"pas_kmh": 0.001},
+    {"pas_kmh": 0.01, "viteza_max_kmh": 5000},
+])
+def test_axa_prea_fina_este_respinsa(client, cerere):
+    raspuns = client.post("/calculate/comparatie", json={"vehicule": _vehicule(), **cerere})
+
+    assert raspuns.status_code == 422
+
+def test_axa_implicita_peste_limita_este_respinsa():
+    vehicule = [VehicleParams(**v) for v in _vehicule()]
+    with pytest.raises(ValueError, match=str(PUNCTE_MAX_AXA)):
+        grila_viteze(vehicule, pas_kmh=1e-4)
@@ -0,0 +1,69 @@
+"""
+Contextul comun al vehiculului: /calculate/all extrage parametrii, evaluează
+caracteristica motorului și cinematica pe trepte o singură dată
+"""
+
+from collections import Counter
+from functools import cached_property
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculations.motor import TabeleMotor
+from calculations.vehicule import ContextVehicul
+from serviciu import CAPITOLE, VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+@pytest.fixture
+def apeluri(monkeypatch):
+    """Numărul de evaluări ale fiecărui pas costisitor, în timpul testului."""
+    numarate: Counter = Counter()
+
+    def numara(nume, fn):
+        def invelis(*args, **kwargs):
+            numarate[nume] += 1
+            return fn(*args, **kwargs)
+        return invelis
+
+    caracteristica = TabeleMotor.caracteristica
+    monkeypatch.setattr(TabeleMotor, "caracteristica",
+                        lambda self, *a, **k: numara("caracteristica_motor", caracteristica)(self, *a, **k))
+
+    # Fiecare parametru scalar este extras de propria funcție (ex. ContextVehicul.m.<locals>.<lambda>)
+    coloana = ContextVehicul._coloana
+    monkeypatch.setattr(ContextVehicul, "_coloana",
+                        lambda self, extrage: numara(extrage.__qualname__, coloana)(self, extrage))
+
+    for nume in ("i_cv", "viteze_trepte_ms", "forte_tractiune"):
+        proprietate = cached_property(numara(nume, ContextVehicul.__dict__[nume].func))
+        proprietate.__set_name__(ContextVehicul, nume)
+        monkeypatch.setattr(ContextVehicul, nume, proprietate)
+    return numarate
+
+def test_calculate_all_evalueaza_fiecare_pas_o_singura_data(client, apeluri):
+    raspuns = client.post("/calculate/all", json=VEHICUL_REFERINTA)
+
+    assert raspuns.status_code == 200
+    assert set(raspuns.json()) == set(CAPITOLE)
+    assert apeluri["caracteristica_motor"] == 1
+    assert apeluri["i_cv"] == 1
+    assert apeluri["viteze_trepte_ms"] == 1
+    assert apeluri["forte_tractiune"] == 1
+    extrase = {nume: n for nume, n in apeluri.items() if nume.startswith("ContextVehicul.")}
+    for parametru in ("m", "f", "r_d", "Cx", "A", "P_max", "n_P", "n_max", "n_min", "i_0", "eta_t"):
+        assert f"ContextVehicul.{parametru}.<locals>.<lambda>" in extrase
+    assert all(n == 1 for n in extrase.values()), extrase
+
+def test_cererea_repetata_nu_mai_calculeaza(client, apeluri):
+    client.post("/calculate/all", json=VEHICUL_REFERINTA)
+    apeluri.clear()
+
+    raspuns = client.post("/calculate/all", json=VEHICUL_REFERINTA)
+
+    assert raspuns.status_code == 200
+    assert not apeluri
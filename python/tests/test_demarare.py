@@ -0,0 +1,68 @@
+"""
+Demararea 0-100 km/h: aceeași valoare în Cap. 5, în tabelul de intervale și
+în indicatorii cheie, indiferent de pasul grilei de viteze
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculations.indicatori import indicatori_cheie
+from calculations.vehicule import ContextVehicul
+from modele import VehicleParams
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+def _interval_0_100(raspuns):
+    return next(i for i in raspuns["intervale"] if (i["de_la_kmh"], i["pana_la_kmh"]) == (0, 100))
+
+@pytest.mark.parametrize("pas_demarare", [0.5, 1.0, 2.0])
+@pytest.mark.parametrize("pas_tabel", [0.01, 0.1, 1.0])
+def test_0_100_nu_depinde_de_endpoint_si_pas(client, pas_demarare, pas_tabel):
+    performante = client.post(f"/calculate/performante?pas_demarare_kmh={pas_demarare}",
+                              json=VEHICUL_REFERINTA).json()["performante_cheie"]
+    interval = _interval_0_100(client.post("/calculate/performante/intervale", json={
+        "vehicul": VEHICUL_REFERINTA, "pas_kmh": pas_tabel
+    }).json())
+    indicatori = indicatori_cheie(ContextVehicul([VehicleParams(**VEHICUL_REFERINTA)]))
+
+    assert interval["timp_s"] == pytest.approx(performante["timp_0_100_s"], abs=0.01)
+    assert interval["spatiu_m"] == pytest.approx(performante["spatiu_0_100_m"], abs=0.05)
+    assert indicatori["timp_0_100_s"][0] == pytest.approx(performante["timp_0_100_s"], abs=0.01)
+
+def _vehicul_lent():
+    vehicul = copy.deepcopy(VEHICUL_REFERINTA)
+    vehicul["motor"]["putereMaxima"] = 15  # v_max ≈ 94 km/h
+    return vehicul
+
+def test_vehicul_sub_100_kmh_demareaza_pana_la_vmax(client):
+    vehicul = _vehicul_lent()
+
+    performante = client.post("/calculate/performante", json=vehicul)
+    toate = client.post("/calculate/all", json=vehicul)
+    lot = client.post("/calculate/batch", json=[vehicul, VEHICUL_REFERINTA])
+
+    assert performante.status_code == toate.status_code == lot.status_code == 200
+    cheie = performante.json()["performante_cheie"]
+    assert cheie["timp_0_100_s"] is None and cheie["spatiu_0_100_m"] is None
+    assert performante.json()["demarare"]["viteze_kmh"][-1] == pytest.approx(cheie["viteza_maxima_kmh"])
+    assert toate.json()["performante"] == performante.json()
+    assert [r["status"] for r in lot.json()["vehicule"]] == ["ok", "ok"]
+
+def test_viteza_finala_explicita_peste_vmax_este_respinsa(client):
+    raspuns = client.post("/calculate/performante?viteza_finala_kmh=100", json=_vehicul_lent())
+
+    assert raspuns.status_code == 422
+    assert "viteza maximă" in raspuns.json()["detail"]
+
+@pytest.mark.parametrize("pas", [0, 1e-6, 0.001])
+def test_pasul_demararii_este_limitat(client, pas):
+    raspuns = client.post(f"/calculate/performante?pas_demarare_kmh={pas}", json=VEHICUL_REFERINTA)
+
+    assert raspuns.status_code == 422
@@ -0,0 +1,53 @@
+"""
+Reducerea curbelor (LTTB): capetele sunt păstrate, bugetul de puncte este
+respectat, iar curbele reduse sunt puncte ale curbelor complete
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculations.esantionare import indici_lttb, reduce_serii
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+@pytest.mark.parametrize("max_puncte", [3, 10, 57])
+def test_capetele_pastrate_si_bugetul_respectat(max_puncte):
+    x = np.tile(np.linspace(0, 10, 500), (3, 1))
+    y = np.sin(x * np.array([[1.0], [2.0], [5.0]]))
+
+    indici = indici_lttb(x, [y, y**2], max_puncte)
+
+    assert indici.shape == (3, max_puncte)
+    assert np.all(indici[:, 0] == 0) and np.all(indici[:, -1] == 499)
+    assert np.all(np.diff(indici, axis=-1) > 0)
+
+def test_varful_izolat_este_pastrat():
+    x = np.arange(1000.0)
+    y = np.zeros(1000)
+    y[613] = 1.0
+
+    assert 613 in indici_lttb(x, [y], 20)
+
+def test_curba_scurta_ramane_neschimbata():
+    x = np.arange(8.0)
+    x_redus, (y_redus,) = reduce_serii(x, [x**2], 20)
+
+    np.testing.assert_array_equal(x_redus, x)
+    np.testing.assert_array_equal(y_redus, x**2)
+
+def test_endpoint_reduce_curbele(client):
+    complet = client.post("/calculate/tractiune", json=VEHICUL_REFERINTA).json()
+    redus = client.post("/calculate/tractiune?max_puncte=20", json=VEHICUL_REFERINTA).json()
+
+    for treapta_completa, treapta_redusa in zip(complet["tractiune_pe_trepte"], redus["tractiune_pe_trepte"]):
+        viteze, forte = treapta_redusa["viteze_kmh"], treapta_redusa["forte_tractiune_N"]
+        assert len(viteze) == len(forte) == 20
+        assert (viteze[0], viteze[-1]) == (treapta_completa["viteze_kmh"][0], treapta_completa["viteze_kmh"][-1])
+        puncte = set(zip(treapta_completa["viteze_kmh"], treapta_completa["forte_tractiune_N"]))
+        assert set(zip(viteze, forte)) <= puncte
@@ -0,0 +1,67 @@
+"""
+Pool-ul de calcul: cererile peste workeri + coadă sunt respinse cu 429,
+calculele care depășesc timpul alocat răspund cu 504
+"""
+
+import asyncio
+import copy
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import serviciu
+from executie import ExecutorCalcule
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+@pytest.fixture
+def executor(monkeypatch):
+    executor = ExecutorCalcule("thread", workeri=1, coada_max=0, timeout_s=5.0)
+    monkeypatch.setattr(main, "executor", executor)
+    yield executor
+    executor.opreste()
+
+def _vehicul(masa_totala):
+    # Vehicul nepăstrat în cache sau în depozitul de proiecte al altor teste
+    vehicul = copy.deepcopy(VEHICUL_REFERINTA)
+    vehicul["masa"]["masaTotala"] = masa_totala
+    return vehicul
+
+def test_pool_saturat_raspunde_429(client, executor):
+    eliberat = threading.Event()
+    ocupat = threading.Thread(target=lambda: asyncio.run(executor.ruleaza(eliberat.wait)))
+    ocupat.start()
+    try:
+        while executor.in_lucru == 0:
+            time.sleep(0.01)
+
+        raspuns = client.post("/calculate/all", json=_vehicul(1851))
+    finally:
+        eliberat.set()
+        ocupat.join()
+
+    assert raspuns.status_code == 429
+    assert raspuns.headers["Retry-After"] == "1"
+    assert executor.statistici()["respinse_429"] == 1
+
+def test_calcul_lent_raspunde_504(client, executor, monkeypatch):
+    calcul = serviciu.calculeaza_capitole
+
+    def lent(*args, **kwargs):
+        time.sleep(0.5)
+        return calcul(*args, **kwargs)
+
+    monkeypatch.setattr(serviciu, "calculeaza_capitole", lent)
+    executor.timeout_s = 0.05
+
+    raspuns = client.post("/calculate/all", json=_vehicul(1852))
+
+    assert raspuns.status_code == 504
+    assert executor.statistici()["expirate"] == 1
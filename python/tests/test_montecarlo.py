@@ -0,0 +1,49 @@
+"""
+Monte Carlo: același seed și aceeași marime_bloc dau același rezultat,
+indiferent de numărul de workeri; altă marime_bloc dă alte eșantioane
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from executie import ExecutorCalcule
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+def _montecarlo(client, marime_bloc):
+    raspuns = client.post("/calculate/montecarlo", json={
+        "vehicul": VEHICUL_REFERINTA,
+        "distributii": [{"camp": "masaTotala", "abatere_relativa": 0.05},
+                        {"camp": "coefAerodinamic", "tip": "uniforma", "minim": 0.28, "maxim": 0.34}],
+        "esantioane": 1200, "seed": 42, "marime_bloc": marime_bloc
+    })
+    assert raspuns.status_code == 200
+    rezultat = raspuns.json()
+    del rezultat["durata_s"]
+    return rezultat
+
+def test_acelasi_seed_si_bloc_dau_acelasi_rezultat(client, monkeypatch):
+    secvential = _montecarlo(client, 300)
+    paralel = ExecutorCalcule("thread", workeri=3, timeout_s=30.0)
+    monkeypatch.setattr(main, "executor", paralel)
+    try:
+        in_paralel = _montecarlo(client, 300)
+    finally:
+        paralel.opreste()
+
+    assert secvential["blocuri"] == 4
+    assert in_paralel == secvential
+
+def test_alta_marime_de_bloc_schimba_rezultatul(client):
+    blocuri_300 = _montecarlo(client, 300)
+    blocuri_400 = _montecarlo(client, 400)
+
+    assert blocuri_400["blocuri"] == 3
+    assert blocuri_400["seed"] == blocuri_300["seed"]
+    assert blocuri_400["parametri"] != blocuri_300["parametri"]
+    assert blocuri_400["indicatori"] != blocuri_300["indicatori"]
@@ -0,0 +1,50 @@
+"""
+Caracteristica motorului: curba de cuplu măsurată (tabel PCHIP) și
+descrierea sursei în Cap. 4
+"""
+
+import copy
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculations.motor import TabeleMotor, tabel_curba_masurata
+from serviciu import VEHICUL_REFERINTA
+
+TURATII = [1000.0, 1500.0, 2200.0, 3000.0, 3700.0, 4500.0, 5300.0, 6000.0]
+CUPLURI = [120.0, 150.0, 175.0, 182.0, 180.0, 170.0, 150.0, 120.0]
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+def _vehicul_masurat():
+    vehicul = copy.deepcopy(VEHICUL_REFERINTA)
+    vehicul["motor"]["curbaCuplu"] = {"turatii": TURATII, "cupluri": CUPLURI}
+    return vehicul
+
+def test_curba_masurata_trece_prin_punctele_masurate():
+    n_start, pas, coeficienti = tabel_curba_masurata(TURATII, CUPLURI)
+    motor = TabeleMotor(np.array([n_start]), np.array([pas]), coeficienti[np.newaxis])
+
+    cuplu = motor.cuplu(np.array([TURATII]))
+
+    np.testing.assert_allclose(cuplu[0], CUPLURI, atol=1e-3)
+
+def test_turatiile_repetate_sunt_mediate():
+    n_start, pas, coeficienti = tabel_curba_masurata(TURATII + [3000.0], CUPLURI + [178.0])
+    motor = TabeleMotor(np.array([n_start]), np.array([pas]), coeficienti[np.newaxis])
+
+    assert motor.cuplu(np.array([[3000.0]]))[0, 0] == pytest.approx(180.0, abs=1e-3)
+
+def test_sursa_caracteristicii_in_tractiune(client):
+    sintetic = client.post("/calculate/tractiune", json=VEHICUL_REFERINTA).json()["caracteristica_motor"]
+    masurat = client.post("/calculate/tractiune", json=_vehicul_masurat()).json()["caracteristica_motor"]
+
+    assert sintetic["sursa"] == "Leiderman-Khlystov"
+    assert "P_max" in sintetic["formula_putere"] and "interpolare" not in sintetic
+    assert masurat["sursa"] == "curba_masurata"
+    assert "PCHIP" in masurat["interpolare"] and "P_max" not in masurat["formula_putere"]
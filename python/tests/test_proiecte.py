@@ -0,0 +1,91 @@
+"""
+Depozitul de proiecte: redeschiderea citește rezultatele păstrate, o
+variantă nouă este calculată o singură dată, iar o versiune nouă a
+calculelor invalidează rezultatele păstrate
+"""
+
+import copy
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import serviciu
+from modele import VehicleParams
+from proiecte import DepozitProiecte
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+@pytest.fixture
+def calcule(monkeypatch):
+    """Vehiculele calculate în pool (listă de loturi), în timpul testului."""
+    loturi = []
+    calculeaza = serviciu.calculeaza_capitole
+
+    def numara(vehicule, *args, **kwargs):
+        loturi.append(len(vehicule))
+        return calculeaza(vehicule, *args, **kwargs)
+
+    monkeypatch.setattr(serviciu, "calculeaza_capitole", numara)
+    return loturi
+
+def _redeschide(client, id_proiect):
+    linii = [json.loads(l) for l in client.get(f"/proiecte/{id_proiect}/rezultate").text.splitlines()]
+    return linii[:-1], linii[-1]["rezumat"]
+
+def _varianta(cx):
+    vehicul = copy.deepcopy(VEHICUL_REFERINTA)
+    vehicul["aerodinamic"]["coefAerodinamic"] = cx
+    return vehicul
+
+def test_redeschiderea_nu_recalculeaza(client, calcule):
+    id_proiect = client.post("/proiecte", json={"nume": "redeschidere"}).json()["id"]
+    client.post(f"/proiecte/{id_proiect}/variante", json={"vehicul": VEHICUL_REFERINTA})
+    main.cache.goleste()
+    calcule.clear()
+
+    variante, rezumat = _redeschide(client, id_proiect)
+
+    assert rezumat["variante"] == 1
+    assert [v["status"] for v in variante] == ["ok"]
+    assert calcule == []
+
+def test_varianta_noua_apare_la_redeschidere(client, calcule):
+    id_proiect = client.post("/proiecte", json={"nume": "variante"}).json()["id"]
+    client.post(f"/proiecte/{id_proiect}/variante", json={"vehicul": _varianta(0.30)})
+    inainte, _ = _redeschide(client, id_proiect)
+    main.depozit().adauga_varianta(id_proiect, VehicleParams(**_varianta(0.40)))
+    main.cache.goleste()
+    calcule.clear()
+
+    dupa, rezumat = _redeschide(client, id_proiect)
+    din_nou, _ = _redeschide(client, id_proiect)
+
+    assert len(inainte) == 1 and rezumat["variante"] == 2
+    assert dupa[0]["rezultate"] == inainte[0]["rezultate"]
+    assert dupa[1]["rezultate"]["rezistente"] != dupa[0]["rezultate"]["rezistente"]
+    assert calcule == [1]  # doar varianta nouă, o singură dată
+    assert din_nou == dupa
+
+def test_versiune_noua_invalideaza_rezultatele(tmp_path):
+    cale = str(tmp_path / "proiecte.sqlite3")
+    depozit = DepozitProiecte(cale, versiune_calcul="1.0")
+    id_proiect = depozit.creeaza_proiect("versiune", None)["id"]
+    varianta = depozit.adauga_varianta(id_proiect, VehicleParams(**VEHICUL_REFERINTA))
+    depozit.salveaza_rezultate([("cheie", varianta["amprenta"], b"{}")])
+    depozit.inchide()
+
+    acelasi = DepozitProiecte(cale, versiune_calcul="1.0")
+    assert acelasi.rezultate_invalidate == 0 and acelasi.rezultate(["cheie"]) == {"cheie": b"{}"}
+    acelasi.inchide()
+
+    nou = DepozitProiecte(cale, versiune_calcul="2.0")
+    assert nou.rezultate_invalidate == 1
+    assert nou.rezultate(["cheie"]) == {}
+    assert len(nou.proiect(id_proiect)["variante"]) == 1
+    nou.inchide()
@@ -0,0 +1,84 @@
+"""
+Punctele caracteristice: rădăcinile și maximele rafinate coincid cu cele
+găsite prin forță brută pe o grilă fină
+"""
+
+import copy
+
+import numpy as np
+import pytest
+
+from calculations.puncte_caracteristice import (DinamicaTrepte, puncte_caracteristice_ctx,
+                                                radacina_incadrata)
+from calculations.vehicule import ContextVehicul
+from modele import VehicleParams
+from serviciu import VEHICUL_REFERINTA
+
+PUNCTE_GRILA = 100_001
+
+def _vehicule():
+    # Referința (ultima treaptă limitată de rezistențe), o variantă cu viteza
+    # maximă într-o treaptă inferioară și una cu curbă de cuplu măsurată
+    aer = copy.deepcopy(VEHICUL_REFERINTA)
+    aer["aerodinamic"]["coefAerodinamic"] = 0.45
+    aer["transmisie"]["raporturiCV"] = [3.727, 2.048, 1.393, 1.029, 0.7]
+    masurat = copy.deepcopy(VEHICUL_REFERINTA)
+    masurat["motor"]["curbaCuplu"] = {
+        "turatii": [1000.0, 1500.0, 2200.0, 3000.0, 3700.0, 4500.0, 5300.0, 6500.0],
+        "cupluri": [120.0, 150.0, 175.0, 182.0, 180.0, 170.0, 150.0, 110.0]
+    }
+    return [VehicleParams(**v) for v in (VEHICUL_REFERINTA, aer, masurat)]
+
+@pytest.fixture(params=range(3))
+def ctx(request):
+    return ContextVehicul([_vehicule()[request.param]])
+
+def _grila_turatii(ctx):
+    t = np.linspace(0, 1, PUNCTE_GRILA)
+    return ctx.n_min[:, :, np.newaxis] + (ctx.n_max - ctx.n_min)[:, :, np.newaxis] * t
+
+def test_viteza_maxima_pe_trepte(ctx):
+    dinamica = DinamicaTrepte(ctx)
+    K = ctx.i_cv.shape[1]
+    n = np.broadcast_to(_grila_turatii(ctx), (1, K, PUNCTE_GRILA))
+    peste = dinamica.factor_dinamic(n) >= ctx.f[:, :, np.newaxis]
+    ultim = PUNCTE_GRILA - 1 - np.argmax(peste[..., ::-1], axis=-1)
+    v_forta_bruta = np.take_along_axis(dinamica.viteza(n), ultim[..., np.newaxis], axis=-1)[..., 0] * 3.6
+    pas_kmh = (dinamica.viteza(n[..., 1]) - dinamica.viteza(n[..., 0])) * 3.6
+
+    p = puncte_caracteristice_ctx(ctx)
+
+    np.testing.assert_allclose(p["v_max_trepte_kmh"], v_forta_bruta, atol=float(pas_kmh.max()) + 1e-9)
+    assert p["viteza_maxima_kmh"][0] == pytest.approx(np.nanmax(v_forta_bruta), abs=float(pas_kmh.max()) + 1e-9)
+
+def test_factorul_dinamic_maxim(ctx):
+    dinamica = DinamicaTrepte(ctx)
+    K = ctx.i_cv.shape[1]
+    n = np.broadcast_to(_grila_turatii(ctx), (1, K, PUNCTE_GRILA))
+    D = dinamica.factor_dinamic(n)
+
+    p = puncte_caracteristice_ctx(ctx)
+
+    assert np.all(p["D_max_trepte"] >= D.max(axis=-1) - 1e-12)
+    np.testing.assert_allclose(p["D_max_trepte"], D.max(axis=-1), rtol=1e-9)
+
+def test_vitezele_de_schimbare(ctx):
+    K = ctx.i_cv.shape[1]
+    p = puncte_caracteristice_ctx(ctx)
+    perechi = DinamicaTrepte(ctx, np.concatenate([np.arange(K - 1), np.arange(1, K)]))
+
+    for k in np.flatnonzero(p["criteriu_schimbare"][0] == 0):
+        v = np.linspace(perechi.viteza(ctx.n_min[0, 0])[0, K - 1 + k],
+                        perechi.viteza(ctx.n_max[0, 0])[0, k], PUNCTE_GRILA)
+        a = perechi.acceleratie(perechi.turatie(np.broadcast_to(v, (1, 2 * K - 2, PUNCTE_GRILA))))
+        prima = np.argmax(a[0, k] < a[0, K - 1 + k])
+
+        assert p["v_schimbare_kmh"][0, k] == pytest.approx(v[prima] * 3.6, abs=(v[1] - v[0]) * 3.6)
+
+def test_radacina_incadrata_vectorizata():
+    radacini = np.array([0.3, 1.7, 2.5, 9.0])
+    fn = lambda x: (x - radacini) * (x**2 + 1)
+
+    x = radacina_incadrata(fn, np.zeros(4), np.full(4, 10.0), fn(np.zeros(4)), fn(np.full(4, 10.0)))
+
+    np.testing.assert_allclose(x, radacini, rtol=1e-9)
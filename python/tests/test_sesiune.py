@@ -0,0 +1,65 @@
+"""
+Sesiunea interactivă: o modificare recalculează doar capitolele care depind
+de câmpul modificat
+"""
+
+import copy
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import serviciu
+from serviciu import VEHICUL_REFERINTA
+from sesiune import capitole_afectate
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+@pytest.fixture
+def capitole(monkeypatch):
+    """Capitolele calculate în pool (o listă per apel), în timpul testului."""
+    apeluri = []
+    calculeaza = serviciu.calculeaza_capitole
+
+    def inregistreaza(vehicule, nume_capitole, *args, **kwargs):
+        apeluri.append(sorted(nume_capitole))
+        return calculeaza(vehicule, nume_capitole, *args, **kwargs)
+
+    monkeypatch.setattr(serviciu, "calculeaza_capitole", inregistreaza)
+    return apeluri
+
+def _patch(ws, id_mesaj, cale, valoare):
+    ws.send_json({"tip": "patch", "id": id_mesaj, "modificari": [{"cale": cale, "valoare": valoare}]})
+    return ws.receive_json()
+
+def test_patch_recalculeaza_doar_capitolele_dependente(client, capitole):
+    vehicul = copy.deepcopy(VEHICUL_REFERINTA)
+    vehicul["masa"]["masaTotala"] = 1853  # nepăstrat de alte teste
+
+    with client.websocket_connect("/ws/sesiune") as ws:
+        ws.send_json({"tip": "init", "id": 1, "vehicul": vehicul})
+        assert ws.receive_json()["tip"] == "complet"
+        assert capitole == [["franare", "performante", "rezistente", "tractiune"]]
+
+        aer = _patch(ws, 2, "aerodinamic.coefAerodinamic", 0.33)
+        centru_masa = _patch(ws, 3, "masa.inaltimeCentruMasa", 600)
+        nume = _patch(ws, 4, "nume", "Varianta")
+
+    assert aer["tip"] == "delta" and aer["modificari"]
+    assert sorted(aer["recalculate"]) == ["performante", "rezistente", "tractiune"]
+    assert centru_masa["recalculate"] == ["franare"]
+    assert nume["recalculate"] == []
+    assert capitole[1:] == [["performante", "rezistente", "tractiune"], ["franare"]]
+
+@pytest.mark.parametrize("cale, afectate", [
+    ("aerodinamic.arieFrontala", {"rezistente", "tractiune", "performante"}),
+    ("transmisie.raporturiCV.2", {"tractiune", "performante"}),
+    ("masa.repartizareFata", {"franare"}),
+    ("optiuni.pas_demarare_kmh", {"performante"}),
+    ("dimensiuni.lungime", set()),
+])
+def test_capitole_afectate(cale, afectate):
+    assert capitole_afectate(cale) == afectate
@@ -0,0 +1,77 @@
+"""
+Simularea demarării în timp: pași și evenimente locale fiecărei simulări,
+deci strategiile unui lot nu se influențează între ele
+"""
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from calculations import simulare
+from modele import VehicleParams
+from serviciu import VEHICUL_REFERINTA
+
+STRATEGII = [{"turatie_schimbare_rpm": 3000 + 250 * i, "timp_schimbare_s": 0.1 + 0.05 * i}
+             for i in range(12)]
+
+@pytest.fixture
+def client():
+    main.cache.goleste()
+    return TestClient(main.app)
+
+@pytest.fixture
+def vehicul():
+    return VehicleParams(**VEHICUL_REFERINTA)
+
+def test_strategiile_lotului_sunt_independente(vehicul):
+    lot = simulare.simuleaza_demarare(vehicul, STRATEGII)["simulari"]
+
+    for strategie, rezultat in zip(STRATEGII, lot):
+        singur = simulare.simuleaza_demarare(vehicul, [strategie])["simulari"][0]
+        assert rezultat["timp_tinta_s"] == singur["timp_tinta_s"]
+        assert rezultat["schimbari"] == singur["schimbari"]
+        assert rezultat["urma"] == singur["urma"]
+
+def test_pasii_nu_cresc_cu_numarul_de_strategii(vehicul):
+    pasi = [simulare.simuleaza_demarare(vehicul, [s])["simulari"][0]["statistici"]["pasi"]
+            for s in STRATEGII]
+
+    lot = simulare.simuleaza_demarare(vehicul, STRATEGII)["simulari"]
+
+    assert lot[0]["statistici"]["pasi"] == max(pasi)
+
+def test_rezultatul_nu_depinde_de_pasul_de_integrare(vehicul, monkeypatch):
+    implicit = simulare.simuleaza_demarare(vehicul, STRATEGII[:3])["simulari"]
+    monkeypatch.setattr(simulare, "PAS_INTEGRARE_S", 0.01)
+    fin = simulare.simuleaza_demarare(vehicul, STRATEGII[:3])["simulari"]
+
+    for a, b in zip(implicit, fin):
+        assert a["timp_tinta_s"] == pytest.approx(b["timp_tinta_s"], abs=2e-3)
+        assert [s["t_s"] for s in a["schimbari"]] == pytest.approx([s["t_s"] for s in b["schimbari"]], abs=2e-3)
+
+def test_schimbarile_la_turatia_strategiei(vehicul):
+    rezultat = simulare.simuleaza_demarare(vehicul, [STRATEGII[4]])["simulari"][0]
+
+    schimbari = rezultat["schimbari"]
+    assert schimbari
+    assert [s["din_treapta"] for s in schimbari] == list(range(1, len(schimbari) + 1))
+    assert all(s["turatie_rpm"] == pytest.approx(STRATEGII[4]["turatie_schimbare_rpm"], abs=1)
+               for s in schimbari)
+    timpi = np.array(rezultat["urma"]["timp_s"])
+    assert np.all(np.diff(timpi) > 0)
+    assert rezultat["urma"]["viteza_kmh"][-1] == pytest.approx(100.0)
+    assert timpi[-1] == rezultat["timp_tinta_s"]
+
+def test_endpoint_urma_pe_grila(client):
+    raspuns = client.post("/simulate/demarare", json={
+        "vehicul": VEHICUL_REFERINTA, "strategii": STRATEGII[:2], "pas_timp_s": 0.1
+    })
+
+    assert raspuns.status_code == 200
+    for rezultat in raspuns.json()["simulari"]:
+        urma = rezultat["urma"]
+        pe_grila = [t for t in urma["timp_s"] if abs(t * 10 - round(t * 10)) < 1e-6]
+        # Toate punctele grilei până la viteza țintă, plus momentele evenimentelor
+        assert len(pe_grila) >= int(rezultat["timp_tinta_s"] / 0.1)
+        assert len(urma["timp_s"]) == len(urma["viteza_kmh"]) == len(urma["treapta"])
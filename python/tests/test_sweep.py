@@ -0,0 +1,38 @@
+"""
+Limitele studiului parametric: lungimea axelor și produsul cartezian
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from modele import PUNCTE_MAX_SWEEP
+from serviciu import VEHICUL_REFERINTA
+
+@pytest.fixture
+def client():
+    return TestClient(main.app)
+
+def test_sweep_raporteaza_numarul_de_puncte(client):
+    axe = [{"camp": "coefAerodinamic", "minim": 0.28, "maxim": 0.34, "puncte": 3},
+           {"camp": "masaTotala", "valori": [1200.0, 1400.0]}]
+    raspuns = client.post("/sweep", json={"vehicul": VEHICUL_REFERINTA, "axe": axe},
+                          headers={"Origin": "http://localhost:5173"})
+
+    assert raspuns.status_code == 200
+    assert raspuns.headers["X-Numar-Puncte"] == "6"
+    assert "X-Numar-Puncte" in raspuns.headers["Access-Control-Expose-Headers"]
+    assert raspuns.text.splitlines()[-1].startswith('{"rezumat":{"puncte":6')
+
+def test_sweep_respinge_axa_prea_lunga(client):
+    axe = [{"camp": "coefAerodinamic", "minim": 0.2, "maxim": 0.4, "puncte": 10**9}]
+    raspuns = client.post("/sweep", json={"vehicul": VEHICUL_REFERINTA, "axe": axe})
+
+    assert raspuns.status_code == 422
+
+def test_sweep_respinge_produs_prea_mare(client):
+    axe = [{"camp": camp, "minim": 1.0, "maxim": 2.0, "puncte": 1000} for camp in ("coefAerodinamic", "masaTotala", "arieFrontala")]
+    raspuns = client.post("/sweep", json={"vehicul": VEHICUL_REFERINTA, "axe": axe})
+
+    assert raspuns.status_code == 422
+    assert str(PUNCTE_MAX_SWEEP) in raspuns.text
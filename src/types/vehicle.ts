@@ -40,6 +40,12 @@ export interface EngineParams {
   turatieCuplMax: number;      // Turație la cuplu maxim [rot/min]
   turatieMaxima: number;       // Turație maximă [rot/min]
   turatieRalanti: number;      // Turație ralanti [rot/min]
+  curbaCuplu?: CurbaCuplu;     // Curba de cuplu măsurată (înlocuiește formula Leiderman)
+}
+
+export interface CurbaCuplu {
+  turatii: number[];           // Turații [rot/min]
+  cupluri: number[];           // Cuplu la sarcină plină [N·m]
 }
 
 export interface TransmissionParams {